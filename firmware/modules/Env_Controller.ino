@@ -255,6 +255,16 @@ void handle_command(String cmd)
 {
     cmd.trim();
     
+    // 하트비트 (서버 연결 생존 확인)
+    if (cmd == "HChb") 
+    {
+        if (client.connected()) 
+        {
+            client.println("HRhb");
+        }
+        return;
+    }
+    
     // 온도 기준점 설정 명령 처리 (HCpX##.#)
     if (cmd.startsWith("HCp") && cmd.length() >= 5) 
     {
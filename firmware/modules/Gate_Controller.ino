@@ -247,8 +247,13 @@ void handle_wifi_command()
 
 void process_command(String cmd)
 {
+    // 하트비트 (서버 연결 생존 확인)
+    if (cmd == "GChb")
+    {
+        send_tcp_message("GRhb\n");
+    }
     // 등록 모드 진입
-    if (cmd == "GCmd1")
+    else if (cmd == "GCmd1")
     {
         enter_register_mode();
     }
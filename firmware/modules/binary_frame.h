@@ -0,0 +1,129 @@
+#ifndef BINARY_FRAME_H
+#define BINARY_FRAME_H
+
+#include <Arduino.h>
+
+// ───── 바이너리 프레임 (서버 utils/protocol.py 와 동일한 형식) ─────
+// 프레임: 0xA5(1) + 길이(2, LE) + 디바이스(1) + 타입(1) + 순번(2, LE) + 코드(2) + 본문
+//   길이 = 디바이스부터 본문 끝까지의 바이트 수
+//   'tp' 본문: int16 LE x n (0.01°C 단위)
+//   'ir' 본문: uint8 (1=감지)
+//   그 외 코드: ASCII 텍스트
+//
+// 사용 순서:
+//   1. 연결 직후 request() 로 "xCbn1" 전송
+//   2. 서버 응답 "xRbn1" 을 handle_reply() 에 넘겨 활성화 (응답 전까지는 텍스트로 전송)
+//   3. 이후 send_temperatures() / send_ir() / send_text() 사용
+//      (enabled() 가 false 이면 기존 텍스트 형식으로 전송하므로 구 서버와도 호환)
+// 서버 → 디바이스 명령은 계속 텍스트('\n' 구분)로 수신합니다.
+
+#define BINARY_FRAME_SYNC 0xA5
+#define BINARY_FRAME_VERSION '1'
+#define BINARY_FRAME_MAX_BODY 64
+
+class BinaryFrame {
+private:
+    Print* out;
+    char device;
+    uint16_t seq;
+    bool active;
+
+    void write_u16(uint8_t* buf, int pos, uint16_t value) {
+        buf[pos] = value & 0xFF;
+        buf[pos + 1] = (value >> 8) & 0xFF;
+    }
+
+    void write_frame(char type, const char* code, const uint8_t* body, uint16_t body_len) {
+        uint8_t frame[9 + BINARY_FRAME_MAX_BODY];
+        if (body_len > BINARY_FRAME_MAX_BODY) body_len = BINARY_FRAME_MAX_BODY;
+
+        frame[0] = BINARY_FRAME_SYNC;
+        write_u16(frame, 1, 6 + body_len);  // 디바이스 + 타입 + 순번 + 코드 + 본문
+        frame[3] = device;
+        frame[4] = type;
+        write_u16(frame, 5, seq++);
+        frame[7] = code[0];
+        frame[8] = code[1];
+        memcpy(frame + 9, body, body_len);
+
+        out->write(frame, 9 + body_len);  // 프레임 하나를 한 번에 전송
+    }
+
+public:
+    BinaryFrame(Print* out, char device) : out(out), device(device), seq(0), active(false) {}
+
+    bool enabled() const { return active; }
+
+    // 연결이 새로 맺어지면 텍스트 모드로 되돌리고 다시 협상
+    void reset() {
+        active = false;
+        seq = 0;
+    }
+
+    // 협상 요청 ("xCbn1")
+    void request() {
+        out->print(device);
+        out->print("Cbn");
+        out->println(BINARY_FRAME_VERSION);
+    }
+
+    // 서버 텍스트 응답 확인 - 협상 응답이면 true (명령으로 처리하지 않음)
+    bool handle_reply(const String& line) {
+        if (line.length() >= 4 && line.charAt(0) == device && line.substring(2, 4) == "bn") {
+            active = line.charAt(1) == 'R';
+            return true;
+        }
+        return false;
+    }
+
+    // 온도 이벤트 ("xEtp" + int16 x count)
+    void send_temperatures(const float* temps, int count) {
+        if (!active) {
+            out->print(device);
+            out->print("Etp");
+            for (int i = 0; i < count; i++) {
+                if (i > 0) out->print(';');
+                out->print(temps[i], 1);
+            }
+            out->println();
+            return;
+        }
+
+        uint8_t body[BINARY_FRAME_MAX_BODY];
+        int n = min(count, BINARY_FRAME_MAX_BODY / 2);
+        for (int i = 0; i < n; i++) {
+            int16_t centi = (int16_t)lroundf(temps[i] * 100.0f);
+            write_u16(body, i * 2, (uint16_t)centi);
+        }
+        write_frame('E', "tp", body, n * 2);
+    }
+
+    // IR 센서 이벤트 ("xEir" + uint8)
+    void send_ir(bool detected) {
+        if (!active) {
+            out->print(device);
+            out->print("Eir");
+            out->println(detected ? 1 : 0);
+            return;
+        }
+
+        uint8_t body[1] = { (uint8_t)(detected ? 1 : 0) };
+        write_frame('E', "ir", body, 1);
+    }
+
+    // 그 외 메시지 (payload: 코드 + 텍스트, 예: "wA1")
+    void send_text(char type, const char* payload) {
+        if (!active) {
+            out->print(device);
+            out->print(type);
+            out->println(payload);
+            return;
+        }
+
+        size_t len = strlen(payload);
+        if (len < 2) return;
+        write_frame(type, payload, (const uint8_t*)(payload + 2), len - 2);
+    }
+};
+
+#endif
@@ -380,7 +380,10 @@ void handleSortSocket() {
             Serial.printf("📦 분류기 수신: %s\n", buffer.c_str());
             
             // 명령 처리
-            if (buffer == "SCst") {
+            if (buffer == "SChb") {
+                // 하트비트 (서버 연결 생존 확인)
+                sortSocket.print("SRhb\n");
+            } else if (buffer == "SCst") {
                 startConveyor();
                 sortSocket.print("SRok\n");
             } else if (buffer == "SCsp") {
@@ -240,6 +240,24 @@ class WindowClass(QMainWindow):
                         else:
                             self.data_manager._warehouse_data[warehouse_id]["status"] = "경고"
                         self.data_manager.warehouse_data_changed.emit()
+                elif action == "temperature_batch":
+                    changed = False
+                    for reading in payload.get("readings", []):
+                        warehouse_id = reading.get("warehouse_id")
+                        temperature = reading.get("temperature")
+                        if warehouse_id not in self.data_manager._warehouse_data or temperature is None:
+                            continue
+                        self.data_manager._warehouse_data[warehouse_id]["temperature"] = temperature
+                        # 상태 업데이트 (서버가 히스테리시스를 적용한 범위 판정 사용)
+                        in_range = reading.get("in_range")
+                        if in_range is None:
+                            min_temp = self.data_manager.temp_thresholds[warehouse_id]["min"]
+                            max_temp = self.data_manager.temp_thresholds[warehouse_id]["max"]
+                            in_range = min_temp <= temperature <= max_temp
+                        self.data_manager._warehouse_data[warehouse_id]["status"] = "정상" if in_range else "경고"
+                        changed = True
+                    if changed:
+                        self.data_manager.warehouse_data_changed.emit()
             elif category == "inventory" and hasattr(self.page_inventory, "handleInventoryEvent"):
                 # 인벤토리 이벤트 처리 (필요시 구현)
                 pass
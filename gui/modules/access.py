@@ -62,9 +62,11 @@ class AccessPage(BasePage):  # BasePage 상속으로 변경
     def init_data(self):
         """데이터 초기화"""
         self.access_logs = []
-        self.filtered_logs = []  # 날짜로 필터링된 로그
+        self.filtered_logs = []  # 현재 페이지 로그 (날짜 필터는 서버에서 적용)
         self.page = 1
         self.items_per_page = 20
+        self.page_cursors = [None]  # 페이지별 시작 커서 (이전 페이지 이동용, 첫 페이지는 None)
+        self.next_cursor = None     # 서버가 준 다음 페이지 커서 (마지막 페이지면 None)
         self.last_update_time = None  # 마지막 데이터 업데이트 시간
     
     def setup_date_combo(self):
@@ -146,91 +148,111 @@ class AccessPage(BasePage):  # BasePage 상속으로 변경
     def on_access_logs_changed(self):
         """출입 로그 데이터 변경 시 호출"""
         self.access_logs = self.data_manager.get_access_logs()
-        self.filter_by_date()
-        self.update_table()
+        
+        # 첫 페이지를 보고 있을 때만 새 로그를 반영 (뒤 페이지는 커서 위치 유지)
+        if self.page == 1:
+            self.load_page()
         
         # 상태 메시지 업데이트
         if hasattr(self, 'lbl_status'):
-            self.lbl_status.setText(f"출입 로그 {len(self.access_logs)}건 로드됨")
+            self.lbl_status.setText(f"출입 로그 {len(self.filtered_logs)}건 로드됨")
             self.lbl_status.setStyleSheet("color: green;")
     
     def on_date_changed(self, index):
         """날짜 선택 변경 시 처리"""
-        self.filter_by_date()
-        self.page = 1  # 페이지 초기화
-        self.update_table()
+        # 페이지 초기화 후 선택한 날짜로 첫 페이지 조회
+        self.page = 1
+        self.page_cursors = [None]
+        self.load_page()
     
-    def filter_by_date(self):
-        """선택된 날짜로 로그 필터링"""
-        if not hasattr(self, 'combo_date') or len(self.access_logs) == 0:
-            self.filtered_logs = self.access_logs.copy()
+    def load_page(self):
+        """선택한 날짜와 현재 페이지 커서로 출입 로그 한 페이지를 서버에서 조회"""
+        selected_date_value = self.combo_date.currentData() if hasattr(self, 'combo_date') else "all"
+        date_filter = None if selected_date_value in (None, "all") else selected_date_value
+        
+        if not self.data_manager.is_server_connected():
+            self.filtered_logs = []
+            self.next_cursor = None
+            self.update_table()
             return
         
-        selected_date_value = self.combo_date.currentData()
+        try:
+            response = self.data_manager._server_connection.get_access_logs(
+                limit=self.items_per_page,
+                cursor=self.page_cursors[self.page - 1],
+                start_date=date_filter,
+                end_date=date_filter
+            )
+        except Exception as e:
+            logger.error(f"출입 로그 페이지 조회 오류: {str(e)}")
+            response = None
         
-        # 전체 기간 선택 시
-        if selected_date_value == "all":
-            self.filtered_logs = self.access_logs.copy()
-            return
-            
-        # 특정 날짜 선택 시
-        self.filtered_logs = []
-        for log in self.access_logs:
-            entry_time = log.get("entry_time", "")
-            if entry_time.startswith(selected_date_value):
-                self.filtered_logs.append(log)
+        if response and response.get("success", False):
+            self.filtered_logs = [self.format_log(log) for log in response.get("logs", [])]
+            self.next_cursor = response.get("next_cursor")
+        else:
+            self.filtered_logs = []
+            self.next_cursor = None
+        
+        self.update_table()
+    
+    @staticmethod
+    def format_log(log):
+        """서버 출입 로그(access_logs 행)를 테이블 표시 형식으로 변환"""
+        if "card_id" not in log:
+            return log
+        timestamp = str(log.get("timestamp", ""))
+        is_exit = log.get("access_type") == "exit"
+        return {
+            "uid": str(log.get("card_id", "")),
+            "name": str(log.get("employee_name", "")),
+            "department": log.get("department", ""),
+            "entry_time": "" if is_exit else timestamp,
+            "exit_time": timestamp if is_exit else ""
+        }
     
     def update_table(self):
-        """테이블에 데이터 표시"""
+        """테이블에 현재 페이지 데이터 표시"""
         # 테이블 초기화
         self.table_access.setRowCount(0)
         
-        # 현재 페이지에 해당하는 데이터 계산
-        start_idx = (self.page - 1) * self.items_per_page
-        end_idx = start_idx + self.items_per_page
-        
-        # 필터링된 접근 로그 중 페이징 처리
-        if self.filtered_logs and len(self.filtered_logs) > 0:
-            current_page_data = self.filtered_logs[start_idx:end_idx]
-            
-            # 테이블에 데이터 추가
-            for row, log in enumerate(current_page_data):
-                self.table_access.insertRow(row)
-                self.table_access.setItem(row, 0, QTableWidgetItem(log.get("uid", "")))
-                self.table_access.setItem(row, 1, QTableWidgetItem(log.get("name", "")))
-                self.table_access.setItem(row, 2, QTableWidgetItem(log.get("department", "")))
-                self.table_access.setItem(row, 3, QTableWidgetItem(log.get("entry_time", "")))
-                self.table_access.setItem(row, 4, QTableWidgetItem(log.get("exit_time", "")))
+        # 서버에서 받은 현재 페이지 로그 표시
+        for row, log in enumerate(self.filtered_logs):
+            self.table_access.insertRow(row)
+            self.table_access.setItem(row, 0, QTableWidgetItem(log.get("uid", "")))
+            self.table_access.setItem(row, 1, QTableWidgetItem(log.get("name", "")))
+            self.table_access.setItem(row, 2, QTableWidgetItem(log.get("department", "")))
+            self.table_access.setItem(row, 3, QTableWidgetItem(log.get("entry_time", "")))
+            self.table_access.setItem(row, 4, QTableWidgetItem(log.get("exit_time", "")))
         
-        # 페이지 정보 업데이트 (페이지 표시 라벨이 있는 경우)
+        # 페이지 정보 업데이트 (키셋 페이지라 전체 페이지 수는 알 수 없음)
         if hasattr(self, 'lbl_page'):
-            total_pages = max(1, (len(self.filtered_logs) + self.items_per_page - 1) // self.items_per_page)
-            self.lbl_page.setText(f"{self.page} / {total_pages}")
+            self.lbl_page.setText(f"{self.page} 페이지")
             
-            # 페이지 이동 버튼 활성화/비활성화
-            if hasattr(self, 'btn_prev'):
-                self.btn_prev.setEnabled(self.page > 1)
-            if hasattr(self, 'btn_next'):
-                self.btn_next.setEnabled(self.page < total_pages)
+        # 페이지 이동 버튼 활성화/비활성화
+        if hasattr(self, 'btn_prev'):
+            self.btn_prev.setEnabled(self.page > 1)
+        if hasattr(self, 'btn_next'):
+            self.btn_next.setEnabled(self.next_cursor is not None)
         
         # 레코드 수 표시 (레코드 수 라벨이 있는 경우)
         if hasattr(self, 'lbl_records'):
-            self.lbl_records.setText(f"총 {len(self.filtered_logs)}건")
+            self.lbl_records.setText(f"{self.page}페이지 {len(self.filtered_logs)}건")
             
-        logger.debug(f"출입 테이블 업데이트: {len(self.filtered_logs)}건 중 {min(start_idx+1, len(self.filtered_logs)) if self.filtered_logs else 0}-{min(end_idx, len(self.filtered_logs))}번째 항목 표시")
+        logger.debug(f"출입 테이블 업데이트: {self.page}페이지 {len(self.filtered_logs)}건 표시")
     
     def prev_page(self):
         """이전 페이지 이동"""
         if self.page > 1:
             self.page -= 1
-            self.update_table()
+            self.load_page()
     
     def next_page(self):
-        """다음 페이지 이동"""
-        total_pages = max(1, (len(self.filtered_logs) + self.items_per_page - 1) // self.items_per_page)
-        if self.page < total_pages:
+        """다음 페이지 이동 (서버가 준 커서로 조회)"""
+        if self.next_cursor:
+            self.page_cursors = self.page_cursors[:self.page] + [self.next_cursor]
             self.page += 1
-            self.update_table()
+            self.load_page()
     
     def handleAccessEvent(self, action, payload):
         """서버로부터 출입 이벤트 처리"""
@@ -301,6 +301,18 @@ class DataManager(QObject):
                         self._warehouse_data[warehouse_id]["temperature"] = temperature
                         self.warehouse_data_changed.emit()
                         
+                # 온도 배치 이벤트 (여러 창고를 한 번에 반영)
+                elif action == "temperature_batch" and "readings" in payload:
+                    changed = False
+                    for reading in payload.get("readings", []):
+                        warehouse_id = reading.get("warehouse_id")
+                        if warehouse_id in self._warehouse_data:
+                            self._warehouse_data[warehouse_id]["temperature"] = reading.get("temperature")
+                            changed = True
+                    
+                    if changed:
+                        self.warehouse_data_changed.emit()
+                        
                 # 경고 상태 업데이트 이벤트
                 elif action == "warehouse_warning" and "warehouse" in payload:
                     warehouse_id = payload.get("warehouse")
@@ -719,18 +731,14 @@ class DataManager(QObject):
             return
         
         try:
-            # 유통기한 만료 항목 조회
-            expired_response = self._server_connection.get_expired_items()
-            
-            # 유통기한 경고 항목 조회 (7일 이내)
-            alerts_response = self._server_connection.get_expiry_alerts(days=7)
+            # 유통기한 경과/임박(7일 이내) 개수 조회 (목록 대신 서버 집계 한 번)
+            summary_response = self._server_connection.get_expiry_summary(days=7)
             
             # 응답 처리
-            if expired_response and "success" in expired_response and expired_response["success"]:
-                self._expiry_data["over"] = expired_response.get("total_count", 0)
-            
-            if alerts_response and "success" in alerts_response and alerts_response["success"]:
-                self._expiry_data["soon"] = alerts_response.get("total_count", 0)
+            if summary_response and summary_response.get("success"):
+                summary = summary_response["data"]
+                self._expiry_data["over"] = summary.get("expired_count", 0)
+                self._expiry_data["soon"] = summary.get("today_count", 0) + summary.get("upcoming_count", 0)
             
             # 변경 신호 발생
             self.expiry_data_changed.emit()
@@ -949,6 +957,21 @@ class DataManager(QObject):
         """온도 임계값 반환"""
         return self.temp_thresholds
     
+    def get_temperature_trend(self, warehouse_id, hours=24, points=288):
+        """창고 최근 온도 추이 조회 (구간별 min/avg/max 목록, 서버 연결이 없거나 실패하면 None)"""
+        if not self.is_server_connected() or not self._server_connection:
+            return None
+        
+        try:
+            result = self._server_connection.get_temperature_trend(warehouse_id, hours, points)
+            if result.get("success"):
+                return result["data"].get("points", [])
+            logger.warning(f"창고 {warehouse_id} 온도 추이 조회 실패: {result.get('error')}")
+        except Exception as e:
+            logger.error(f"온도 추이 조회 오류: {str(e)}")
+        
+        return None
+    
     def get_notifications(self):
         """알림 목록 반환"""
         return self._notifications
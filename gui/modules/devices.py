@@ -16,6 +16,13 @@ logger = logging.getLogger(__name__)
 class DevicesPage(BasePage):
     """장치 관리 페이지 위젯 클래스"""
     
+    # 디바이스 ID별 표시 이름
+    DEVICE_NAMES = {
+        "S": "분류기",
+        "H": "환경 제어",
+        "G": "출입 게이트"
+    }
+    
     def __init__(self, parent=None, data_manager=None):
         """
         장치 관리 페이지 초기화
@@ -27,6 +34,7 @@ class DevicesPage(BasePage):
         super().__init__(parent)
         self.page_name = "장치 관리"  # 기본 클래스 속성 설정
         self.current_sorter_state = "stopped"  # 'stopped', 'running', 'pause' 중 하나
+        self.sorter_connected = True  # 서버가 분류기 연결 끊김을 알리기 전까지 연결된 것으로 간주
         # UI 로드
         uic.loadUi("ui/widgets/devices.ui", self)
         
@@ -90,6 +98,42 @@ class DevicesPage(BasePage):
         # 분류기 관련 이벤트인 경우 처리
         if category == "sorter":
             self.handleSorterEvent(action, payload)
+        # 디바이스 연결 상태 변경 (하트비트 기반 즉시 알림)
+        elif category == "device" and action == "connection":
+            self.handle_device_connection(payload)
+    
+    def handle_device_connection(self, payload):
+        """디바이스 연결/끊김 이벤트 처리"""
+        device_id = payload.get("device_id", "")
+        connected = payload.get("connected", False)
+        reason = payload.get("reason", "")
+        name = self.DEVICE_NAMES.get(device_id, device_id)
+        
+        current_time = QDateTime.currentDateTime().toString("hh:mm:ss")
+        if connected:
+            self.add_log_message(f"{current_time} - {name} 연결됨")
+        else:
+            self.add_log_message(f"{current_time} - {name} 연결 끊김 ({reason})")
+        
+        if device_id != "S":
+            return
+        
+        self.sorter_connected = connected
+        if connected:
+            # 재연결 시 마지막으로 받은 분류기 상태로 복원
+            self.btn_start.setEnabled(True)
+            self.btn_pause.setEnabled(True)
+            self.btn_stop.setEnabled(True)
+            self.handleSorterEvent("status_update", {"state": self.current_sorter_state})
+            self.show_status_message("분류기 연결됨", is_success=True)
+        else:
+            self.conveyor_status.setText("분류기 끊김")
+            self.conveyor_status.setStyleSheet("background-color: #757575; color: white; border-radius: 3px; padding: 5px; font-weight: bold;")
+            self.conveyor_running = False
+            self.btn_start.setEnabled(False)
+            self.btn_pause.setEnabled(False)
+            self.btn_stop.setEnabled(False)
+            self.show_status_message("분류기 연결 끊김", is_error=True)
     
     def connect_button_signals(self):
         """버튼 이벤트 연결"""
@@ -368,10 +412,10 @@ class DevicesPage(BasePage):
         try:
             # 서버 연결 상태 확인
             if self.data_manager.is_server_connected():
-                # 컨베이어 제어 버튼 활성화 (필수)
-                self.btn_start.setEnabled(True)
-                self.btn_pause.setEnabled(True)
-                self.btn_stop.setEnabled(True)
+                # 컨베이어 제어 버튼 활성화 (분류기 연결 끊김 상태면 비활성 유지)
+                self.btn_start.setEnabled(self.sorter_connected)
+                self.btn_pause.setEnabled(self.sorter_connected)
+                self.btn_stop.setEnabled(self.sorter_connected)
                 
                 # 초기 상태에서만 기본값 설정 (0개로 시작)
                 if not hasattr(self, '_ui_initialized') or not self._ui_initialized:
@@ -4,6 +4,10 @@ from PyQt6.QtGui import *
 from PyQt6.QtCore import *
 from PyQt6 import uic
 import logging
+from datetime import datetime
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.dates import DateFormatter
 
 from modules.base_page import BasePage
 from modules.data_manager import DataManager
@@ -12,6 +16,11 @@ from modules.error_handler import ErrorHandler
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 온도 추이 차트 설정
+TREND_HOURS = 24                # 차트에 표시할 최근 시간
+TREND_POINTS = 288              # 구간 수 (24시간 기준 5분 간격)
+TREND_REFRESH_MS = 60 * 1000    # 차트 갱신 주기
+
 class EnvironmentPage(BasePage):
     """환경 관리 페이지 위젯 클래스"""
     
@@ -42,6 +51,9 @@ class EnvironmentPage(BasePage):
         # 팬 상태 표시 라벨 생성 (이 줄을 추가)
         self.create_fan_status_labels()
         
+        # 창고별 온도 추이 차트 생성
+        self.create_trend_charts()
+        
         # 개발 모드인 경우 시뮬레이션 컨트롤 추가 (선택 사항)
         if hasattr(self.data_manager, 'DEBUG_MODE') and self.data_manager.DEBUG_MODE:
             self.setup_simulation_controls()
@@ -58,6 +70,12 @@ class EnvironmentPage(BasePage):
         # 데이터 변경 이벤트 연결
         self.connect_data_signals()
         
+        # 온도 추이 차트 주기적 갱신 (실시간 이벤트와 별도로 서버 로컬 기록을 조회)
+        self.trend_timer = QTimer(self)
+        self.trend_timer.timeout.connect(self.update_trend_charts)
+        self.trend_timer.start(TREND_REFRESH_MS)
+        self.update_trend_charts()
+        
         logger.info("환경 관리 페이지 초기화 완료")
 
         # 헤더 레이블 폰트 설정
@@ -274,6 +292,59 @@ class EnvironmentPage(BasePage):
         except Exception as e:
             logger.error(f"팬 상태 라벨 생성 오류: {str(e)}")
 
+    def create_trend_charts(self):
+        """창고별 최근 온도 추이 차트 동적 생성 (각 창고 프레임 오른쪽 빈 영역)"""
+        self.trend_charts = {}
+        try:
+            frames = [self.frame_A, self.frame_B, self.frame_C]
+            warehouse_ids = ["A", "B", "C"]
+            
+            for i, frame in enumerate(frames):
+                wh_id = warehouse_ids[i]
+                
+                figure = Figure(figsize=(2.5, 1.5), dpi=100)
+                figure.subplots_adjust(left=0.16, right=0.97, top=0.9, bottom=0.16)
+                canvas = FigureCanvas(figure)
+                canvas.setParent(frame)
+                canvas.setGeometry(QRect(580, 10, 250, 150))
+                canvas.setObjectName(f"canvas_trend_{wh_id}")
+                
+                self.trend_charts[wh_id] = (figure, canvas)
+                
+        except Exception as e:
+            logger.error(f"온도 추이 차트 생성 오류: {str(e)}")
+    
+    def update_trend_charts(self):
+        """창고별 최근 TREND_HOURS시간 온도 추이(평균선 + 최저/최고 범위) 갱신"""
+        for wh_id, (figure, canvas) in self.trend_charts.items():
+            try:
+                points = self.data_manager.get_temperature_trend(wh_id, TREND_HOURS, TREND_POINTS)
+                
+                figure.clear()
+                ax = figure.add_subplot(111)
+                ax.set_title(f"최근 {TREND_HOURS}시간", fontsize=7)
+                ax.tick_params(labelsize=6)
+                
+                if points:
+                    times = [datetime.fromtimestamp(point["t"]) for point in points]
+                    ax.fill_between(times, [point["min"] for point in points],
+                                    [point["max"] for point in points], color='#4285F4', alpha=0.25, linewidth=0)
+                    ax.plot(times, [point["avg"] for point in points], color='#4285F4', linewidth=1)
+                    
+                    # 온도 임계값 표시
+                    threshold = self.temp_thresholds.get(wh_id, {})
+                    for key in ("min", "max"):
+                        if key in threshold:
+                            ax.axhline(threshold[key], color='#EA4335', linewidth=0.6, linestyle='--')
+                    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
+                else:
+                    ax.text(0.5, 0.5, "기록 없음", ha='center', va='center', fontsize=7, transform=ax.transAxes)
+                    ax.set_xticks([])
+                
+                canvas.draw_idle()
+            except Exception as e:
+                logger.error(f"창고 {wh_id} 온도 추이 차트 갱신 오류: {str(e)}")
+    
     def update_operation_mode(self, wh_id):
         """운영 모드(냉방/난방/정지) 업데이트"""
         try:
@@ -454,6 +525,22 @@ class EnvironmentPage(BasePage):
                     
                     logger.debug(f"환경 이벤트: 창고 {wh_id} 온도 업데이트 - {temperature}°C")
                     
+            # temperature_batch 액션 처리 (배치 내 모든 창고 반영 후 UI 한 번 갱신)
+            elif action == "temperature_batch" and "readings" in payload:
+                updated = []
+                for reading in payload.get("readings", []):
+                    wh_id = reading.get("warehouse_id")
+                    temperature = reading.get("temperature")
+                    
+                    if wh_id in self.warehouses and temperature is not None:
+                        self.warehouses[wh_id]["current_temp"] = temperature
+                        self.update_operation_mode(wh_id)
+                        updated.append(wh_id)
+                
+                if updated:
+                    self.update_ui()
+                    logger.debug(f"환경 이벤트: 창고 {updated} 온도 배치 업데이트")
+                    
             # 팬 상태 업데이트 처리 추가
             elif action == "fan_status_update" and "warehouse" in payload:
                 wh_id = payload.get("warehouse")
@@ -368,10 +368,13 @@ class InventoryListDialog(QDialog):
     
     def init_data(self):
         """데이터 초기화"""
-        self.inventory_items = []
-        self.filtered_items = []
+        self.inventory_items = []       # 현재 페이지 물품 (서버에서 받은 그대로)
+        self.filtered_items = []        # 테이블에 표시할 물품 (검색어는 서버에서 적용)
+        self.search_text = ""           # 조회에 사용 중인 검색어 (검색 버튼을 누를 때 확정)
         self.current_page = 1
         self.items_per_page = 20
+        self.page_cursors = [None]      # 페이지별 시작 커서 (이전 페이지 이동용, 첫 페이지는 None)
+        self.next_cursor = None         # 서버가 준 다음 페이지 커서 (마지막 페이지면 None)
     
     def setup_ui(self):
         """UI 구성"""
@@ -510,18 +513,26 @@ class InventoryListDialog(QDialog):
                 return
                 
             try:
-                # API 호출: 재고 물품 목록 조회
+                # API 호출: 현재 페이지 커서와 창고/검색어 필터로 재고 물품 한 페이지 조회
                 server_conn = self.data_manager._server_connection
-                response = server_conn.get_inventory_items(limit=100, offset=0)
+                selected_warehouse = self.combo_warehouse.currentData()
+                response = server_conn.get_inventory_items(
+                    category=None if selected_warehouse == "all" else selected_warehouse,
+                    limit=self.items_per_page,
+                    cursor=self.page_cursors[self.current_page - 1],
+                    search=self.search_text or None
+                )
                 
                 if response and response.get("success", False):
                     # 데이터 가져오기 성공 - data 필드에서 아이템 리스트 추출
                     self.inventory_items = response.get("data", [])
-                    logger.info(f"재고 데이터 {len(self.inventory_items)}건 로드 완료")
+                    self.next_cursor = response.get("next_cursor")
+                    logger.info(f"재고 데이터 {self.current_page}페이지 {len(self.inventory_items)}건 로드 완료")
                 else:
                     # 오류 발생 - error 객체에서 메시지 추출
                     logger.warning("재고 데이터 가져오기 실패")
                     self.inventory_items = []
+                    self.next_cursor = None
                     
                     # 오류 메시지 표시
                     error_obj = response.get("error", {})
@@ -530,17 +541,19 @@ class InventoryListDialog(QDialog):
             except Exception as e:
                 logger.error(f"재고 API 호출 오류: {str(e)}")
                 self.inventory_items = []
+                self.next_cursor = None
                 
                 # 오류 메시지 표시
                 self.show_api_exception("API 호출 오류", e)
             
-            # 필터 적용
-            self.apply_search_filter()
+            # 검색어 필터 적용
+            self.filter_current_page()
         
         except Exception as e:
             logger.error(f"fetch_inventory_data 실행 중 오류: {str(e)}")
             self.inventory_items = []
-            self.apply_search_filter()
+            self.next_cursor = None
+            self.filter_current_page()
             
             # 오류 메시지 표시
             ErrorHandler.show_error_message("오류", f"재고 데이터를 가져오는 중 오류가 발생했습니다: {str(e)}")
@@ -562,40 +575,27 @@ class InventoryListDialog(QDialog):
         """API 예외 표시"""
         ErrorHandler.show_error_message(title, f"{title} 중 오류: {str(exception)}")
     
-    # inventory.py 파일에서 apply_search_filter 함수 수정
     def apply_search_filter(self):
-        """검색 및 필터 적용"""
+        """검색 및 필터 적용 (창고/검색어 필터는 서버에서 적용하므로 첫 페이지부터 다시 조회)"""
+        self.search_text = self.input_search.text().strip()
+        self.current_page = 1
+        self.page_cursors = [None]
+        self.next_cursor = None
+        self.fetch_inventory_data()
+    
+    def filter_current_page(self):
+        """현재 페이지 물품 표시 (검색어는 서버 조회에 이미 적용됨)"""
         try:
-            # 필터 조건 가져오기
-            search_text = self.input_search.text().lower()
-            selected_warehouse = self.combo_warehouse.currentData()
-            
-            # 필터링
-            self.filtered_items = []
-            for item in self.inventory_items:
-                # 검색어 필터 - 필드명 변경
-                if search_text and not (
-                    search_text in str(item.get("product_name", "")).lower() or  # 상품명
-                    search_text in str(item.get("id", "")).lower()              # 상품아이디
-                ):
-                    continue
-                
-                # 창고 필터 - 필드명 변경
-                if selected_warehouse != "all" and item.get("warehouse_id", "") != selected_warehouse:
-                    continue
-                
-                # 모든 필터 통과
-                self.filtered_items.append(item)
+            self.filtered_items = list(self.inventory_items)
             
             # 페이지 정보 업데이트
-            self.current_page = 1
             self.update_pagination()
             
             # 테이블 업데이트
             self.update_table()
             
-            # 총 레코드 수 표시 업데이트
-            self.lbl_total_records.setText(f"총 {len(self.filtered_items)}건")
+            # 레코드 수 표시 업데이트 (전체 건수는 세지 않으므로 현재 페이지 기준)
+            self.lbl_total_records.setText(f"{self.current_page}페이지 {len(self.filtered_items)}건")
             
             # 필터링 결과 표시
             if len(self.filtered_items) > 0:
@@ -629,19 +629,12 @@ class InventoryListDialog(QDialog):
     
     def update_pagination(self):
         """페이지 정보 업데이트"""
-        # 전체 페이지 수 계산
-        total_pages = max(1, (len(self.filtered_items) + self.items_per_page - 1) // self.items_per_page)
-        
-        # 현재 페이지 범위 조정
-        if self.current_page > total_pages:
-            self.current_page = total_pages
-        
-        # 페이지 정보 표시 업데이트
-        self.lbl_page.setText(f"{self.current_page} / {total_pages}")
+        # 페이지 정보 표시 업데이트 (키셋 페이지라 전체 페이지 수는 알 수 없음)
+        self.lbl_page.setText(f"{self.current_page} 페이지")
         
         # 페이지 버튼 활성화/비활성화
         self.btn_prev_page.setEnabled(self.current_page > 1)
-        self.btn_next_page.setEnabled(self.current_page < total_pages)
+        self.btn_next_page.setEnabled(self.next_cursor is not None)
     
         # inventory.py 파일에서 update_table 함수 수정
     def update_table(self):
@@ -650,12 +643,8 @@ class InventoryListDialog(QDialog):
             # 테이블 초기화
             self.table_inventory.setRowCount(0)
             
-            # 현재 페이지에 표시할 데이터 범위 계산
-            start_idx = (self.current_page - 1) * self.items_per_page
-            end_idx = min(start_idx + self.items_per_page, len(self.filtered_items))
-            
-            # 테이블에 데이터 추가
-            for i, item in enumerate(self.filtered_items[start_idx:end_idx]):
+            # 테이블에 데이터 추가 (서버에서 받은 현재 페이지)
+            for i, item in enumerate(self.filtered_items):
                 row = self.table_inventory.rowCount()
                 self.table_inventory.insertRow(row)
                 
@@ -679,13 +668,11 @@ class InventoryListDialog(QDialog):
         """이전 페이지로 이동"""
         if self.current_page > 1:
             self.current_page -= 1
-            self.update_pagination()
-            self.update_table()
+            self.fetch_inventory_data()
     
     def next_page(self):
-        """다음 페이지로 이동"""
-        total_pages = max(1, (len(self.filtered_items) + self.items_per_page - 1) // self.items_per_page)
-        if self.current_page < total_pages:
+        """다음 페이지로 이동 (서버가 준 커서로 조회)"""
+        if self.next_cursor:
+            self.page_cursors = self.page_cursors[:self.current_page] + [self.next_cursor]
             self.current_page += 1
-            self.update_pagination()
-            self.update_table()
\ No newline at end of file
+            self.fetch_inventory_data()
\ No newline at end of file
@@ -520,6 +520,27 @@ class ServerConnection(QObject):
             
         return standardized
     
+    def get_temperature_trend(self, warehouse_id, hours=24, points=288):
+        """최근 온도 추이 조회 (구간별 min/avg/max - 서버 로컬 기록 사용)"""
+        params = {'warehouse': warehouse_id, 'hours': hours, 'points': points}
+        response = self._send_request('GET', 'environment/trend', params)
+        standardized = self._standardize_response(response, f"창고 {warehouse_id} 온도 추이 조회")
+        
+        # 서버 응답 {"status": "ok", "data": {...}}의 안쪽 데이터를 꺼냄
+        if standardized["success"]:
+            body = standardized.get("data") or {}
+            if body.get("status") != "ok" or not isinstance(body.get("data"), dict):
+                return {
+                    "success": False,
+                    "error": {
+                        "code": "INVALID_RESPONSE",
+                        "message": body.get("message", "온도 추이 데이터가 올바르지 않습니다.")
+                    }
+                }
+            standardized["data"] = body["data"]
+        
+        return standardized
+    
     # ===== 재고 관리 API =====
     
     def get_inventory_status(self):
@@ -527,14 +548,20 @@ class ServerConnection(QObject):
         response = self._send_request('GET', 'inventory/status')
         return self._standardize_response(response, "재고 상태 조회")
     
-    def get_inventory_items(self, category=None, limit=20, offset=0):
-        """재고 물품 목록 조회"""
+    def get_inventory_items(self, category=None, limit=20, cursor=None, search=None):
+        """재고 물품 목록 한 페이지 조회 (다음 페이지는 응답의 next_cursor를 cursor로 전달)
+
+        search: 상품명 또는 물품 ID 부분 일치 검색어 (다음 페이지도 같은 검색어로 요청)
+        """
         params = {
-            'limit': limit,
-            'offset': offset
+            'limit': limit
         }
         if category:
             params['category'] = category
+        if search:
+            params['search'] = search
+        if cursor:
+            params['cursor'] = cursor
             
         response = self._send_request('GET', 'inventory/items', params)
         standardized = self._standardize_response(response, "재고 물품 목록 조회")
@@ -642,11 +669,39 @@ class ServerConnection(QObject):
         
         return standardized
     
+    def get_expiry_summary(self, days=7):
+        """유통기한 현황 요약 조회 (창고별 경과/오늘 만료/임박 개수)"""
+        params = {'days': days}
+        response = self._send_request('GET', 'expiry/summary', params)
+        standardized = self._standardize_response(response, "유통기한 현황 요약 조회")
+        
+        # 오류 시 기본 데이터 추가
+        if not standardized["success"] or "data" not in standardized:
+            standardized["data"] = {
+                "warehouses": {},
+                "expired_count": 0,
+                "today_count": 0,
+                "upcoming_count": 0,
+                "days_threshold": days
+            }
+        
+        return standardized
+    
     # ===== 출입 관리 API =====
     
-    def get_access_logs(self):
-        """출입 기록 조회"""
-        response = self._send_request('GET', 'access/logs')
+    def get_access_logs(self, limit=20, cursor=None, start_date=None, end_date=None):
+        """출입 기록 한 페이지 조회 (다음 페이지는 응답의 next_cursor를 cursor로 전달)"""
+        params = {
+            'limit': limit
+        }
+        if cursor:
+            params['cursor'] = cursor
+        if start_date:
+            params['start_date'] = start_date
+        if end_date:
+            params['end_date'] = end_date
+            
+        response = self._send_request('GET', 'access/logs', params)
         standardized = self._standardize_response(response, "출입 로그 조회")
         
         # 데이터 필드 확인 및 추가
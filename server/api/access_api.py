@@ -33,17 +33,24 @@ def get_access_controller():
 @bp.route('/logs', methods=['GET'])
 def get_access_logs():
     try:
-        # 페이징 처리 추가
+        # 페이징 처리 (이전 응답의 next_cursor를 cursor로 전달)
         limit = request.args.get('limit', default=20, type=int)
-        offset = request.args.get('offset', default=0, type=int)
+        cursor = request.args.get('cursor')
         
         # 날짜 필터링 (선택적)
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
         
         # 데이터베이스에서 로그 가져오기
-        logs = db_manager.get_access_logs(limit=limit, offset=offset, 
-                                         start_date=start_date, end_date=end_date)
+        try:
+            logs, next_cursor = db_manager.get_access_logs(limit=limit, cursor=cursor,
+                                                           start_date=start_date, end_date=end_date)
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "error": {"message": str(e)},
+                "timestamp": datetime.now().isoformat()
+            }), 400
         
         # 타입 체크 및 변환 - 안전한 형태로 수정
         if logs is None:
@@ -70,6 +77,7 @@ def get_access_logs():
             "success": True,
             "logs": logs,
             "total_count": len(logs),
+            "next_cursor": next_cursor,
             "timestamp": datetime.now().isoformat()
         }
         return jsonify(result)
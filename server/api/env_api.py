@@ -1,4 +1,6 @@
 # server/api/env_api.py
+from datetime import datetime
+import time
 from flask import Blueprint, request, jsonify
 from api import get_controller
 import logging
@@ -132,6 +134,82 @@ def get_temperature_thresholds():
         "data": thresholds
     })
 
+# ==== 온도 기록 조회 ====
+def _parse_time(value, default):
+    """epoch 초 또는 ISO 8601 문자열을 epoch 초로 변환 (값이 없으면 default)"""
+    if not value:
+        return default
+    try:
+        return int(float(value))
+    except ValueError:
+        return int(datetime.fromisoformat(value).timestamp())
+
+@bp.route('/history', methods=['GET'])
+def get_temperature_history():
+    """창고 온도 기록을 조회합니다.
+    
+    쿼리 파라미터:
+        warehouse: 창고 ID (A, B, C)
+        start, end: 조회 구간 (epoch 초 또는 ISO 8601, 기본값 최근 24시간)
+        max_points: 최대 점 수 - 이 수 안에 들어오는 가장 세밀한 해상도(원본/1분/15분/1시간)를 사용
+    """
+    warehouse = request.args.get('warehouse')
+    if warehouse not in ['A', 'B', 'C']:
+        return jsonify({"status": "error", "message": "유효하지 않은 창고 ID"}), 400
+    
+    try:
+        end = _parse_time(request.args.get('end'), int(time.time()))
+        start = _parse_time(request.args.get('start'), end - 86400)
+        max_points = request.args.get('max_points', type=int)
+    except ValueError:
+        return jsonify({"status": "error", "message": "start/end는 epoch 초 또는 ISO 8601 형식이어야 합니다."}), 400
+    
+    env_controller = get_env_controller()
+    if not env_controller:
+        return jsonify({"status": "error", "message": "환경 제어 컨트롤러가 초기화되지 않았습니다."}), 500
+    
+    try:
+        result = env_controller.get_history(warehouse, start, end, max_points)
+    except Exception as e:
+        logger.error(f"온도 기록 조회 오류: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+    
+    if result.get("status") == "error":
+        return jsonify(result), 400
+    
+    return jsonify(result)
+
+@bp.route('/trend', methods=['GET'])
+def get_temperature_trend():
+    """최근 온도 추이를 조회합니다 (DB를 거치지 않고 서버 로컬 링 파일에서 계산).
+    
+    쿼리 파라미터:
+        warehouse: 창고 ID (A, B, C)
+        hours: 조회할 최근 시간 (기본값 24)
+        points: 구간 수 - 구간마다 min/avg/max (기본값 288)
+    """
+    warehouse = request.args.get('warehouse')
+    if warehouse not in ['A', 'B', 'C']:
+        return jsonify({"status": "error", "message": "유효하지 않은 창고 ID"}), 400
+    
+    hours = request.args.get('hours', 24, type=float)
+    points = request.args.get('points', 288, type=int)
+    
+    env_controller = get_env_controller()
+    if not env_controller:
+        return jsonify({"status": "error", "message": "환경 제어 컨트롤러가 초기화되지 않았습니다."}), 500
+    
+    try:
+        result = env_controller.get_trend(warehouse, hours, points)
+    except Exception as e:
+        logger.error(f"온도 추이 조회 오류: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+    
+    if result.get("status") == "error":
+        return jsonify(result), 400
+    
+    return jsonify(result)
+
 # ==== 온도 경고 조회 ====
 @bp.route('/warnings', methods=['GET'])
 def get_temperature_warnings():
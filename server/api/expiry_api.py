@@ -1,6 +1,7 @@
+import json
 from datetime import datetime
 from typing import Dict, List, Optional
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from api import get_controller
 import logging
 
@@ -30,6 +31,12 @@ def get_expiry_controller():
             
         def get_expired_items(self):
             return []
+            
+        def get_expiry_summary(self, days=7):
+            return None
+            
+        def iter_expiry_items(self, days=7, warehouse_id=None):
+            return iter(())
     
     return DummyExpiryController()
 
@@ -92,4 +99,52 @@ def get_expired_items():
             "success": False,
             "error": {"message": str(e)},
             "timestamp": datetime.now().isoformat()
-        }), 500 
\ No newline at end of file
+        }), 500 
+
+@bp.route("/summary", methods=["GET"])
+def get_expiry_summary():
+    """유통기한 현황 요약 (창고별 경과/오늘 만료/임박 개수, DB 집계 쿼리 한 번)
+    
+    details=true 이면 NDJSON으로 응답합니다. 첫 줄은 요약이고, 이어서 경과/임박 물품을
+    유통기한 순으로 한 줄에 하나씩 보냅니다 (warehouse_id로 창고 지정 가능).
+    """
+    try:
+        days = request.args.get("days", default=7, type=int)
+        details = request.args.get("details", default="false").lower() in ("1", "true", "yes")
+        warehouse_id = request.args.get("warehouse_id")
+        
+        controller = get_expiry_controller()
+        summary = controller.get_expiry_summary(days)
+        if summary is None:
+            return jsonify({
+                "success": False,
+                "error": {"message": "유통기한 현황을 집계할 수 없습니다."},
+                "timestamp": datetime.now().isoformat()
+            }), 503
+        
+        response = {
+            "success": True,
+            "data": summary,
+            "timestamp": datetime.now().isoformat()
+        }
+        if not details:
+            return jsonify(response)
+        
+        def generate():
+            yield json.dumps(response, ensure_ascii=False) + "\n"
+            try:
+                for item in controller.iter_expiry_items(days, warehouse_id):
+                    yield json.dumps(item, ensure_ascii=False, default=str) + "\n"
+            except Exception as e:
+                # 응답 상태 코드는 이미 보냈으므로 마지막 줄로 오류를 알림
+                logger.error(f"유통기한 물품 스트리밍 오류: {str(e)}")
+                yield json.dumps({"success": False, "error": {"message": str(e)}}, ensure_ascii=False) + "\n"
+        
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    except Exception as e:
+        logger.error(f"유통기한 현황 조회 오류: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": {"message": str(e)},
+            "timestamp": datetime.now().isoformat()
+        }), 500
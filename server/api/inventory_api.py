@@ -31,8 +31,8 @@ def get_inventory_controller():
         def get_inventory_status(self):
             return {"status": "unknown", "message": "인벤토리 컨트롤러가 초기화되지 않았습니다."}
         
-        def get_inventory_items(self, category=None, limit=20, offset=0):
-            return []
+        def get_inventory_items(self, category=None, limit=20, cursor=None, search=None):
+            return [], None
             
         def get_inventory_item(self, item_id):
             return None
@@ -91,10 +91,18 @@ def get_inventory_items():
     try:
         category = request.args.get("category")
         limit = request.args.get("limit", default=20, type=int)
-        offset = request.args.get("offset", default=0, type=int)
+        cursor = request.args.get("cursor")
+        search = request.args.get("search", "").strip() or None
         
         controller = get_inventory_controller()
-        items = controller.get_inventory_items(category, limit, offset)
+        try:
+            items, next_cursor = controller.get_inventory_items(category, limit, cursor, search)
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "error": {"message": str(e)},
+                "timestamp": datetime.now().isoformat()
+            }), 400
         
         # None 또는 다른 타입 체크
         if items is None:
@@ -110,6 +118,7 @@ def get_inventory_items():
             "success": True,
             "data": items,
             "total_count": len(items),
+            "next_cursor": next_cursor,
             "timestamp": datetime.now().isoformat()
         })
     except Exception as e:
@@ -0,0 +1,124 @@
+# server/benchmarks/bench_add_item.py
+"""
+ProductItemRepository.add_item 입고 처리량 벤치마크
+
+  legacy:  이전 방식 - 제품 확인 SELECT + MAX(id) SELECT + INSERT (자동 커밋이라 왕복 3회, 동시 실행 시 ID 중복 가능)
+  current: 현재 방식 - 블록 예약 ID + 자동 커밋 INSERT ... SELECT 한 문장, 창고 사용량은
+           product_item 트리거가 갱신 (왕복 1회, 블록마다 예약 왕복 1회)
+
+여러 스레드(분류기)가 동시에 입고할 때의 초당 처리 건수, 아이템당 DB 왕복 수, 중복 ID 수를 출력합니다.
+기본은 config.py 의 DB 설정으로 로컬 MySQL 에 접속하고(벤치마크 행은 끝나면 삭제),
+--standin 을 주면 왕복 지연을 흉내 내는 대체 드라이버를 사용합니다 (대체 드라이버는
+MAX(id)를 계산하지 않으므로 이때 legacy 의 중복 ID 수는 의미가 없고, 트리거의 서버 쪽
+실행 시간도 반영되지 않습니다).
+
+실행: python benchmarks/bench_add_item.py [--threads 4] [--items 500] [--standin]
+"""
+import argparse
+import importlib
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# db 패키지의 db_connection 속성은 싱글톤 인스턴스이므로 모듈은 importlib로 가져옴
+db_connection_module = importlib.import_module("db.db_connection")
+DBConnection = db_connection_module.DBConnection
+from db.repository import ProductItemRepository
+from benchmarks.standin_mysql import StandInConnection, install
+
+PRODUCT_ID = "01"
+WAREHOUSE_ID = "A"
+EXP_DATE = "2099-12-31"
+ENTRY_TIME = "2099-01-01 00:00:00"     # 벤치마크 행 표시 (정리 시 이 값으로 삭제)
+
+
+def legacy_add_item(db):
+    """이전 add_item 과 같은 쿼리 순서"""
+    if not db.execute_query("SELECT id FROM product WHERE id = %s", (PRODUCT_ID,)):
+        return None
+
+    result = db.execute_query("SELECT MAX(CAST(id AS UNSIGNED)) FROM product_item")
+    new_id = str(int(result[0][0]) + 1 if result and result[0][0] else 1).zfill(2)
+
+    affected = db.execute_update("""
+        INSERT INTO product_item
+        (id, warehouse_id, product_id, exp, entry_time)
+        VALUES (%s, %s, %s, %s, %s)
+    """, (new_id, WAREHOUSE_ID, PRODUCT_ID, EXP_DATE, ENTRY_TIME))
+    return new_id if affected > 0 else None
+
+
+def run(name, add, threads, items, standin):
+    ids = []
+    ids_lock = threading.Lock()
+    failures = [0]
+
+    def worker():
+        local = []
+        for _ in range(items):
+            try:
+                item_id = add()
+            except RuntimeError:
+                # 이전 방식은 동시 실행 시 같은 ID 로 INSERT 해 기본 키 중복 오류가 남
+                item_id = None
+            if item_id is None:
+                failures[0] += 1
+            else:
+                local.append(item_id)
+        with ids_lock:
+            ids.extend(local)
+
+    round_trips = StandInConnection.round_trips
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total = threads * items
+    duplicates = len(ids) - len(set(ids))
+    line = (f"{name:<8} {total:>6}건 {elapsed:7.2f}s  {total / elapsed:9,.0f} 건/s  "
+            f"실패 {failures[0]}  중복 ID {duplicates}")
+    if standin:
+        line += f"  왕복 {(StandInConnection.round_trips - round_trips) / total:.2f}회/건"
+    print(line)
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="add_item 입고 처리량 벤치마크")
+    parser.add_argument("--threads", type=int, default=4, help="동시 입고 스레드 수 (분류기 수)")
+    parser.add_argument("--items", type=int, default=500, help="스레드당 입고 건수")
+    parser.add_argument("--standin", action="store_true", help="MySQL 대신 대체 드라이버 사용")
+    parser.add_argument("--latency", type=float, default=0.0003, help="대체 드라이버 왕복 지연(초)")
+    args = parser.parse_args()
+
+    if args.standin:
+        # db 패키지를 가져오면서 실제 드라이버로 만든 연결 풀은 버리고 대체 드라이버로 다시 연결
+        install(db_connection_module, args.latency)
+
+    db = DBConnection()
+    if not db.ensure_connection():
+        print("DB 연결 실패 (--standin 으로 대체 드라이버 사용 가능)")
+        return 1
+
+    repo = ProductItemRepository(db)
+    try:
+        legacy = run("legacy", lambda: legacy_add_item(db), args.threads, args.items, args.standin)
+        current = run("current", lambda: repo.add_item(PRODUCT_ID, WAREHOUSE_ID, EXP_DATE, ENTRY_TIME),
+                      args.threads, args.items, args.standin)
+        print(f"처리량 비율 (current/legacy): x{current / legacy:.2f}")
+    finally:
+        if not args.standin:
+            # 창고 사용량(used_capacity)은 트리거가 지운 행만큼 내림
+            db.execute_update("DELETE FROM product_item WHERE entry_time = %s", (ENTRY_TIME,))
+        db.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# server/benchmarks/bench_binary_framing.py
+"""
+텍스트 라인 프로토콜 vs 길이 접두 바이너리 프레임 벤치마크
+
+고빈도 텔레메트리(HEtp 온도, SEir IR 센서)를 같은 의미의 텍스트 스트림과
+바이너리 스트림으로 만들어 recv 크기 청크로 재생하고, 프레임 분리부터
+온도 float 값을 얻기까지의 처리량과 전송 바이트 수를 비교합니다.
+
+실행: python benchmarks/bench_binary_framing.py [--messages 50000] [--chunk 1024]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.frame_decoder import LineFrameDecoder, BinaryFrameDecoder
+from utils.protocol import encode_binary_message
+
+
+def build_messages(count: int, seed: int = 1):
+    """온도 이벤트 80%, IR 이벤트 20% 비율의 텍스트 메시지 목록"""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        if rng.random() < 0.8:
+            temps = (rng.uniform(-25, -18), rng.uniform(0, 8), rng.uniform(15, 25))
+            messages.append("HEtp" + ";".join(f"{t:.1f}" for t in temps))
+        else:
+            messages.append(f"SEir{rng.randint(0, 1)}")
+    return messages
+
+
+def split_chunks(stream: bytes, chunk_size: int):
+    return [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def text_path(chunks):
+    """LineFrameDecoder + 기존 EnvController 방식의 split/float 해석"""
+    decoder = LineFrameDecoder()
+    count = 0
+    checksum = 0.0
+    for data in chunks:
+        for message in decoder.feed(data):
+            content = message[2:]
+            if content.startswith('tp'):
+                temps = [float(t.strip()) for t in content[2:].split(';')]
+                checksum += sum(temps)
+            count += 1
+    return count, checksum
+
+
+def binary_path(chunks):
+    """BinaryFrameDecoder (온도는 디코딩 단계에서 숫자로 전달됨)"""
+    decoder = BinaryFrameDecoder()
+    count = 0
+    checksum = 0.0
+    for data in chunks:
+        for _, _, _, content, values in decoder.feed(data):
+            if content == 'tp':
+                checksum += sum(values)
+            count += 1
+    return count, checksum
+
+
+def run(name, func, chunks, repeat):
+    best = float('inf')
+    count = 0
+    checksum = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count, checksum = func(chunks)
+        best = min(best, time.perf_counter() - start)
+    rate = count / best if best > 0 else 0
+    # 온도 합계는 두 경로가 같은 값을 얻었는지 확인용
+    print(f"{name:<8} {count:>8} msgs  {best * 1000:8.2f} ms  {rate:12,.0f} msgs/s  온도 합계 {checksum:,.1f}")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트/바이너리 프레임 벤치마크")
+    parser.add_argument("--messages", type=int, default=50000, help="재생할 메시지 수")
+    parser.add_argument("--chunk", type=int, default=1024, help="recv 청크 크기")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    messages = build_messages(args.messages)
+    text_stream = "".join(m + "\n" for m in messages).encode('utf-8')
+    binary_stream = b"".join(encode_binary_message(m, seq) for seq, m in enumerate(messages))
+
+    print(f"텍스트   {len(text_stream):>10,} 바이트 ({len(text_stream) / len(messages):.1f} B/msg)")
+    print(f"바이너리 {len(binary_stream):>10,} 바이트 ({len(binary_stream) / len(messages):.1f} B/msg)")
+
+    text_rate = run("text", text_path, split_chunks(text_stream, args.chunk), args.repeat)
+    binary_rate = run("binary", binary_path, split_chunks(binary_stream, args.chunk), args.repeat)
+
+    if text_rate > 0:
+        print(f"처리량 비율 (binary/text): x{binary_rate / text_rate:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# server/benchmarks/bench_db_roundtrip.py
+"""
+쿼리당 연결 확인(ping) 유무에 따른 DB 쿼리 지연 벤치마크
+
+  ping:  이전 방식 - 매 쿼리 전에 is_connected()로 서버에 ping
+         (SELECT 왕복 2회, UPDATE는 실행 후 commit까지 왕복 3회)
+  lazy:  현재 방식 - 바로 실행하고 연결 끊김 예외일 때만 재연결, 자동 커밋 연결이라 commit 없음
+         (SELECT/UPDATE 모두 왕복 1회)
+
+각 방식으로 같은 SELECT 와 UPDATE 를 반복해 쿼리당 지연의 평균/p50/p99 를 출력합니다.
+기본은 config.py 의 DB 설정으로 로컬 MySQL 에 접속하고, --standin 을 주면
+왕복 지연을 흉내 내는 대체 드라이버를 사용합니다.
+
+실행: python benchmarks/bench_db_roundtrip.py [--queries 2000] [--standin --latency 0.0003]
+"""
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# db 패키지의 db_connection 속성은 싱글톤 인스턴스이므로 모듈은 importlib로 가져옴
+db_connection_module = importlib.import_module("db.db_connection")
+DBConnection = db_connection_module.DBConnection
+from benchmarks.standin_mysql import install
+
+
+def measure(run, queries):
+    samples = []
+    for n in range(queries):
+        start = time.perf_counter()
+        run(n)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples):
+    ordered = sorted(samples)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    mean = statistics.fmean(samples)
+    print(f"{name:<13} 평균 {mean:7.3f} ms  p50 {p50:7.3f} ms  p99 {p99:7.3f} ms")
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쿼리당 ping 유무 지연 벤치마크")
+    parser.add_argument("--queries", type=int, default=2000, help="방식별 쿼리 수")
+    parser.add_argument("--standin", action="store_true", help="MySQL 대신 대체 드라이버 사용")
+    parser.add_argument("--latency", type=float, default=0.0003, help="대체 드라이버 왕복 지연(초)")
+    args = parser.parse_args()
+
+    if args.standin:
+        # db 패키지를 가져오면서 실제 드라이버로 만든 연결 풀은 버리고 대체 드라이버로 다시 연결
+        install(db_connection_module, args.latency)
+
+    db = DBConnection()
+    if not db.ensure_connection():
+        print("DB 연결 실패 (--standin 으로 대체 드라이버 사용 가능)")
+        return 1
+
+    def select(n):
+        db.execute_query("SELECT %s", (n,))
+
+    def update(n):
+        db.execute_update("UPDATE warehouse SET used_capacity = used_capacity WHERE warehouse_id = %s",
+                          (n % 4,))
+
+    # 워밍업
+    measure(select, 50)
+    measure(update, 50)
+
+    # 이전 방식: 대여한 연결을 매번 ping 으로 확인한 뒤 실행, 쓰기는 실행 후 commit
+    checkout = db._checkout
+    write = db._write
+
+    def checkout_with_ping():
+        conn = checkout()
+        if conn is not None:
+            conn.raw.is_connected()
+        return conn
+
+    def write_with_commit(conn, *args, **kwargs):
+        result = write(conn, *args, **kwargs)
+        conn.raw.commit()
+        return result
+
+    for name, run in (("SELECT", select), ("UPDATE", update)):
+        db._checkout = checkout_with_ping
+        db._write = write_with_commit
+        ping_mean = report(f"{name} ping", measure(run, args.queries))
+
+        del db._checkout
+        del db._write
+        lazy_mean = report(f"{name} lazy", measure(run, args.queries))
+
+        print(f"{name} 쿼리당 지연 비율 (lazy/ping): x{lazy_mean / ping_mean:.2f}")
+    db.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
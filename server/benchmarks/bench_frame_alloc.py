@@ -0,0 +1,123 @@
+# server/benchmarks/bench_frame_alloc.py
+"""
+카메라 프레임 조립 메모리 할당 벤치마크 (tracemalloc)
+
+카메라 프레임(녹화 폴더 또는 합성 프레임)을 기존 펌웨어 형식의 데이터그램으로 로컬 UDP 소켓에
+보내 놓고, 한 스레드에서 프레임 하나씩 조립해 np.frombuffer 로 디코딩 직전 배열을 만들기까지
+파이썬 힙에 새로 할당된 바이트를 tracemalloc 으로 잽니다 (JPEG 디코딩은 제외).
+
+  legacy: 이전 방식 - recvfrom() + 프레임마다 bytearray(크기) + bytes() 복사 후 np.frombuffer
+  pooled: 현재 방식 - 풀 버퍼에 recvfrom_into(memoryview) + 복사 없이 np.frombuffer
+
+실행: python benchmarks/bench_frame_alloc.py [--frames 녹화폴더] [--rounds 5]
+"""
+import argparse
+import os
+import socket
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.udp_handler import UDPBarcodeHandler, PACKET_SIZE
+from benchmarks.camera_frames import load_frames, send_frame
+
+HOST = "127.0.0.1"
+
+
+def open_pair():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind((HOST, 0))
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
+    receiver.settimeout(1.0)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    return receiver, sender
+
+
+def legacy_frame(receiver):
+    """이전 _receive_loop/_process_image 와 같은 방식으로 프레임 하나 조립"""
+    buffer = bytearray()
+    position = 0
+    expected_size = 0
+    while True:
+        data, addr = receiver.recvfrom(PACKET_SIZE)
+        if data.startswith(b'FRAME_START'):
+            expected_size = int(data.decode().strip().split(':')[1])
+            buffer = bytearray(expected_size)
+            position = 0
+        elif data.startswith(b'FRAME_END'):
+            return np.frombuffer(bytes(buffer[:position]), dtype=np.uint8)
+        elif position + len(data) <= expected_size:
+            buffer[position:position + len(data)] = data
+            position += len(data)
+
+
+class PooledReceiver(UDPBarcodeHandler):
+    """현재 수신 경로를 스레드 없이 한 프레임씩 실행"""
+
+    def __init__(self, receiver):
+        super().__init__(host=HOST, port=0, decode_workers=1, queue_size=1)
+        self.udp_socket = receiver
+
+    def frame(self):
+        while not len(self.frame_queue):
+            self._receive_datagram()
+        frame = self.frame_queue.get(timeout=0)
+        jpg = np.frombuffer(frame.buffer, dtype=np.uint8, count=frame.size)
+        del jpg
+        self.buffer_pool.release(frame.buffer)
+
+
+def run(name, make_receiver, frames, rounds):
+    receiver, sender = open_pair()
+    address = receiver.getsockname()
+    receive_one = make_receiver(receiver)
+
+    # 첫 프레임으로 풀/캐시를 채운 뒤 측정
+    send_frame(sender, address, frames[0])
+    receive_one()
+
+    total = 0
+    peak = 0
+    count = 0
+    elapsed = 0.0
+    tracemalloc.start()
+    try:
+        for _ in range(rounds):
+            for jpg in frames:
+                send_frame(sender, address, jpg)
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                began = time.perf_counter()
+                receive_one()
+                elapsed += time.perf_counter() - began
+                _, frame_peak = tracemalloc.get_traced_memory()
+                total += frame_peak - before
+                peak = max(peak, frame_peak - before)
+                count += 1
+    finally:
+        tracemalloc.stop()
+        receiver.close()
+        sender.close()
+
+    print(f"{name:<7} 프레임 {count:4d}  프레임당 최대 할당 평균 {total / count / 1024:8.1f} KiB  "
+          f"최대 {peak / 1024:8.1f} KiB  조립 {elapsed / count * 1e6:7.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카메라 프레임 조립 메모리 할당 벤치마크")
+    parser.add_argument("--frames", help="녹화한 카메라 프레임(JPEG) 폴더 (없으면 합성 프레임)")
+    parser.add_argument("--rounds", type=int, default=5, help="프레임 목록 반복 횟수")
+    args = parser.parse_args()
+
+    frames, _ = load_frames(args.frames)
+    print(f"프레임 {len(frames)}개 (평균 {sum(map(len, frames)) // len(frames):,} 바이트)")
+
+    run("legacy", lambda receiver: (lambda: legacy_frame(receiver)), frames, args.rounds)
+    run("pooled", lambda receiver: PooledReceiver(receiver).frame, frames, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# server/benchmarks/bench_frame_decoder.py
+"""
+TCP 수신 프레임 디코더 마이크로 벤치마크
+
+분류기/환경제어 ESP32가 보내는 메시지 버스트(SEir1, SEbc..., SEss..., HEtp...)를
+recv(1024) 크기 청크로 잘라 재생하고, 기존 bytes 누적 + split 방식과
+LineFrameDecoder의 처리량을 비교합니다.
+
+실행: python benchmarks/bench_frame_decoder.py [--lines 20000] [--chunk 1024]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.frame_decoder import LineFrameDecoder
+
+# 컨베이어 가동 중 캡처한 메시지 버스트 (순서 그대로 반복 재생)
+CAPTURED_BURST = [
+    b"SEir1",
+    b"HEtp-18.5;4.2;21.3",
+    b"SEbc1012605301",
+    b"HEwA0",
+    b"SEir1",
+    b"HEtp-18.4;4.2;21.4",
+    b"SEssA",
+    b"HEAC2",
+    b"SEbc2052507151",
+    b"SEir1",
+    b"HEtp-18.4;4.3;21.4",
+    b"SEssB",
+    b"SRok",
+    b"HEtp-18.3;4.3;21.5",
+    b"SEbc3112606011",
+    b"SEssC",
+]
+
+
+def build_stream(lines: int) -> bytes:
+    """캡처 버스트를 지정한 줄 수만큼 반복한 바이트 스트림 생성"""
+    burst = b"\n".join(CAPTURED_BURST) + b"\n"
+    repeat = lines // len(CAPTURED_BURST) + 1
+    return burst * repeat
+
+
+def split_chunks(stream: bytes, chunk_size: int):
+    return [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def legacy_decode(chunks):
+    """기존 TCPHandler._process_data 방식 (bytes 누적 + split 반복)"""
+    buffer = b""
+    count = 0
+    for data in chunks:
+        buffer += data
+        while b'\n' in buffer:
+            message, buffer = buffer.split(b'\n', 1)
+            if message:
+                message.decode('utf-8')
+                count += 1
+    return count
+
+
+def decoder_decode(chunks):
+    """LineFrameDecoder 방식"""
+    decoder = LineFrameDecoder()
+    count = 0
+    for data in chunks:
+        count += len(decoder.feed(data))
+    return count
+
+
+def run(name, func, chunks, repeat):
+    best = float('inf')
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func(chunks)
+        best = min(best, time.perf_counter() - start)
+    rate = count / best if best > 0 else 0
+    print(f"{name:<10} {count:>8} msgs  {best * 1000:8.2f} ms  {rate:12,.0f} msgs/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TCP 프레임 디코더 벤치마크")
+    parser.add_argument("--lines", type=int, default=20000, help="재생할 메시지 수")
+    parser.add_argument("--chunk", type=int, default=1024, help="recv 청크 크기")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    stream = build_stream(args.lines)
+    chunks = split_chunks(stream, args.chunk)
+    print(f"스트림 {len(stream):,} 바이트, 청크 {len(chunks):,}개 (청크 크기 {args.chunk})")
+
+    legacy_rate = run("legacy", legacy_decode, chunks, args.repeat)
+    decoder_rate = run("decoder", decoder_decode, chunks, args.repeat)
+
+    if legacy_rate > 0:
+        print(f"처리량 향상: x{decoder_rate / legacy_rate:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# server/benchmarks/bench_qr_detect.py
+"""
+QR 인식 모드별 처리 속도/인식률 벤치마크
+
+녹화한 컨베이어 프레임 폴더(--frames, *.jpg 이름 순) 또는 합성 프레임을 순서대로 한 스레드에서
+JPEG 디코딩 + QR 인식하고, 인식 모드(utils/qr_scanner.py)별로 초당 처리 프레임 수와
+인식률(recall), 인식 단계(ROI/축소 전체/원본 전체/실패) 분포를 출력합니다.
+
+  full:       컬러 원본 해상도 + 전체 프레임 인식 (기존 방식)
+  fast:       1/2 흑백 축소 디코딩 + 직전 QR 영역(ROI) 우선, 놓치면 축소 프레임 전체
+  fast_multi: fast + 전체 인식에 detectAndDecodeMulti
+  +full_res:  축소 프레임으로 놓친 프레임을 원본 해상도로 다시 인식 (full_res_fallback)
+
+처리 속도는 QR이 있는 프레임(인식 경로)과 QR이 없는 프레임(실패 경로)을 따로 냅니다.
+컨베이어 프레임은 대부분 QR이 없으므로 실패 경로 속도가 실제 부하를 좌우합니다.
+QR이 없는 프레임은 합성이면 빈 컨베이어 프레임(--blank개), 녹화면 full 모드가 읽지 못한 프레임입니다.
+
+인식률 기준은 합성 프레임이면 그린 QR 값, 녹화 프레임이면 full 모드가 읽은 값입니다.
+
+실행: python benchmarks/bench_qr_detect.py [--frames 녹화폴더] [--count 60] [--blank 30] [--rounds 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.qr_scanner import (QRScanner, QRRegionTracker, DETECT_MODE_FULL, DETECT_MODE_FAST,
+                              DETECT_MODE_FAST_MULTI, STAGES, STAGE_MISS)
+from benchmarks.camera_frames import load_frames, blank_frames
+
+CAMERA = "bench"
+
+# (이름, 인식 모드, full_res_fallback)
+VARIANTS = (
+    ("full", DETECT_MODE_FULL, False),
+    ("fast", DETECT_MODE_FAST, False),
+    ("fast+full_res", DETECT_MODE_FAST, True),
+    ("fast_multi", DETECT_MODE_FAST_MULTI, False),
+    ("fast_multi+full_res", DETECT_MODE_FAST_MULTI, True),
+)
+
+
+def scan_all(mode, full_res_fallback, frames, rounds):
+    """(프레임별 인식 결과 목록, 프레임별 평균 초, 단계별 횟수) 반환 - 결과는 첫 바퀴만 기록"""
+    scanner = QRScanner(QRRegionTracker(), full_res_fallback)
+    arrays = [np.frombuffer(jpg, dtype=np.uint8) for jpg in frames]
+    stages = {stage: 0 for stage in STAGES}
+    results = []
+    elapsed = [0.0] * len(arrays)
+    for round_index in range(rounds):
+        for index, jpg in enumerate(arrays):
+            began = time.perf_counter()
+            img = scanner.decode(jpg, mode)
+            codes, _, stage = scanner.detect(img, CAMERA, mode, jpg) if img is not None else ([], None, STAGE_MISS)
+            elapsed[index] += time.perf_counter() - began
+            stages[stage] += 1
+            if round_index == 0:
+                results.append(codes)
+    return results, [seconds / rounds for seconds in elapsed], stages
+
+
+def fps(seconds):
+    return f"{len(seconds) / sum(seconds):7.1f} fps" if seconds else "      -    "
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QR 인식 모드별 속도/인식률 벤치마크")
+    parser.add_argument("--frames", help="녹화한 카메라 프레임(JPEG) 폴더 (없으면 합성 프레임)")
+    parser.add_argument("--count", type=int, default=60, help="합성 프레임 수")
+    parser.add_argument("--blank", type=int, default=30, help="QR 없는 합성 프레임 수")
+    parser.add_argument("--rounds", type=int, default=3, help="프레임 목록 반복 횟수")
+    args = parser.parse_args()
+
+    frames, expected = load_frames(args.frames, count=args.count)
+    if not args.frames:
+        # 물품 사이 빈 컨베이어 구간
+        frames = frames + blank_frames(args.blank)
+        expected = expected + [None] * args.blank
+    print(f"프레임 {len(frames)}개 (평균 {sum(map(len, frames)) // len(frames):,} 바이트) x {args.rounds}회")
+
+    for name, mode, full_res_fallback in VARIANTS:
+        results, elapsed, stages = scan_all(mode, full_res_fallback, frames, args.rounds)
+        if mode == DETECT_MODE_FULL and args.frames:
+            # 녹화 프레임은 full 모드 결과를 정답으로 사용
+            expected = [codes[0] if codes else None for codes in results]
+
+        targets = [(answer, codes) for answer, codes in zip(expected, results) if answer is not None]
+        hits = sum(1 for answer, codes in targets if answer in codes)
+        recall = hits / len(targets) if targets else 0.0
+        with_qr = [seconds for answer, seconds in zip(expected, elapsed) if answer is not None]
+        without_qr = [seconds for answer, seconds in zip(expected, elapsed) if answer is None]
+        stage_text = " / ".join(f"{stage} {count}" for stage, count in stages.items())
+        print(f"{name:<20} QR 있음 {fps(with_qr)}  QR 없음 {fps(without_qr)}  "
+              f"인식률 {recall * 100:5.1f}% ({hits}/{len(targets)})  [{stage_text}]")
+
+
+if __name__ == '__main__':
+    main()
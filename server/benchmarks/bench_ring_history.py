@@ -0,0 +1,65 @@
+# server/benchmarks/bench_ring_history.py
+"""
+온도 기록 링 파일(utils/ring_history.py) 마이크로 벤치마크
+
+임시 디렉터리에 링 파일을 만들어 초당 1건 기준 --days 일치 측정값을 채운 뒤
+(용량을 넘겨 한 바퀴 돌아간 상태로 만듦), 기록 1건 추가와 최근 1시간/24시간 구간 조회,
+24시간 288구간 min/avg/max 집계에 걸리는 시간을 출력합니다. DB는 사용하지 않습니다.
+
+실행: python benchmarks/bench_ring_history.py [--days 3] [--capacity 172800] [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.ring_history import RingHistory
+
+START_TS = 1_700_000_000
+
+
+def fill(ring, records):
+    began = time.perf_counter()
+    for n in range(records):
+        ring.append(START_TS + n, -18.0 + (n % 600) / 100)
+    return (time.perf_counter() - began) / records
+
+
+def measure(name, call, repeat):
+    """repeat 번 실행해 가장 빠른 1회 시간을 출력"""
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - began)
+    print(f"{name:<26} {best * 1e6:10.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="온도 기록 링 파일 벤치마크")
+    parser.add_argument("--days", type=float, default=3, help="채울 측정값 기간 (일, 초당 1건)")
+    parser.add_argument("--capacity", type=int, default=2 * 86400, help="링 용량 (레코드 수)")
+    parser.add_argument("--repeat", type=int, default=200, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    records = int(args.days * 86400)
+    end = START_TS + records
+    with tempfile.TemporaryDirectory() as directory:
+        ring = RingHistory(os.path.join(directory, "bench.ring"), args.capacity)
+        per_append = fill(ring, records)
+        print(f"레코드 {records:,}건 기록 (용량 {args.capacity:,}, 보관 {len(ring):,}건)")
+        print(f"{'append':<26} {per_append * 1e6:10.2f} µs")
+
+        measure("range 1h", lambda: ring.range(end - 3600, end), args.repeat)
+        measure("range 24h", lambda: ring.range(end - 86400, end), args.repeat)
+        measure("downsample 1h / 60", lambda: ring.downsample(end - 3600, end, 60), args.repeat)
+        measure("downsample 24h / 288", lambda: ring.downsample(end - 86400, end, 300), args.repeat)
+
+        ring.close()
+        del ring
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+# server/benchmarks/bench_sort_ingest.py
+"""
+분류 완료 아이템 저장 방식별 수신 스레드 지연 벤치마크
+
+  sync:   이전 방식 - 수신 스레드에서 add_item 으로 아이템마다 바로 INSERT
+  buffer: 현재 방식 - WriteBehindBuffer 에 넣고 쓰기 스레드가 묶음으로 INSERT
+
+분류 완료(SEss) 하나를 처리할 때 수신 스레드가 막히는 시간의 평균/p99 와,
+모든 아이템이 DB 에 들어갈 때까지의 총 시간, 아이템당 DB 왕복 수를 출력합니다.
+이어서 DB 가 내려간 동안 들어온 아이템이 보관 파일에 쌓였다가 DB 복구 후
+재저장되는지 확인합니다. 기본은 config.py 의 DB 설정으로 로컬 MySQL 에 접속하고
+(벤치마크 행은 끝나면 삭제), --standin 을 주면 왕복 지연을 흉내 내는 대체 드라이버를 사용합니다.
+
+실행: python benchmarks/bench_sort_ingest.py [--items 1000] [--standin]
+"""
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# db 패키지의 db_connection 속성은 싱글톤 인스턴스이므로 모듈은 importlib로 가져옴
+db_connection_module = importlib.import_module("db.db_connection")
+DBConnection = db_connection_module.DBConnection
+from db.repository import ProductItemRepository
+from db.occupancy import WarehouseOccupancy
+from db.write_behind import WriteBehindBuffer
+from benchmarks.standin_mysql import StandInConnection, install
+
+PRODUCT_ID = "01"
+WAREHOUSE_ID = "A"
+EXP_DATE = "2099-12-31"
+ENTRY_TIME = "2099-01-01 00:00:00"     # 벤치마크 행 표시 (정리 시 이 값으로 삭제)
+
+
+def make_record():
+    return {"product_id": PRODUCT_ID, "warehouse_id": WAREHOUSE_ID,
+            "exp_date": EXP_DATE, "entry_time": ENTRY_TIME}
+
+
+def report(name, samples, total_elapsed, items, round_trips, standin):
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    line = (f"{name:<7} 수신 스레드 평균 {statistics.fmean(samples):8.4f} ms  p99 {p99:8.4f} ms  "
+            f"전체 저장 {total_elapsed:6.2f}s")
+    if standin:
+        line += f"  왕복 {round_trips / items:.2f}회/건"
+    print(line)
+    return statistics.fmean(samples)
+
+
+def run_sync(repo, items, standin):
+    samples = []
+    round_trips = StandInConnection.round_trips
+    start = time.perf_counter()
+    for _ in range(items):
+        t = time.perf_counter()
+        repo.add_item(PRODUCT_ID, WAREHOUSE_ID, EXP_DATE, ENTRY_TIME)
+        samples.append((time.perf_counter() - t) * 1000)
+    elapsed = time.perf_counter() - start
+    return report("sync", samples, elapsed, items, StandInConnection.round_trips - round_trips, standin)
+
+
+def run_buffer(repo, items, standin, spill_path):
+    writer = WriteBehindBuffer(repo.add_items, batch_size=20, flush_interval=0.2,
+                               spill_path=spill_path, name="bench-writer")
+    samples = []
+    round_trips = StandInConnection.round_trips
+    start = time.perf_counter()
+    for _ in range(items):
+        t = time.perf_counter()
+        writer.submit(make_record())
+        samples.append((time.perf_counter() - t) * 1000)
+    writer.stop(timeout=60)
+    elapsed = time.perf_counter() - start
+    mean = report("buffer", samples, elapsed, items, StandInConnection.round_trips - round_trips, standin)
+    print(f"        쓰기 버퍼 통계: {writer.get_stats()}")
+    return mean
+
+
+def run_outage(repo, items, spill_path):
+    """DB 다운 중 보관 파일에 쌓인 아이템이 복구 후 재저장되는지 확인 (대체 드라이버 전용)"""
+    writer = WriteBehindBuffer(repo.add_items, batch_size=20, flush_interval=0.05,
+                               spill_path=spill_path, retry_interval=0.2, name="bench-writer")
+    pool = repo.db.pool
+    create = pool.connect_func
+
+    def down():
+        raise ConnectionError("Can't connect to MySQL server")
+
+    # 풀의 연결을 모두 끊고 새 연결도 만들 수 없게 함
+    pool.connect_func = down
+    pool.discard_idle()
+    for _ in range(items):
+        writer.submit(make_record())
+    time.sleep(0.5)
+    spilled = writer.get_stats()["spill_pending"]
+
+    pool.connect_func = create
+    deadline = time.time() + 10
+    while writer.get_stats()["spill_pending"] and time.time() < deadline:
+        time.sleep(0.05)
+    writer.stop()
+
+    stats = writer.get_stats()
+    print(f"outage  DB 다운 중 보관 {spilled}건 -> 복구 후 재저장 {stats['replayed']}건, "
+          f"남은 보관 {stats['spill_pending']}건")
+    return stats["spill_pending"] == 0 and stats["replayed"] == items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분류 완료 아이템 저장 방식 벤치마크")
+    parser.add_argument("--items", type=int, default=1000, help="방식별 아이템 수")
+    parser.add_argument("--standin", action="store_true", help="MySQL 대신 대체 드라이버 사용")
+    parser.add_argument("--latency", type=float, default=0.0003, help="대체 드라이버 왕복 지연(초)")
+    args = parser.parse_args()
+
+    if args.standin:
+        # db 패키지를 가져오면서 실제 드라이버로 만든 연결 풀은 버리고 대체 드라이버로 다시 연결
+        install(db_connection_module, args.latency)
+
+    db = DBConnection()
+    if not db.ensure_connection():
+        print("DB 연결 실패 (--standin 으로 대체 드라이버 사용 가능)")
+        return 1
+
+    repo = ProductItemRepository(db)
+    spill_dir = tempfile.mkdtemp(prefix="bench_sort_ingest_")
+    try:
+        sync = run_sync(repo, args.items, args.standin)
+        buffer = run_buffer(repo, args.items, args.standin, os.path.join(spill_dir, "items.jsonl"))
+        print(f"수신 스레드 지연 비율 (buffer/sync): x{buffer / sync:.3f}")
+        if args.standin:
+            ok = run_outage(repo, min(args.items, 200), os.path.join(spill_dir, "outage.jsonl"))
+            print("보관/재저장 확인:", "OK" if ok else "실패")
+    finally:
+        if not args.standin:
+            db.execute_update("DELETE FROM product_item WHERE entry_time = %s", (ENTRY_TIME,))
+            # 직접 지운 행만큼 창고 사용량(used_capacity)도 맞춤
+            WarehouseOccupancy(db).reconcile()
+        db.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
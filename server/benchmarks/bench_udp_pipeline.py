@@ -0,0 +1,95 @@
+# server/benchmarks/bench_udp_pipeline.py
+"""
+카메라 UDP 수신/디코딩 파이프라인 벤치마크
+
+로컬 포트에 UDPBarcodeHandler를 띄우고 카메라 프레임을 --fps 속도로 재생해
+  inline:   이전 방식 - 수신 스레드가 JPEG 디코딩과 QR 인식까지 직접 수행
+  pipeline: 현재 방식 - 수신 스레드는 조립만, 디코딩 스레드(--workers개)가 인식
+두 방식의 조립 완료/불완전/폐기/인식 프레임 수와 단계별 평균 지연을 비교합니다.
+--cameras 로 카메라 여러 대가 한 포트로 동시에 보내는 상황을 재현합니다 (카메라마다 송신 스레드,
+--protocol v1 이면 헤더 형식, legacy 면 기존 펌웨어 형식을 송신 소켓별로 구분).
+
+실행: python benchmarks/bench_udp_pipeline.py [--fps 20] [--seconds 5] [--workers 2] [--cameras 1]
+                                             [--protocol legacy|v1] [--frames 녹화폴더]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.udp_handler import UDPBarcodeHandler
+from benchmarks.camera_frames import load_frames, replay
+
+HOST = "127.0.0.1"
+
+
+class InlineHandler(UDPBarcodeHandler):
+    """이전 방식 재현 - 조립을 마친 프레임을 수신 스레드에서 바로 처리"""
+
+    def _complete_partial(self, key):
+        super()._complete_partial(key)
+        frame = self.frame_queue.get(timeout=0)
+        if frame is not None:
+            try:
+                self._process_image(frame, self.qr_scanners[0])
+            finally:
+                self.buffer_pool.release(frame.buffer)
+
+    def _decode_loop(self, qr_scanner):
+        return
+
+
+def run(name, handler_class, args, port, frames):
+    handler = handler_class(host=HOST, port=port, decode_workers=args.workers, queue_size=args.queue)
+    if not handler.start():
+        raise SystemExit("UDP 핸들러 시작 실패")
+    try:
+        results = [0] * args.cameras
+        senders = [
+            threading.Thread(target=lambda n: results.__setitem__(
+                n, replay((HOST, port), frames, args.fps, args.seconds, args.protocol, camera_id=n + 1)), args=(n,))
+            for n in range(args.cameras)
+        ]
+        for sender in senders:
+            sender.start()
+        for sender in senders:
+            sender.join()
+        sent = sum(results)
+        time.sleep(0.5)     # 남은 프레임 처리 대기
+    finally:
+        handler.stop()
+
+    stats = handler.get_stats()
+    latency = stats["latency"]
+    print(f"{name:<9} 송신 {sent:4d}  조립 {stats['received']:4d}  불완전 {stats['incomplete']:4d}  "
+          f"폐기 {stats['dropped']:4d}  디코딩 {stats['decoded']:4d}  인식 {stats['recognized']:4d}  "
+          f"(조립 {latency['reassembly']['avg_ms']:.1f} / 대기 {latency['queue_wait']['avg_ms']:.1f} / "
+          f"디코딩 {latency['decode']['avg_ms']:.1f} / 인식 {latency['detect']['avg_ms']:.1f} / "
+          f"전체 {latency['total']['avg_ms']:.1f} ms)")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카메라 UDP 파이프라인 벤치마크")
+    parser.add_argument("--fps", type=float, default=20, help="프레임 송신 속도")
+    parser.add_argument("--seconds", type=float, default=5, help="측정 시간(초)")
+    parser.add_argument("--workers", type=int, default=2, help="pipeline 디코딩 스레드 수")
+    parser.add_argument("--queue", type=int, default=2, help="pipeline 디코딩 대기 프레임 수")
+    parser.add_argument("--cameras", type=int, default=1, help="동시에 송신하는 카메라 수")
+    parser.add_argument("--protocol", choices=("legacy", "v1"), default="legacy", help="데이터그램 형식")
+    parser.add_argument("--frames", help="녹화한 카메라 프레임(JPEG) 폴더 (없으면 합성 프레임)")
+    parser.add_argument("--port", type=int, default=18999, help="벤치마크용 UDP 포트")
+    args = parser.parse_args()
+
+    frames, _ = load_frames(args.frames)
+    print(f"프레임 {len(frames)}개 (평균 {sum(map(len, frames)) // len(frames):,} 바이트), {args.fps} fps x {args.seconds}초, "
+          f"카메라 {args.cameras}대 ({args.protocol})")
+
+    run("inline", InlineHandler, args, args.port, frames)
+    run("pipeline", UDPBarcodeHandler, args, args.port + 1, frames)
+
+
+if __name__ == '__main__':
+    main()
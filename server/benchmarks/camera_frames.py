@@ -0,0 +1,104 @@
+# server/benchmarks/camera_frames.py
+"""
+카메라 UDP 벤치마크용 JPEG 프레임 준비와 송신
+
+--frames 로 녹화한 컨베이어 프레임 폴더(*.jpg)를 주면 그 파일들을 이름 순으로 사용하고,
+없으면 640x480 회색 배경 위에 분류기 바코드 형식의 QR 코드가 컨베이어를 따라 지나가는
+프레임을 만들어 씁니다 (frame 번호별 정답 QR 값은 expected 목록으로 함께 반환).
+"""
+import glob
+import os
+import socket
+import time
+
+import cv2
+import numpy as np
+
+from utils.udp_handler import encode_frame_datagrams
+
+FRAME_WIDTH = 640
+FRAME_HEIGHT = 480
+FRAMES_PER_ITEM = 10        # 합성 프레임에서 물품 하나가 화면을 지나가는 프레임 수
+CHUNK_SIZE = 1024           # ESP32-CAM 펌웨어의 UDP 청크 크기 (Esp_camera_test.ino packet_size)
+
+
+def load_frames(directory=None, count=30, jpeg_quality=80):
+    """(JPEG 바이트 목록, 정답 QR 값 목록) 반환 - 녹화 프레임은 정답을 알 수 없으므로 None"""
+    if directory:
+        paths = sorted(glob.glob(os.path.join(directory, "*.jpg")) + glob.glob(os.path.join(directory, "*.jpeg")))
+        if not paths:
+            raise SystemExit(f"{directory} 에 JPEG 파일이 없습니다.")
+        frames = []
+        for path in paths:
+            with open(path, "rb") as f:
+                frames.append(f.read())
+        return frames, [None] * len(frames)
+
+    # 물품 하나가 FRAMES_PER_ITEM 프레임 동안 컨베이어를 따라 왼쪽에서 오른쪽으로 지나감
+    rng = np.random.default_rng(0)
+    encoder = cv2.QRCodeEncoder.create()
+    frames = []
+    expected = []
+    for n in range(count):
+        item, step = divmod(n, FRAMES_PER_ITEM)
+        code = f"{item % 3 + 1}0{item % 9 + 1}25{item % 12 + 1:02d}{item % 28 + 1:02d}1"
+        qr = cv2.resize(encoder.encode(code), None, fx=5, fy=5, interpolation=cv2.INTER_NEAREST)
+        qr = cv2.copyMakeBorder(qr, 15, 15, 15, 15, cv2.BORDER_CONSTANT, value=255)   # 여백(quiet zone)
+        image = cv2.GaussianBlur(rng.integers(80, 150, (FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8), (0, 0), 2)
+        x = 20 + step * (FRAME_WIDTH - qr.shape[1] - 40) // (FRAMES_PER_ITEM - 1)
+        y = (FRAME_HEIGHT - qr.shape[0]) // 2 + int(rng.integers(-20, 21))
+        image[y:y + qr.shape[0], x:x + qr.shape[1]] = cv2.cvtColor(qr, cv2.COLOR_GRAY2BGR)
+        ok, jpg = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+        frames.append(jpg.tobytes())
+        expected.append(code)
+    return frames, expected
+
+
+def blank_frames(count=30, jpeg_quality=80):
+    """QR이 없는 합성 프레임 (물품 사이 빈 컨베이어 - 인식 실패 경로 측정용)"""
+    rng = np.random.default_rng(1)
+    frames = []
+    for _ in range(count):
+        image = cv2.GaussianBlur(rng.integers(80, 150, (FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8), (0, 0), 2)
+        ok, jpg = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+        frames.append(jpg.tobytes())
+    return frames
+
+
+def send_frame(sock, address, jpg, chunk_size=CHUNK_SIZE):
+    """기존 펌웨어 형식(FRAME_START:<크기> / 원본 청크 / FRAME_END)으로 프레임 하나 송신"""
+    sock.sendto(f"FRAME_START:{len(jpg)}".encode(), address)
+    for offset in range(0, len(jpg), chunk_size):
+        sock.sendto(jpg[offset:offset + chunk_size], address)
+    sock.sendto(b"FRAME_END", address)
+
+
+def send_frame_v1(sock, address, jpg, camera_id, frame_id, chunk_size=CHUNK_SIZE):
+    """버전 1 헤더 형식으로 프레임 하나 송신"""
+    for datagram in encode_frame_datagrams(camera_id, frame_id, jpg, chunk_size):
+        sock.sendto(datagram, address)
+
+
+def replay(address, frames, fps, seconds, protocol="legacy", camera_id=1):
+    """frames를 fps 속도로 seconds초 동안 반복 송신하고 보낸 프레임 수를 반환
+
+    protocol: "legacy"(기존 펌웨어 형식) 또는 "v1"(헤더 형식, camera_id 사용)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    interval = 1.0 / fps
+    sent = 0
+    began = time.perf_counter()
+    try:
+        while time.perf_counter() - began < seconds:
+            jpg = frames[sent % len(frames)]
+            if protocol == "v1":
+                send_frame_v1(sock, address, jpg, camera_id, sent)
+            else:
+                send_frame(sock, address, jpg)
+            sent += 1
+            delay = began + sent * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    finally:
+        sock.close()
+    return sent
@@ -0,0 +1,146 @@
+# server/benchmarks/check_query_plans.py
+"""
+자주 쓰는 조회 쿼리의 실행 계획(EXPLAIN) 확인
+
+리포지토리 메서드가 실제로 보내는 SQL 과 파라미터를 가로채 같은 SQL 을 EXPLAIN 하고,
+마이그레이션으로 만든 인덱스를 쓰는지 확인합니다. 작은 테이블에서는 옵티마이저가 인덱스
+대신 전체 스캔을 고르므로, 확인 전에 표시용 행을 넣고 ANALYZE TABLE 한 뒤 끝나면 지웁니다.
+config.py 의 DB 설정으로 로컬 MySQL 에 접속하며 (마이그레이션 적용 후 실행),
+인덱스를 쓰지 않는 쿼리가 있으면 종료 코드 1 을 반환합니다.
+
+실행: python benchmarks/check_query_plans.py [--rows 5000]
+"""
+import argparse
+import importlib
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# db 패키지의 db_connection 속성은 싱글톤 인스턴스이므로 모듈은 importlib로 가져옴
+db_connection_module = importlib.import_module("db.db_connection")
+DBConnection = db_connection_module.DBConnection
+from db.repository import ProductItemRepository, AccessLogRepository
+from db.occupancy import WarehouseOccupancy
+
+ITEM_ID_PREFIX = "PLAN"                 # 표시용 product_item ID 접두어 (정리 시 이 값으로 삭제)
+CARD_ID_PREFIX = "PLAN-"                # 표시용 access_logs card_id 접두어
+WAREHOUSES = ("A", "B", "C")
+PRODUCTS = {"A": "01", "B": "04", "C": "10"}
+
+
+def insert_rows(db, rows):
+    base = datetime(2099, 1, 1)
+    items = []
+    logs = []
+    for n in range(rows):
+        warehouse = WAREHOUSES[n % len(WAREHOUSES)]
+        items.append((f"{ITEM_ID_PREFIX}{n}", warehouse, PRODUCTS[warehouse],
+                      (base + timedelta(days=n % 3650)).strftime("%Y-%m-%d"),
+                      (base + timedelta(minutes=n)).strftime("%Y-%m-%d %H:%M:%S")))
+        logs.append((f"{CARD_ID_PREFIX}{n % 200}", "plan", "entry" if n % 2 else "exit",
+                     datetime(2020, 1, 1) + timedelta(minutes=n * 7)))
+
+    db.execute_many("""
+        INSERT INTO product_item (id, warehouse_id, product_id, exp, entry_time)
+        VALUES (%s, %s, %s, %s, %s)
+    """, items)
+    db.execute_many("""
+        INSERT INTO access_logs (card_id, employee_name, access_type, timestamp)
+        VALUES (%s, %s, %s, %s)
+    """, logs)
+    db.execute_query("ANALYZE TABLE product_item")
+    db.execute_query("ANALYZE TABLE access_logs")
+
+
+def delete_rows(db):
+    db.execute_update("DELETE FROM product_item WHERE id LIKE %s", (f"{ITEM_ID_PREFIX}%",))
+    db.execute_update("DELETE FROM access_logs WHERE card_id LIKE %s", (f"{CARD_ID_PREFIX}%",))
+
+
+def capture_query(db, call):
+    """리포지토리 메서드를 실행하며 보낸 마지막 SQL과 파라미터를 반환"""
+    captured = []
+    original = db.execute_dict_query
+
+    def recorder(query, params=None):
+        captured.append((query, params))
+        return original(query, params)
+
+    db.execute_dict_query = recorder
+    try:
+        call()
+    finally:
+        del db.execute_dict_query
+    return captured[-1]
+
+
+def second_page(page):
+    """첫 페이지 결과에서 다음 페이지 커서를 꺼냄 (커서 조건이 붙은 SQL을 확인하기 위함)"""
+    _, next_cursor = page
+    return next_cursor
+
+
+def check(db, name, query, params, table, expected_keys):
+    plan = db.execute_dict_query("EXPLAIN " + query, params) or []
+    rows = [row for row in plan if row.get("table") == table]
+    key = rows[0].get("key") if rows else None
+    extra = rows[0].get("Extra") if rows else ""
+    ok = key in expected_keys
+    print(f"{'OK ' if ok else 'NG '} {name:<22} {table}.key={key}  type={rows[0].get('type') if rows else '-'}  {extra or ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자주 쓰는 조회 쿼리의 인덱스 사용 확인")
+    parser.add_argument("--rows", type=int, default=5000, help="확인 전에 넣을 표시용 행 수")
+    args = parser.parse_args()
+
+    db = DBConnection()
+    if not db.ensure_connection():
+        print("DB 연결 실패")
+        return 1
+
+    items = ProductItemRepository(db)
+    access_logs = AccessLogRepository(db)
+
+    cases = [
+        ("get_expiring_items", lambda: items.get_expiring_items(7),
+         "pi", {"idx_product_item_exp"}),
+        ("get_expired_items", lambda: items.get_expired_items(),
+         "pi", {"idx_product_item_exp"}),
+        ("get_expiry_summary", lambda: items.get_expiry_summary(7),
+         "product_item", {"idx_product_item_exp"}),
+        ("get_by_warehouse", lambda: items.get_by_warehouse("A"),
+         "pi", {"idx_product_item_warehouse_exp"}),
+        ("get_all", lambda: items.get_all(limit=20),
+         "pi", {"idx_product_item_entry_time"}),
+        ("get_page", lambda: items.get_page(limit=20, cursor=second_page(items.get_page(limit=20))),
+         "pi", {"idx_product_item_entry_time"}),
+        ("get_page(warehouse)", lambda: items.get_page(limit=20, warehouse_id="B"),
+         "pi", {"idx_product_item_warehouse_entry"}),
+        ("get_logs", lambda: access_logs.get_logs(limit=20, start_date="2020-01-02", end_date="2020-01-03"),
+         "access_logs", {"idx_access_logs_timestamp"}),
+        ("get_last_access", lambda: access_logs.get_last_access(f"{CARD_ID_PREFIX}7"),
+         "access_logs", {"idx_access_logs_card_time"}),
+    ]
+
+    delete_rows(db)
+    insert_rows(db, args.rows)
+    try:
+        results = []
+        for name, call, table, expected_keys in cases:
+            query, params = capture_query(db, call)
+            results.append(check(db, name, query, params, table, expected_keys))
+    finally:
+        delete_rows(db)
+        # 직접 넣고 지운 행 때문에 어긋난 창고 사용량(used_capacity)을 맞춤
+        WarehouseOccupancy(db).reconcile()
+        db.close()
+
+    print(f"인덱스 사용 {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
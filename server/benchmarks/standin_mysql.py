@@ -0,0 +1,135 @@
+# server/benchmarks/standin_mysql.py
+"""
+MySQL 없이 DBConnection 을 돌려보기 위한 대체 드라이버
+
+mysql.connector 연결에서 DBConnection 이 쓰는 메서드(cursor, start_transaction,
+commit, rollback, is_connected, close)만 흉내 냅니다. 서버 왕복마다 latency 초를 기다리고,
+한 연결을 두 스레드가 동시에 쓰면 violations 를 올리며, drop_rate 확률로
+연결이 끊긴 상태가 되어 다음 쿼리에서 ConnectionError 를 냅니다.
+parses 는 서버가 SQL 을 파싱한 횟수(준비문 커서는 SQL 이 바뀔 때만)입니다.
+"""
+import random
+import threading
+import time
+
+
+class StandInCursor:
+    column_names = ("value",)
+
+    def __init__(self, connection, dictionary=False, prepared=False):
+        self.connection = connection
+        self.dictionary = dictionary
+        self.prepared = prepared
+        self.prepared_query = None
+        self.result = []
+        self.rowcount = 0
+        self.lastrowid = None
+
+    def execute(self, query, params=None):
+        # 준비문 커서는 SQL이 바뀔 때만 서버 파싱(PREPARE), 일반 커서는 매번 파싱
+        if not self.prepared or self.prepared_query != query:
+            self.prepared_query = query
+            with StandInConnection.lock:
+                StandInConnection.parses += 1
+        self.connection.round_trip()
+        value = params[0] if params else None
+        self.result = [{"value": value}] if self.dictionary else [(value,)]
+        # 여러 행 INSERT 는 VALUES 의 행 수만큼 들어간 것으로 봄
+        self.rowcount = max(1, query.count("(%s")) if query.lstrip().startswith("INSERT") else 1
+        if "LAST_INSERT_ID(" in query:
+            # id_sequence 블록 예약: 서버 쪽 시퀀스를 올리고 올린 값을 돌려줌
+            with StandInConnection.lock:
+                StandInConnection.sequence += params[0]
+                self.lastrowid = StandInConnection.sequence
+
+    def executemany(self, query, params_list):
+        with StandInConnection.lock:
+            StandInConnection.parses += 1
+        self.connection.round_trip()
+        self.rowcount = len(params_list)
+
+    def fetchall(self):
+        return self.result
+
+    def fetchmany(self, size=1):
+        rows, self.result = self.result[:size], self.result[size:]
+        return rows
+
+    def close(self):
+        pass
+
+
+class StandInConnection:
+    """mysql.connector 연결과 같은 메서드를 가진 대체 연결 (동시 사용 감지)"""
+
+    violations = 0
+    opened = 0
+    round_trips = 0
+    parses = 0
+    sequence = 1
+    lock = threading.Lock()
+
+    def __init__(self, latency=0.001, drop_rate=0.0):
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.busy = False
+        self.alive = True
+        with StandInConnection.lock:
+            StandInConnection.opened += 1
+
+    def round_trip(self):
+        if not self.alive:
+            raise ConnectionError("Lost connection to MySQL server during query")
+        if self.busy:
+            with StandInConnection.lock:
+                StandInConnection.violations += 1
+        self.busy = True
+        try:
+            with StandInConnection.lock:
+                StandInConnection.round_trips += 1
+            time.sleep(self.latency)   # 네트워크 왕복 흉내
+        finally:
+            self.busy = False
+            # 일정 확률로 서버가 연결을 끊은 상황 흉내
+            if self.drop_rate and random.random() < self.drop_rate:
+                self.alive = False
+
+    def cursor(self, dictionary=False, prepared=False):
+        return StandInCursor(self, dictionary, prepared)
+
+    def start_transaction(self, consistent_snapshot=False):
+        self.round_trip()
+
+    def commit(self):
+        self.round_trip()
+
+    def rollback(self):
+        self.round_trip()
+
+    def is_connected(self):
+        # mysql.connector 의 is_connected()도 서버에 ping 을 보냄
+        if not self.alive:
+            return False
+        self.round_trip()
+        return True
+
+    def close(self):
+        self.alive = False
+
+
+def reset_pool(db):
+    """db 패키지를 가져올 때 싱글톤이 만든 연결 풀을 닫음
+
+    다음 ensure_connection()이 그 뒤에 바꾼 풀 크기/연결 함수로 풀을 새로 만듭니다.
+    """
+    if db.pool is not None:
+        db.pool.close()
+    db.pool = None
+    db.connected = False
+
+
+def install(db_connection_module, latency, drop_rate=0.0):
+    """DBConnection 이 대체 드라이버로 연결하게 바꾸고 이미 만든 연결 풀을 버림"""
+    db_connection_module.MYSQL_AVAILABLE = True
+    db_connection_module.DBConnection._create_connection = lambda self: StandInConnection(latency, drop_rate)
+    reset_pool(db_connection_module.DBConnection())
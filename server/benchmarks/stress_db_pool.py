@@ -0,0 +1,118 @@
+# server/benchmarks/stress_db_pool.py
+"""
+DBConnection 연결 풀 동시성 스트레스 테스트
+
+여러 스레드가 execute_query / execute_dict_query / execute_update 를 동시에 호출하면서
+다음을 확인합니다.
+  - 한 연결을 두 스레드가 동시에 쓰지 않는지 (커서 섞임 없음)
+  - 각 쿼리가 자기 파라미터에 대한 결과를 돌려받는지
+  - 열린 연결 수가 풀 크기를 넘지 않는지
+  - 끊긴 연결을 쿼리 오류로 감지해 교체하는지 (조회는 재시도되어 결과가 맞아야 함)
+
+기본은 MySQL 없이 동작하는 대체 드라이버를 사용하고, --mysql 을 주면 config.py 의
+DB 설정으로 실제 MySQL 에 접속합니다.
+
+실행: python benchmarks/stress_db_pool.py [--threads 32] [--queries 200] [--pool 8]
+"""
+import argparse
+import importlib
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# db 패키지의 db_connection 속성은 싱글톤 인스턴스이므로 모듈은 importlib로 가져옴
+db_connection_module = importlib.import_module("db.db_connection")
+DBConnection = db_connection_module.DBConnection
+from benchmarks.standin_mysql import StandInConnection, install, reset_pool
+
+
+# ==== 스트레스 실행 ====
+def worker(db, index, queries, results):
+    ok = errors = mismatches = 0
+    for n in range(queries):
+        token = index * 1_000_000 + n
+        try:
+            kind = n % 3
+            if kind == 0:
+                rows = db.execute_query("SELECT %s", (token,))
+                matched = rows == [(token,)]
+            elif kind == 1:
+                rows = db.execute_dict_query("SELECT %s AS value", (token,))
+                matched = rows == [{"value": token}]
+            else:
+                matched = db.execute_update("UPDATE t SET v = %s", (token,)) == 1
+
+            if matched:
+                ok += 1
+            else:
+                mismatches += 1
+        except RuntimeError:
+            errors += 1
+    results[index] = (ok, errors, mismatches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 연결 풀 동시성 스트레스 테스트")
+    parser.add_argument("--threads", type=int, default=32, help="동시 실행 스레드 수")
+    parser.add_argument("--queries", type=int, default=200, help="스레드당 쿼리 수")
+    parser.add_argument("--pool", type=int, default=8, help="연결 풀 크기")
+    parser.add_argument("--latency", type=float, default=0.001, help="대체 드라이버 쿼리 지연(초)")
+    parser.add_argument("--drop-rate", type=float, default=0.002, help="대체 드라이버 연결 끊김 확률")
+    parser.add_argument("--mysql", action="store_true", help="대체 드라이버 대신 실제 MySQL 사용")
+    args = parser.parse_args()
+
+    # db 패키지를 가져오면서 싱글톤이 이미 기본 설정(실제 드라이버, 기본 풀 크기)으로 풀을 만들었으므로
+    # 바꾼 뒤 그 풀을 버리고 다시 연결
+    db_connection_module.DB_POOL_SIZE = args.pool
+
+    if args.mysql:
+        reset_pool(DBConnection())
+    else:
+        install(db_connection_module, args.latency, args.drop_rate)
+
+    db = DBConnection()
+    if not db.ensure_connection():
+        print("DB 연결 실패")
+        return 1
+
+    results = {}
+    threads = [threading.Thread(target=worker, args=(db, i, args.queries, results))
+               for i in range(args.threads)]
+
+    peak_open = 0
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    while any(t.is_alive() for t in threads):
+        peak_open = max(peak_open, db.pool.get_stats()["open"])
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    ok = sum(r[0] for r in results.values())
+    errors = sum(r[1] for r in results.values())
+    mismatches = sum(r[2] for r in results.values())
+    total = args.threads * args.queries
+    stats = db.pool.get_stats()
+
+    print(f"쿼리 {total:,}건 / {elapsed:.2f}s ({total / elapsed:,.0f} q/s)")
+    print(f"성공 {ok:,}  오류 {errors:,}  결과 불일치 {mismatches:,}")
+    print(f"최대 동시 연결 {peak_open} / 풀 크기 {stats['size']}")
+    print(f"풀 지표: {stats}")
+    print(f"준비문 캐시: {db.get_statement_stats()}")
+    if not args.mysql:
+        print(f"연결 동시 사용 감지 {StandInConnection.violations}회, 생성된 연결 {StandInConnection.opened}개, "
+              f"SQL 파싱 {StandInConnection.parses:,}회")
+
+    db.close()
+
+    failed = mismatches > 0 or peak_open > stats["size"]
+    if not args.mysql:
+        failed = failed or StandInConnection.violations > 0
+    print("결과:", "실패" if failed else "통과")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,6 +21,22 @@ DEBUG = False\
 # ===== UDP 설정 =====
 UDP_HOST = "0.0.0.0"  # 모든 인터페이스에서 수신
 UDP_PORT = 8999
+UDP_DECODE_WORKERS = 2      # 카메라 프레임 JPEG 디코딩/QR 인식 스레드 수
+UDP_FRAME_QUEUE_SIZE = 2    # 디코딩 대기 프레임 수 (넘치면 같은 카메라의 가장 오래된 프레임 폐기 - 카메라 수 이상 권장)
+UDP_FRAME_BUFFER_SIZE = 128 * 1024  # 재사용 프레임 버퍼 크기 (이보다 큰 JPEG만 버퍼를 새로 할당)
+UDP_FRAME_TIMEOUT = 0.5     # 이 시간(초) 동안 조각이 오지 않은 조립 중 프레임 폐기
+UDP_MAX_PARTIAL_FRAMES = 8  # 동시에 조립하는 최대 프레임 수 (카메라 여러 대 + 순서 바뀐 프레임)
+# QR 인식 모드 (benchmarks/bench_qr_detect.py 합성 프레임 인식률, 1/2 축소 후 QR 한 변 약 60px):
+#   "full"       원본 해상도 전체 프레임 - 98.3%
+#   "fast"       1/2 흑백 축소 + 직전 QR 영역 우선, 놓치면 축소 전체 - 83.3%
+#   "fast_multi" 1/2 흑백 축소 전체를 매번 detectAndDecodeMulti (한 프레임에 QR 여러 개) - 16.7%
+#                (UDP_DETECT_FULL_RES_FALLBACK을 켜면 91.7%, 대신 QR 없는 프레임이 full보다 느림)
+# fast는 QR이 축소 후에도 충분히 크게 찍히는 카메라에서만 켬 (작게 찍히면 처음 보이는 프레임을 놓침)
+UDP_DETECT_MODE = "full"
+UDP_DETECT_MODE_BY_CAMERA = {
+    # "1": "fast",  # 카메라 ID(버전 1 헤더) 또는 송신 IP(기존 펌웨어)별 모드
+}
+UDP_DETECT_FULL_RES_FALLBACK = False  # fast 계열에서 축소 프레임으로 놓치면 원본 해상도로 다시 인식 (QR 없는 프레임이 느려짐)
 
 # 데이터베이스 설정
 DB_HOST = "localhost"
@@ -29,6 +45,15 @@ DB_USER = "root"
 DB_PASSWORD = "134679"
 DB_NAME = "rail_db"
 DB_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+DB_POOL_SIZE = 8                  # 연결 풀 최대 연결 수
+DB_POOL_TIMEOUT = 5.0             # 모든 연결이 사용 중일 때 대여 대기 시간(초)
+DB_POOL_MAX_LIFETIME = 1800       # 연결 최대 수명(초) - 지나면 대여 시 재생성
+DB_POOL_KEEPALIVE_INTERVAL = 60  # 이 시간(초) 이상 쉰 유휴 연결을 백그라운드에서 확인 (0이면 끔)
+DB_STATEMENT_CACHE_SIZE = 64      # 연결별 준비문 캐시 크기 (SQL 텍스트 기준 LRU, 0이면 끔)
+DB_STATEMENT_MAX_PARAMS = 16      # 자리표시자가 이보다 많은 SQL은 캐시하지 않음 (행 수만큼 늘어나는 다중 행 SQL)
+DB_ID_BLOCK_SIZE = 50             # id_sequence 테이블에서 한 번에 예약하는 ID 수
+DB_STREAM_BATCH_SIZE = 500        # stream_query가 서버에서 한 번에 읽어 오는 행 수
+OCCUPANCY_RECONCILE_INTERVAL = 600  # 창고 사용량(used_capacity)과 실제 아이템 수 점검 주기(초, 0이면 끔)
 
 # ===== TCP 하드웨어 통신 설정 =====
 TCP_PORT = 9000
@@ -38,6 +63,48 @@ HARDWARE_IP = {
     'access_controller': '192.168.0.20'
 }
 
+# ===== TCP I/O 엔진 설정 =====
+# "thread": 클라이언트 소켓마다 수신 스레드 생성 (기존 방식)
+# "selector": 단일 selectors 이벤트 루프에서 모든 디바이스 소켓 처리
+TCP_IO_ENGINE = "thread"
+TCP_SELECT_TIMEOUT = 0.5  # 이벤트 루프 대기 시간(초) - 종료 플래그 확인 주기
+
+# ===== TCP 송신 큐 설정 =====
+# 연결마다 송신 큐를 두고 전용 송신 스레드(thread) 또는 이벤트 루프(selector)가 비움
+# 오버플로 정책: "reject"(새 메시지 거부), "drop_oldest"(가장 오래된 메시지 폐기),
+#               "coalesce"(같은 명령의 대기 메시지를 최신 값으로 교체)
+TCP_SEND_QUEUE_SIZE = 64
+TCP_SEND_OVERFLOW_POLICY = "reject"
+TCP_SEND_OVERFLOW_POLICY_BY_DEVICE = {
+    'H': "coalesce",  # 환경제어: 설정 온도는 최신 값만 의미 있음
+}
+TCP_SEND_TIMEOUT = 2.0  # 이 시간(초) 동안 쓸 수 없는 연결은 끊음
+
+# ===== 명령 응답(ack) 설정 =====
+# 연결로 보낸 명령('C')은 보낸 순서대로 그 연결의 다음 'R'/'X' 응답과 짝지어짐
+# (send_command()는 응답 결과를 기다리고, 재전송은 처음 보낸 연결로만)
+TCP_COMMAND_TIMEOUT = 1.0          # 응답 제한 시간(초)
+TCP_COMMAND_RETRIES = 2            # 응답이 없을 때 재전송 횟수
+TCP_TIMER_TICK = 0.05             # 타이머 휠 틱 / 제한 시간 확인 주기(초)
+
+# ===== 디바이스 연결 생존 확인 =====
+# TCP keepalive: 유휴 TCP_KEEPALIVE_IDLE초 후 TCP_KEEPALIVE_INTERVAL초 간격으로 TCP_KEEPALIVE_COUNT회 확인
+TCP_KEEPALIVE_IDLE = 5
+TCP_KEEPALIVE_INTERVAL = 1
+TCP_KEEPALIVE_COUNT = 3
+TCP_USER_TIMEOUT_MS = 3000  # 보낸 데이터가 이 시간(ms) 동안 ACK되지 않으면 연결 종료 (0: 사용 안 함)
+# 애플리케이션 하트비트: 수신이 TCP_HEARTBEAT_INTERVAL초 없으면 'xChb' 전송,
+# TCP_HEARTBEAT_TIMEOUT초 동안 아무것도 받지 못하면 연결 종료 후 device/connection 이벤트 발송
+# 응답 펌웨어가 확인된 디바이스만 켬 - 응답하지 않는 펌웨어는 연결이 반복해서 끊김
+# (firmware/modules의 Env/Gate 컨트롤러는 'xRhb' 응답 구현, 분류기 양산 펌웨어는 아직 없음)
+TCP_HEARTBEAT_INTERVAL = 1.0
+TCP_HEARTBEAT_TIMEOUT = 4.0   # 하트비트 여러 주기 - Wi-Fi 순간 끊김, AT 모뎀(Gate) 왕복 지연 감안
+TCP_HEARTBEAT_DEVICES = []    # 예: ['H', 'G']
+
+# ===== 바이너리 프레임 =====
+# 디바이스가 'xCbn1'로 요청하면 해당 연결의 수신을 길이 접두 바이너리 프레임으로 전환 (utils/protocol.py 참고)
+TCP_BINARY_FRAMING = True
+
 # ===== 디바이스 id 자동 매핑 =====
 AUTO_DEVICE_MAPPING = {
     '192.168.232.169': 'S',  # 분류기 ESP32
@@ -77,6 +144,32 @@ def get_warehouse_config():
 
 WAREHOUSES = get_warehouse_config()
 
+# 온도 수집 배치 설정
+ENV_TEMP_BATCH_WINDOW = 1.0   # 온도 배치 창(초) - 창마다 temperature_batch 이벤트 한 번 발송 (0이면 즉시)
+ENV_TEMP_DEADBAND = 0.2       # 마지막 반영 값과 이 값(°C) 미만으로 차이나면 무시
+ENV_TEMP_HYSTERESIS = 0.5     # 범위 이탈 후 복귀 판정 시 범위 안쪽 여유(°C)
+ENV_SET_TEMP_TIMEOUT = 0.5    # 목표 온도 설정 API가 HRok/HXe1 응답을 기다리는 시간(초) - 재전송 없음
+
+# 분류 완료 아이템 묶음 저장 설정 (write-behind)
+SORT_WRITE_BATCH_SIZE = 20          # 이 개수가 모이면 바로 저장
+SORT_WRITE_FLUSH_MS = 200           # 첫 아이템 후 이 시간(ms)이 지나면 모인 만큼 저장
+SORT_WRITE_QUEUE_SIZE = 1000        # 쓰기 큐 최대 길이 (넘치면 보관 파일로 옮김)
+SORT_WRITE_RETRY_INTERVAL = 5.0     # DB 다운 시 보관 파일 재저장 시도 주기(초)
+SORT_WRITE_SPILL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sorted_items.jsonl")
+
+# 온도 기록(시계열) 저장 설정 - 측정값은 쓰기 버퍼로 묶어 저장하고 주기적으로 집계/정리
+TEMP_HISTORY_BATCH_SIZE = 100       # 이 개수가 모이면 바로 저장
+TEMP_HISTORY_FLUSH_MS = 2000        # 첫 측정값 후 이 시간(ms)이 지나면 모인 만큼 저장
+TEMP_HISTORY_QUEUE_SIZE = 5000      # 쓰기 큐 최대 길이 (넘치면 보관 파일로 옮김)
+TEMP_HISTORY_SPILL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "temp_readings.jsonl")
+TEMP_HISTORY_ROLLUP_INTERVAL = 60   # 1분/15분/1시간 집계 및 보관 기간 정리 주기(초, 0이면 끔)
+TEMP_HISTORY_MAX_POINTS = 500       # /api/environment/history 응답 최대 점 수 (해상도 선택 기준)
+
+# 온도 기록 로컬 캐시 (창고별 메모리 맵 링 파일 - DB 없이 최근 추이 조회)
+ENV_HISTORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history")
+ENV_HISTORY_CAPACITY = 7 * 86400    # 창고별 보관 레코드 수 (초당 1건 기준 7일, 레코드당 12바이트)
+ENV_HISTORY_FLUSH_INTERVAL = 5.0    # 링 파일 변경 내용을 디스크에 반영하는 주기(초)
+
 # ===== 로깅 설정 =====
 LOG_LEVEL = "DEBUG"
 LOG_FILE = "server.log"
@@ -94,10 +187,44 @@ CONFIG = {
     "DB_PASSWORD": DB_PASSWORD,
     "DB_NAME": DB_NAME,
     "DB_URL": DB_URL,
+    "DB_POOL_SIZE": DB_POOL_SIZE,
+    "DB_POOL_TIMEOUT": DB_POOL_TIMEOUT,
+    "DB_POOL_MAX_LIFETIME": DB_POOL_MAX_LIFETIME,
+    "DB_POOL_KEEPALIVE_INTERVAL": DB_POOL_KEEPALIVE_INTERVAL,
+    "DB_STATEMENT_CACHE_SIZE": DB_STATEMENT_CACHE_SIZE,
+    "DB_STATEMENT_MAX_PARAMS": DB_STATEMENT_MAX_PARAMS,
+    "DB_ID_BLOCK_SIZE": DB_ID_BLOCK_SIZE,
+    "DB_STREAM_BATCH_SIZE": DB_STREAM_BATCH_SIZE,
+    "OCCUPANCY_RECONCILE_INTERVAL": OCCUPANCY_RECONCILE_INTERVAL,
     "SERVER_HOST": SERVER_HOST,
     "SERVER_PORT": SERVER_PORT,
     "DEBUG": DEBUG,
+    "UDP_DECODE_WORKERS": UDP_DECODE_WORKERS,
+    "UDP_FRAME_QUEUE_SIZE": UDP_FRAME_QUEUE_SIZE,
+    "UDP_FRAME_BUFFER_SIZE": UDP_FRAME_BUFFER_SIZE,
+    "UDP_FRAME_TIMEOUT": UDP_FRAME_TIMEOUT,
+    "UDP_MAX_PARTIAL_FRAMES": UDP_MAX_PARTIAL_FRAMES,
+    "UDP_DETECT_MODE": UDP_DETECT_MODE,
+    "UDP_DETECT_MODE_BY_CAMERA": UDP_DETECT_MODE_BY_CAMERA,
+    "UDP_DETECT_FULL_RES_FALLBACK": UDP_DETECT_FULL_RES_FALLBACK,
     "TCP_PORT": TCP_PORT,
+    "TCP_IO_ENGINE": TCP_IO_ENGINE,
+    "TCP_SELECT_TIMEOUT": TCP_SELECT_TIMEOUT,
+    "TCP_SEND_QUEUE_SIZE": TCP_SEND_QUEUE_SIZE,
+    "TCP_SEND_OVERFLOW_POLICY": TCP_SEND_OVERFLOW_POLICY,
+    "TCP_SEND_OVERFLOW_POLICY_BY_DEVICE": TCP_SEND_OVERFLOW_POLICY_BY_DEVICE,
+    "TCP_SEND_TIMEOUT": TCP_SEND_TIMEOUT,
+    "TCP_COMMAND_TIMEOUT": TCP_COMMAND_TIMEOUT,
+    "TCP_COMMAND_RETRIES": TCP_COMMAND_RETRIES,
+    "TCP_TIMER_TICK": TCP_TIMER_TICK,
+    "TCP_KEEPALIVE_IDLE": TCP_KEEPALIVE_IDLE,
+    "TCP_KEEPALIVE_INTERVAL": TCP_KEEPALIVE_INTERVAL,
+    "TCP_KEEPALIVE_COUNT": TCP_KEEPALIVE_COUNT,
+    "TCP_USER_TIMEOUT_MS": TCP_USER_TIMEOUT_MS,
+    "TCP_HEARTBEAT_INTERVAL": TCP_HEARTBEAT_INTERVAL,
+    "TCP_HEARTBEAT_TIMEOUT": TCP_HEARTBEAT_TIMEOUT,
+    "TCP_HEARTBEAT_DEVICES": TCP_HEARTBEAT_DEVICES,
+    "TCP_BINARY_FRAMING": TCP_BINARY_FRAMING,
     "HARDWARE_IP": HARDWARE_IP,
     "MULTI_PORT_MODE": MULTI_PORT_MODE,
     "TCP_PORTS": TCP_PORTS,
@@ -105,6 +232,24 @@ CONFIG = {
     "SOCKETIO_PING_INTERVAL": SOCKETIO_PING_INTERVAL,
     "SOCKETIO_ASYNC_MODE": SOCKETIO_ASYNC_MODE,
     "WAREHOUSES": WAREHOUSES,
+    "ENV_TEMP_BATCH_WINDOW": ENV_TEMP_BATCH_WINDOW,
+    "ENV_TEMP_DEADBAND": ENV_TEMP_DEADBAND,
+    "ENV_TEMP_HYSTERESIS": ENV_TEMP_HYSTERESIS,
+    "ENV_SET_TEMP_TIMEOUT": ENV_SET_TEMP_TIMEOUT,
+    "SORT_WRITE_BATCH_SIZE": SORT_WRITE_BATCH_SIZE,
+    "SORT_WRITE_FLUSH_MS": SORT_WRITE_FLUSH_MS,
+    "SORT_WRITE_QUEUE_SIZE": SORT_WRITE_QUEUE_SIZE,
+    "SORT_WRITE_RETRY_INTERVAL": SORT_WRITE_RETRY_INTERVAL,
+    "SORT_WRITE_SPILL_FILE": SORT_WRITE_SPILL_FILE,
+    "TEMP_HISTORY_BATCH_SIZE": TEMP_HISTORY_BATCH_SIZE,
+    "TEMP_HISTORY_FLUSH_MS": TEMP_HISTORY_FLUSH_MS,
+    "TEMP_HISTORY_QUEUE_SIZE": TEMP_HISTORY_QUEUE_SIZE,
+    "TEMP_HISTORY_SPILL_FILE": TEMP_HISTORY_SPILL_FILE,
+    "TEMP_HISTORY_ROLLUP_INTERVAL": TEMP_HISTORY_ROLLUP_INTERVAL,
+    "TEMP_HISTORY_MAX_POINTS": TEMP_HISTORY_MAX_POINTS,
+    "ENV_HISTORY_DIR": ENV_HISTORY_DIR,
+    "ENV_HISTORY_CAPACITY": ENV_HISTORY_CAPACITY,
+    "ENV_HISTORY_FLUSH_INTERVAL": ENV_HISTORY_FLUSH_INTERVAL,
     "LOG_LEVEL": LOG_LEVEL,
     "LOG_FILE": LOG_FILE,
     "LOG_MAX_SIZE": LOG_MAX_SIZE,
@@ -1,9 +1,14 @@
 import logging
 from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime
+import threading
 import time
 from config import CONFIG
 from utils.protocol import create_message, parse_message, DEVICE_WAREHOUSE, MSG_COMMAND
+from db import temperature_history
+from db.temperature_history import to_centi
+from db.write_behind import WriteBehindBuffer
+from utils.ring_history import WarehouseRingHistory
 
 
 logger = logging.getLogger(__name__)
@@ -49,8 +54,44 @@ class EnvController:
                 "fan_mode": self.FAN_OFF,
                 "fan_speed": 0,
                 "warning": False,
+                "in_range": True,
                 "type": None
             }
+        
+        # 온도 배치 처리 설정
+        self.batch_window = CONFIG.get("ENV_TEMP_BATCH_WINDOW", 1.0)
+        self.deadband = CONFIG.get("ENV_TEMP_DEADBAND", 0.2)
+        self.hysteresis = CONFIG.get("ENV_TEMP_HYSTERESIS", 0.5)
+        
+        # 배치 창 동안 모인 창고별 최신 온도 (창 종료 시 한 번에 반영)
+        self.pending_temps: Dict[str, float] = {}
+        self.batch_lock = threading.Lock()
+        self.batch_timer: Optional[threading.Timer] = None
+        
+        # 모든 측정값을 온도 기록 저장소에 묶음 저장 (TCP 수신 스레드가 DB 커밋을 기다리지 않음)
+        self.temperature_history = temperature_history
+        self.reading_writer = None
+        if temperature_history is not None:
+            self.reading_writer = WriteBehindBuffer(
+                temperature_history.add_readings,
+                batch_size=CONFIG["TEMP_HISTORY_BATCH_SIZE"],
+                flush_interval=CONFIG["TEMP_HISTORY_FLUSH_MS"] / 1000.0,
+                queue_size=CONFIG["TEMP_HISTORY_QUEUE_SIZE"],
+                spill_path=CONFIG["TEMP_HISTORY_SPILL_FILE"],
+                name="temp-reading-writer"
+            )
+        
+        # DB와 별도로 최근 측정값을 창고별 링 파일에도 기록 (DB가 느리거나 내려가도 추이 조회 가능)
+        self.ring_history = None
+        try:
+            self.ring_history = WarehouseRingHistory(
+                CONFIG["ENV_HISTORY_DIR"],
+                self.warehouses,
+                capacity=CONFIG["ENV_HISTORY_CAPACITY"],
+                flush_interval=CONFIG["ENV_HISTORY_FLUSH_INTERVAL"]
+            )
+        except OSError as e:
+            logger.error(f"온도 기록 링 파일을 열 수 없습니다: {str(e)}")
     
         # DB에서 설정 로드 (기본값 업데이트)
         self._load_warehouse_settings()
@@ -137,8 +178,19 @@ class EnvController:
         value = int(temperature)
         command = f"HCp{warehouse}{value}\n"
         
-        if not self.tcp_handler.send_message("H", command):
-            return {"status": "error", "message": "환경 제어 통신 오류"}
+        # 디바이스 응답(HRok/HXe1)까지 대기 - HTTP 요청 스레드가 오래 묶이지 않도록
+        # 짧은 제한 시간 한 번만 기다리고 재전송하지 않음 (실패하면 사용자가 다시 설정)
+        timeout = CONFIG.get("ENV_SET_TEMP_TIMEOUT", 0.5)
+        future = self.tcp_handler.send_command("H", command, timeout=timeout, retries=0)
+        try:
+            result = future.result(timeout=timeout + 0.5)
+        except Exception:
+            result = {"success": False, "error": "timeout"}
+        
+        if not result["success"]:
+            if result["error"] == "timeout":
+                return {"status": "error", "message": "환경 제어 응답 없음"}
+            return {"status": "error", "message": f"환경 제어 통신 오류: {result['error']}"}
         
         # 내부 상태 업데이트
         self.warehouse_data[warehouse]["target_temp"] = temperature
@@ -232,6 +284,11 @@ class EnvController:
             logger.error("이벤트 메시지에 내용이 없음")
             return False
                 
+        # 바이너리 프레임 온도 이벤트 - 이미 숫자로 해석된 값 사용
+        if message.get('values') is not None and message.get('content') == 'tp':
+            self._apply_temperatures(message['values'])
+            return True
+        
         # raw 또는 content 키에서 메시지 가져오기
         content = message.get('raw', message.get('content', ''))
         
@@ -367,37 +424,123 @@ class EnvController:
             
         try:
             # 세미콜론으로 구분된 온도 값 파싱
-            temps = temp_data.split(';')
-            warehouses = ['A', 'B', 'C']
-            
-            for i, temp_str in enumerate(temps):
-                if i >= len(warehouses):
-                    break
-                    
+            temps = []
+            for temp_str in temp_data.split(';')[:3]:
                 try:
-                    temp = float(temp_str.strip())
-                    warehouse = warehouses[i]
-                    
-                    # 이전 값과 다를 때만 업데이트
-                    if self.warehouse_data[warehouse]["temp"] != temp:
-                        logger.debug(f"온도 업데이트: 창고 {warehouse}, {temp}°C")
-                        self.warehouse_data[warehouse]["temp"] = temp
-                        
-                        # 경고 상태일 때 DB 로깅
-                        if self.warehouse_data[warehouse]["warning"]:
-                            self._log_temperature_warning(warehouse, temp, "warning")
-                        
-                        # 소켓 이벤트 발송
-                        self._emit_event("temperature_update", {
-                            "warehouse_id": warehouse,
-                            "temperature": temp
-                        })
-                        
-                except (ValueError, IndexError):
+                    temps.append(float(temp_str.strip()))
+                except ValueError:
                     logger.warning(f"온도 변환 오류: '{temp_str}'")
+                    temps.append(None)
+            
+            self._apply_temperatures(temps)
         except Exception as e:
             logger.error(f"온도 데이터 처리 오류: {str(e)}")
     
+    def _apply_temperatures(self, temps) -> None:
+        """창고 A, B, C 순서의 온도 값을 배치에 추가 (None은 건너뜀)
+        
+        값은 배치 창(ENV_TEMP_BATCH_WINDOW)이 끝날 때 _flush_temperature_batch()에서
+        한 번에 반영되며, 창 안에서 같은 창고의 값은 최신 값으로 덮어씁니다.
+        """
+        warehouses = ['A', 'B', 'C']
+        
+        # 데드밴드/배치와 관계없이 모든 측정값을 기록
+        ts = int(time.time())
+        for warehouse, temp in zip(warehouses, temps):
+            if temp is None or warehouse not in self.warehouse_data:
+                continue
+            if self.ring_history:
+                self.ring_history.append(warehouse, ts, temp)
+            if self.reading_writer:
+                self.reading_writer.submit({"warehouse_id": warehouse, "ts": ts, "centi": to_centi(temp)})
+        
+        with self.batch_lock:
+            for warehouse, temp in zip(warehouses, temps):
+                if temp is not None and warehouse in self.warehouse_data:
+                    self.pending_temps[warehouse] = temp
+            
+            if not self.pending_temps or self.batch_timer is not None:
+                return
+            
+            timer = None
+            if self.batch_window > 0:
+                timer = threading.Timer(self.batch_window, self._flush_temperature_batch)
+                timer.daemon = True
+                self.batch_timer = timer
+        
+        # 배치 창이 0이면 즉시 반영
+        if timer:
+            timer.start()
+        else:
+            self._flush_temperature_batch()
+    
+    def _flush_temperature_batch(self) -> None:
+        """배치 창 동안 모인 온도를 반영하고 temperature_batch 이벤트 한 번으로 발송"""
+        with self.batch_lock:
+            pending = self.pending_temps
+            self.pending_temps = {}
+            self.batch_timer = None
+        
+        if not pending:
+            return
+        
+        readings = []
+        warning_rows = []
+        
+        for warehouse, temp in pending.items():
+            data = self.warehouse_data[warehouse]
+            in_range = self._check_temp_range(warehouse, temp)
+            
+            # 데드밴드: 마지막 반영 값과의 차이가 작고 범위 상태도 같으면 무시
+            last_temp = data["temp"]
+            if (last_temp is not None and abs(temp - last_temp) < self.deadband
+                    and in_range == data["in_range"]):
+                continue
+            
+            data["temp"] = temp
+            data["in_range"] = in_range
+            readings.append({
+                "warehouse_id": warehouse,
+                "temperature": temp,
+                "in_range": in_range,
+                "warning": data["warning"]
+            })
+            
+            # 경고 상태일 때 DB 로깅 (배치 단위로 한 번에 저장)
+            if data["warning"]:
+                warning_rows.append((warehouse, temp, "warning"))
+        
+        if not readings:
+            return
+        
+        logger.debug(f"온도 배치 반영: {[(r['warehouse_id'], r['temperature']) for r in readings]}")
+        
+        if warning_rows:
+            self._log_temperature_warnings(warning_rows)
+        
+        # 소켓 이벤트 발송 (모든 창고를 이벤트 하나로)
+        self._emit_event("temperature_batch", {
+            "readings": readings,
+            "window_ms": int(self.batch_window * 1000)
+        })
+    
+    def _check_temp_range(self, warehouse: str, temp: float) -> bool:
+        """허용 범위 판정 (히스테리시스 적용)
+        
+        범위를 벗어나면 즉시 이탈로 판정하고, 복귀는 범위 안쪽으로
+        ENV_TEMP_HYSTERESIS 이상 들어와야 인정해 경계값에서의 상태 떨림을 막습니다.
+        """
+        data = self.warehouse_data[warehouse]
+        min_temp, max_temp = data["temp_range"]
+        if min_temp is None or max_temp is None:
+            return True
+        
+        if data["in_range"]:
+            return min_temp <= temp <= max_temp
+        
+        margin = min(self.hysteresis, (max_temp - min_temp) / 2)
+        return min_temp + margin <= temp <= max_temp - margin
+    
     def _log_temperature_warning(self, warehouse: str, temperature: float, status: str) -> bool:
         """온도 경고 로그 저장 (내부 메서드)
         
@@ -417,6 +560,107 @@ class EnvController:
             
         logger.warning(f"온도 경고 로그를 저장할 적절한 메서드를 찾을 수 없습니다. (창고: {warehouse})")
         return False
+    
+    def _log_temperature_warnings(self, rows: List[Tuple[str, float, str]]) -> bool:
+        """온도 경고 로그 일괄 저장 (내부 메서드)
+        
+        일괄 저장을 지원하는 리포지토리면 한 번의 쿼리로, 아니면 한 건씩 저장합니다.
+        """
+        repo = self.warning_log_repo
+        if repo is None and self.db_helper is not None:
+            repo = self.db_helper if hasattr(self.db_helper, 'log_temperature_warning') \
+                else getattr(self.db_helper, 'warning_log_repo', None)
+        
+        if repo is not None and hasattr(repo, 'log_temperature_warnings'):
+            return repo.log_temperature_warnings(rows)
+        
+        results = [self._log_temperature_warning(*row) for row in rows]
+        return all(results)
+    
+    def stop(self) -> None:
+        """배치 타이머 정지 및 남은 온도 반영, 남은 측정값 저장 (서버 종료 시)"""
+        with self.batch_lock:
+            timer = self.batch_timer
+        if timer:
+            timer.cancel()
+        self._flush_temperature_batch()
+        if self.reading_writer:
+            self.reading_writer.stop()
+        if self.ring_history:
+            self.ring_history.close()
+    
+    def get_history(self, warehouse: str, start: int, end: int, max_points: Optional[int] = None) -> Dict[str, Any]:
+        """창고 온도 기록 조회 (구간 길이에 맞는 해상도의 집계 사용)
+        
+        Args:
+            warehouse: 창고 ID
+            start: 시작 시각 (epoch 초)
+            end: 끝 시각 (epoch 초, 포함하지 않음)
+            max_points: 응답 최대 점 수 (기본값 TEMP_HISTORY_MAX_POINTS)
+        """
+        if max_points is None:
+            max_points = CONFIG.get("TEMP_HISTORY_MAX_POINTS", 500)
+        max_points = max(1, max_points)
+        if warehouse not in self.warehouse_data:
+            return {"status": "error", "message": f"알 수 없는 창고: {warehouse}"}
+        if start >= end:
+            return {"status": "error", "message": "시작 시각은 끝 시각보다 앞서야 합니다."}
+        history = None
+        if self.temperature_history is not None:
+            try:
+                history = self.temperature_history.get_history(warehouse, start, end, max_points)
+            except Exception as e:
+                logger.warning(f"DB 온도 기록 조회 실패 - 링 파일 사용: {str(e)}")
+        
+        # DB를 쓸 수 없으면 로컬 링 파일에서 같은 형식으로 응답
+        if history is None:
+            history = self._ring_history_points(warehouse, start, end, max_points)
+        if history is None:
+            return {"status": "error", "message": "온도 기록을 조회할 수 없습니다."}
+        
+        return {
+            "status": "ok",
+            "data": history,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def get_trend(self, warehouse: str, hours: float = 24, points: int = 288) -> Dict[str, Any]:
+        """최근 hours시간 온도 추이 (DB를 거치지 않고 링 파일에서 points개 구간의 min/avg/max)"""
+        if warehouse not in self.warehouse_data:
+            return {"status": "error", "message": f"알 수 없는 창고: {warehouse}"}
+        if hours <= 0 or points <= 0:
+            return {"status": "error", "message": "hours와 points는 0보다 커야 합니다."}
+        
+        end = int(time.time()) + 1
+        start = end - int(hours * 3600)
+        history = self._ring_history_points(warehouse, start, end, points)
+        if history is None:
+            return {"status": "error", "message": "온도 기록 링 파일을 사용할 수 없습니다."}
+        
+        return {
+            "status": "ok",
+            "data": history,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _ring_history_points(self, warehouse: str, start: int, end: int, max_points: int) -> Optional[Dict[str, Any]]:
+        """링 파일에서 start ~ end 구간을 max_points개 이하 구간으로 묶어 반환 (링 파일이 없으면 None)"""
+        if not self.ring_history:
+            return None
+        
+        bucket_seconds = max(1, -(-(end - start) // max_points))
+        points = self.ring_history.downsample(warehouse, start, end, bucket_seconds)
+        if points is None:
+            return None
+        
+        return {
+            "warehouse_id": warehouse,
+            "resolution": "local",
+            "bucket_seconds": bucket_seconds,
+            "start": start,
+            "end": end,
+            "points": points
+        }
         
     def _set_warning_status(self, warehouse: str, warning_status: bool) -> None:
         """경고 상태 설정"""
@@ -508,7 +752,8 @@ class EnvController:
                 "status": self.warehouse_data[wh]["state"],
                 "fan_mode": self.warehouse_data[wh]["fan_mode"],
                 "fan_speed": self.warehouse_data[wh]["fan_speed"],
-                "warning": self.warehouse_data[wh]["warning"]
+                "warning": self.warehouse_data[wh]["warning"],
+                "in_range": self.warehouse_data[wh]["in_range"]
             }
         
         return {
@@ -532,7 +777,8 @@ class EnvController:
                 "status": self.warehouse_data[warehouse]["state"],
                 "fan_mode": self.warehouse_data[warehouse]["fan_mode"],
                 "fan_speed": self.warehouse_data[warehouse]["fan_speed"],
-                "warning": self.warehouse_data[warehouse]["warning"]
+                "warning": self.warehouse_data[warehouse]["warning"],
+                "in_range": self.warehouse_data[warehouse]["in_range"]
             },
             "timestamp": datetime.now().isoformat()
         }
@@ -1,7 +1,6 @@
 import json
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
 
 class ExpiryController:
     """유통기한 관리 컨트롤러 클래스
@@ -27,6 +26,14 @@ class ExpiryController:
     def get_expired_items(self) -> List[Dict]:
         """유통기한 만료 물품을 조회합니다."""
         return self.product_item_repo.get_expired_items()
+    
+    def get_expiry_summary(self, days_threshold: int = 7) -> Optional[Dict]:
+        """창고별 유통기한 경과/오늘 만료/임박 개수를 조회합니다."""
+        return self.product_item_repo.get_expiry_summary(days_threshold)
+    
+    def iter_expiry_items(self, days_threshold: int = 7, warehouse_id: Optional[str] = None) -> Iterator[Dict]:
+        """유통기한 경과/임박 물품을 유통기한 순으로 하나씩 반환합니다."""
+        return self.product_item_repo.iter_expiry_items(days_threshold, warehouse_id)
         
     def process_expired_item(self, item_id: str, action: str, description: str) -> bool:
         # 직접 repository 사용
@@ -53,41 +60,19 @@ class ExpiryController:
         
     def check_expiry_dates(self):
         """모든 물품의 유통기한을 검사합니다."""
-        today = datetime.now().date()
-        
-        # 데이터베이스에서 모든 물품 조회
-        all_items = self.product_item_repo.get_all()
-        
-        expired_items = []
-        today_items = []
-        upcoming_items = []
-        
-        for item in all_items:
-            # product_item_repo의 결과는 'exp' 필드를 사용합니다
-            exp_date = item['exp']
-            days_remaining = (exp_date - today).days
-            
-            # 상태 업데이트
-            if days_remaining < 0:
-                item["status"] = "expired"
-                expired_items.append(item)
-            elif days_remaining == 0:
-                item["status"] = "danger"
-                today_items.append(item)
-            elif days_remaining <= 7:
-                item["status"] = "warning"
-                upcoming_items.append(item)
-            else:
-                item["status"] = "normal"
-                
-            item["days_remaining"] = days_remaining
+        # 창고별 개수를 DB에서 한 번에 집계 (물품 목록은 가져오지 않음)
+        summary = self.get_expiry_summary(7)
+        if summary is None:
+            self.logger.warning("유통기한 현황을 집계할 수 없습니다.")
+            return
         
         # 상태 데이터 생성
         status_data = {
-            "expired_count": len(expired_items),
-            "today_count": len(today_items),
-            "upcoming_count": len(upcoming_items),
-            "reference_date": today.isoformat()
+            "expired_count": summary["expired_count"],
+            "today_count": summary["today_count"],
+            "upcoming_count": summary["upcoming_count"],
+            "warehouses": summary["warehouses"],
+            "reference_date": summary["reference_date"]
         }
         
         # WebSocket으로 상태 브로드캐스트
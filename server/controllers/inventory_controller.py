@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 class InventoryController:
@@ -10,42 +10,18 @@ class InventoryController:
         self.logger = logging.getLogger(__name__)
         
         # db_helper 대신 직접 리포지토리 사용
-        from db import product_item_repo, warehouse_repo
+        from db import product_item_repo, warehouse_repo, warehouse_occupancy
         self.product_item_repo = product_item_repo
         self.warehouse_repo = warehouse_repo
-        
-        # 데이터베이스에서 데이터 로드 시도
-        items = self.product_item_repo.get_all()
-        if items:
-            self.inventory_items = items
-        else:
-            # 기본 항목 설정
-            self.inventory_items = [
-                # 기존 하드코딩된 항목들
-            ]
+        self.occupancy = warehouse_occupancy
         
     def get_inventory_status(self) -> Dict:
         """재고 현황 요약 정보 조회"""
         try:
-            # 창고 정보 가져오기
-            warehouse_info = self.warehouse_repo.get_all()
-            
-            # 창고별 재고 수량 계산
-            count_query = """
-                SELECT warehouse_id, COUNT(*) as count
-                FROM product_item
-                GROUP BY warehouse_id
-            """
-            count_results = self.product_item_repo.db.execute_dict_query(count_query)
-            
-            # 카운트 결과 처리
-            warehouse_counts = {}
-            if count_results:
-                for row in count_results:
-                    wh_id = row["warehouse_id"]
-                    count = row["count"]
-                    warehouse_counts[wh_id] = count
-                    self.logger.info(f"창고 {wh_id}의 물품 수: {count}")
+            # 창고별 용량/재고 수량 (아이템 추가/삭제 시 갱신되는 점유량 캐시 - product_item을 세지 않음)
+            occupancy = self.occupancy.snapshot()
+            warehouse_info = [{"id": wh_id, "capacity": values["capacity"]} for wh_id, values in occupancy.items()]
+            warehouse_counts = {wh_id: values["used"] for wh_id, values in occupancy.items()}
             
             # 창고별 정보 구성
             warehouses = {}
@@ -109,45 +85,27 @@ class InventoryController:
                 }
             }
             
-    def get_inventory_items(self, category: Optional[str] = None, limit: int = 20, offset: int = 0) -> List[Dict]:
-        """재고 물품 목록을 조회합니다."""
-        # 카테고리 필터링
-        filtered_items = self.inventory_items
-        if category:
-            filtered_items = [item for item in self.inventory_items if item["warehouse_id"] == category]
-            
-        # 페이지네이션
-        paginated_items = filtered_items[offset:offset+limit]
-        
-        # 제품명 추가하기 위한 결과 리스트
-        result_items = []
+    def get_inventory_items(self, category: Optional[str] = None, limit: int = 20,
+                            cursor: Optional[str] = None,
+                            search: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """재고 물품 목록을 최근 입고 순으로 한 페이지 조회합니다.
         
-        for item in paginated_items:
-            # 기본 아이템 데이터 복사
-            result_item = item.copy()
-            
-            # 제품 정보 조회 (제품명)
-            try:
-                product_id = item.get("product_id")
-                # product 테이블에서 직접 조회 (join 쿼리 사용)
-                query = """
-                    SELECT p.name
-                    FROM product p
-                    WHERE p.id = %s
-                """
-                product_result = self.product_item_repo.db.execute_dict_query(query, (product_id,))
-                
-                if product_result and len(product_result) > 0:
-                    result_item["product_name"] = product_result[0]["name"]
-                else:
-                    result_item["product_name"] = f"상품-{product_id}"
-            except Exception as e:
-                self.logger.error(f"제품 정보 조회 오류: {str(e)}")
-                result_item["product_name"] = f"상품-{product_id}"
+        Args:
+            category (Optional[str]): 창고 ID 필터
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 응답의 next_cursor (첫 페이지는 None)
+            search (Optional[str]): 상품명 또는 물품 ID 부분 일치 검색어
             
-            result_items.append(result_item)
+        Returns:
+            Tuple[List[Dict], Optional[str]]: (물품 목록, 다음 페이지 커서)
+        """
+        items, next_cursor = self.product_item_repo.get_page(limit, cursor, category, search)
+        
+        # 제품명은 조회 쿼리의 JOIN 결과 사용
+        for item in items:
+            item["product_name"] = item.get("name") or f"상품-{item.get('product_id')}"
                 
-        return result_items
+        return items, next_cursor
         
     def get_inventory_item(self, item_id: str) -> Optional[Dict]:
         """특정 재고 물품을 조회합니다.
@@ -158,11 +116,7 @@ class InventoryController:
         Returns:
             Optional[Dict]: 재고 물품 정보
         """
-        for item in self.inventory_items:
-            if item["item_id"] == item_id:
-                return item
-                
-        return None
+        return self.product_item_repo.get_by_id(item_id)
         
     def handle_message(self, message: Dict):
         """TCP 메시지 처리
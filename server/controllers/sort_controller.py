@@ -5,7 +5,9 @@ import threading
 from typing import Dict, Tuple, Optional, Any
 from datetime import datetime  
 from utils.protocol import *  
+from config import CONFIG
 from db import product_item_repo
+from db.write_behind import WriteBehindBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,19 @@ class SortController:
         if not self.has_db_access:
             logger.warning("DB 리포지토리에 접근할 수 없습니다. 바코드 데이터 저장이 비활성화됩니다.")
 
+        # 분류 완료 아이템은 쓰기 버퍼에 넣고 별도 스레드에서 묶음 저장 (TCP 수신 스레드가 DB 커밋을 기다리지 않음)
+        self.item_writer = None
+        if self.has_db_access:
+            self.item_writer = WriteBehindBuffer(
+                product_item_repo.add_items,
+                batch_size=CONFIG["SORT_WRITE_BATCH_SIZE"],
+                flush_interval=CONFIG["SORT_WRITE_FLUSH_MS"] / 1000.0,
+                queue_size=CONFIG["SORT_WRITE_QUEUE_SIZE"],
+                spill_path=CONFIG["SORT_WRITE_SPILL_FILE"],
+                retry_interval=CONFIG["SORT_WRITE_RETRY_INTERVAL"],
+                name="sort-item-writer"
+            )
+
         # 최근 분류 로그 (최대 20개)
         self.sort_logs = []
         
@@ -168,22 +183,23 @@ class SortController:
                 "error_message": f"분류기 오류: {error_code}"
             })
     def _save_completed_item_to_db(self, zone: str, item_info: dict) -> bool:
-        """분류 완료된 아이템을 DB에 저장
+        """분류 완료된 아이템을 쓰기 버퍼에 넣어 DB에 저장
+        
+        저장은 쓰기 스레드에서 묶음으로 이루어지므로 분류 로그에는 먼저 추가하고,
+        저장이 끝나면 로그의 item_id를 채웁니다.
         
         Args:
             zone: 분류된 존 (A, B, C, E)
             item_info: 바코드 파싱 정보
             
         Returns:
-            bool: 저장 성공 여부
+            bool: 저장 요청 성공 여부
         """
         try:
             # DB 접근 가능 여부 확인
-            if not hasattr(self, 'db_helper') or not self.db_helper:
+            if not hasattr(self, 'db_helper') or not self.db_helper or not self.item_writer:
                 self.logger.warning("DB 연결 없음 - 아이템 저장 무시됨")
                 return False
-                
-            from db import product_item_repo
             
             # 필요한 정보 추출
             product_id = item_info.get('item_code', '00')
@@ -193,31 +209,32 @@ class SortController:
             # 현재 시간을 입고 시간으로 사용
             entry_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            # DB에 저장
-            item_id = product_item_repo.add_item(
-                product_id=product_id,
-                warehouse_id=zone,
-                exp_date=expiry_date,
-                entry_time=entry_time
-            )
-            
-            if item_id:
-                self.logger.info(f"제품 정보 저장 완료: ID={item_id}, 창고={zone}, 바코드={original_barcode}")
-                
-                # 분류 로그에 추가
-                self._add_sort_log({
-                    "item_id": item_id,
-                    "barcode": original_barcode,
-                    "warehouse_id": zone,
-                    "product_id": product_id,
-                    "expiry_date": expiry_date,
-                    "timestamp": datetime.now().isoformat()
-                })
-                
-                return True
-            else:
-                self.logger.error(f"제품 정보 저장 실패: 창고={zone}, 바코드={original_barcode}")
-                return False
+            # 분류 로그에 먼저 추가 (item_id는 저장 후 채움)
+            log_entry = {
+                "item_id": None,
+                "barcode": original_barcode,
+                "warehouse_id": zone,
+                "product_id": product_id,
+                "expiry_date": expiry_date,
+                "timestamp": datetime.now().isoformat()
+            }
+            self._add_sort_log(log_entry)
+            
+            def on_saved(item_id):
+                if item_id:
+                    log_entry["item_id"] = item_id
+                    self.logger.info(f"제품 정보 저장 완료: ID={item_id}, 창고={zone}, 바코드={original_barcode}")
+                else:
+                    self.logger.error(f"제품 정보 저장 실패: 창고={zone}, 바코드={original_barcode}")
+            
+            # 쓰기 버퍼에 추가 (큐가 가득 차면 보관 파일로 옮겨져 나중에 저장됨)
+            self.item_writer.submit({
+                "product_id": product_id,
+                "warehouse_id": zone,
+                "exp_date": expiry_date,
+                "entry_time": entry_time
+            }, on_saved)
+            return True
                 
         except Exception as e:
             self.logger.error(f"분류 완료 아이템 저장 중 오류: {str(e)}")
@@ -358,11 +375,38 @@ class SortController:
         # 프로토콜 형식으로 메시지 생성
         command = create_message(DEVICE_SORTER, MSG_COMMAND, f"{SORT_CMD_SORT}{zone}")
         
-        success = self.tcp_handler.send_message(DEVICE_SORTER, command)
-        if not success:
-            logger.error(f"분류 명령 전송 실패: {zone}")
+        # 응답(SRok)을 기다리지 않고 바로 반환 - 결과는 콜백으로 확인
+        # 중복 분류를 막기 위해 재전송하지 않음
+        future = self.tcp_handler.send_command(
+            DEVICE_SORTER, command, retries=0,
+            callback=lambda result: self._on_sort_command_result(zone, result))
         
-        return success
+        # 연결이 없거나 큐가 가득 차 즉시 실패한 경우만 False
+        return not (future.done() and not future.result()["success"])
+    
+    def _send_control_command(self, name):
+        """시작/정지/일시정지 명령 전송 (응답 SRok은 콜백으로 확인, 같은 상태 명령이므로 재전송 허용)"""
+        command = create_message(DEVICE_SORTER, MSG_COMMAND, name)
+        future = self.tcp_handler.send_command(
+            DEVICE_SORTER, command,
+            callback=lambda result: self._on_control_command_result(name, result))
+        
+        # 연결이 없거나 큐가 가득 차 즉시 실패한 경우만 False
+        return not (future.done() and not future.result()["success"])
+    
+    def _on_control_command_result(self, name, result):
+        """시작/정지/일시정지 명령 응답 콜백"""
+        if result["success"]:
+            logger.debug(f"분류기 명령 응답 수신: {name} ({result['rtt_ms']}ms)")
+        else:
+            logger.error(f"분류기 명령 실패: {name} ({result['error']})")
+    
+    def _on_sort_command_result(self, zone, result):
+        """분류 명령 응답 콜백"""
+        if result["success"]:
+            logger.debug(f"분류 명령 응답 수신: {zone} ({result['rtt_ms']}ms)")
+        else:
+            logger.error(f"분류 명령 실패: {zone} ({result['error']})")
     
     def _add_sort_log(self, item_info):
         """분류 로그 추가"""
@@ -430,8 +474,7 @@ class SortController:
             logger.info("자동 정지: 물품 없음")
             
             # 정지 명령 전송
-            command = create_message(DEVICE_SORTER, MSG_COMMAND, SORT_CMD_STOP)
-            self.tcp_handler.send_message(DEVICE_SORTER, command)
+            self._send_control_command(SORT_CMD_STOP)
             
             # 상태 업데이트
             self.state = self.STATE_STOPPED
@@ -451,9 +494,16 @@ class SortController:
                 "sort_counts": self.sort_counts,
                 "last_updated": time.time()
             },
-            "logs": self.sort_logs[:5]  # 최근 5개 로그만 반환
+            "logs": self.sort_logs[:5],  # 최근 5개 로그만 반환
+            "writer": self.item_writer.get_stats() if self.item_writer else None
         }
     
+    def close(self):
+        """쓰기 버퍼에 남은 아이템 저장 및 타이머 정리 (서버 종료 시)"""
+        self._cancel_auto_stop_timer()
+        if self.item_writer:
+            self.item_writer.stop()
+    
     def start_sorter(self):
         """분류기를 시작 상태로 설정"""
         if self.state == self.STATE_STOPPED or self.state == self.STATE_PAUSED:
@@ -464,13 +514,10 @@ class SortController:
             self._emit_status_update()
             
             # 프로토콜 형식으로 시작 명령 전송
-            command = create_message(DEVICE_SORTER, MSG_COMMAND, SORT_CMD_START)
-            
-            # 디버그 로그 추가 - 문제 확인용
-            logger.info(f"분류기 시작 명령 생성: {command.strip()}")
+            logger.info(f"분류기 시작 명령 생성: {DEVICE_SORTER}{MSG_COMMAND}{SORT_CMD_START}")
             
             # 분류기 디바이스 연결 확인
-            success = self.tcp_handler.send_message(DEVICE_SORTER, command)
+            success = self._send_control_command(SORT_CMD_START)
             
             # 연결되지 않았다면 클라이언트 연결 리스트 출력
             if success:
@@ -491,10 +538,7 @@ class SortController:
             self._cancel_auto_stop_timer()
             
             # 프로토콜 형식으로 일시정지 명령 전송
-            command = create_message(DEVICE_SORTER, MSG_COMMAND, SORT_CMD_PAUSE)  
-            
-            # 명령 전송
-            success = self.tcp_handler.send_message(DEVICE_SORTER, command)
+            success = self._send_control_command(SORT_CMD_PAUSE)
             
             if success:
                 logger.info("분류기 일시정지 명령 전송 성공")
@@ -525,10 +569,7 @@ class SortController:
             self._emit_status_update()
             
             # 프로토콜 형식으로 정지 명령 전송
-            command = create_message(DEVICE_SORTER, MSG_COMMAND, SORT_CMD_STOP)
-            
-            # 명령 전송
-            success = self.tcp_handler.send_message(DEVICE_SORTER, command)
+            success = self._send_control_command(SORT_CMD_STOP)
             
             if success:
                 logger.info("분류기 정지 명령 전송 성공")
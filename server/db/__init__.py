@@ -29,11 +29,20 @@ try:
         ProductItemRepository, EmployeeRepository, AccessLogRepository, 
         WarningLogRepository
     )
+    from .occupancy import WarehouseOccupancy
+    from .temperature_history import TemperatureHistory
+    from config import WAREHOUSES
+    
+    # 창고 점유량 캐시 (아이템 추가/삭제 시 갱신, 점검 작업은 main.py에서 시작)
+    warehouse_occupancy = WarehouseOccupancy(db_connection)
+    
+    # 온도 기록 저장소 (1분/15분/1시간 집계 및 보관 기간 정리 작업은 main.py에서 시작)
+    temperature_history = TemperatureHistory(db_connection, list(WAREHOUSES.keys()))
     
     # 주요 리포지토리 인스턴스 생성
     warehouse_repo = WarehouseRepository(db_connection)
     product_repo = ProductRepository(db_connection)
-    product_item_repo = ProductItemRepository(db_connection)
+    product_item_repo = ProductItemRepository(db_connection, warehouse_occupancy)
     employee_repo = EmployeeRepository(db_connection)
     access_log_repo = AccessLogRepository(db_connection)
     warning_log_repo = WarningLogRepository(db_connection)
@@ -48,7 +57,8 @@ try:
     __all__ = [
         'DBConnection', 'init_database', 'db_connection', 'db_manager',
         'warehouse_repo', 'product_repo', 'product_item_repo', 
-        'employee_repo', 'access_log_repo', 'warning_log_repo'
+        'employee_repo', 'access_log_repo', 'warning_log_repo', 'warehouse_occupancy',
+        'temperature_history'
     ]
     
 except ImportError as e:
@@ -84,6 +94,18 @@ except ImportError as e:
         def get_by_id(self, *args, **kwargs):
             return None
     
+    # 더미 창고 점유량 캐시
+    class DummyOccupancy:
+        """더미 창고 점유량 캐시 클래스"""
+        def snapshot(self):
+            return {}
+            
+        def start_reconcile(self, *args, **kwargs):
+            pass
+            
+        def stop_reconcile(self):
+            pass
+    
     # 더미 초기화 함수
     def init_database(*args, **kwargs):
         return False
@@ -96,6 +118,8 @@ except ImportError as e:
     employee_repo = DummyRepository()
     access_log_repo = DummyRepository()
     warning_log_repo = DummyRepository()
+    warehouse_occupancy = DummyOccupancy()
+    temperature_history = None
     
     # DBManager 가져오기 시도
     try:
@@ -0,0 +1,306 @@
+# db/connection_pool.py
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """풀의 모든 연결이 사용 중이고 대기 시간 안에 반납되지 않음"""
+
+
+class _Waiter:
+    """연결 반납을 기다리는 스레드 하나 (반납 시 conn을 직접 넘겨받음)"""
+    __slots__ = ('cond', 'conn', 'granted')
+
+    def __init__(self, lock: threading.Lock):
+        self.cond = threading.Condition(lock)
+        self.conn: Optional['PooledConnection'] = None
+        self.granted = False        # conn 또는 새 연결을 만들 자리를 받음
+
+
+# ==== 풀 연결 ====
+class PooledConnection:
+    """풀이 관리하는 드라이버 연결 하나"""
+    __slots__ = ('raw', 'created_at', 'last_used', 'statements')
+
+    def __init__(self, raw: Any):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.statements = None      # 연결별 준비문 캐시 (사용하는 쪽에서 설정)
+
+
+# ==== 연결 풀 클래스 ====
+class ConnectionPool:
+    """크기 제한이 있는 스레드 안전 DB 연결 풀
+
+    연결은 필요할 때 최대 size개까지 만들고, 대여(acquire)/반납(release)으로 재사용합니다.
+    - 대여 시에는 서버 왕복을 하지 않습니다. 끊긴 연결은 쿼리 오류로 알게 되며, 호출자가
+      release(conn, broken=True)로 버리면 다음 대여에서 새로 연결합니다.
+    - 유휴 연결 유지: start_keepalive()의 백그라운드 스레드가 keepalive_interval초 이상 쉰
+      유휴 연결만 check_func로 확인해 서버의 유휴 연결 종료(wait_timeout)를 막고
+      끊긴 연결을 미리 정리합니다.
+    - 수명 재생성: max_lifetime초가 지난 연결은 대여 시점에 닫고 새로 만듭니다.
+    - 대기 지표: 모든 연결이 사용 중일 때의 대기 횟수/시간과 시간 초과 수를 집계합니다.
+
+    드라이버와 무관하게 connect_func()가 돌려주는 객체의 close()만 사용하므로
+    mysql.connector 외의 대체 드라이버로도 동작합니다.
+    """
+
+    def __init__(self, connect_func: Callable[[], Any], size: int = 8, timeout: float = 5.0,
+                 max_lifetime: float = 1800.0, check_func: Optional[Callable[[Any], bool]] = None):
+        self.connect_func = connect_func
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.check_func = check_func or (lambda raw: raw.is_connected())
+
+        # 유휴 연결 유지 스레드
+        self.keepalive_interval = 0.0
+        self.keepalive_thread: Optional[threading.Thread] = None
+        self.keepalive_stop = threading.Event()
+
+        self.idle: deque = deque()
+        self.waiters: deque = deque()   # 대기 중인 스레드 (먼저 온 순서로 연결을 넘겨받음)
+        self.total = 0                  # 만들어진 연결 수 (대여 중 + 유휴) 와 생성 중인 자리
+        self.closed = False
+        self.lock = threading.Lock()
+
+        # 지표
+        self.acquires = 0
+        self.waits = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.timeouts = 0
+        self.created = 0
+        self.recycled = 0
+        self.broken = 0
+        self.keepalive_checks = 0
+
+    # ==== 대여 ====
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """연결 하나를 대여합니다. 대기 시간을 넘기면 PoolTimeoutError."""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        waiter = None
+
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("연결 풀이 닫혔습니다")
+            self.acquires += 1
+
+            waiter = _Waiter(self.lock)
+
+            # 먼저 기다리는 스레드가 있으면 새치기하지 않고 뒤에 줄을 섬
+            if not self.waiters and self.idle:
+                # 최근에 반납된 연결부터 사용 (오래 쉰 연결은 자연히 정리됨)
+                waiter.conn = self.idle.pop()
+            elif not self.waiters and self.total < self.size:
+                self.total += 1
+            else:
+                self.waiters.append(waiter)
+                self.waits += 1
+
+                while not waiter.granted:
+                    remaining = timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        self.waiters.remove(waiter)
+                        self.timeouts += 1
+                        raise PoolTimeoutError(f"DB 연결 풀 대기 시간 초과 ({timeout}초, 크기 {self.size})")
+                    waiter.cond.wait(remaining)
+
+                wait_ms = (time.monotonic() - start) * 1000
+                self.wait_total_ms += wait_ms
+                if wait_ms > self.wait_max_ms:
+                    self.wait_max_ms = wait_ms
+
+                if waiter.conn is None and self.closed:
+                    raise RuntimeError("연결 풀이 닫혔습니다")
+
+        # 연결 확인/생성은 잠금 밖에서 (네트워크 왕복 동안 다른 스레드를 막지 않음)
+        try:
+            if waiter.conn is not None:
+                return self._validate(waiter.conn)
+            # 자리만 받은 경우 새 연결 생성
+            return self._create()
+        except Exception:
+            self._discard_slot()
+            raise
+
+    def _create(self) -> PooledConnection:
+        conn = PooledConnection(self.connect_func())
+        self.created += 1
+        return conn
+
+    def _validate(self, conn: PooledConnection) -> PooledConnection:
+        """수명이 지난 연결은 새 연결로 교체 (서버 왕복 없음)"""
+        if self.max_lifetime > 0 and time.monotonic() - conn.created_at >= self.max_lifetime:
+            self._close_raw(conn)
+            self.recycled += 1
+            return self._create()
+        return conn
+
+    # ==== 반납 ====
+    def release(self, conn: PooledConnection, broken: bool = False):
+        """대여한 연결을 반납합니다. broken=True면 닫고 자리만 반환합니다 (연결 끊김 오류 시)."""
+        if broken:
+            self.broken += 1
+            self._close_raw(conn)
+            self._discard_slot()
+            return
+
+        conn.last_used = time.monotonic()
+        self._return_idle(conn)
+
+    def _return_idle(self, conn: PooledConnection):
+        with self.lock:
+            if not self.closed:
+                if self.waiters:
+                    # 가장 오래 기다린 스레드에 바로 넘김
+                    waiter = self.waiters.popleft()
+                    waiter.conn = conn
+                    waiter.granted = True
+                    waiter.cond.notify()
+                else:
+                    self.idle.append(conn)
+                return
+            self.total -= 1
+
+        self._close_raw(conn)
+
+    def discard_idle(self) -> int:
+        """유휴 연결을 모두 닫습니다 (서버 재시작 등으로 한꺼번에 끊겼을 가능성이 클 때)."""
+        with self.lock:
+            idle = list(self.idle)
+            self.idle.clear()
+            self.total -= len(idle)
+
+        for conn in idle:
+            self._close_raw(conn)
+        return len(idle)
+
+    def _discard_slot(self):
+        """연결 생성 실패 등으로 자리를 반환 (대기 중인 스레드가 새로 만들 수 있도록)"""
+        with self.lock:
+            if self.waiters and not self.closed:
+                waiter = self.waiters.popleft()
+                waiter.granted = True
+                waiter.cond.notify()
+            else:
+                self.total -= 1
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """with pool.connection() as raw: ... 형태로 대여/반납 (예외 시 연결을 버림)"""
+        conn = self.acquire(timeout)
+        broken = False
+        try:
+            yield conn.raw
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(conn, broken)
+
+    # ==== 유휴 연결 유지 ====
+    def start_keepalive(self, interval: float):
+        """interval초마다 그만큼 쉰 유휴 연결을 확인하는 백그라운드 스레드 시작"""
+        if interval <= 0 or self.keepalive_thread is not None:
+            return
+        self.keepalive_interval = interval
+        self.keepalive_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
+        self.keepalive_thread.start()
+
+    def _keepalive_loop(self):
+        while not self.keepalive_stop.wait(self.keepalive_interval):
+            try:
+                self.keepalive()
+            except Exception as e:
+                logger.error(f"유휴 연결 확인 오류: {str(e)}")
+
+    def keepalive(self, now: Optional[float] = None) -> int:
+        """keepalive_interval초 이상 쉰 유휴 연결을 확인하고 끊긴 연결을 닫습니다."""
+        now = time.monotonic() if now is None else now
+        threshold = now - self.keepalive_interval
+
+        # 확인하는 동안 다른 스레드가 빌려가지 않도록 유휴 목록에서 잠시 꺼냄
+        with self.lock:
+            stale = [conn for conn in self.idle if conn.last_used <= threshold]
+            if not stale:
+                return 0
+            self.idle = deque(conn for conn in self.idle if conn.last_used > threshold)
+
+        dropped = 0
+        for conn in stale:
+            healthy = False
+            try:
+                healthy = self.check_func(conn.raw)
+            except Exception:
+                pass
+            self.keepalive_checks += 1
+
+            if healthy:
+                conn.last_used = time.monotonic()
+                self._return_idle(conn)
+            else:
+                logger.debug("유휴 연결 끊김 감지 - 닫습니다.")
+                self.release(conn, broken=True)
+                dropped += 1
+        return dropped
+
+    @staticmethod
+    def _close_raw(conn: PooledConnection):
+        try:
+            conn.raw.close()
+        except Exception:
+            pass
+
+    # ==== 종료 ====
+    def close(self):
+        """유휴 연결을 모두 닫고, 대여 중인 연결은 반납될 때 닫습니다."""
+        self.keepalive_stop.set()
+
+        with self.lock:
+            self.closed = True
+            idle = list(self.idle)
+            self.idle.clear()
+            self.total -= len(idle)
+            
+            # 대기 중인 스레드는 연결 없이 깨워 RuntimeError로 끝냄
+            for waiter in self.waiters:
+                waiter.granted = True
+                waiter.cond.notify()
+            self.waiters.clear()
+
+        for conn in idle:
+            self._close_raw(conn)
+
+    # ==== 통계 ====
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 크기/사용량과 대기 지표를 반환합니다."""
+        with self.lock:
+            idle = len(self.idle)
+            total = self.total
+            waiting = len(self.waiters)
+
+        return {
+            "size": self.size,
+            "open": total,
+            "in_use": total - idle,
+            "idle": idle,
+            "waiting": waiting,
+            "acquires": self.acquires,
+            "waits": self.waits,
+            "wait_avg_ms": round(self.wait_total_ms / self.waits, 3) if self.waits else 0.0,
+            "wait_max_ms": round(self.wait_max_ms, 3),
+            "timeouts": self.timeouts,
+            "created": self.created,
+            "recycled": self.recycled,
+            "broken": self.broken,
+            "keepalive_checks": self.keepalive_checks
+        }
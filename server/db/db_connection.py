@@ -2,7 +2,8 @@
 import logging
 import os
 import sys
-from typing import Optional, Dict, List, Any, Tuple
+from contextlib import contextmanager
+from typing import Optional, Dict, Iterator, List, Any, Tuple
 
 # MySQL 라이브러리 임포트
 try:
@@ -13,14 +14,70 @@ except ImportError:
     logging.warning("MySQL 라이브러리를 가져올 수 없습니다. 'pip install mysql-connector-python' 명령어로 설치하세요.")
     MYSQL_AVAILABLE = False
 
+# 연결 끊김으로 볼 예외 (서버 재시작, wait_timeout, 네트워크 단절 등)
+# OperationalError: 2006 server has gone away, 2013 lost connection 등
+# InterfaceError: 2055 lost connection (소켓 오류) 등
+if MYSQL_AVAILABLE:
+    DISCONNECT_ERRORS = (ConnectionError, mysql.connector.errors.OperationalError,
+                         mysql.connector.errors.InterfaceError)
+else:
+    DISCONNECT_ERRORS = (ConnectionError,)
+
+# 행 제약 위반으로 볼 예외 (기본 키 중복 1062, 외래 키 위반 1452 등) - 그 문장만 실패하고 연결/트랜잭션은 유지
+if MYSQL_AVAILABLE:
+    INTEGRITY_ERRORS = (mysql.connector.errors.IntegrityError,)
+else:
+    INTEGRITY_ERRORS = ()
+
 # 상위 디렉토리를 import path에 추가 (config.py 접근용)
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from config import DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME
+from config import (DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME, DB_POOL_SIZE,
+                    DB_POOL_TIMEOUT, DB_POOL_MAX_LIFETIME, DB_POOL_KEEPALIVE_INTERVAL,
+                    DB_STATEMENT_CACHE_SIZE, DB_STATEMENT_MAX_PARAMS, DB_STREAM_BATCH_SIZE)
+from .connection_pool import ConnectionPool, PooledConnection, PoolTimeoutError
+from .statement_cache import StatementCache, StatementStats, ER_UNSUPPORTED_PS
 
 logger = logging.getLogger(__name__)
 
+# _execute()가 DB 접속 불가를 알리는 표식 (None은 정상 결과일 수 있으므로 구분)
+_NO_CONNECTION = object()
+
+
+class Transaction:
+    """DBConnection.transaction()이 넘겨주는 트랜잭션 핸들 (한 연결에서 여러 쿼리 실행)
+    
+    커밋/롤백은 transaction() 블록이 끝날 때 한 번 하므로 여기서는 실행만 합니다.
+    """
+    
+    def __init__(self, db: 'DBConnection', conn: PooledConnection):
+        self.db = db
+        self.conn = conn
+    
+    def execute_query(self, query: str, params: Tuple = None, prepare: bool = True) -> List[Tuple]:
+        """트랜잭션 안에서 SELECT 실행"""
+        return self.db._fetch_all(self.conn, query, params, False, prepare)
+    
+    def execute_update(self, query: str, params: Tuple = None, prepare: bool = True) -> int:
+        """트랜잭션 안에서 INSERT/UPDATE/DELETE 실행 (영향받은 행 수 반환)"""
+        cursor, cached = self.db._run_statement(self.conn, query, params, prepare=prepare)
+        affected_rows = cursor.rowcount
+        if not cached:
+            cursor.close()
+        return affected_rows
+
 class DBConnection:
-    """데이터베이스 연결 관리 클래스"""
+    """데이터베이스 연결 관리 클래스
+    
+    하나의 연결을 공유하는 대신 ConnectionPool에서 쿼리마다 연결을 대여/반납하므로
+    Flask 요청 스레드, TCP 핸들러 스레드, 타이머 스레드가 동시에 쿼리를 실행해도
+    커서가 한 소켓에서 섞이지 않습니다.
+    
+    쿼리 전에 연결 확인(ping)을 하지 않고 바로 실행합니다. 연결 끊김 예외가 나면 그 연결을
+    버리고 유휴 연결도 정리한 뒤, 다시 실행해도 안전한 조회 쿼리만 새 연결로 한 번 재시도합니다.
+    
+    같은 SQL 텍스트는 연결별 준비문 캐시(StatementCache)의 커서로 실행해 서버가 매번
+    다시 파싱하지 않게 하므로, 리포지토리 코드는 그대로 execute_*만 호출하면 됩니다.
+    """
     
     _instance = None
     
@@ -45,10 +102,13 @@ class DBConnection:
         
         logger.info(f"데이터베이스 설정 로드: {self.host}:{self.port}/{self.database}")
         
-        # DB 연결 초기화
-        self.connection = None
+        # DB 연결 풀 초기화
+        self.pool: Optional[ConnectionPool] = None
         self.connected = False
         
+        # 준비문 캐시 지표 (모든 풀 연결 공유)
+        self.statement_stats = StatementStats()
+        
         # MySQL 라이브러리 확인 및 연결
         if MYSQL_AVAILABLE:
             self.connect()
@@ -56,19 +116,36 @@ class DBConnection:
             logger.warning("MySQL 라이브러리가 설치되어 있지 않습니다.")
         
         self._initialized = True
+    
+    def _create_connection(self):
+        """풀에 넣을 새 드라이버 연결 생성"""
+        return mysql.connector.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            # 풀 연결은 오래 살아 있으므로 SELECT만 하는 연결이 오래된 스냅샷을 보지 않도록 자동 커밋
+            autocommit=True
+        )
         
     def connect(self) -> bool:
-        """데이터베이스 연결"""
+        """데이터베이스 연결 (연결 풀 생성 후 연결 하나로 접속 확인)"""
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
+            if self.pool is None or self.pool.closed:
+                self.pool = ConnectionPool(
+                    self._create_connection,
+                    size=DB_POOL_SIZE,
+                    timeout=DB_POOL_TIMEOUT,
+                    max_lifetime=DB_POOL_MAX_LIFETIME
+                )
+                self.pool.start_keepalive(DB_POOL_KEEPALIVE_INTERVAL)
+            
+            conn = self.pool.acquire()
+            self.pool.release(conn)
+            
             self.connected = True
-            logger.info(f"데이터베이스 '{self.database}'에 연결됨")
+            logger.info(f"데이터베이스 '{self.database}'에 연결됨 (연결 풀 크기: {self.pool.size})")
             return True
         except Exception as e:
             self._handle_connection_error(e)
@@ -88,89 +165,303 @@ class DBConnection:
             logger.error(f"데이터베이스 연결 오류: {error_str}")
         
     def ensure_connection(self) -> bool:
-        """연결 확인 및 필요시 재연결"""
+        """연결 풀 확인 및 필요시 재연결
+        
+        개별 연결의 끊김은 풀이 대여 시점에 확인하고 교체합니다.
+        """
         if not MYSQL_AVAILABLE:
             return False
         
+        if self.pool is None or self.pool.closed or not self.connected:
+            logger.debug("DB 연결 풀이 준비되지 않음. 새로 연결합니다.")
+            return self.connect()
+        
+        return True
+    
+    def _checkout(self) -> Optional[PooledConnection]:
+        """풀에서 연결 대여 (DB 접속 불가 시 None, 풀 대기 시간 초과 시 예외)"""
+        if not self.ensure_connection():
+            return None
+        
         try:
-            # 연결 객체 없음
-            if not self.connection:
-                logger.debug("DB 연결 객체가 없음. 새로 연결합니다.")
-                return self.connect()
-            
-            # 연결 끊김
-            if not self.connection.is_connected():
-                logger.debug("DB 연결이 끊어짐. 재연결합니다.")
-                try:
-                    self.connection.close()
-                except:
-                    pass
-                return self.connect()
+            return self.pool.acquire()
+        except PoolTimeoutError as e:
+            logger.error(str(e))
+            raise RuntimeError(str(e)) from e
+        except Exception as e:
+            self._handle_connection_error(e)
+            self.connected = False
+            return None
+    
+    def _execute(self, operation, retry: bool) -> Any:
+        """대여한 연결로 operation(conn) 실행
+        
+        연결 끊김 예외면 연결을 버리고(같은 시점에 쉬던 유휴 연결도 끊겼을 가능성이 크므로 정리),
+        retry=True인 경우 새 연결로 한 번 더 실행합니다. DB 접속 불가 시 _NO_CONNECTION 반환.
+        """
+        attempts = 2 if retry else 1
+        for attempt in range(attempts):
+            conn = self._checkout()
+            if conn is None:
+                return _NO_CONNECTION
             
-            return True
+            try:
+                result = operation(conn)
+            except DISCONNECT_ERRORS as e:
+                self.pool.release(conn, broken=True)
+                self.pool.discard_idle()
+                if attempt + 1 < attempts:
+                    logger.warning(f"DB 연결 끊김 감지, 새 연결로 재시도: {str(e)}")
+                    continue
+                raise
+            except Exception:
+                self.pool.release(conn)
+                raise
             
-        except Exception as e:
-            logger.error(f"DB 연결 확인 오류: {str(e)}")
-            return self.connect()  # 오류 발생 시 재연결
+            self.pool.release(conn)
+            return result
     
-    def execute_query(self, query: str, params: Tuple = None) -> Optional[List[Tuple]]:
-        """SELECT 쿼리 실행"""
-        if not self.ensure_connection():
-            logger.warning("DB 연결 없음 - 쿼리 실행 불가")
-            return None
+    def _run_statement(self, conn: PooledConnection, query: str, params, many: bool = False,
+                       prepare: bool = True):
+        """준비문 캐시의 커서로 실행하고 커서를 반환 (준비 불가 SQL, prepare=False면 일반 커서로 실행)
+        
+        반환된 커서가 일반 커서면 호출자가 닫아야 하므로 (cursor, cached)를 반환합니다.
+        """
+        if conn.statements is None:
+            conn.statements = StatementCache(conn.raw, DB_STATEMENT_CACHE_SIZE, self.statement_stats,
+                                             DB_STATEMENT_MAX_PARAMS)
         
+        if prepare:
+            cursor = conn.statements.get(query)
+        else:
+            self.statement_stats.count("unprepared")
+            cursor = None
+        if cursor is not None:
+            try:
+                if many:
+                    cursor.executemany(query, params)
+                else:
+                    cursor.execute(query, params)
+                return cursor, True
+            except DISCONNECT_ERRORS:
+                raise
+            except Exception as e:
+                conn.statements.discard(query)
+                if getattr(e, 'errno', None) != ER_UNSUPPORTED_PS:
+                    raise
+                # DDL 등 준비문으로 실행할 수 없는 SQL은 기억해 두고 일반 실행
+                logger.debug(f"준비문 미지원 SQL, 일반 실행으로 전환: {query.strip()[:60]}")
+                self.statement_stats.mark_unpreparable(query)
+        
+        cursor = conn.raw.cursor()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            result = cursor.fetchall()
+            if many:
+                cursor.executemany(query, params)
+            else:
+                cursor.execute(query, params)
+        except Exception:
             cursor.close()
-            return result
+            raise
+        return cursor, False
+    
+    def _fetch_all(self, conn: PooledConnection, query: str, params: Tuple, dictionary: bool,
+                   prepare: bool = True):
+        cursor, cached = self._run_statement(conn, query, params, prepare=prepare)
+        try:
+            rows = cursor.fetchall()
+            if dictionary:
+                # 준비문 커서는 딕셔너리 결과를 지원하지 않는 버전이 있어 컬럼 이름으로 직접 변환
+                columns = cursor.column_names
+                rows = [dict(zip(columns, row)) for row in rows]
+            return rows
+        finally:
+            if not cached:
+                cursor.close()
+    
+    def _write(self, conn: PooledConnection, query: str, params, many: bool, with_id: bool = False,
+               prepare: bool = True):
+        # autocommit 연결이므로 문장 하나가 곧 트랜잭션 (커밋 왕복 없음, 실패한 문장은 서버가 되돌림)
+        cursor, cached = self._run_statement(conn, query, params, many, prepare)
+        
+        affected_rows = cursor.rowcount
+        last_id = cursor.lastrowid if with_id else None
+        if not cached:
+            cursor.close()
+        return (affected_rows, last_id) if with_id else affected_rows
+    
+    def execute_query(self, query: str, params: Tuple = None, prepare: bool = True) -> Optional[List[Tuple]]:
+        """SELECT 쿼리 실행 (연결 끊김 시 한 번 재시도)
+        
+        prepare=False면 준비문 캐시를 거치지 않습니다 (실행마다 SQL 텍스트가 달라지는 쿼리).
+        """
+        try:
+            result = self._execute(lambda conn: self._fetch_all(conn, query, params, False, prepare), retry=True)
         except Exception as e:
             error_msg = f"쿼리 실행 실패: {str(e)}"
             logger.error(error_msg)
             logger.error(f"쿼리: {query}, 파라미터: {params}")
             # 원본 예외를 포함하여 새 예외 발생
             raise RuntimeError(error_msg) from e
-    
-    def execute_dict_query(self, query: str, params: Tuple = None) -> Optional[List[Dict]]:
-        """SELECT 쿼리 실행 후 딕셔너리 리스트로 결과 반환"""
-        if not self.ensure_connection():
+        
+        if result is _NO_CONNECTION:
             logger.warning("DB 연결 없음 - 쿼리 실행 불가")
             return None
-        
+        return result
+    
+    def execute_dict_query(self, query: str, params: Tuple = None, prepare: bool = True) -> Optional[List[Dict]]:
+        """SELECT 쿼리 실행 후 딕셔너리 리스트로 결과 반환 (연결 끊김 시 한 번 재시도)"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, params)
-            result = cursor.fetchall()
-            cursor.close()
-            return result
+            result = self._execute(lambda conn: self._fetch_all(conn, query, params, True, prepare), retry=True)
         except Exception as e:
             error_msg = f"쿼리 실행 실패: {str(e)}"
             logger.error(error_msg)
             logger.error(f"쿼리: {query}, 파라미터: {params}")
             # 원본 예외를 포함하여 새 예외 발생
             raise RuntimeError(error_msg) from e
+        
+        if result is _NO_CONNECTION:
+            logger.warning("DB 연결 없음 - 쿼리 실행 불가")
+            return None
+        return result
     
-    def execute_update(self, query: str, params: Tuple = None) -> int:
-        """INSERT/UPDATE/DELETE 쿼리 실행"""
-        if not self.ensure_connection():
+    def execute_update(self, query: str, params: Tuple = None, prepare: bool = True) -> int:
+        """INSERT/UPDATE/DELETE 쿼리 실행
+        
+        서버에 반영됐는지 알 수 없으므로 연결 끊김 시에도 재시도하지 않습니다.
+        """
+        try:
+            result = self._execute(lambda conn: self._write(conn, query, params, False, prepare=prepare),
+                                   retry=False)
+        except Exception as e:
+            error_msg = f"업데이트 실행 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(f"쿼리: {query}, 파라미터: {params}")
+            # 원본 예외를 포함하여 새 예외 발생
+            raise RuntimeError(error_msg) from e
+        
+        if result is _NO_CONNECTION:
             logger.warning("DB 연결 없음 - 업데이트 실행 불가")
             return 0
+        return result
+    
+    def execute_update_with_id(self, query: str, params: Tuple = None) -> Tuple[int, Optional[int]]:
+        """INSERT/UPDATE 쿼리 실행 후 (영향받은 행 수, LAST_INSERT_ID) 반환
         
+        AUTO_INCREMENT 값이나 LAST_INSERT_ID(expr)로 지정한 값을 같은 왕복의 응답에서 받습니다.
+        """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            return affected_rows
+            result = self._execute(lambda conn: self._write(conn, query, params, False, True), retry=False)
         except Exception as e:
             error_msg = f"업데이트 실행 실패: {str(e)}"
             logger.error(error_msg)
             logger.error(f"쿼리: {query}, 파라미터: {params}")
-            self.connection.rollback()
-            # 원본 예외를 포함하여 새 예외 발생
             raise RuntimeError(error_msg) from e
+        
+        if result is _NO_CONNECTION:
+            logger.warning("DB 연결 없음 - 업데이트 실행 불가")
+            return 0, None
+        return result
+    
+    def execute_many(self, query: str, params_list: List[Tuple], prepare: bool = True) -> int:
+        """같은 INSERT/UPDATE 쿼리를 여러 파라미터로 실행 (한 번에 커밋, 재시도 없음)"""
+        if not params_list:
+            return 0
+        
+        try:
+            result = self._execute(lambda conn: self._write(conn, query, params_list, True, prepare=prepare),
+                                   retry=False)
+        except Exception as e:
+            error_msg = f"일괄 업데이트 실행 실패: {str(e)}"
+            logger.error(error_msg)
+            logger.error(f"쿼리: {query}, 파라미터 수: {len(params_list)}")
+            raise RuntimeError(error_msg) from e
+        
+        if result is _NO_CONNECTION:
+            logger.warning("DB 연결 없음 - 일괄 업데이트 실행 불가")
+            return 0
+        return result
+    
+    @contextmanager
+    def transaction(self, consistent_snapshot: bool = False):
+        """한 연결에서 여러 쿼리를 하나의 트랜잭션으로 실행
+        
+            with db.transaction() as tx:
+                tx.execute_update(...)
+                tx.execute_update(...)
+        
+        블록이 예외 없이 끝나면 커밋하고, 예외가 나면 롤백한 뒤 예외를 다시 발생시킵니다.
+        실행 도중 끊기면 어디까지 반영됐는지 알 수 없으므로 재시도하지 않습니다.
+        
+        Raises:
+            RuntimeError: DB 접속 불가, 연결 끊김
+        """
+        conn = self._checkout()
+        if conn is None:
+            raise RuntimeError("DB 연결 없음 - 트랜잭션 시작 불가")
+        
+        broken = False
+        try:
+            conn.raw.start_transaction(consistent_snapshot=consistent_snapshot)
+            yield Transaction(self, conn)
+            conn.raw.commit()
+        except DISCONNECT_ERRORS as e:
+            broken = True
+            raise RuntimeError(f"트랜잭션 중 DB 연결 끊김: {str(e)}") from e
+        except Exception:
+            try:
+                conn.raw.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            self.pool.release(conn, broken=broken)
+            if broken:
+                self.pool.discard_idle()
+    
+    def stream_query(self, query: str, params: Tuple = None,
+                     batch_size: int = DB_STREAM_BATCH_SIZE) -> Iterator[Dict]:
+        """SELECT 결과를 딕셔너리로 한 행씩 넘겨주는 제너레이터
+        
+        버퍼링하지 않는 커서로 batch_size 행씩 받아 오므로 결과 전체를 메모리에 올리지 않습니다.
+        끝까지 읽거나 제너레이터를 닫을 때까지 연결 하나를 대여하며, 도중에 닫으면 읽지 않은
+        결과가 남은 연결은 풀에 돌려주지 않고 버립니다.
+        
+        Raises:
+            RuntimeError: DB 접속 불가, 쿼리 실행 실패
+        """
+        conn = self._checkout()
+        if conn is None:
+            raise RuntimeError("DB 연결 없음 - 쿼리 실행 불가")
+        
+        # 준비문 캐시의 커서는 다른 쿼리와 공유하므로 읽는 동안 쓸 일반 커서를 따로 엶
+        cursor = None
+        finished = False
+        broken = False
+        try:
+            cursor = conn.raw.cursor()
+            cursor.execute(query, params)
+            columns = cursor.column_names
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+            finished = True
+        except DISCONNECT_ERRORS as e:
+            broken = True
+            logger.error(f"쿼리 스트리밍 중 DB 연결 끊김: {str(e)}")
+            raise RuntimeError(f"쿼리 실행 실패: {str(e)}") from e
+        except Exception as e:
+            logger.error(f"쿼리 스트리밍 실패: {str(e)}")
+            logger.error(f"쿼리: {query}, 파라미터: {params}")
+            raise RuntimeError(f"쿼리 실행 실패: {str(e)}") from e
+        finally:
+            if finished and cursor is not None:
+                cursor.close()
+            self.pool.release(conn, broken=broken or not finished)
+            if broken:
+                self.pool.discard_idle()
     
     def get_connection_status(self) -> Dict[str, Any]:
         """데이터베이스 연결 상태 반환"""
@@ -181,26 +472,31 @@ class DBConnection:
             "user": self.user
         }
         
-        if self.connected and self.connection:
+        if self.connected and self.pool:
             try:
-                cursor = self.connection.cursor()
-                cursor.execute("SELECT VERSION()")
-                version = cursor.fetchone()
-                cursor.close()
-                status["version"] = version[0] if version else "Unknown"
+                result = self.execute_query("SELECT VERSION()")
+                status["version"] = result[0][0] if result else "Unknown"
             except:
                 status["version"] = "Error"
+            status["pool"] = self.pool.get_stats()
+            status["statements"] = self.get_statement_stats()
         
         return status
     
+    def get_statement_stats(self) -> Dict[str, Any]:
+        """준비문 캐시 적중률 등 지표 반환"""
+        stats = self.statement_stats.to_dict()
+        stats["capacity_per_connection"] = DB_STATEMENT_CACHE_SIZE
+        stats["max_params"] = DB_STATEMENT_MAX_PARAMS
+        return stats
+    
     def close(self):
-        """연결 종료"""
-        if self.connection and self.connected:
+        """연결 풀 종료"""
+        if self.pool:
             try:
-                self.connection.close()
-                logger.info("데이터베이스 연결 종료")
+                self.pool.close()
+                logger.info("데이터베이스 연결 풀 종료")
             except Exception as e:
                 logger.error(f"데이터베이스 연결 종료 오류: {str(e)}")
         
         self.connected = False
-        self.connection = None
\ No newline at end of file
@@ -134,5 +134,13 @@ class DBManager:
         if self.connected:
             return product_item_repo.get_expired_items()
         return []
+
+    def get_access_logs(self, limit: int = 20, cursor: Optional[str] = None,
+                        start_date: Optional[str] = None, end_date: Optional[str] = None):
+        """출입 로그를 한 페이지 조회 (로그 목록, 다음 페이지 커서)"""
+        from . import access_log_repo
+        if self.connected:
+            return access_log_repo.get_logs(limit, cursor, start_date, end_date)
+        return [], None
 # 초기 인스턴스 (실제로는 db/__init__.py에서 초기화)
 db_manager = DBManager()
\ No newline at end of file
@@ -18,10 +18,77 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 # 데이터베이스 연결 모듈 임포트
 from .db_connection import DBConnection
+from .id_sequence import ID_SEQUENCE_TABLE_SQL, ID_SEQUENCE_SEED_SQL
+from .temperature_history import TEMP_HISTORY_TABLES_SQL
 from config import DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME
 
 logger = logging.getLogger(__name__)
 
+# ==== 스키마 버전 관리 ====
+SCHEMA_VERSION_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS `schema_version` (
+      `version` int NOT NULL,
+      `description` varchar(200) DEFAULT NULL,
+      `applied_at` datetime DEFAULT CURRENT_TIMESTAMP,
+      PRIMARY KEY (`version`)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+# 마이그레이션 단계: (버전, 설명, SQL 목록) - 버전 순서대로 한 번씩 적용하고 schema_version에 기록
+# _create_tables의 테이블 정의가 버전 0이며, 이미 배포된 단계는 고치지 말고 새 버전을 뒤에 추가할 것
+MIGRATION_STEPS = [
+    (1, "product_item 창고별 유통기한/유통기한/입고 시간 인덱스", [
+        # 창고별 조회 + 유통기한 정렬 (warehouse_id 외래 키 인덱스 역할도 하므로 기존 단일 인덱스는 제거)
+        "CREATE INDEX `idx_product_item_warehouse_exp` ON `product_item` (`warehouse_id`, `exp`)",
+        "ALTER TABLE `product_item` DROP INDEX `warehouse_id`",
+        # 유통기한 임박/만료 조회 - product_item 컬럼을 모두 포함해 행을 읽지 않음
+        "CREATE INDEX `idx_product_item_exp` ON `product_item` (`exp`, `warehouse_id`, `product_id`, `entry_time`)",
+        # 최근 입고 순 목록
+        "CREATE INDEX `idx_product_item_entry_time` ON `product_item` (`entry_time`)"
+    ]),
+    (2, "access_logs 카드별 시간/시간 인덱스", [
+        # 카드별 마지막 출입 기록
+        "CREATE INDEX `idx_access_logs_card_time` ON `access_logs` (`card_id`, `timestamp`)",
+        # 기간별 출입 로그 (최신 순)
+        "CREATE INDEX `idx_access_logs_timestamp` ON `access_logs` (`timestamp`)"
+    ]),
+    (3, "product_item 창고별 입고 시간 인덱스", [
+        # 창고별 재고 목록 키셋 페이지 (입고 시간 역순)
+        "CREATE INDEX `idx_product_item_warehouse_entry` ON `product_item` (`warehouse_id`, `entry_time`)"
+    ]),
+    (4, "warehouse 사용량(used_capacity) 컬럼", [
+        # 아이템 추가/삭제 트랜잭션에서 증감하는 창고별 아이템 수 (현재 개수로 시작)
+        "ALTER TABLE `warehouse` ADD COLUMN `used_capacity` int NOT NULL DEFAULT 0 AFTER `capacity`",
+        """
+            UPDATE warehouse w
+            SET w.used_capacity = (SELECT COUNT(*) FROM product_item pi WHERE pi.warehouse_id = w.id)
+        """
+    ]),
+    (5, "온도 측정값 시계열 및 1분/15분/1시간 집계 테이블", TEMP_HISTORY_TABLES_SQL),
+    (6, "product_item 추가/삭제 시 warehouse 사용량(used_capacity) 갱신 트리거", [
+        # 아이템 INSERT/DELETE 문장 안에서 사용량을 함께 바꾸므로 추가/삭제가 서버 왕복 1회로 끝남
+        """
+            CREATE TRIGGER `trg_product_item_insert_capacity` AFTER INSERT ON `product_item`
+            FOR EACH ROW UPDATE warehouse SET used_capacity = used_capacity + 1 WHERE id = NEW.warehouse_id
+        """,
+        """
+            CREATE TRIGGER `trg_product_item_delete_capacity` AFTER DELETE ON `product_item`
+            FOR EACH ROW UPDATE warehouse SET used_capacity = used_capacity - 1 WHERE id = OLD.warehouse_id
+        """,
+        # 트리거 생성 전까지 쌓인 오차 정리
+        """
+            UPDATE warehouse w
+            SET w.used_capacity = (SELECT COUNT(*) FROM product_item pi WHERE pi.warehouse_id = w.id)
+        """
+    ])
+]
+
+# 단계 도중 실패 후 다시 적용할 때 이미 반영된 SQL의 오류는 무시
+ER_DUP_FIELDNAME = 1060             # 같은 이름의 컬럼이 이미 있음
+ER_DUP_KEYNAME = 1061               # 같은 이름의 인덱스가 이미 있음
+ER_CANT_DROP_FIELD_OR_KEY = 1091    # 제거할 인덱스가 이미 없음
+ER_TRG_ALREADY_EXISTS = 1359        # 같은 이름의 트리거가 이미 있음
+
 class DatabaseMigration:
     """데이터베이스 마이그레이션 및 초기화 관리 클래스"""
     
@@ -96,6 +163,14 @@ class DatabaseMigration:
                 # 2.3. 필요한 스키마 업데이트 (target_temp 컬럼 추가 등)
                 self._update_warehouse_schema()
             
+            # 3. ID 시퀀스 테이블 (product_item ID 블록 발급용)
+            self._ensure_id_sequences()
+            
+            # 4. 버전별 스키마 마이그레이션 (인덱스 등)
+            if not self._apply_migrations():
+                logger.error("스키마 마이그레이션 실패")
+                return False
+            
             logger.info("데이터베이스 초기화가 완료되었습니다.")
             return True
             
@@ -422,6 +497,59 @@ class DatabaseMigration:
             logger.error(f"누락된 테이블 생성 중 오류: {str(e)}")
             return False
     
+    def _ensure_id_sequences(self) -> bool:
+        """id_sequence 테이블 생성 및 시퀀스 시작값 설정 (기존 ID 최댓값 + 1)"""
+        try:
+            self.db.execute_update(ID_SEQUENCE_TABLE_SQL)
+            self.db.execute_update(ID_SEQUENCE_SEED_SQL.format(table="product_item"), ("product_item",))
+            logger.info("ID 시퀀스 테이블 확인 완료")
+            return True
+        except Exception as e:
+            logger.error(f"ID 시퀀스 테이블 생성 중 오류: {str(e)}")
+            return False
+    
+    def _apply_migrations(self) -> bool:
+        """schema_version 기준으로 아직 적용하지 않은 마이그레이션 단계를 순서대로 적용"""
+        try:
+            self.db.execute_update(SCHEMA_VERSION_TABLE_SQL)
+            
+            result = self.db.execute_query("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+            if result is None:
+                logger.warning("스키마 버전을 확인할 수 없습니다.")
+                return False
+            current_version = int(result[0][0]) if result else 0
+            
+            for version, description, statements in MIGRATION_STEPS:
+                if version <= current_version:
+                    continue
+                
+                logger.info(f"스키마 마이그레이션 {version} 적용: {description}")
+                for sql in statements:
+                    self._execute_migration_sql(sql)
+                
+                self.db.execute_update(
+                    "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                    (version, description)
+                )
+                current_version = version
+            
+            logger.info(f"스키마 버전 확인 완료: {current_version}")
+            return True
+        except Exception as e:
+            logger.error(f"스키마 마이그레이션 중 오류: {str(e)}")
+            return False
+    
+    def _execute_migration_sql(self, sql: str):
+        """마이그레이션 SQL 실행 (이전 시도에서 이미 반영된 컬럼/인덱스/트리거 변경은 건너뜀)"""
+        try:
+            self.db.execute_update(sql)
+        except RuntimeError as e:
+            if getattr(e.__cause__, 'errno', None) in (ER_DUP_FIELDNAME, ER_DUP_KEYNAME, ER_CANT_DROP_FIELD_OR_KEY,
+                                                       ER_TRG_ALREADY_EXISTS):
+                logger.info(f"이미 반영된 마이그레이션 SQL 건너뜀: {sql.strip()}")
+                return
+            raise
+    
     def _update_warehouse_schema(self) -> bool:
         """warehouse 테이블의 스키마 업데이트 (target_temp 컬럼 추가 등)"""
         try:
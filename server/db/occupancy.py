@@ -0,0 +1,125 @@
+# db/occupancy.py
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 창고별 실제 아이템 수 (점검 작업에서만 사용 - product_item 전체를 읽음)
+COUNT_ITEMS_SQL = "SELECT warehouse_id, COUNT(*) FROM product_item GROUP BY warehouse_id"
+
+
+def capacity_delta_sql(deltas: Dict[str, int]):
+    """창고별 증감을 used_capacity에 더하는 UPDATE 한 문장과 파라미터 생성"""
+    cases = " ".join(["WHEN %s THEN %s"] * len(deltas))
+    placeholders = ", ".join(["%s"] * len(deltas))
+    params = []
+    for warehouse_id, delta in deltas.items():
+        params.extend((warehouse_id, delta))
+    params.extend(deltas.keys())
+    query = f"""
+        UPDATE warehouse SET used_capacity = used_capacity + CASE id {cases} ELSE 0 END
+        WHERE id IN ({placeholders})
+    """
+    return query, tuple(params)
+
+
+# ==== 창고 점유량 캐시 ====
+class WarehouseOccupancy:
+    """warehouse.used_capacity를 메모리에 보관하는 창고 점유량 캐시
+
+    아이템 추가/삭제는 product_item 트리거가 used_capacity를 같은 문장에서 올리고 내리며,
+    리포지토리가 반영 후 apply()로 같은 증감을 캐시에 반영합니다. 따라서 재고 현황 조회는
+    product_item을 읽지 않고 창고 수만큼의 캐시 값만 돌려줍니다.
+
+    reconcile()은 한 스냅샷 안에서 product_item의 실제 개수와 used_capacity를 비교해
+    어긋난 만큼 보정하고 캐시를 다시 읽습니다 (트리거 밖에서 used_capacity를 바꾼 SQL,
+    트리거 적용 전 데이터, 다른 서버 프로세스의 추가/삭제로 캐시만 어긋난 경우 등).
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.lock = threading.Lock()
+        self.warehouses: Dict[str, Dict[str, int]] = {}   # id -> {"capacity", "used"}
+        self.loaded = False
+        self.drift_corrections = 0      # 오차를 보정한 점검 횟수
+        self.reconcile_stop = threading.Event()
+        self.reconcile_thread: Optional[threading.Thread] = None
+
+    def load(self) -> bool:
+        """warehouse 테이블에서 용량과 사용량을 읽어 캐시를 채움"""
+        try:
+            rows = self.db.execute_query("SELECT id, capacity, used_capacity FROM warehouse")
+        except Exception as e:
+            logger.error(f"창고 점유량 로드 오류: {str(e)}")
+            return False
+        if rows is None:
+            return False
+
+        with self.lock:
+            self.warehouses = {
+                warehouse_id: {"capacity": capacity or 0, "used": used or 0}
+                for warehouse_id, capacity, used in rows
+            }
+            self.loaded = True
+        return True
+
+    def apply(self, deltas: Dict[str, int]):
+        """커밋된 증감을 캐시에 반영"""
+        with self.lock:
+            for warehouse_id, delta in deltas.items():
+                if warehouse_id in self.warehouses:
+                    self.warehouses[warehouse_id]["used"] += delta
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """창고별 {"capacity", "used"} 복사본 반환 (처음 한 번만 DB 조회)"""
+        if not self.loaded:
+            self.load()
+        with self.lock:
+            return {warehouse_id: dict(values) for warehouse_id, values in self.warehouses.items()}
+
+    # ==== 점검 작업 ====
+    def reconcile(self) -> Dict[str, int]:
+        """실제 아이템 수와 used_capacity를 비교해 어긋난 창고를 보정
+
+        Returns:
+            Dict[str, int]: 보정한 창고별 차이 (실제 - 기록, 어긋난 창고가 없으면 빈 딕셔너리)
+        """
+        with self.db.transaction(consistent_snapshot=True) as tx:
+            # 같은 스냅샷에서 읽어야 점검 중에 들어온 아이템을 오차로 보지 않음
+            recorded = {warehouse_id: used or 0 for warehouse_id, used in
+                        tx.execute_query("SELECT id, used_capacity FROM warehouse")}
+            actual = {warehouse_id: count for warehouse_id, count in tx.execute_query(COUNT_ITEMS_SQL)}
+
+            drift = {}
+            for warehouse_id, used in recorded.items():
+                difference = actual.get(warehouse_id, 0) - used
+                if difference:
+                    drift[warehouse_id] = difference
+
+            # 스냅샷 이후의 증감을 덮어쓰지 않도록 절대값이 아닌 차이만큼 더함
+            if drift:
+                tx.execute_update(*capacity_delta_sql(drift))
+
+        if drift:
+            self.drift_corrections += 1
+            logger.warning(f"창고 점유량 오차 보정: {drift}")
+        self.load()
+        return drift
+
+    def start_reconcile(self, interval: float):
+        """interval초마다 reconcile()을 실행하는 백그라운드 스레드 시작"""
+        if interval <= 0 or self.reconcile_thread is not None:
+            return
+        self.reconcile_thread = threading.Thread(target=self._reconcile_loop, args=(interval,), daemon=True)
+        self.reconcile_thread.start()
+
+    def stop_reconcile(self):
+        self.reconcile_stop.set()
+
+    def _reconcile_loop(self, interval: float):
+        while not self.reconcile_stop.wait(interval):
+            try:
+                self.reconcile()
+            except Exception as e:
+                logger.error(f"창고 점유량 점검 오류: {str(e)}")
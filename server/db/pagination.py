@@ -0,0 +1,35 @@
+# db/pagination.py
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+
+# ==== 키셋 페이지 커서 ====
+# 커서는 마지막으로 받은 행의 정렬 키 값 (예: (entry_time, id))을 JSON으로 묶어
+# base64url로 인코딩한 불투명 문자열입니다. 클라이언트는 받은 next_cursor를 그대로 돌려보내며,
+# 서버는 이 값보다 뒤에 오는 행만 조회하므로 OFFSET처럼 앞 페이지 행을 건너뛰는 비용이 없습니다.
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값 목록을 커서 문자열로 인코딩 (datetime 등은 문자열로 변환)"""
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩 (커서가 없으면 None)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 키 개수가 size와 다른 커서
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"잘못된 페이지 커서: {cursor}") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"잘못된 페이지 커서: {cursor}")
+    return values
@@ -1,9 +1,13 @@
 # db/repository.py
 import logging
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Union, Tuple
 from datetime import datetime, timedelta
 
-from .db_connection import DBConnection
+from .db_connection import DBConnection, INTEGRITY_ERRORS
+from .id_sequence import IdSequence
+from .pagination import encode_cursor, decode_cursor
+from .occupancy import WarehouseOccupancy
+from config import DB_ID_BLOCK_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,14 @@ class BaseRepository:
     def _log_error(self, message: str, error: Exception):
         """오류 로깅 헬퍼 메서드"""
         self.logger.error(f"{message}: {str(error)}")
+    
+    @staticmethod
+    def _keyset_page(rows: List[Dict], limit: int, keys: Tuple[str, ...]) -> Tuple[List[Dict], Optional[str]]:
+        """limit + 1행 조회 결과를 (페이지, 다음 페이지 커서)로 나눔 (마지막 페이지면 커서 None)"""
+        if len(rows) <= limit:
+            return rows, None
+        page = rows[:limit]
+        return page, encode_cursor([page[-1][key] for key in keys])
 
 
 
@@ -255,6 +267,14 @@ class ProductRepository(BaseRepository):
 class ProductItemRepository(BaseRepository):
     """제품 아이템 (개별 재고) 데이터 관리 리포지토리"""
     
+    def __init__(self, db_connection: Optional[DBConnection] = None,
+                 occupancy: Optional[WarehouseOccupancy] = None):
+        super().__init__(db_connection)
+        # 아이템 ID는 id_sequence 테이블에서 블록 단위로 예약해 메모리에서 발급
+        self.id_sequence = IdSequence(self.db, "product_item", "product_item", DB_ID_BLOCK_SIZE)
+        # 창고 점유량 캐시 (추가/삭제 후 증감 반영 - warehouse.used_capacity는 product_item 트리거가 갱신)
+        self.occupancy = occupancy
+    
     def get_all(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """모든 제품 아이템 정보 조회"""
         try:
@@ -276,6 +296,58 @@ class ProductItemRepository(BaseRepository):
             self._log_error("제품 아이템 정보 조회 오류", e)
             return []
     
+    def get_page(self, limit: int = 20, cursor: Optional[str] = None,
+                 warehouse_id: Optional[str] = None,
+                 search: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """제품 아이템 목록을 최근 입고 순으로 한 페이지 조회 (키셋 페이지네이션)
+        
+        (entry_time, id) 내림차순으로 정렬하고 커서의 (entry_time, id)보다 뒤의 행부터 읽으므로
+        페이지가 깊어져도 조회 비용이 같습니다. 다음 페이지 여부를 알기 위해 limit + 1행을 읽습니다.
+        search가 있으면 상품명 또는 아이템 ID 부분 일치 행만 조회합니다 (다음 페이지도 같은 검색어).
+        
+        Returns:
+            Tuple[List[Dict], Optional[str]]: (아이템 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+            
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        after = decode_cursor(cursor, 2)
+        try:
+            conditions = []
+            params = []
+            
+            if warehouse_id:
+                conditions.append("pi.warehouse_id = %s")
+                params.append(warehouse_id)
+            
+            if search:
+                pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                conditions.append("(p.name LIKE %s OR pi.id LIKE %s)")
+                params.extend([pattern, pattern])
+            
+            if after:
+                conditions.append("(pi.entry_time < %s OR (pi.entry_time = %s AND pi.id < %s))")
+                params.extend([after[0], after[0], after[1]])
+            
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = f"""
+                SELECT pi.id, pi.warehouse_id, pi.product_id, pi.exp, pi.entry_time,
+                       p.name, p.category
+                FROM product_item pi
+                JOIN product p ON pi.product_id = p.id
+                {where}
+                ORDER BY pi.entry_time DESC, pi.id DESC
+                LIMIT %s
+            """
+            params.append(limit + 1)
+            
+            # 필터/커서 조합마다 SQL이 달라지므로 준비문 캐시를 거치지 않음
+            result = self.db.execute_dict_query(query, tuple(params), prepare=False)
+            return self._keyset_page(result or [], limit, ("entry_time", "id"))
+        except Exception as e:
+            self._log_error("제품 아이템 페이지 조회 오류", e)
+            return [], None
+    
     def get_by_id(self, item_id: str) -> Optional[Dict]:
         """ID로 제품 아이템 정보 조회"""
         try:
@@ -384,57 +456,229 @@ class ProductItemRepository(BaseRepository):
             self._log_error(f"유통기한 만료 아이템 조회 오류", e)
             return []
     
-    def add_item(self, product_id: str, warehouse_id: str, exp_date: Union[datetime, str], entry_time: Optional[str] = None) -> Optional[str]:
-        """제품 아이템 추가"""
+    def get_expiry_summary(self, days: int = 7) -> Optional[Dict[str, Any]]:
+        """창고별 유통기한 경과/오늘 만료/임박(days일 이내) 개수를 쿼리 한 번으로 집계
+        
+        exp <= 오늘+days 범위만 읽으므로 (exp 인덱스 범위 스캔) 전체 재고 수와 관계없이
+        기한이 가까운 아이템 수만큼만 비용이 듭니다.
+        
+        Returns:
+            Optional[Dict[str, Any]]: 창고별 개수와 합계 (DB를 사용할 수 없으면 None)
+        """
         try:
-            # 유효한 제품 ID 확인
-            product_query = "SELECT id FROM product WHERE id = %s"
-            product_result = self.db.execute_query(product_query, (product_id,))
+            today = datetime.now().date()
+            target_date = today + timedelta(days=days)
             
-            if not product_result:
-                self.logger.warning(f"존재하지 않는 제품 ID: {product_id}")
+            query = """
+                SELECT warehouse_id,
+                       SUM(CASE WHEN DATEDIFF(exp, %s) < 0 THEN 1 ELSE 0 END) AS expired,
+                       SUM(CASE WHEN DATEDIFF(exp, %s) = 0 THEN 1 ELSE 0 END) AS today,
+                       SUM(CASE WHEN DATEDIFF(exp, %s) > 0 THEN 1 ELSE 0 END) AS upcoming
+                FROM product_item
+                WHERE exp <= %s
+                GROUP BY warehouse_id
+            """
+            result = self.db.execute_dict_query(query, (today, today, today, target_date))
+            if result is None:
                 return None
             
+            # MySQL의 SUM 결과는 Decimal이므로 int로 변환
+            warehouses = {
+                row['warehouse_id']: {
+                    "expired": int(row['expired'] or 0),
+                    "today": int(row['today'] or 0),
+                    "upcoming": int(row['upcoming'] or 0)
+                }
+                for row in result
+            }
+            return {
+                "warehouses": warehouses,
+                "expired_count": sum(counts["expired"] for counts in warehouses.values()),
+                "today_count": sum(counts["today"] for counts in warehouses.values()),
+                "upcoming_count": sum(counts["upcoming"] for counts in warehouses.values()),
+                "days_threshold": days,
+                "reference_date": today.isoformat()
+            }
+        except Exception as e:
+            self._log_error("유통기한 현황 집계 오류", e)
+            return None
+    
+    def iter_expiry_items(self, days: int = 7, warehouse_id: Optional[str] = None) -> Iterator[Dict]:
+        """유통기한 경과/임박 아이템을 유통기한 순으로 한 행씩 넘겨주는 제너레이터
+        
+        남은 일수(days_remaining)와 상태(expired/danger/warning)는 SQL에서 계산합니다.
+        
+        Raises:
+            RuntimeError: DB를 사용할 수 없거나 조회 실패
+        """
+        today = datetime.now().date()
+        target_date = today + timedelta(days=days)
+        
+        query = """
+            SELECT pi.id, pi.warehouse_id, pi.product_id, pi.exp, pi.entry_time,
+                   p.name, p.category,
+                   DATEDIFF(pi.exp, %s) AS days_remaining,
+                   CASE WHEN pi.exp < %s THEN 'expired'
+                        WHEN pi.exp = %s THEN 'danger'
+                        ELSE 'warning' END AS status
+            FROM product_item pi
+            JOIN product p ON pi.product_id = p.id
+            WHERE pi.exp <= %s
+        """
+        params = [today, today, today, target_date]
+        if warehouse_id:
+            query += " AND pi.warehouse_id = %s"
+            params.append(warehouse_id)
+        query += " ORDER BY pi.exp ASC, pi.id ASC"
+        
+        return self.db.stream_query(query, tuple(params))
+    
+    def add_item(self, product_id: str, warehouse_id: str, exp_date: Union[datetime, str], entry_time: Optional[str] = None) -> Optional[str]:
+        """제품 아이템 추가
+        
+        ID는 미리 예약한 블록에서 받고, 제품 존재 확인은 INSERT ... SELECT 안에서 합니다
+        (블록이 바닥날 때만 예약 왕복 추가). 창고 사용량(used_capacity)은 product_item 트리거가
+        같은 문장에서 올리므로 자동 커밋 INSERT 한 번(왕복 1회)으로 끝납니다.
+        """
+        try:
             # 입고 시간이 없으면 현재 시간 사용
             if not entry_time:
                 entry_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            # 새 아이템 ID 생성 (최대 ID + 1)
-            id_query = "SELECT MAX(CAST(id AS UNSIGNED)) FROM product_item"
-            id_result = self.db.execute_query(id_query)
-            
-            if id_result and id_result[0][0]:
-                new_id = str(int(id_result[0][0]) + 1)
-            else:
-                new_id = "1"
+            # 새 아이템 ID 발급 (동시에 여러 분류기가 추가해도 겹치지 않음)
+            next_id = self.id_sequence.next_id()
+            if next_id is None:
+                self.logger.warning("아이템 ID를 발급할 수 없습니다.")
+                return None
             
             # 적절한 자릿수로 패딩
-            new_id = new_id.zfill(2)
+            new_id = str(next_id).zfill(2)
             
-            # 아이템 추가
+            # 아이템 추가 (존재하는 제품 ID일 때만 행이 삽입됨)
             query = """
                 INSERT INTO product_item 
                 (id, warehouse_id, product_id, exp, entry_time) 
-                VALUES (%s, %s, %s, %s, %s)
+                SELECT %s, %s, p.id, %s, %s FROM product p WHERE p.id = %s
             """
             
-            affected = self.db.execute_update(query, (new_id, warehouse_id, product_id, exp_date, entry_time))
+            affected = self.db.execute_update(query, (new_id, warehouse_id, exp_date, entry_time, product_id))
             
             if affected > 0:
-                # 창고 용량 업데이트
-                self._update_warehouse_capacity(warehouse_id)
+                self._apply_occupancy({warehouse_id: affected})
                 return new_id
-            else:
-                return None
+            
+            self.logger.warning(f"존재하지 않는 제품 ID: {product_id}")
+            return None
                 
         except Exception as e:
             self._log_error(f"제품 아이템 추가 오류 (제품: {product_id})", e)
             return None
-    
+
+    def add_items(self, items: List[Dict]) -> List[Optional[str]]:
+        """제품 아이템 여러 개를 한 번에 추가 (분류 완료 아이템 묶음 저장용)
+
+        존재하는 제품 확인 SELECT 한 번과, 한 트랜잭션 안의 여러 행 INSERT 한 번으로 묶음 전체를
+        저장합니다 (창고 사용량은 product_item 트리거가 갱신). 발급한 ID는 각 item['item_id']에
+        기록해 두므로, 실패한 묶음을 그대로 다시 넣어도 이미 저장된 ID의 행은 건너뜁니다.
+        제약 위반(잘못된 창고 등)으로 여러 행 INSERT가 실패하면 같은 트랜잭션에서 한 행씩 다시
+        넣어 문제 행만 뺍니다.
+
+        Args:
+            items: product_id, warehouse_id, exp_date, entry_time (, item_id) 딕셔너리 목록
+
+        Returns:
+            List[Optional[str]]: 아이템별 ID (존재하지 않는 제품이거나 저장되지 않은 행이면 None)
+
+        Raises:
+            RuntimeError: DB를 사용할 수 없거나 저장 실패 (호출 측에서 재시도)
+        """
+        if not items:
+            return []
+
+        product_ids = sorted({item['product_id'] for item in items})
+        placeholders = ", ".join(["%s"] * len(product_ids))
+        rows = self.db.execute_query(f"SELECT id FROM product WHERE id IN ({placeholders})", tuple(product_ids),
+                                     prepare=False)
+        if rows is None:
+            raise RuntimeError("DB 연결 없음")
+        known_products = {row[0] for row in rows}
+
+        results: List[Optional[str]] = []
+        rows = []           # (결과 위치, INSERT 값)
+        retried_ids = []
+        for item in items:
+            if item['product_id'] not in known_products:
+                self.logger.warning(f"존재하지 않는 제품 ID: {item['product_id']}")
+                results.append(None)
+                continue
+
+            if item.get('item_id'):
+                # 이전 시도에서 ID를 받은 기록 (저장됐을 수 있음)
+                retried_ids.append(item['item_id'])
+            else:
+                next_id = self.id_sequence.next_id()
+                if next_id is None:
+                    raise RuntimeError("아이템 ID를 발급할 수 없습니다.")
+                item['item_id'] = str(next_id).zfill(2)
+
+            rows.append((len(results), (item['item_id'], item['warehouse_id'], item['product_id'], item['exp_date'],
+                                        item.get('entry_time') or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))))
+            results.append(item['item_id'])
+
+        if not rows:
+            return results
+
+        deltas: Dict[str, int] = {}
+        with self.db.transaction() as tx:
+            if retried_ids:
+                placeholders = ", ".join(["%s"] * len(retried_ids))
+                saved = {row[0] for row in tx.execute_query(
+                    f"SELECT id FROM product_item WHERE id IN ({placeholders})", tuple(retried_ids), prepare=False
+                )}
+                rows = [row for row in rows if row[1][0] not in saved]
+
+            if rows:
+                query = f"""
+                    INSERT INTO product_item
+                    (id, warehouse_id, product_id, exp, entry_time)
+                    VALUES {", ".join(["(%s, %s, %s, %s, %s)"] * len(rows))}
+                """
+                try:
+                    tx.execute_update(query, tuple(value for _, values in rows for value in values), prepare=False)
+                    inserted = rows
+                except INTEGRITY_ERRORS:
+                    # 실패한 문장만 되돌려지고 트랜잭션은 유지됨 - 한 행씩 넣어 문제 행만 제외
+                    inserted = self._insert_rows_one_by_one(tx, rows, results)
+
+                for _, values in inserted:
+                    deltas[values[1]] = deltas.get(values[1], 0) + 1
+
+        self._apply_occupancy(deltas)
+        return results
+
+    def _insert_rows_one_by_one(self, tx, rows: List[Tuple[int, Tuple]],
+                                results: List[Optional[str]]) -> List[Tuple[int, Tuple]]:
+        """여러 행 INSERT가 제약 위반으로 실패했을 때 한 행씩 INSERT (실패한 행의 결과는 None)"""
+        query = """
+            INSERT INTO product_item
+            (id, warehouse_id, product_id, exp, entry_time)
+            VALUES (%s, %s, %s, %s, %s)
+        """
+        inserted = []
+        for index, values in rows:
+            try:
+                tx.execute_update(query, values)
+            except INTEGRITY_ERRORS as e:
+                self.logger.warning(f"제품 아이템 저장 실패 (ID: {values[0]}, 창고: {values[1]}): {str(e)}")
+                results[index] = None
+                continue
+            inserted.append((index, values))
+        return inserted
+
     def remove_item(self, item_id: str) -> bool:
-        """제품 아이템 제거"""
+        """제품 아이템 제거 (창고 사용량은 product_item 트리거가 내림)"""
         try:
-            # 아이템 정보 가져오기 (로깅 목적)
+            # 아이템 정보 가져오기 (점유량 캐시 갱신 및 로깅)
             item_query = "SELECT warehouse_id, product_id FROM product_item WHERE id = %s"
             item_result = self.db.execute_query(item_query, (item_id,))
             
@@ -445,47 +689,39 @@ class ProductItemRepository(BaseRepository):
             warehouse_id = item_result[0][0]
             product_id = item_result[0][1]
             
-            # 아이템 삭제
-            query = "DELETE FROM product_item WHERE id = %s"
-            affected = self.db.execute_update(query, (item_id,))
+            # 아이템 삭제 (동시에 같은 아이템을 지우면 한쪽만 행이 삭제되므로 그쪽만 캐시에 반영)
+            affected = self.db.execute_update("DELETE FROM product_item WHERE id = %s", (item_id,))
             
             if affected > 0:
-                # 로그 기록: used_capacity를 업데이트할 필요 없음 (실시간 계산으로 변경)
+                self._apply_occupancy({warehouse_id: -affected})
                 self.logger.info(f"제품 아이템 제거 성공: ID={item_id}, 창고={warehouse_id}, 제품={product_id}")
                 return True
-            else:
-                return False
-                
+            
+            return False
         except Exception as e:
             self._log_error(f"제품 아이템 제거 오류 (ID: {item_id})", e)
             return False
     
+    def _apply_occupancy(self, deltas: Dict[str, int]):
+        """반영된 창고별 증감을 점유량 캐시에 반영"""
+        if self.occupancy and deltas:
+            self.occupancy.apply(deltas)
+    
     def get_warehouse_usage(self, warehouse_id: str = None) -> Dict[str, int]:
-        """창고별 사용량 계산 (DB에서 실시간 조회)"""
+        """창고별 사용량 조회 (product_item을 세지 않고 점유량 캐시/used_capacity 사용)"""
         try:
-            query = """
-                SELECT warehouse_id, COUNT(*) as count
-                FROM product_item
-            """
-            params = []
+            if self.occupancy:
+                usage = {wh_id: values["used"] for wh_id, values in self.occupancy.snapshot().items()}
+            else:
+                result = self.db.execute_query("SELECT id, used_capacity FROM warehouse")
+                usage = {row[0]: row[1] or 0 for row in result or []}
             
             if warehouse_id:
-                query += " WHERE warehouse_id = %s"
-                params.append(warehouse_id)
-                
-            query += " GROUP BY warehouse_id"
-            
-            result = self.db.execute_dict_query(query, tuple(params) if params else None)
-            
-            usage = {}
-            if result:
-                for row in result:
-                    usage[row["warehouse_id"]] = row["count"]
-                    
+                return {warehouse_id: usage[warehouse_id]} if warehouse_id in usage else {}
             return usage
             
         except Exception as e:
-            self._log_error(f"창고 사용량 계산 오류", e)
+            self._log_error(f"창고 사용량 조회 오류", e)
             return {}
 
 class EmployeeRepository(BaseRepository):
@@ -546,8 +782,17 @@ class EmployeeRepository(BaseRepository):
 class AccessLogRepository(BaseRepository):
     """출입 로그 관리 리포지토리"""
     
-    def get_logs(self, limit: int = 20, offset: int = 0, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict]:
-        """출입 로그 조회"""
+    def get_logs(self, limit: int = 20, cursor: Optional[str] = None, start_date: Optional[str] = None,
+                 end_date: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """출입 로그를 최신 순으로 한 페이지 조회 (키셋 페이지네이션)
+        
+        Returns:
+            Tuple[List[Dict], Optional[str]]: (로그 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+            
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        after = decode_cursor(cursor, 2)
         try:
             query = """
                 SELECT id, card_id, employee_name, access_type, timestamp, created_at 
@@ -557,28 +802,30 @@ class AccessLogRepository(BaseRepository):
             
             params = []
             
-            # 날짜 필터링 조건 추가
+            # 날짜 필터링 조건 추가 (컬럼을 함수로 감싸지 않아야 timestamp 인덱스를 사용)
             if start_date:
-                query += " AND DATE(timestamp) >= %s"
+                query += " AND timestamp >= %s"
                 params.append(start_date)
             
             if end_date:
-                query += " AND DATE(timestamp) <= %s"
+                query += " AND timestamp < DATE_ADD(%s, INTERVAL 1 DAY)"
                 params.append(end_date)
             
-            # 정렬 및 페이징
-            query += " ORDER BY timestamp DESC LIMIT %s OFFSET %s"
-            params.extend([limit, offset])
+            # 이전 페이지의 마지막 (timestamp, id) 다음부터
+            if after:
+                query += " AND (timestamp < %s OR (timestamp = %s AND id < %s))"
+                params.extend([after[0], after[0], after[1]])
             
-            result = self.db.execute_dict_query(query, tuple(params))
+            # 정렬 및 페이징
+            query += " ORDER BY timestamp DESC, id DESC LIMIT %s"
+            params.append(limit + 1)
             
-            if not result:
-                return []
-                
-            return result
+            # 필터/커서 조합마다 SQL이 달라지므로 준비문 캐시를 거치지 않음
+            result = self.db.execute_dict_query(query, tuple(params), prepare=False)
+            return self._keyset_page(result or [], limit, ("timestamp", "id"))
         except Exception as e:
             self._log_error("출입 로그 조회 오류", e)
-            return []
+            return [], None
     
     def get_daily_stats(self, date: str) -> Optional[Dict]:
         """특정 날짜의 출입 통계 조회"""
@@ -682,6 +929,22 @@ class WarningLogRepository(BaseRepository):
             self._log_error(f"온도 경고 로그 저장 오류 (창고: {warehouse_id})", e)
             return False
     
+    def log_temperature_warnings(self, rows: List[Tuple[str, float, str]]) -> bool:
+        """온도 경고 로그 일괄 저장 (rows: [(창고 ID, 온도, 상태), ...])"""
+        if not rows:
+            return True
+        try:
+            query = """
+                INSERT INTO temp_warning_logs 
+                (warehouse_id, temperature, status, dttm) 
+                VALUES (%s, %s, %s, NOW())
+            """
+            affected = self.db.execute_many(query, rows)
+            return affected > 0
+        except Exception as e:
+            self._log_error(f"온도 경고 로그 일괄 저장 오류 ({len(rows)}건)", e)
+            return False
+    
     def get_temp_warnings(self, warehouse_id: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """온도 경고 로그 조회"""
         try:
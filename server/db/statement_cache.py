@@ -0,0 +1,105 @@
+# db/statement_cache.py
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# MySQL 오류 1295 (ER_UNSUPPORTED_PS): 준비문 프로토콜로 실행할 수 없는 SQL
+ER_UNSUPPORTED_PS = 1295
+
+
+# ==== 준비문 통계 ====
+class StatementStats:
+    """풀 전체에서 공유하는 준비문 캐시 지표 (연결이 재생성되어도 유지)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.unprepared = 0             # 준비문을 쓸 수 없어 일반 실행한 횟수
+        self.unpreparable = set()       # ER_UNSUPPORTED_PS가 난 SQL 텍스트
+
+    def count(self, field: str):
+        with self.lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def mark_unpreparable(self, query: str):
+        with self.lock:
+            self.unpreparable.add(query)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "unprepared": self.unprepared,
+                "unpreparable": len(self.unpreparable)
+            }
+
+
+# ==== 연결별 준비문 캐시 ====
+class StatementCache:
+    """연결 하나에 묶인 SQL 텍스트 -> 준비문 커서 LRU 캐시
+
+    mysql.connector의 준비문 커서(cursor(prepared=True))는 처음 execute할 때 서버에서
+    SQL을 한 번 파싱(PREPARE)하고, 같은 SQL로 다시 execute하면 파라미터만 보냅니다.
+    SQL마다 커서를 하나씩 보관해 재사용하며, capacity를 넘으면 가장 오래 쓰지 않은
+    커서를 닫아 서버의 준비문도 해제합니다. 연결은 한 번에 한 스레드만 쓰므로 잠금이 없습니다.
+
+    행 수만큼 VALUES/IN 목록이 늘어나는 SQL은 실행할 때마다 텍스트가 달라 재사용되지 않고
+    자주 쓰는 준비문만 밀어내므로, 자리표시자가 max_params보다 많으면 캐시하지 않습니다
+    (호출 측에서 prepare=False로 명시할 수도 있음).
+    """
+
+    def __init__(self, raw: Any, capacity: int, stats: StatementStats, max_params: int = 16):
+        self.raw = raw
+        self.capacity = capacity
+        self.max_params = max_params
+        self.stats = stats
+        self.cursors: 'OrderedDict[str, Any]' = OrderedDict()
+
+    def get(self, query: str) -> Optional[Any]:
+        """SQL에 대한 준비문 커서를 반환 (캐시 비활성/준비 불가/자리표시자가 많은 SQL이면 None)"""
+        if (self.capacity <= 0 or query in self.stats.unpreparable
+                or query.count("%s") > self.max_params):
+            self.stats.count("unprepared")
+            return None
+
+        cursor = self.cursors.get(query)
+        if cursor is not None:
+            self.cursors.move_to_end(query)
+            self.stats.count("hits")
+            return cursor
+
+        self.stats.count("misses")
+        cursor = self.raw.cursor(prepared=True)
+        self.cursors[query] = cursor
+
+        if len(self.cursors) > self.capacity:
+            _, evicted = self.cursors.popitem(last=False)
+            self._close_cursor(evicted)
+            self.stats.count("evictions")
+
+        return cursor
+
+    def discard(self, query: str):
+        """실행 오류가 난 SQL의 커서를 버림 (다음 실행 때 다시 준비)"""
+        cursor = self.cursors.pop(query, None)
+        if cursor is not None:
+            self._close_cursor(cursor)
+
+    def __len__(self):
+        return len(self.cursors)
+
+    @staticmethod
+    def _close_cursor(cursor: Any):
+        try:
+            cursor.close()
+        except Exception:
+            pass
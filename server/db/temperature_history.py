@@ -0,0 +1,275 @@
+# db/temperature_history.py
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# ==== 테이블 정의 ====
+# 원본 측정값: 창고별 초 단위 한 행 (온도는 0.01°C 단위 정수 - smallint로 -327.68 ~ 327.67°C)
+TEMP_READINGS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS `temp_readings` (
+      `warehouse_id` varchar(20) NOT NULL,
+      `ts` int unsigned NOT NULL,
+      `centi` smallint NOT NULL,
+      PRIMARY KEY (`warehouse_id`, `ts`)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+# 집계 테이블: bucket은 구간 시작 시각(epoch 초), 평균은 sum_centi / samples
+# 합계와 개수를 두므로 상위 집계(15분, 1시간)를 하위 집계에서 정확히 다시 계산할 수 있음
+ROLLUP_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS `{table}` (
+      `warehouse_id` varchar(20) NOT NULL,
+      `bucket` int unsigned NOT NULL,
+      `min_centi` smallint NOT NULL,
+      `max_centi` smallint NOT NULL,
+      `sum_centi` int NOT NULL,
+      `samples` int NOT NULL,
+      PRIMARY KEY (`warehouse_id`, `bucket`)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+# 해상도 단계: (이름, 구간 길이(초), 테이블, 보관 기간(초)) - 세밀한 단계부터
+RAW_LEVEL = ("raw", 1, "temp_readings", 2 * 86400)
+ROLLUP_LEVELS = [
+    ("1m", 60, "temp_rollup_1m", 14 * 86400),
+    ("15m", 900, "temp_rollup_15m", 90 * 86400),
+    ("1h", 3600, "temp_rollup_1h", 730 * 86400),
+]
+LEVELS = [RAW_LEVEL] + ROLLUP_LEVELS
+
+TEMP_HISTORY_TABLES_SQL = [TEMP_READINGS_TABLE_SQL] + [
+    ROLLUP_TABLE_SQL.format(table=table) for _, _, table, _ in ROLLUP_LEVELS
+]
+
+PURGE_BATCH_SIZE = 5000     # 보관 기간이 지난 행을 한 번에 지우는 최대 행 수 (긴 잠금 방지)
+
+
+def to_centi(temperature: float) -> int:
+    """°C 값을 0.01°C 단위 정수로 변환 (smallint 범위로 제한)"""
+    return max(-32768, min(32767, int(round(temperature * 100))))
+
+
+# ==== 온도 시계열 저장소 ====
+class TemperatureHistory:
+    """창고 온도 측정값 시계열 저장소
+
+    add_readings()는 측정값 묶음을 여러 행 INSERT 한 번으로 temp_readings에 저장합니다
+    (같은 창고/같은 초는 마지막 값으로 덮어쓰므로 같은 묶음을 다시 저장해도 안전).
+    rollup()은 끝난 구간만 1분 -> 15분 -> 1시간 순으로 집계해 각 집계 테이블에 덮어쓰고,
+    purge()는 단계별 보관 기간이 지난 행을 지웁니다. 두 작업은 start_maintenance()의
+    백그라운드 스레드가 주기적으로 실행합니다.
+
+    늦게 저장된 측정값(DB 다운 후 보관 파일 재저장 등)은 가장 이른 시각을 기억해 두었다가
+    다음 집계에서 그 구간부터 다시 계산합니다.
+    """
+
+    def __init__(self, db, warehouse_ids: Sequence[str], grace: float = 10.0):
+        self.db = db
+        self.warehouse_ids = list(warehouse_ids)
+        self.grace = grace                  # 쓰기 버퍼 지연을 감안해 구간이 끝나고 기다리는 시간(초)
+        self.lock = threading.Lock()
+        self.watermarks: Dict[str, int] = {}    # 단계별 다음 집계 시작 시각
+        self.dirty_since: Optional[int] = None  # 마지막 집계 이후 저장된 측정값 중 가장 이른 시각
+        self.maintenance_stop = threading.Event()
+        self.maintenance_thread: Optional[threading.Thread] = None
+
+    # ==== 저장 ====
+    def add_readings(self, readings: List[Dict]) -> List[Optional[bool]]:
+        """측정값 묶음 저장 (WriteBehindBuffer의 flush_func)
+
+        Args:
+            readings: warehouse_id, ts(epoch 초), centi 딕셔너리 목록
+
+        Raises:
+            RuntimeError: DB를 사용할 수 없거나 저장 실패 (호출 측에서 재시도)
+        """
+        if not readings:
+            return []
+
+        query = f"""
+            INSERT INTO temp_readings (warehouse_id, ts, centi)
+            VALUES {", ".join(["(%s, %s, %s)"] * len(readings))}
+            ON DUPLICATE KEY UPDATE centi = VALUES(centi)
+        """
+        params = tuple(value for reading in readings
+                       for value in (reading['warehouse_id'], int(reading['ts']), int(reading['centi'])))
+        # 같은 값으로 덮어쓴 행은 영향받은 행 수가 0일 수 있어 연결 없음과 구분하려고 트랜잭션 사용
+        with self.db.transaction() as tx:
+            tx.execute_update(query, params, prepare=False)
+
+        earliest = min(int(reading['ts']) for reading in readings)
+        with self.lock:
+            if self.dirty_since is None or earliest < self.dirty_since:
+                self.dirty_since = earliest
+        return [True] * len(readings)
+
+    # ==== 집계/정리 ====
+    def rollup(self, now: Optional[float] = None) -> Dict[str, int]:
+        """끝난 구간을 단계별로 집계
+
+        Returns:
+            Dict[str, int]: 단계별로 다시 계산한 구간 수
+        """
+        now = int(now if now is not None else time.time())
+        with self.lock:
+            dirty_since = self.dirty_since
+            self.dirty_since = None
+
+        placeholders = ", ".join(["%s"] * len(self.warehouse_ids))
+        done = {}
+        watermarks = {}
+        try:
+            # 한 트랜잭션으로 실행 - DB 접속 불가면 예외가 나므로 빈 구간을 집계한 것으로 넘어가지 않음
+            with self.db.transaction() as tx:
+                for source, (name, seconds, table, _) in zip(LEVELS, ROLLUP_LEVELS):
+                    _, _, source_table, source_retention = source
+                    end = (now - int(self.grace)) // seconds * seconds
+                    start = self._rollup_start(tx, name, seconds, table, end, source_retention)
+                    if dirty_since is not None:
+                        start = min(start, dirty_since // seconds * seconds)
+                    if start >= end:
+                        continue
+
+                    if source is RAW_LEVEL:
+                        time_column = "ts"
+                        columns = "MIN(centi), MAX(centi), SUM(centi), COUNT(*)"
+                    else:
+                        time_column = "bucket"
+                        columns = "MIN(min_centi), MAX(max_centi), SUM(sum_centi), SUM(samples)"
+                    # 같은 구간을 다시 계산하면 덮어쓰므로 여러 번 실행해도 결과가 같음
+                    query = f"""
+                        INSERT INTO {table} (warehouse_id, bucket, min_centi, max_centi, sum_centi, samples)
+                        SELECT warehouse_id, {time_column} DIV {seconds} * {seconds} AS start_time, {columns}
+                        FROM {source_table}
+                        WHERE warehouse_id IN ({placeholders}) AND {time_column} >= %s AND {time_column} < %s
+                        GROUP BY warehouse_id, start_time
+                        ON DUPLICATE KEY UPDATE min_centi = VALUES(min_centi), max_centi = VALUES(max_centi),
+                                                sum_centi = VALUES(sum_centi), samples = VALUES(samples)
+                    """
+                    # 분 단위로 몇 번만 실행하므로 자주 쓰는 준비문 캐시를 차지하지 않게 일반 실행
+                    tx.execute_update(query, tuple(self.warehouse_ids) + (start, end), prepare=False)
+                    done[name] = (end - start) // seconds
+                    watermarks[name] = end
+        except Exception:
+            # 실패한 구간은 다음 집계에서 다시 계산
+            with self.lock:
+                if dirty_since is not None and (self.dirty_since is None or dirty_since < self.dirty_since):
+                    self.dirty_since = dirty_since
+            raise
+
+        self.watermarks.update(watermarks)
+        return done
+
+    def _rollup_start(self, tx, name: str, seconds: int, table: str, end: int, source_retention: int) -> int:
+        """집계 시작 시각 (처음에는 집계 테이블의 마지막 구간, 비어 있으면 원본 보관 기간 시작)"""
+        if name in self.watermarks:
+            return self.watermarks[name]
+
+        rows = tx.execute_query(f"SELECT MAX(bucket) FROM {table}")
+        if rows and rows[0][0] is not None:
+            # 마지막 구간은 덜 모인 상태로 집계됐을 수 있으므로 다시 계산
+            return int(rows[0][0])
+        return max(0, (end - source_retention) // seconds * seconds)
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """단계별 보관 기간이 지난 행 삭제
+
+        Returns:
+            int: 삭제한 행 수
+        """
+        now = int(now if now is not None else time.time())
+        placeholders = ", ".join(["%s"] * len(self.warehouse_ids))
+        deleted = 0
+        for _, _, table, retention in LEVELS:
+            time_column = "ts" if table == RAW_LEVEL[2] else "bucket"
+            query = f"""
+                DELETE FROM {table}
+                WHERE warehouse_id IN ({placeholders}) AND {time_column} < %s
+                LIMIT {PURGE_BATCH_SIZE}
+            """
+            while True:
+                affected = self.db.execute_update(query, tuple(self.warehouse_ids) + (now - retention,),
+                                                  prepare=False)
+                deleted += affected
+                if affected < PURGE_BATCH_SIZE:
+                    break
+        return deleted
+
+    # ==== 조회 ====
+    def get_history(self, warehouse_id: str, start: int, end: int, max_points: int = 500,
+                    now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """start ~ end(epoch 초) 구간의 온도 기록 조회
+
+        구간 길이 / 해상도가 max_points 이하이고 start가 보관 기간 안에 있는 단계 중 가장
+        세밀한 단계를 고릅니다 (조건을 만족하는 단계가 없으면 1시간 집계).
+
+        Returns:
+            Optional[Dict[str, Any]]: 선택한 해상도와 점 목록 (DB를 사용할 수 없으면 None)
+        """
+        now = int(now if now is not None else time.time())
+        level = LEVELS[-1]
+        for candidate in LEVELS:
+            _, seconds, _, retention = candidate
+            if (end - start) / seconds <= max_points and start >= now - retention:
+                level = candidate
+                break
+
+        name, seconds, table, _ = level
+        if level is RAW_LEVEL:
+            query = """
+                SELECT ts, centi, centi, centi, 1
+                FROM temp_readings
+                WHERE warehouse_id = %s AND ts >= %s AND ts < %s
+                ORDER BY ts
+            """
+        else:
+            query = f"""
+                SELECT bucket, min_centi, max_centi, sum_centi, samples
+                FROM {table}
+                WHERE warehouse_id = %s AND bucket >= %s AND bucket < %s
+                ORDER BY bucket
+            """
+        rows = self.db.execute_query(query, (warehouse_id, start // seconds * seconds, end))
+        if rows is None:
+            return None
+
+        points = [
+            {
+                "t": int(bucket),
+                "min": min_centi / 100,
+                "avg": round(float(sum_centi) / samples / 100, 2),
+                "max": max_centi / 100,
+                "samples": int(samples)
+            }
+            for bucket, min_centi, max_centi, sum_centi, samples in rows
+        ]
+        return {
+            "warehouse_id": warehouse_id,
+            "resolution": name,
+            "bucket_seconds": seconds,
+            "start": start,
+            "end": end,
+            "points": points
+        }
+
+    # ==== 주기 작업 ====
+    def start_maintenance(self, interval: float):
+        """interval초마다 rollup()과 purge()를 실행하는 백그라운드 스레드 시작"""
+        if interval <= 0 or self.maintenance_thread is not None:
+            return
+        self.maintenance_thread = threading.Thread(target=self._maintenance_loop, args=(interval,), daemon=True)
+        self.maintenance_thread.start()
+
+    def stop_maintenance(self):
+        self.maintenance_stop.set()
+
+    def _maintenance_loop(self, interval: float):
+        while not self.maintenance_stop.wait(interval):
+            try:
+                self.rollup()
+                self.purge()
+            except Exception as e:
+                logger.error(f"온도 기록 집계/정리 오류: {str(e)}")
@@ -0,0 +1,284 @@
+# db/write_behind.py
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기록 하나가 저장된 뒤 호출되는 콜백 (저장된 ID, 저장 실패/제외 시 None)
+SavedCallback = Callable[[Optional[Any]], None]
+
+
+# ==== 그룹 커밋 쓰기 버퍼 ====
+class WriteBehindBuffer:
+    """기록을 큐에 모았다가 별도 스레드에서 묶음으로 저장하는 쓰기 지연(write-behind) 버퍼
+
+    submit()은 큐에 넣기만 하고 바로 반환하므로 호출 스레드(TCP 수신 등)가 DB 커밋을
+    기다리지 않습니다. 쓰기 스레드는 batch_size개가 모이거나 첫 기록 후 flush_interval초가
+    지나면 flush_func(records)를 한 번 호출해 묶음 전체를 저장합니다.
+
+    flush_func가 예외를 내면(DB 다운 등) 묶음을 spill_path의 추가 전용 파일에 한 줄씩
+    JSON으로 기록하고 fsync한 뒤, retry_interval초마다 파일을 앞에서부터 다시 저장합니다.
+    파일이 남아 있는 동안 새 기록도 파일 뒤에 붙여 저장 순서를 유지합니다.
+    다시 저장은 최소 한 번(at-least-once)이라 재저장 도중 서버가 죽으면 마지막 묶음이
+    한 번 더 저장될 수 있으므로, flush_func는 같은 기록을 다시 받아도 안전해야 합니다.
+    """
+
+    def __init__(self, flush_func: Callable[[List[Dict]], List[Optional[Any]]],
+                 batch_size: int = 20, flush_interval: float = 0.2, queue_size: int = 1000,
+                 spill_path: Optional[str] = None, retry_interval: float = 5.0,
+                 name: str = "write-behind"):
+        self.flush_func = flush_func
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self.spill_path = spill_path
+        self.retry_interval = retry_interval
+        self.name = name
+
+        self.queue: 'queue.Queue[Optional[Tuple[Dict, Optional[SavedCallback]]]]' = queue.Queue(
+            maxsize=max(1, queue_size)
+        )
+        self.spill_lock = threading.Lock()
+        self.spilled_count = self._count_spilled()
+        self.last_replay = 0.0
+        self.running = True
+
+        # 통계
+        self.stats_lock = threading.Lock()
+        self.submitted = 0
+        self.flushed = 0
+        self.batches = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.failed_flushes = 0
+
+        if self.spilled_count:
+            logger.warning(f"{self.name}: 이전 실행에서 저장하지 못한 기록 {self.spilled_count}개 - 재저장 대기")
+
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    # ==== 공개 API ====
+    def submit(self, record: Dict, callback: Optional[SavedCallback] = None) -> bool:
+        """기록을 쓰기 큐에 추가 (블로킹 없음)
+
+        Returns:
+            bool: 큐에 들어갔으면 True, 큐가 가득 차 바로 파일로 옮겼으면 False
+        """
+        with self.stats_lock:
+            self.submitted += 1
+
+        if self.running:
+            try:
+                self.queue.put_nowait((record, callback))
+                return True
+            except queue.Full:
+                logger.warning(f"{self.name}: 쓰기 큐 가득 참 - 파일로 옮김")
+
+        self._spill([record])
+        return False
+
+    def stop(self, timeout: float = 5.0):
+        """남은 기록을 저장(또는 파일로 옮김)하고 쓰기 스레드 종료"""
+        if not self.running:
+            return
+        self.running = False
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self.thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """쓰기 버퍼 통계 반환"""
+        with self.stats_lock:
+            return {
+                "queued": self.queue.qsize(),
+                "submitted": self.submitted,
+                "flushed": self.flushed,
+                "batches": self.batches,
+                "avg_batch": round(self.flushed / self.batches, 2) if self.batches else 0.0,
+                "spilled": self.spilled,
+                "replayed": self.replayed,
+                "failed_flushes": self.failed_flushes,
+                "spill_pending": self.spilled_count
+            }
+
+    # ==== 쓰기 스레드 ====
+    def _run(self):
+        while True:
+            batch, stopping = self._collect_batch()
+
+            if self.spilled_count and (stopping or time.time() - self.last_replay >= self.retry_interval):
+                self._replay()
+
+            if batch:
+                self._flush(batch)
+
+            if stopping:
+                break
+
+        logger.info(f"{self.name}: 쓰기 스레드 종료 (남은 파일 기록 {self.spilled_count}개)")
+
+    def _collect_batch(self) -> Tuple[List[Tuple[Dict, Optional[SavedCallback]]], bool]:
+        """첫 기록을 기다린 뒤 batch_size개 또는 flush_interval초까지 모아 반환"""
+        # 파일에 남은 기록이 있으면 재저장 주기마다 깨어남
+        wait = self.retry_interval if self.spilled_count else None
+        try:
+            entry = self.queue.get(timeout=wait)
+        except queue.Empty:
+            return [], False
+        if entry is None:
+            return self._drain(), True
+
+        batch = [entry]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                entry = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                batch.extend(self._drain())
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    def _drain(self) -> List[Tuple[Dict, Optional[SavedCallback]]]:
+        entries = []
+        while True:
+            try:
+                entry = self.queue.get_nowait()
+            except queue.Empty:
+                return entries
+            if entry is not None:
+                entries.append(entry)
+
+    def _flush(self, batch: List[Tuple[Dict, Optional[SavedCallback]]]):
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start:start + self.batch_size]
+            records = [record for record, _ in chunk]
+
+            # 파일에 앞선 기록이 남아 있으면 순서를 지키기 위해 뒤에 붙임
+            if self.spilled_count:
+                self._spill(records)
+                continue
+
+            results = self._call_flush(records)
+            if results is None:
+                self._spill(records)
+                continue
+
+            for (_, callback), result in zip(chunk, results):
+                if callback:
+                    try:
+                        callback(result)
+                    except Exception as e:
+                        logger.error(f"{self.name}: 저장 콜백 오류: {str(e)}")
+
+    def _call_flush(self, records: List[Dict]) -> Optional[List[Optional[Any]]]:
+        """flush_func 호출 (실패 시 None)"""
+        try:
+            results = self.flush_func(records)
+        except Exception as e:
+            with self.stats_lock:
+                self.failed_flushes += 1
+            logger.warning(f"{self.name}: 묶음 저장 실패 ({len(records)}개): {str(e)}")
+            return None
+
+        with self.stats_lock:
+            self.flushed += len(records)
+            self.batches += 1
+        return results
+
+    # ==== 파일 보관/재저장 ====
+    def _spill(self, records: List[Dict]):
+        """기록을 추가 전용 파일에 붙이고 fsync (파일 경로가 없으면 버림)"""
+        if not self.spill_path:
+            logger.error(f"{self.name}: 보관 파일 미설정 - 기록 {len(records)}개 유실")
+            return
+
+        lines = "".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records)
+        with self.spill_lock:
+            try:
+                directory = os.path.dirname(self.spill_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                logger.error(f"{self.name}: 보관 파일 기록 실패 - 기록 {len(records)}개 유실: {str(e)}")
+                return
+            self.spilled_count += len(records)
+
+        with self.stats_lock:
+            self.spilled += len(records)
+        logger.info(f"{self.name}: 기록 {len(records)}개 파일 보관 (대기 {self.spilled_count}개)")
+
+    def _replay(self):
+        """보관 파일의 기록을 앞에서부터 묶음 단위로 다시 저장"""
+        self.last_replay = time.time()
+
+        with self.spill_lock:
+            records = self._read_spilled()
+
+        done = 0
+        while done < len(records):
+            chunk = records[done:done + self.batch_size]
+            if self._call_flush(chunk) is None:
+                break
+            done += len(chunk)
+            with self.stats_lock:
+                self.replayed += len(chunk)
+
+        if done:
+            with self.spill_lock:
+                self._truncate_spilled(done)
+            logger.info(f"{self.name}: 보관 기록 {done}개 재저장 (남은 기록 {self.spilled_count}개)")
+
+    def _read_spilled(self) -> List[Dict]:
+        records = []
+        try:
+            with open(self.spill_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # 기록 도중 죽어 잘린 마지막 줄 등
+                        logger.error(f"{self.name}: 손상된 보관 기록 무시: {line[:80]!r}")
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _truncate_spilled(self, done: int):
+        """재저장한 앞쪽 done개를 파일에서 제거 (임시 파일 작성 후 교체)"""
+        # 읽은 뒤 새로 붙은 기록도 보존하도록 잠금 안에서 다시 읽음
+        remaining = self._read_spilled()[done:]
+        if not remaining:
+            try:
+                os.remove(self.spill_path)
+            except FileNotFoundError:
+                pass
+        else:
+            temp_path = self.spill_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for record in remaining:
+                    f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.spill_path)
+        self.spilled_count = len(remaining)
+
+    def _count_spilled(self) -> int:
+        if not self.spill_path:
+            return 0
+        return len(self._read_spilled())
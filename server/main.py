@@ -93,9 +93,32 @@ else:
     from utils.tcp_handler import TCPHandler
     tcp_handler = TCPHandler(SERVER_HOST, TCP_PORT)
 
+# 디바이스 연결/해제를 GUI에 즉시 알림
+def emit_device_connection(device_id, client_id, connected, reason):
+    socketio.emit("event", {
+        "type": "event",
+        "category": "device",
+        "action": "connection",
+        "payload": {
+            "device_id": device_id,
+            "client_id": client_id,
+            "connected": connected,
+            "reason": reason
+        },
+        "timestamp": int(datetime.datetime.now().timestamp())
+    }, namespace='/ws')
+
+tcp_handler.add_connection_listener(emit_device_connection)
+
 # TCP 서버 시작
 tcp_handler.start()
 
+# DB 백그라운드 작업 시작 (창고 점유량 점검, 온도 기록 집계/보관 기간 정리)
+from db import warehouse_occupancy, temperature_history
+warehouse_occupancy.start_reconcile(CONFIG["OCCUPANCY_RECONCILE_INTERVAL"])
+if temperature_history is not None:
+    temperature_history.start_maintenance(CONFIG["TEMP_HISTORY_ROLLUP_INTERVAL"])
+
 # TCP 서버 상태 확인 (디버깅 목적)
 logger.info("==== TCP 서버 상태 ====")
 logger.info(f"TCP 서버 주소: {SERVER_HOST}:{TCP_PORT}")
@@ -185,7 +208,25 @@ except Exception as e:
 @app.route('/api/status', methods=['GET'])
 def get_status():
     system_monitor = SystemMonitor()
-    return jsonify(system_monitor.get_system_status())
+    status = system_monitor.get_system_status()
+    
+    # TCP 디스패치 라우트별 호출 횟수
+    if hasattr(tcp_handler, 'get_dispatch_stats'):
+        status["tcp_dispatch"] = tcp_handler.get_dispatch_stats()
+    
+    # 연결별 송신 큐 깊이 및 전송 지연
+    if hasattr(tcp_handler, 'get_send_stats'):
+        status["tcp_send"] = tcp_handler.get_send_stats()
+    
+    # 디바이스/명령별 응답 왕복 지연
+    if hasattr(tcp_handler, 'get_command_stats'):
+        status["tcp_commands"] = tcp_handler.get_command_stats()
+    
+    # 카메라 프레임 수신/디코딩 파이프라인 (프레임 수와 단계별 지연)
+    if udp_handler:
+        status["udp_barcode"] = udp_handler.get_stats()
+    
+    return jsonify(status)
 
 @app.errorhandler(404)
 def not_found_error(error):
@@ -196,6 +237,9 @@ def internal_error(error):
     app.logger.error('서버 오류: %s', str(error))
     return jsonify({"status": "error", "message": "서버 내부 오류가 발생했습니다"}), 500
     
+# UDP 바코드 핸들러 (서버 실행 시 생성)
+udp_handler = None
+
 def handle_barcode(barcode_data):
     """바코드 데이터 수신 콜백 함수"""
     if sort_controller:
@@ -212,6 +256,15 @@ def handle_barcode(barcode_data):
 # 종료 함수 추가
 def shutdown():
     """서버 종료 시 정리 작업"""
+    env_controller = controllers.get("environment")
+    if env_controller:
+        env_controller.stop()
+    sort_controller = controllers.get("sort")
+    if sort_controller:
+        sort_controller.close()
+    warehouse_occupancy.stop_reconcile()
+    if temperature_history is not None:
+        temperature_history.stop_maintenance()
     tcp_handler.stop()
     logger.info("==== 서버 종료 ====")
 
@@ -223,7 +276,15 @@ if __name__ == '__main__':
             host=UDP_HOST,
             port=UDP_PORT,
             callback=handle_barcode,
-            debug_mode=DEBUG  # 디버그 모드일 때 이미지 시각화
+            debug_mode=DEBUG,  # 디버그 모드일 때 이미지 시각화
+            decode_workers=CONFIG["UDP_DECODE_WORKERS"],
+            queue_size=CONFIG["UDP_FRAME_QUEUE_SIZE"],
+            frame_buffer_size=CONFIG["UDP_FRAME_BUFFER_SIZE"],
+            frame_timeout=CONFIG["UDP_FRAME_TIMEOUT"],
+            max_partial_frames=CONFIG["UDP_MAX_PARTIAL_FRAMES"],
+            detect_mode=CONFIG["UDP_DETECT_MODE"],
+            detect_mode_by_camera=CONFIG["UDP_DETECT_MODE_BY_CAMERA"],
+            full_res_fallback=CONFIG["UDP_DETECT_FULL_RES_FALLBACK"]
         )
         
         # UDP 바코드 핸들러 시작
@@ -238,7 +299,7 @@ if __name__ == '__main__':
         logger.error(f"서버 실행 중 오류 발생: {str(e)}")
     finally:
         # UDP 핸들러 종료
-        if 'udp_handler' in locals() and udp_handler:
+        if udp_handler:
             udp_handler.stop()
         
         # 종료 작업 수행
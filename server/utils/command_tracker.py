@@ -0,0 +1,372 @@
+# server/utils/command_tracker.py
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Callable, List
+
+logger = logging.getLogger(__name__)
+
+# ==== 왕복 지연 히스토그램 ====
+class LatencyHistogram:
+    """명령 왕복 지연(ms) 히스토그램 (고정 버킷)"""
+
+    # 버킷 상한(ms) - 마지막 버킷은 그 이상 전부
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.timeouts = 0
+        self.errors = 0
+        self.retries = 0
+
+    def record(self, rtt_ms: float):
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, rtt_ms)] += 1
+        self.count += 1
+        self.total_ms += rtt_ms
+        if rtt_ms > self.max_ms:
+            self.max_ms = rtt_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"<={bound}": n for bound, n in zip(self.BUCKETS_MS, self.counts)}
+        buckets[f">{self.BUCKETS_MS[-1]}"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "retries": self.retries,
+            "buckets": buckets
+        }
+
+
+# ==== 응답 대기 명령 ====
+class PendingCommand:
+    """응답('R'/'X')을 기다리는 명령 하나 (재전송해도 처음 보낸 연결로만 보냄)"""
+    __slots__ = ('device_id', 'client_id', 'command', 'coalesce_key', 'name', 'future', 'timeout',
+                 'retries_left', 'attempts', 'sent_at', 'deadline')
+
+    def __init__(self, device_id: str, client_id: str, command: str, name: str, future: Future,
+                 timeout: float, retries: int, coalesce_key: Optional[str] = None):
+        self.device_id = device_id
+        self.client_id = client_id
+        self.command = command
+        self.coalesce_key = coalesce_key  # 송신 큐 coalesce 정책의 키 (없으면 명령 앞 4글자)
+        self.name = name                # 히스토그램 집계용 명령 이름 (예: 'so', 'pA')
+        self.future = future
+        self.timeout = timeout
+        self.retries_left = retries
+        self.attempts = 0
+        self.sent_at = 0.0
+        self.deadline = 0.0
+
+
+# ==== 연결로 보낸 명령 한 번 ====
+class SentCommand:
+    """연결로 실제 보낸 명령 한 번 (응답 하나와 짝지어짐)
+
+    재전송하면 같은 명령이 두 번 기록되어 늦게 온 첫 응답과 재전송 응답이 각각 하나씩 소비합니다.
+    pending이 None이면 결과를 기다리지 않는 명령(send())입니다.
+    """
+    __slots__ = ('pending', 'device_id', 'name', 'sent_at', 'expires_at')
+
+    def __init__(self, pending: Optional[PendingCommand], device_id: str, name: str,
+                 sent_at: float, expires_at: float):
+        self.pending = pending
+        self.device_id = device_id
+        self.name = name
+        self.sent_at = sent_at
+        self.expires_at = expires_at
+
+
+# ==== 명령/응답 연관 추적 클래스 ====
+class CommandTracker:
+    """연결별로 보낸 명령을 순서대로 기록하고 다음 'R'/'X' 응답과 짝지어 결과를 전달합니다.
+
+    펌웨어 응답(HRok, HXe1, SRok)에는 명령 식별자가 없으므로 연결마다 실제로 보낸 순서대로
+    줄을 세우고, 응답이 오면 가장 먼저 보낸 명령에 대응시킵니다. 순서가 어긋나지 않도록
+    연결로 나가는 명령('C')은 결과를 기다리지 않는 것(send())까지 모두 여기를 거쳐야 합니다.
+
+    응답 제한 시간이 지나면 같은 연결로 재시도 횟수만큼 다시 보내고, 모두 소진하면
+    timeout으로 완료합니다. 보낸 기록은 제한 시간의 LATE_REPLY_FACTOR배까지 남겨 두어
+    늦게 도착한 응답이 다음 명령의 응답으로 잘못 짝지어지지 않게 합니다.
+
+    결과 future 값:
+        {"success": bool, "reply": str|None, "error": str|None, "attempts": int, "rtt_ms": float|None}
+    """
+
+    LATE_REPLY_FACTOR = 2.0
+
+    def __init__(self, send_func: Callable[..., Future], timeout: float = 1.0, retries: int = 2):
+        # (device_id, command, client_id, coalesce_key, on_replaced) -> Future[bool]
+        self.send_func = send_func
+        self.default_timeout = timeout
+        self.default_retries = retries
+        self.pending: Dict[str, List[PendingCommand]] = {}  # 클라이언트 ID -> 결과 대기 명령
+        self.inflight: Dict[str, deque] = {}                # 클라이언트 ID -> 보낸 순서의 SentCommand
+        self.lock = threading.Lock()
+        # 보낸 기록 추가와 송신 큐 삽입을 한 번에 (연결별 순서 일치) - 송신 큐 삽입 중 교체 알림으로
+        # 완료된 명령의 콜백이 같은 스레드에서 다시 명령을 보낼 수 있으므로 재진입 허용
+        self.send_lock = threading.RLock()
+
+        # (디바이스, 명령 이름) -> 히스토그램
+        self.histograms: Dict[tuple, LatencyHistogram] = {}
+        self.unmatched_replies = 0
+        self.late_replies = 0
+
+    # ==== 명령 전송 ====
+    def submit(self, device_id: str, client_id: Optional[str], command: str, timeout: Optional[float] = None,
+               retries: Optional[int] = None, coalesce_key: Optional[str] = None) -> Future:
+        """명령을 client_id 연결로 보내고 응답 결과를 담을 future를 반환합니다."""
+        if not command.endswith('\n'):
+            command = command + '\n'
+
+        pending = PendingCommand(
+            device_id, client_id, command, self._command_name(command), Future(),
+            self.default_timeout if timeout is None else timeout,
+            self.default_retries if retries is None else retries,
+            coalesce_key
+        )
+
+        if client_id is None:
+            self._resolve(pending, self._failure(pending, "no_connection"))
+            return pending.future
+
+        with self.lock:
+            self.pending.setdefault(client_id, []).append(pending)
+
+        self._send(pending)
+        return pending.future
+
+    def send(self, device_id: str, client_id: str, command: str, coalesce_key: Optional[str] = None) -> Future:
+        """결과를 기다리지 않는 명령을 보내고 전송 결과(True/False) future를 반환합니다.
+
+        응답은 기다리지 않지만 보낸 순서에는 기록해 두어, 그 응답이 다른 명령과 짝지어지지 않게 합니다.
+        """
+        if not command.endswith('\n'):
+            command = command + '\n'
+        now = time.perf_counter()
+        record = SentCommand(None, device_id, self._command_name(command), now,
+                             now + self.default_timeout * self.LATE_REPLY_FACTOR)
+        return self._transmit(client_id, record, command, coalesce_key)
+
+    def _send(self, pending: PendingCommand):
+        pending.attempts += 1
+        pending.sent_at = time.perf_counter()
+        pending.deadline = pending.sent_at + pending.timeout
+
+        record = SentCommand(pending, pending.device_id, pending.name, pending.sent_at,
+                             pending.sent_at + pending.timeout * self.LATE_REPLY_FACTOR)
+        self._transmit(pending.client_id, record, pending.command, pending.coalesce_key)
+
+    def _transmit(self, client_id: str, record: SentCommand, command: str,
+                  coalesce_key: Optional[str] = None) -> Future:
+        with self.send_lock:
+            with self.lock:
+                self.inflight.setdefault(client_id, deque()).append(record)
+            sent = self.send_func(record.device_id, command, client_id, coalesce_key,
+                                  lambda: self._on_replaced(client_id, record))
+
+        sent.add_done_callback(lambda f: self._on_sent(client_id, record, f.result()))
+        return sent
+
+    def _on_sent(self, client_id: str, record: SentCommand, success: bool):
+        if success:
+            return
+
+        pending = record.pending
+        with self.lock:
+            # 보내지 못한 명령에는 응답도 없음
+            self._remove_record(client_id, record)
+            if pending is None:
+                return
+            if pending.retries_left > 0:
+                # 응답 제한 시간을 기다리지 않고 다음 확인 주기에 재전송
+                pending.deadline = 0.0
+                return
+            if not self._remove_pending(pending):
+                return
+
+        self._resolve(pending, self._failure(pending, "send_failed"))
+
+    def _on_replaced(self, client_id: str, record: SentCommand):
+        """송신 큐에서 같은 명령의 최신 값으로 교체됨 - 따로 전송되지 않으므로 응답도 재전송도 없음"""
+        pending = record.pending
+        with self.lock:
+            self._remove_record(client_id, record)
+            if pending is None or not self._remove_pending(pending):
+                return
+
+        self._resolve(pending, self._failure(pending, "coalesced"))
+
+    def _remove_record(self, client_id: str, record: SentCommand) -> bool:
+        """보낸 기록 제거 (잠금 보유 상태에서 호출)"""
+        queue = self.inflight.get(client_id)
+        if queue is None or record not in queue:
+            return False
+        queue.remove(record)
+        return True
+
+    @staticmethod
+    def _command_name(command: str) -> str:
+        """'HCpA-20' -> 'pA', 'SCsoB' -> 'so'"""
+        return command[2:4].strip() or command[:2]
+
+    # ==== 응답 처리 ====
+    def on_reply(self, client_id: str, message_type: str, content: str) -> bool:
+        """client_id 연결에서 수신한 'R'/'X' 메시지를 그 연결로 가장 먼저 보낸 명령에 대응시킵니다."""
+        now = time.perf_counter()
+        with self.lock:
+            queue = self.inflight.get(client_id)
+            record = None
+            while queue:
+                record = queue.popleft()
+                if record.expires_at >= now:
+                    break
+                # 응답이 끝내 오지 않은 기록
+                record = None
+
+            pending = record.pending if record is not None else None
+            if pending is not None and not self._remove_pending(pending):
+                # 이미 끝난 명령(재전송 전 요청 또는 시간 초과)에 대한 늦은 응답
+                self.late_replies += 1
+                return True
+
+        if record is None:
+            self.unmatched_replies += 1
+            return False
+
+        rtt_ms = (now - record.sent_at) * 1000
+        histogram = self._histogram(record.device_id, record.name)
+        histogram.record(rtt_ms)
+
+        success = message_type == 'R'
+        if not success:
+            histogram.errors += 1
+
+        if pending is not None:
+            self._resolve(pending, {
+                "success": success,
+                "reply": content.strip(),
+                "error": None if success else content.strip(),
+                "attempts": pending.attempts,
+                "rtt_ms": round(rtt_ms, 3)
+            })
+        return True
+
+    # ==== 제한 시간 확인 ====
+    def expire(self, now: Optional[float] = None):
+        """제한 시간이 지난 명령을 재전송하거나 timeout으로 완료합니다."""
+        now = time.perf_counter() if now is None else now
+        resend: List[PendingCommand] = []
+        expired: List[PendingCommand] = []
+
+        with self.lock:
+            for pending_list in self.pending.values():
+                for pending in list(pending_list):
+                    if pending.deadline > now:
+                        continue
+                    if pending.retries_left > 0:
+                        pending.retries_left -= 1
+                        # 재전송 중 다시 만료되지 않도록 미리 기한 연장
+                        pending.deadline = now + pending.timeout
+                        resend.append(pending)
+                    else:
+                        pending_list.remove(pending)
+                        expired.append(pending)
+
+            # 늦은 응답을 기다릴 기한도 지난 보낸 기록 정리
+            for client_id, queue in list(self.inflight.items()):
+                if queue and any(record.expires_at < now for record in queue):
+                    self.inflight[client_id] = deque(record for record in queue if record.expires_at >= now)
+
+        for pending in resend:
+            logger.warning(f"명령 응답 없음, 재전송 ({pending.attempts}회 시도): {pending.command.strip()}")
+            self._histogram(pending.device_id, pending.name).retries += 1
+            self._send(pending)
+
+        for pending in expired:
+            logger.error(f"명령 응답 시간 초과: {pending.command.strip()}")
+            self._histogram(pending.device_id, pending.name).timeouts += 1
+            self._resolve(pending, self._failure(pending, "timeout"))
+
+    # ==== 연결 종료 ====
+    def drop_connection(self, client_id: str):
+        """끊긴 연결로 보낸 명령을 정리하고 결과 대기 명령을 실패로 완료합니다."""
+        with self.lock:
+            self.inflight.pop(client_id, None)
+            pending_list = self.pending.pop(client_id, [])
+
+        for pending in pending_list:
+            self._resolve(pending, self._failure(pending, "disconnected"))
+
+    def cancel_all(self):
+        """대기 중인 모든 명령을 실패로 완료합니다 (서버 종료 시)."""
+        with self.lock:
+            pending_list = [pending for queue in self.pending.values() for pending in queue]
+            self.pending.clear()
+            self.inflight.clear()
+
+        for pending in pending_list:
+            self._resolve(pending, self._failure(pending, "cancelled"))
+
+    def _remove_pending(self, pending: PendingCommand) -> bool:
+        """결과 대기 목록에서 제거 (잠금 보유 상태에서 호출) - 이미 끝났으면 False"""
+        pending_list = self.pending.get(pending.client_id)
+        if pending_list is None or pending not in pending_list:
+            return False
+        pending_list.remove(pending)
+        return True
+
+    @staticmethod
+    def _failure(pending: PendingCommand, error: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "reply": None,
+            "error": error,
+            "attempts": pending.attempts,
+            "rtt_ms": None
+        }
+
+    @staticmethod
+    def _resolve(pending: PendingCommand, result: Dict[str, Any]):
+        if not pending.future.done():
+            try:
+                pending.future.set_result(result)
+            except Exception:
+                pass
+
+    def _histogram(self, device_id: str, name: str) -> LatencyHistogram:
+        key = (device_id, name)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    # ==== 통계 ====
+    def get_stats(self) -> Dict[str, Any]:
+        """디바이스/명령별 왕복 지연 히스토그램과 미응답 명령 수를 반환합니다."""
+        latency = {}
+        for (device_id, name), histogram in list(self.histograms.items()):
+            latency.setdefault(device_id, {})[name] = histogram.to_dict()
+
+        outstanding = {}
+        with self.lock:
+            for pending_list in self.pending.values():
+                for pending in pending_list:
+                    outstanding[pending.device_id] = outstanding.get(pending.device_id, 0) + 1
+            inflight = {client_id: len(queue) for client_id, queue in self.inflight.items() if queue}
+
+        return {
+            "latency": latency,
+            "outstanding": outstanding,
+            "inflight": inflight,
+            "unmatched_replies": self.unmatched_replies,
+            "late_replies": self.late_replies
+        }
@@ -0,0 +1,191 @@
+# server/utils/frame_decoder.py
+import logging
+from typing import List, Optional, Tuple
+
+from .protocol import (BINARY_FRAME_SYNC, BINARY_FRAME_HEADER, BINARY_FRAME_MAX_LENGTH,
+                       decode_binary_payload)
+
+logger = logging.getLogger(__name__)
+
+# 바이트 값 -> 1글자 문자열 (바이너리 헤더의 디바이스/타입 변환용)
+_CHARS = [chr(i) for i in range(256)]
+
+# ==== 개행 구분 프레임 디코더 클래스 ====
+class LineFrameDecoder:
+    """연결별 '\n' 구분 메시지 프레임 디코더
+
+    수신 청크를 하나의 bytearray에 이어 붙이고, 읽기 오프셋과 find()로
+    프레임 경계를 찾습니다. 프레임은 memoryview 슬라이스에서 바로 디코딩하므로
+    메시지마다 버퍼를 복사하지 않으며, 이미 처리한 앞부분은 일정 크기 이상
+    쌓였을 때만 한 번에 잘라냅니다(compaction).
+
+    한 연결의 데이터는 해당 연결의 수신 루프에서만 처리되므로 잠금을 사용하지 않습니다.
+    """
+
+    # 처리된 앞부분이 이 크기를 넘으면 버퍼 압축
+    COMPACT_THRESHOLD = 4096
+
+    # 개행 없이 쌓일 수 있는 최대 크기 (초과 시 버퍼 폐기)
+    MAX_FRAME_SIZE = 64 * 1024
+
+    def __init__(self, delimiter: bytes = b'\n', encoding: str = 'utf-8'):
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.buffer = bytearray()
+        self.read_pos = 0      # 아직 처리하지 않은 데이터 시작 위치
+        self.scan_pos = 0      # 구분자 검색을 재개할 위치
+
+        # 통계
+        self.frames_decoded = 0
+        self.decode_errors = 0
+        self.overflows = 0
+
+    # ==== 데이터 공급 ====
+    def feed(self, data: bytes) -> List[str]:
+        """수신 데이터를 추가하고 완성된 메시지 목록을 반환합니다 (빈 줄 제외)."""
+        buffer = self.buffer
+        buffer += data
+
+        messages = []
+        delimiter = self.delimiter
+        start = self.read_pos
+
+        # 이전 호출에서 검색한 구간은 다시 검색하지 않음
+        end = buffer.find(delimiter, self.scan_pos)
+        if end != -1:
+            with memoryview(buffer) as view:
+                while end != -1:
+                    if end > start:
+                        try:
+                            messages.append(str(view[start:end], self.encoding))
+                        except UnicodeDecodeError as e:
+                            self.decode_errors += 1
+                            logger.error(f"메시지 디코딩 오류: {str(e)}")
+                    start = end + 1
+                    end = buffer.find(delimiter, start)
+
+        self.read_pos = start
+        self.scan_pos = len(buffer)
+        self.frames_decoded += len(messages)
+
+        pending = len(buffer) - start
+        if pending == 0:
+            # 모두 처리됨 - 할당은 유지한 채 비우기
+            buffer.clear()
+            self.read_pos = self.scan_pos = 0
+        elif pending > self.MAX_FRAME_SIZE:
+            # 구분자 없이 너무 큰 데이터 - 비정상 스트림으로 보고 폐기
+            self.overflows += 1
+            logger.warning(f"프레임 최대 크기 초과: {pending} 바이트 폐기")
+            buffer.clear()
+            self.read_pos = self.scan_pos = 0
+        elif start >= self.COMPACT_THRESHOLD:
+            # 처리된 앞부분 제거 (가끔씩만 수행)
+            del buffer[:start]
+            self.scan_pos -= start
+            self.read_pos = 0
+
+        return messages
+
+    # ==== 버퍼 초기화 ====
+    def reset(self):
+        """버퍼에 남아 있는 미완성 데이터를 버립니다."""
+        self.buffer.clear()
+        self.read_pos = 0
+        self.scan_pos = 0
+
+    # ==== 미처리 데이터 크기 ====
+    def pending_bytes(self) -> int:
+        """아직 구분자를 받지 못한 데이터 크기를 반환합니다."""
+        return len(self.buffer) - self.read_pos
+
+
+# ==== 길이 접두 바이너리 프레임 디코더 클래스 ====
+class BinaryFrameDecoder:
+    """연결별 바이너리 프레임 디코더 (바이너리 프레임 협상 후 LineFrameDecoder 대신 사용)
+
+    LineFrameDecoder와 같은 bytearray + 읽기 오프셋 구조이며, 헤더의 길이로 프레임
+    경계를 찾습니다. 동기 바이트가 맞지 않거나 길이가 비정상이면 다음 동기 바이트까지
+    건너뜁니다(resync).
+
+    feed()는 (디바이스, 타입, 순번, content, values) 튜플 목록을 반환합니다.
+    """
+
+    COMPACT_THRESHOLD = LineFrameDecoder.COMPACT_THRESHOLD
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.read_pos = 0
+        self.last_seq: Optional[int] = None
+
+        # 통계
+        self.frames_decoded = 0
+        self.decode_errors = 0
+        self.resyncs = 0
+        self.seq_gaps = 0
+
+    # ==== 데이터 공급 ====
+    def feed(self, data: bytes) -> List[Tuple[str, str, int, str, Optional[tuple]]]:
+        """수신 데이터를 추가하고 완성된 프레임 목록을 반환합니다."""
+        buffer = self.buffer
+        buffer += data
+
+        frames = []
+        header = BINARY_FRAME_HEADER
+        header_size = header.size
+        pos = self.read_pos
+        end = len(buffer)
+
+        last_seq = self.last_seq
+
+        while end - pos >= header_size:
+            sync, length, device, msg_type, seq = header.unpack_from(buffer, pos)
+
+            if sync != BINARY_FRAME_SYNC or length < 6 or length > BINARY_FRAME_MAX_LENGTH:
+                # 다음 동기 바이트로 이동
+                self.resyncs += 1
+                next_sync = buffer.find(BINARY_FRAME_SYNC, pos + 1)
+                pos = end if next_sync == -1 else next_sync
+                continue
+
+            frame_end = pos + 3 + length
+            if frame_end > end:
+                break
+
+            try:
+                content, values = decode_binary_payload(buffer, pos + header_size, frame_end)
+                frames.append((_CHARS[device], _CHARS[msg_type], seq, content, values))
+            except (UnicodeDecodeError, ValueError) as e:
+                self.decode_errors += 1
+                logger.error(f"바이너리 프레임 디코딩 오류: {str(e)}")
+
+            # 순번이 건너뛴 경우 집계 (펌웨어 재시작으로 0부터 다시 시작하는 경우 포함)
+            if last_seq is not None and seq != (last_seq + 1) & 0xFFFF:
+                self.seq_gaps += 1
+            last_seq = seq
+
+            pos = frame_end
+
+        self.last_seq = last_seq
+        self.frames_decoded += len(frames)
+
+        if pos >= end:
+            buffer.clear()
+            self.read_pos = 0
+        elif pos >= self.COMPACT_THRESHOLD:
+            del buffer[:pos]
+            self.read_pos = 0
+        else:
+            self.read_pos = pos
+
+        return frames
+
+    # ==== 버퍼 초기화 ====
+    def reset(self):
+        self.buffer.clear()
+        self.read_pos = 0
+        self.last_seq = None
+
+    # ==== 미처리 데이터 크기 ====
+    def pending_bytes(self) -> int:
+        return len(self.buffer) - self.read_pos
@@ -1,83 +1,36 @@
 # server/utils/multi_tcp_handler.py
 import logging
-from typing import Dict, Any, Callable, List
+from typing import Dict, Any
 
 from .tcp_handler import TCPHandler
 
 logger = logging.getLogger(__name__)
 
 # ==== 다중 포트 TCP 핸들러 클래스 ====
-class MultiTCPHandler:
+class MultiTCPHandler(TCPHandler):
+    """디바이스 종류별 리슨 포트를 하나의 이벤트 루프에서 처리하는 TCP 핸들러
+
+    모든 포트가 selector 이벤트 루프, 디스패치 테이블, 라우팅 테이블, 명령 추적기를
+    공유하므로 컨트롤러는 단일 포트 모드와 똑같이 'S'/'H'/'G' 또는 매핑된 이름으로
+    핸들러를 등록하고 명령을 보낼 수 있습니다. 연결이 들어온 포트로 디바이스를 판별합니다.
+    """
+
     # ==== 다중 TCP 핸들러 초기화 ====
     def __init__(self, devices_config: Dict[str, Dict[str, Any]]):
         """
         디바이스별 별도 포트를 사용하는 TCP 핸들러를 초기화합니다.
-        
+
         Args:
-            devices_config: 디바이스별 설정 {디바이스ID: {host, port}}
+            devices_config: 디바이스별 설정 {디바이스ID 또는 별칭: {host, port}}
+                            (예: {'sort_controller': {'host': '0.0.0.0', 'port': 9001}})
         """
-        self.handlers = {}
+        super().__init__(port=None, io_engine=self.IO_ENGINE_SELECTOR)
         self.config = devices_config
-        
-        # 디바이스별 TCP 핸들러 생성
+
+        # 디바이스별 리슨 포트 추가
         for device_id, config in devices_config.items():
-            host = config.get('host', '192.168.0.10')
+            host = config.get('host', '0.0.0.0')
             port = config.get('port', 9000)
-            
-            handler = TCPHandler(host=host, port=port)
-            self.handlers[device_id] = handler
-            
-            logger.info(f"디바이스 {device_id} 핸들러 생성: {host}:{port}")
-    
-    # ==== 모든 핸들러 시작 ====
-    def start(self) -> bool:
-        """모든 TCP 핸들러를 시작합니다."""
-        success = True
-        
-        for device_id, handler in self.handlers.items():
-            if not handler.start():
-                logger.error(f"디바이스 {device_id} 핸들러 시작 실패")
-                success = False
-            else:
-                logger.info(f"디바이스 {device_id} 핸들러 시작 성공")
-        
-        return success
-    
-    # ==== 모든 핸들러 종료 ====
-    def stop(self):
-        """모든 TCP 핸들러를 종료합니다."""
-        for device_id, handler in self.handlers.items():
-            try:
-                handler.stop()
-                logger.info(f"디바이스 {device_id} 핸들러 종료 성공")
-            except Exception as e:
-                logger.error(f"디바이스 {device_id} 핸들러 종료 실패: {str(e)}")
-    
-    # ==== 디바이스 핸들러 등록 ====
-    def register_device_handler(self, device_id: str, message_type: str, handler: Callable):
-        """디바이스별 메시지 타입 핸들러를 등록합니다."""
-        if device_id in self.handlers:
-            self.handlers[device_id].register_device_handler(device_id, message_type, handler)
-            logger.debug(f"디바이스 {device_id}, 타입 {message_type} 핸들러 등록")
-        else:
-            logger.error(f"등록되지 않은 디바이스 ID: {device_id}")
-    
-    # ==== 메시지 전송 ====
-    def send_message(self, device_id: str, command: str) -> bool:
-        """지정된 디바이스에 명령 메시지를 전송합니다."""
-        if device_id in self.handlers:
-            return self.handlers[device_id].send_message(device_id, command)
-        else:
-            logger.error(f"등록되지 않은 디바이스 ID: {device_id}")
-            return False
-    
-    # ==== 연결된 디바이스 목록 ====
-    def get_connected_devices(self) -> List[str]:
-        """현재 연결된 모든 디바이스 ID 목록을 반환합니다."""
-        devices = []
-        
-        for device_id, handler in self.handlers.items():
-            if handler.is_device_connected(device_id):
-                devices.append(device_id)
-        
-        return devices
\ No newline at end of file
+
+            self.add_listener(host, port, device_id)
+            logger.info(f"디바이스 {device_id} 포트 추가: {host}:{port} -> {self.resolve_device_id(device_id)}")
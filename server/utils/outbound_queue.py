@@ -0,0 +1,225 @@
+# server/utils/outbound_queue.py
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+# ==== 송신 대기 메시지 ====
+class OutboundMessage:
+    """송신 큐에 들어간 메시지 하나 (전송 결과는 future로 전달)"""
+    __slots__ = ('payload', 'key', 'future', 'on_replaced', 'enqueued_at')
+
+    def __init__(self, payload: bytes, key: Optional[str], future: Future,
+                 on_replaced: Optional[Callable[[], None]] = None):
+        self.payload = payload
+        self.key = key                  # coalesce 정책에서 같은 명령을 판별하는 키
+        self.future = future
+        self.on_replaced = on_replaced  # coalesce로 새 메시지에 밀려 따로 전송되지 않게 됐을 때 호출
+        self.enqueued_at = time.perf_counter()
+
+
+# ==== 연결별 송신 큐 클래스 ====
+class OutboundQueue:
+    """연결 하나의 송신 큐
+
+    최대 깊이를 넘으면 오버플로 정책에 따라 처리합니다.
+    - drop_oldest: 가장 오래된 메시지를 버리고(결과 False) 새 메시지 추가
+    - coalesce: 같은 키의 대기 메시지를 새 내용으로 교체, 없으면 거부
+    - reject: 새 메시지 거부 (결과 False)
+
+    write_to()는 소켓에 한 번만 send()를 시도하므로 selector 이벤트 루프와
+    전용 송신 스레드 양쪽에서 사용할 수 있습니다.
+    """
+
+    POLICY_DROP_OLDEST = "drop_oldest"
+    POLICY_COALESCE = "coalesce"
+    POLICY_REJECT = "reject"
+    POLICIES = (POLICY_DROP_OLDEST, POLICY_COALESCE, POLICY_REJECT)
+
+    def __init__(self, max_depth: int = 64, policy: str = POLICY_REJECT):
+        self.max_depth = max_depth
+        self.policy = policy if policy in self.POLICIES else self.POLICY_REJECT
+        self.messages = deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.closed = False
+
+        # 현재 전송 중인 메시지 (부분 전송 상태)
+        self.current: Optional[OutboundMessage] = None
+        self.current_view: Optional[memoryview] = None
+
+        # 통계
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.failed = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.latency_last = 0.0
+
+    # ==== 메시지 추가 ====
+    def put(self, payload: bytes, key: Optional[str] = None,
+            on_replaced: Optional[Callable[[], None]] = None) -> Future:
+        """메시지를 큐에 넣고 전송 결과(True/False)를 담을 future를 반환합니다.
+
+        on_replaced: coalesce 정책으로 이 메시지가 같은 키의 새 메시지로 교체되면 호출할 함수
+        (future는 교체한 메시지의 전송 결과를 그대로 받음)
+        """
+        future = Future()
+        dropped = None
+        replaced = None
+
+        with self.lock:
+            if self.closed:
+                self.failed += 1
+                future.set_result(False)
+                return future
+
+            message = OutboundMessage(payload, key, future, on_replaced)
+
+            if len(self.messages) >= self.max_depth:
+                if self.policy == self.POLICY_DROP_OLDEST:
+                    dropped = self.messages.popleft()
+                    self.dropped += 1
+                elif self.policy == self.POLICY_COALESCE:
+                    replaced = self._coalesce(message)
+                    if replaced is None:
+                        self.rejected += 1
+                        future.set_result(False)
+                        return future
+                else:
+                    self.rejected += 1
+                    future.set_result(False)
+                    return future
+
+            if replaced is None:
+                self.messages.append(message)
+                self.not_empty.notify()
+
+        if dropped is not None:
+            self._resolve(dropped.future, False)
+        if replaced is not None and replaced.on_replaced is not None:
+            replaced.on_replaced()
+        return future
+
+    def _coalesce(self, message: OutboundMessage) -> Optional[OutboundMessage]:
+        """같은 키의 대기 메시지를 새 메시지로 교체하고 교체된 메시지를 반환합니다 (잠금 보유 상태에서 호출)."""
+        if message.key is None:
+            return None
+
+        for index, queued in enumerate(self.messages):
+            if queued.key == message.key:
+                # 이전 요청은 교체된 메시지의 전송 결과를 그대로 받음
+                previous = queued.future
+                message.future.add_done_callback(lambda f: self._resolve(previous, f.result()))
+                message.enqueued_at = queued.enqueued_at
+                self.messages[index] = message
+                self.coalesced += 1
+                return queued
+        return None
+
+    # ==== 대기 ====
+    def wait(self, timeout: float) -> bool:
+        """보낼 메시지가 생길 때까지 대기합니다 (전용 송신 스레드용)."""
+        with self.lock:
+            if not self.messages and self.current is None and not self.closed:
+                self.not_empty.wait(timeout)
+            return self.has_pending()
+
+    def has_pending(self) -> bool:
+        return self.current is not None or bool(self.messages)
+
+    # ==== 소켓 쓰기 ====
+    def write_to(self, sock) -> bool:
+        """소켓에 send()를 한 번 시도합니다. 아직 보낼 데이터가 남아 있으면 True를 반환합니다.
+
+        소켓 오류는 그대로 전달되며, 호출한 쪽에서 연결을 정리해야 합니다.
+        """
+        message = self.current
+        view = self.current_view
+        if message is None:
+            with self.lock:
+                if not self.messages:
+                    return False
+                message = self.current = self.messages.popleft()
+            view = self.current_view = memoryview(message.payload)
+
+        try:
+            sent = sock.send(view)
+        except (BlockingIOError, InterruptedError):
+            return True
+
+        view = view[sent:]
+        with self.lock:
+            if self.current is not message:
+                # 전송 중 close()로 정리됨
+                return False
+            if view:
+                self.current_view = view
+            else:
+                self.current = None
+                self.current_view = None
+
+        if not view:
+            self._complete(message)
+
+        return self.has_pending()
+
+    def _complete(self, message: OutboundMessage):
+        latency = time.perf_counter() - message.enqueued_at
+        self.sent += 1
+        self.latency_total += latency
+        self.latency_last = latency
+        if latency > self.latency_max:
+            self.latency_max = latency
+        self._resolve(message.future, True)
+
+    # ==== 종료 ====
+    def close(self):
+        """큐를 닫고 전송되지 못한 모든 메시지를 실패로 처리합니다."""
+        with self.lock:
+            self.closed = True
+            pending = list(self.messages)
+            self.messages.clear()
+            if self.current is not None:
+                pending.insert(0, self.current)
+                self.current = None
+                self.current_view = None
+            self.not_empty.notify_all()
+
+        self.failed += len(pending)
+        for message in pending:
+            self._resolve(message.future, False)
+
+    @staticmethod
+    def _resolve(future: Future, result: bool):
+        if not future.done():
+            try:
+                future.set_result(result)
+            except Exception:
+                pass
+
+    # ==== 통계 ====
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 깊이, 정책별 처리 수, 전송 지연(ms)을 반환합니다."""
+        return {
+            "depth": len(self.messages) + (1 if self.current is not None else 0),
+            "max_depth": self.max_depth,
+            "policy": self.policy,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "latency_avg_ms": round(self.latency_total / self.sent * 1000, 3) if self.sent else 0.0,
+            "latency_max_ms": round(self.latency_max * 1000, 3),
+            "latency_last_ms": round(self.latency_last * 1000, 3)
+        }
+
+    def __len__(self):
+        return len(self.messages)
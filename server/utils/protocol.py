@@ -5,7 +5,18 @@ IOT 시스템 통신 프로토콜 정의
 - 디바이스 ID (1바이트): 'S'(분류기), 'H'(창고환경), 'G'(입출입)
 - 메시지 타입 (1바이트): 'E'(이벤트), 'C'(명령), 'R'(응답), 'X'(에러)
 - 페이로드 (가변): 각 메시지별 데이터 ('\n'으로 종료)
+
+바이너리 프레임 (선택, 연결별 협상):
+- 디바이스가 텍스트 'xCbn1' 전송 → 서버가 'xRbn1' 응답
+- 응답을 받은 뒤부터 디바이스 → 서버 방향은 바이너리 프레임 사용 (서버 → 디바이스는 텍스트 유지)
+- 프레임: 동기 바이트 0xA5(1) + 길이(2, LE) + 디바이스(1) + 타입(1) + 순번(2, LE) + 페이로드
+  (길이 = 디바이스부터 페이로드 끝까지의 바이트 수)
+- 페이로드: 코드(2바이트 ASCII) + 본문
+  - 'tp': int16 LE x n (0.01°C 단위, 창고 A, B, C 순서)
+  - 'ir': uint8 (1=감지)
+  - 그 외: ASCII 텍스트 (텍스트 프로토콜 페이로드의 나머지 부분)
 """
+import struct
 
 # 디바이스 식별자
 DEVICE_SORTER = 'S'  # 분류기
@@ -23,6 +34,10 @@ RESPONSE_OK = 'ok'  # 성공
 ERROR_COMM = 'e1'   # 통신 오류
 ERROR_SENSOR = 'e2'  # 센서 오류
 
+# 공통 명령
+CMD_HEARTBEAT = 'hb'  # 하트비트 (서버 'xChb' → 디바이스 'xRhb')
+CMD_BINARY_FRAMING = 'bn'  # 바이너리 프레임 협상 (디바이스 'xCbn1' → 서버 'xRbn1')
+
 # 분류기 이벤트
 SORT_EVENT_IR = 'ir'        # IR 센서 (1=감지)
 SORT_EVENT_BARCODE = 'bc'   # 바코드 인식
@@ -56,6 +71,17 @@ SORT_ZONE_MAP = {
     'E': 'E'
 }
 
+# 바이너리 프레임 설정
+BINARY_FRAME_VERSION = 1
+BINARY_FRAME_SYNC = 0xA5
+BINARY_FRAME_HEADER = struct.Struct('<BHBBH')  # 동기, 길이, 디바이스, 타입, 순번
+BINARY_FRAME_MAX_LENGTH = 1024
+BINARY_TEMP_SCALE = 100  # 0.01°C 단위
+
+# 바이너리 페이로드 코드별 본문 형식 (숫자 배열로 전달되는 코드만)
+BINARY_CODE_TEMPERATURE = b'tp'
+BINARY_CODE_IR = b'ir'
+
 # 메시지 생성 함수
 def create_message(device, msg_type, payload):
     """통신 프로토콜에 맞는 메시지 생성"""
@@ -76,6 +102,56 @@ def parse_message(message):
     
     return device, msg_type, payload
 
+# 바이너리 프레임 생성 함수
+def encode_binary_frame(device, msg_type, seq, code, body=b''):
+    """바이너리 프레임 생성 (code: 2바이트 ASCII, body: 본문 바이트)"""
+    if isinstance(code, str):
+        code = code.encode('ascii')
+    length = 4 + len(code) + len(body)
+    return BINARY_FRAME_HEADER.pack(
+        BINARY_FRAME_SYNC, length, ord(device), ord(msg_type), seq & 0xFFFF
+    ) + code + body
+
+def encode_binary_temperatures(device, seq, temperatures):
+    """온도 목록을 'tp' 바이너리 이벤트 프레임으로 생성"""
+    body = struct.pack(f'<{len(temperatures)}h', *(round(t * BINARY_TEMP_SCALE) for t in temperatures))
+    return encode_binary_frame(device, MSG_EVENT, seq, BINARY_CODE_TEMPERATURE, body)
+
+def encode_binary_message(message, seq):
+    """텍스트 프로토콜 메시지('HEtp-18.5;4.2;21.3')를 같은 의미의 바이너리 프레임으로 변환"""
+    device, msg_type, payload = parse_message(message)
+    code = payload[:2]
+    if msg_type == MSG_EVENT and code == 'tp':
+        return encode_binary_temperatures(device, seq, [float(t) for t in payload[2:].split(';')])
+    if msg_type == MSG_EVENT and code == 'ir':
+        return encode_binary_frame(device, msg_type, seq, BINARY_CODE_IR, bytes([int(payload[2:] or 0)]))
+    return encode_binary_frame(device, msg_type, seq, code, payload[2:].encode('utf-8'))
+
+# 바이너리 페이로드 해석 함수
+_TEMP_STRUCTS = {}
+
+def decode_binary_payload(buffer, start=0, end=None):
+    """바이너리 페이로드(buffer[start:end]) 해석 → (content, values)
+
+    숫자 본문 코드는 텍스트 변환 없이 values로 전달합니다.
+    - 'tp': content 'tp', values (온도, ...)
+    - 'ir': content 'ir1', values (1,)
+    - 그 외: content 코드+텍스트, values None
+    """
+    if end is None:
+        end = len(buffer)
+    code = buffer[start:start + 2]
+    if code == BINARY_CODE_TEMPERATURE:
+        count = (end - start - 2) >> 1
+        temp_struct = _TEMP_STRUCTS.get(count)
+        if temp_struct is None:
+            temp_struct = _TEMP_STRUCTS.setdefault(count, struct.Struct(f'<{count}h'))
+        return 'tp', tuple([v / BINARY_TEMP_SCALE for v in temp_struct.unpack_from(buffer, start + 2)])
+    if code == BINARY_CODE_IR:
+        state = buffer[start + 2] if end > start + 2 else 0
+        return f'ir{state}', (state,)
+    return str(buffer[start:end], 'utf-8'), None
+
 # 바코드 파싱 함수
 def parse_barcode(barcode):
     """바코드 파싱: 1자리(구역) + 2자리(물품번호) + 6자리(유통기한)"""
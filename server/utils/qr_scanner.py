@@ -0,0 +1,154 @@
+# server/utils/qr_scanner.py
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ==== 인식 모드 ====
+# full:       컬러 원본 해상도로 디코딩 후 전체 프레임 인식 (기존 방식)
+# fast:       JPEG를 1/2 크기 흑백으로 바로 디코딩하고, 직전에 QR이 보인 영역(ROI)을 먼저 인식,
+#             놓치면 축소 프레임 전체 인식 (full_res_fallback이면 그래도 놓칠 때 원본 해상도로 다시 인식)
+# fast_multi: 1/2 흑백 축소 프레임 전체를 매번 detectAndDecodeMulti로 인식 (한 프레임에 물품 여러 개 -
+#             QR 하나의 ROI만 보면 나머지 QR을 놓치므로 ROI 단계 없음)
+DETECT_MODE_FULL = "full"
+DETECT_MODE_FAST = "fast"
+DETECT_MODE_FAST_MULTI = "fast_multi"
+DETECT_MODES = (DETECT_MODE_FULL, DETECT_MODE_FAST, DETECT_MODE_FAST_MULTI)
+
+# 인식 단계 (통계 키)
+STAGE_ROI = "roi"
+STAGE_FULL = "full"
+STAGE_FULL_RES = "full_res"
+STAGE_MISS = "miss"
+STAGES = (STAGE_ROI, STAGE_FULL, STAGE_FULL_RES, STAGE_MISS)
+
+ROI_TTL = 1.0           # 마지막으로 QR을 찾은 뒤 이 시간(초)까지만 그 영역을 먼저 확인
+ROI_MARGIN = 0.5        # ROI 여백 (QR 크기 대비 비율, 컨베이어 이동량 감안)
+ROI_MIN_MARGIN = 16     # ROI 최소 여백(픽셀) - 인식에 필요한 QR 주변 여백(quiet zone) 확보
+
+
+# ==== 카메라별 QR 위치 기억 ====
+class QRRegionTracker:
+    """카메라별로 마지막으로 QR을 찾은 영역을 기억 (디코딩 스레드들이 공유)"""
+
+    def __init__(self, ttl: float = ROI_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.regions: Dict[str, Tuple[Tuple[int, int, int, int], float, Tuple[int, int]]] = {}
+
+    def get(self, camera: str, shape: Tuple[int, int], now: float) -> Optional[Tuple[int, int, int, int]]:
+        """ROI (x0, y0, x1, y1) - 없거나 오래됐거나 이미지 크기가 바뀌었으면 None"""
+        with self.lock:
+            entry = self.regions.get(camera)
+        if entry is None:
+            return None
+        region, found_at, region_shape = entry
+        if now - found_at > self.ttl or region_shape != shape:
+            return None
+        return region
+
+    def update(self, camera: str, points: np.ndarray, shape: Tuple[int, int], now: float):
+        """찾은 QR 꼭짓점으로 다음 프레임의 ROI 갱신 (이미지 좌표)"""
+        points = points.reshape(-1, 2)
+        x0, y0 = points.min(axis=0)
+        x1, y1 = points.max(axis=0)
+        margin = max(x1 - x0, y1 - y0) * ROI_MARGIN + ROI_MIN_MARGIN
+        height, width = shape
+        region = (max(0, int(x0 - margin)), max(0, int(y0 - margin)),
+                  min(width, int(x1 + margin)), min(height, int(y1 + margin)))
+        with self.lock:
+            self.regions[camera] = (region, now, shape)
+
+    def clear(self, camera: str):
+        with self.lock:
+            self.regions.pop(camera, None)
+
+
+# ==== QR 인식기 ====
+class QRScanner:
+    """디코딩 스레드 하나가 쓰는 QR 인식기
+
+    cv2.QRCodeDetector는 스레드 간 공유하지 않으므로 디코딩 스레드마다 하나씩 만들고,
+    ROI 기억(QRRegionTracker)만 공유합니다. decode()와 detect()를 나눠 두어 호출 측이
+    JPEG 디코딩과 QR 인식 시간을 따로 잴 수 있습니다.
+
+    full_res_fallback이면 fast 계열에서 축소 프레임 전체 인식까지 놓친 프레임을 원본 해상도
+    흑백으로 다시 디코딩해 인식합니다. QR이 작게 찍히는 카메라의 인식률은 오르지만, QR이 없는
+    프레임(컨베이어 대부분)마다 JPEG 디코딩과 원본 해상도 인식이 한 번씩 더 듭니다.
+    """
+
+    def __init__(self, tracker: QRRegionTracker, full_res_fallback: bool = False):
+        self.detector = cv2.QRCodeDetector()
+        self.tracker = tracker
+        self.full_res_fallback = full_res_fallback
+
+    @staticmethod
+    def decode(jpg: np.ndarray, mode: str) -> Optional[np.ndarray]:
+        """JPEG 디코딩 (fast 계열은 libjpeg 축소 디코딩으로 1/2 크기 흑백 - 디코딩 자체도 빨라짐)"""
+        if mode == DETECT_MODE_FULL:
+            return cv2.imdecode(jpg, cv2.IMREAD_COLOR)
+        return cv2.imdecode(jpg, cv2.IMREAD_REDUCED_GRAYSCALE_2)
+
+    def detect(self, img: np.ndarray, camera: str, mode: str,
+               jpg: Optional[np.ndarray] = None) -> Tuple[List[str], Optional[np.ndarray], str]:
+        """QR 인식
+
+        fast는 ROI -> 축소 프레임 전체, fast_multi는 축소 프레임 전체 순서로 인식하고,
+        full_res_fallback이 켜져 있고 jpg가 주어지면 마지막으로 원본 해상도 흑백 프레임 전체를 인식합니다.
+
+        Returns:
+            (인식한 문자열 목록, 첫 QR의 꼭짓점(img 좌표) 또는 None, 인식 단계)
+        """
+        if mode == DETECT_MODE_FULL:
+            data, points, _ = self.detector.detectAndDecode(img)
+            return ([data] if data else []), (points if data else None), (STAGE_FULL if data else STAGE_MISS)
+
+        now = time.monotonic()
+        shape = img.shape[:2]
+
+        # 1단계: 직전에 QR이 보인 영역만 인식 (QR 하나만 찾으므로 fast만)
+        region = self.tracker.get(camera, shape, now) if mode == DETECT_MODE_FAST else None
+        if region is not None:
+            x0, y0, x1, y1 = region
+            data, points, _ = self.detector.detectAndDecode(img[y0:y1, x0:x1])
+            if data and points is not None:
+                points = points.reshape(-1, 2) + (x0, y0)
+                self.tracker.update(camera, points, shape, now)
+                return [data], points, STAGE_ROI
+
+        # 2단계: 축소 프레임 전체 인식
+        found = self._detect_whole(img, mode)
+        if found:
+            self.tracker.update(camera, found[0][1], shape, now)
+            return [data for data, _ in found], found[0][1], STAGE_FULL
+
+        # 3단계(선택): 원본 해상도로 다시 디코딩해 전체 인식 (꼭짓점은 img 좌표로 환산)
+        if self.full_res_fallback and jpg is not None:
+            full = cv2.imdecode(jpg, cv2.IMREAD_GRAYSCALE)
+            if full is not None:
+                scale = img.shape[1] / full.shape[1]
+                found = [(data, corners * scale) for data, corners in self._detect_whole(full, mode)]
+                if found:
+                    self.tracker.update(camera, found[0][1], shape, now)
+                    return [data for data, _ in found], found[0][1], STAGE_FULL_RES
+
+        self.tracker.clear(camera)
+        return [], None, STAGE_MISS
+
+    def _detect_whole(self, img: np.ndarray, mode: str) -> List[Tuple[str, np.ndarray]]:
+        """프레임 전체 인식 - [(문자열, 꼭짓점(img 좌표, 4x2))] (fast_multi는 여러 개)"""
+        if mode == DETECT_MODE_FAST_MULTI:
+            ok, decoded, points, _ = self.detector.detectAndDecodeMulti(img)
+            if not ok or points is None:
+                return []
+            return [(data, corners.reshape(-1, 2)) for data, corners in zip(decoded, points) if data]
+
+        data, points, _ = self.detector.detectAndDecode(img)
+        if data and points is not None:
+            return [(data, points.reshape(-1, 2))]
+        return []
@@ -0,0 +1,210 @@
+# server/utils/ring_history.py
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ==== 파일 형식 ====
+# [헤더 64바이트][ts int64 x capacity][value float32 x capacity] - 레코드 하나는 12바이트 고정 크기
+# 열(column)별로 연속 배치해 시각 열의 이진 탐색과 구간 복사가 연속 메모리에서 이루어집니다.
+# 헤더의 count는 지금까지 쓴 레코드 수로, 다음에 쓸 자리는 count % capacity 입니다.
+# 레코드를 먼저 쓰고 count를 올리므로 count까지의 레코드는 항상 완성된 값입니다.
+MAGIC = b"RHST"
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+HEADER_DTYPE = np.dtype([
+    ("magic", "S4"),
+    ("version", "<u4"),
+    ("capacity", "<u8"),
+    ("count", "<u8"),
+    ("last_ts", "<i8"),
+    ("reserved", "V32"),
+])
+TS_DTYPE = np.dtype("<i8")
+VALUE_DTYPE = np.dtype("<f4")
+RECORD_SIZE = TS_DTYPE.itemsize + VALUE_DTYPE.itemsize
+
+
+# ==== 메모리 맵 링 파일 ====
+class RingHistory:
+    """고정 크기 레코드를 순환 기록하는 메모리 맵(np.memmap) 파일
+
+    가장 오래된 레코드부터 덮어쓰며, 파일은 프로세스가 재시작해도 그대로 남아 있어
+    다시 열면 이어서 기록합니다. 시각(ts)은 늘 증가하도록 기록하므로(시계가 뒤로 가면
+    마지막 시각 사용) 링의 두 구간은 각각 정렬되어 있고, 구간 조회는 이진 탐색으로 합니다.
+    쓰기는 한 프로세스에서만 하며, 같은 프로세스의 조회와는 락으로 보호합니다.
+    """
+
+    def __init__(self, path: str, capacity: int):
+        self.path = path
+        self.capacity = int(capacity)
+        self.lock = threading.Lock()
+        self.header, self.ts, self.values = self._open()
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        expected_size = HEADER_SIZE + self.capacity * RECORD_SIZE
+        if os.path.exists(self.path):
+            header = np.memmap(self.path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+            valid = (header["magic"][0] == MAGIC and header["version"][0] == FORMAT_VERSION
+                     and int(header["capacity"][0]) == self.capacity
+                     and os.path.getsize(self.path) == expected_size)
+            if valid:
+                return (header,) + self._map_columns()
+
+            # 용량이 바뀌었거나 손상된 파일은 옆에 보관하고 새로 만듦
+            del header
+            backup = self.path + ".old"
+            os.replace(self.path, backup)
+            logger.warning(f"링 파일 형식/용량 불일치 - {backup}(으)로 옮기고 새로 만듦")
+
+        with open(self.path, "wb") as f:
+            f.truncate(expected_size)
+        header = np.memmap(self.path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+        header["magic"] = MAGIC
+        header["version"] = FORMAT_VERSION
+        header["capacity"] = self.capacity
+        header["count"] = 0
+        header["last_ts"] = 0
+        header.flush()
+        return (header,) + self._map_columns()
+
+    def _map_columns(self):
+        ts = np.memmap(self.path, dtype=TS_DTYPE, mode="r+", offset=HEADER_SIZE, shape=(self.capacity,))
+        values = np.memmap(self.path, dtype=VALUE_DTYPE, mode="r+",
+                           offset=HEADER_SIZE + self.capacity * TS_DTYPE.itemsize, shape=(self.capacity,))
+        return ts, values
+
+    # ==== 기록 ====
+    def append(self, ts: int, value: float):
+        """레코드 하나 추가 (가장 오래된 레코드 자리에 덮어씀)"""
+        with self.lock:
+            count = int(self.header["count"][0])
+            ts = max(int(ts), int(self.header["last_ts"][0]))
+            slot = count % self.capacity
+            self.ts[slot] = ts
+            self.values[slot] = value
+            self.header["last_ts"] = ts
+            self.header["count"] = count + 1
+
+    def flush(self):
+        """메모리 맵의 변경 내용을 파일에 반영 (프로세스가 죽어도 OS 캐시에는 남지만 전원 차단 대비)"""
+        with self.lock:
+            self.ts.flush()
+            self.values.flush()
+            self.header.flush()
+
+    def close(self):
+        self.flush()
+
+    def __len__(self) -> int:
+        return min(int(self.header["count"][0]), self.capacity)
+
+    # ==== 조회 ====
+    def range(self, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """start <= ts < end 레코드의 (시각 배열, 값 배열)을 시각 순으로 복사해 반환"""
+        with self.lock:
+            count = int(self.header["count"][0])
+            if count <= self.capacity:
+                segments = [(0, count)]
+            else:
+                head = count % self.capacity
+                segments = [(head, self.capacity), (0, head)]
+
+            # 두 구간의 범위를 이진 탐색으로 찾은 뒤 결과 배열을 한 번만 할당해 열별로 복사
+            bounds = []
+            for first, last in segments:
+                ts = self.ts[first:last]
+                lo = first + int(np.searchsorted(ts, start, side="left"))
+                hi = first + int(np.searchsorted(ts, end, side="left"))
+                if lo < hi:
+                    bounds.append((lo, hi))
+
+            total = sum(hi - lo for lo, hi in bounds)
+            ts_out = np.empty(total, dtype=TS_DTYPE)
+            values_out = np.empty(total, dtype=VALUE_DTYPE)
+            position = 0
+            for lo, hi in bounds:
+                ts_out[position:position + hi - lo] = self.ts[lo:hi]
+                values_out[position:position + hi - lo] = self.values[lo:hi]
+                position += hi - lo
+        return ts_out, values_out
+
+    def downsample(self, start: int, end: int, bucket_seconds: int) -> List[Dict[str, Any]]:
+        """start ~ end 구간을 bucket_seconds 간격으로 묶은 min/avg/max 목록 (레코드가 없는 구간은 생략)"""
+        ts, values = self.range(start, end)
+        if not len(ts):
+            return []
+
+        # 구간 경계의 위치를 이진 탐색으로 찾고, 레코드가 있는 구간만 reduceat으로 한 번에 집계
+        bucket_seconds = max(1, int(bucket_seconds))
+        edges = np.arange(start, end, bucket_seconds, dtype=np.int64)
+        positions = np.searchsorted(ts, edges, side="left")
+        counts = np.diff(np.append(positions, len(ts)))
+        filled = counts > 0
+        positions = positions[filled]
+        counts = counts[filled]
+
+        # 배열 단위로 반올림한 뒤 tolist()로 한 번에 파이썬 값으로 변환 (원소별 변환보다 빠름)
+        mins = np.round(np.minimum.reduceat(values, positions).astype(np.float64), 2).tolist()
+        maxs = np.round(np.maximum.reduceat(values, positions).astype(np.float64), 2).tolist()
+        means = np.round(np.add.reduceat(values, positions, dtype=np.float64) / counts, 2).tolist()
+
+        return [
+            {"t": edge, "min": low, "avg": mean, "max": high, "samples": n}
+            for edge, low, mean, high, n in zip(edges[filled].tolist(), mins, means, maxs, counts.tolist())
+        ]
+
+
+# ==== 창고별 링 파일 묶음 ====
+class WarehouseRingHistory:
+    """창고마다 링 파일 하나(<directory>/temp_<창고 ID>.ring)를 두는 온도 기록 캐시
+
+    DB와 관계없이 최근 온도 기록을 보관하므로, DB가 느리거나 내려가 있어도
+    최근 N시간 추이를 바로 답할 수 있습니다.
+    """
+
+    def __init__(self, directory: str, warehouse_ids: List[str], capacity: int,
+                 flush_interval: float = 5.0):
+        self.rings = {
+            warehouse_id: RingHistory(os.path.join(directory, f"temp_{warehouse_id}.ring"), capacity)
+            for warehouse_id in warehouse_ids
+        }
+        self.flush_stop = threading.Event()
+        self.flush_thread: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self.flush_thread = threading.Thread(target=self._flush_loop, args=(flush_interval,),
+                                                 name="ring-history-flush", daemon=True)
+            self.flush_thread.start()
+
+    def append(self, warehouse_id: str, ts: int, value: float):
+        ring = self.rings.get(warehouse_id)
+        if ring is not None:
+            ring.append(ts, value)
+
+    def downsample(self, warehouse_id: str, start: int, end: int, bucket_seconds: int) -> Optional[List[Dict[str, Any]]]:
+        """창고의 start ~ end 구간 min/avg/max 목록 (알 수 없는 창고면 None)"""
+        ring = self.rings.get(warehouse_id)
+        if ring is None:
+            return None
+        return ring.downsample(start, end, bucket_seconds)
+
+    def close(self):
+        self.flush_stop.set()
+        for ring in self.rings.values():
+            ring.close()
+
+    def _flush_loop(self, interval: float):
+        while not self.flush_stop.wait(interval):
+            for ring in self.rings.values():
+                try:
+                    ring.flush()
+                except Exception as e:
+                    logger.error(f"링 파일 반영 오류: {str(e)}")
@@ -1,12 +1,42 @@
 import socket
+import select
+import selectors
 import threading
 import logging
 import time
-from typing import Dict, Callable, Any, Optional, List
+from concurrent.futures import Future
+from typing import Dict, Callable, Any, Optional, List, Tuple
 from config import CONFIG
+from .frame_decoder import LineFrameDecoder, BinaryFrameDecoder
+from .outbound_queue import OutboundQueue
+from .command_tracker import CommandTracker
+from .timer_wheel import TimerWheel
+from .protocol import CMD_HEARTBEAT, CMD_BINARY_FRAMING, BINARY_FRAME_VERSION, MSG_COMMAND, MSG_RESPONSE, MSG_ERROR
 
 logger = logging.getLogger(__name__)
 
+# ==== 디스패치 테이블 항목 ====
+class DispatchRoute:
+    """(디바이스, 메시지 타입) 하나에 대한 핸들러와 호출 횟수"""
+    __slots__ = ('handler', 'source', 'hits')
+    
+    def __init__(self, handler: Callable, source: str):
+        self.handler = handler
+        self.source = source  # 핸들러가 등록된 키 (예: 'env_controller:E')
+        self.hits = 0
+
+# ==== 리슨 소켓 ====
+class TCPListener:
+    """리슨 포트 하나 (포트 전용 디바이스가 지정되면 해당 포트의 연결은 그 디바이스로 고정)"""
+    __slots__ = ('host', 'port', 'device_id', 'name', 'socket')
+    
+    def __init__(self, host: str, port: int, device_id: Optional[str] = None, name: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.device_id = device_id  # 원본 디바이스 ID ('S', 'H', 'G') 또는 None(첫 메시지로 판별)
+        self.name = name or device_id or str(port)
+        self.socket = None
+
 # ==== TCP 소켓 통신을 관리하는 핸들러 클래스 ====
 class TCPHandler:
     # TCP 핸들러 장치 ID 매핑 (필요한 경우)
@@ -16,26 +46,108 @@ class TCPHandler:
         'G': 'access_controller' # 출입 제어 - 첫 문자가 G인 메시지
     }
     
+    # 추가 별칭 -> 원본 디바이스 ID (TCP_PORTS 키, 컨트롤러 등록 이름)
+    DEVICE_ALIASES = {
+        'env_ab_controller': 'H',
+        'env_cd_controller': 'H',
+        'gate_controller': 'G'
+    }
+    
+    # 매핑된 ID/별칭 -> 원본 디바이스 ID (라우팅 조회용, 클래스 정의 시 한 번만 생성)
+    REVERSE_DEVICE_ID_MAPPING = dict({v: k for k, v in DEVICE_ID_MAPPING.items()}, **DEVICE_ALIASES)
+    
+    # 이전 버전 메시지 타입 이름 -> 프로토콜 메시지 타입 (등록 시점에 변환)
+    LEGACY_MESSAGE_TYPES = {
+        'evt': 'E',
+        'res': 'R',
+        'err': 'X'
+    }
+    
+    # 지원하는 I/O 엔진
+    IO_ENGINE_THREAD = "thread"      # 클라이언트별 수신 스레드
+    IO_ENGINE_SELECTOR = "selector"  # 단일 이벤트 루프
+    
+    # selector 이벤트 루프 깨우기용 소켓 식별자
+    _WAKE_EVENT = object()
+    
     # ==== TCP 핸들러 초기화 ====
-    def __init__(self, host: str = '0.0.0.0', port: int = 9000):
+    def __init__(self, host: str = '0.0.0.0', port: Optional[int] = 9000, io_engine: Optional[str] = None):
         self.host = host
         self.port = port
         self.server_socket = None
+        
+        # 리슨 소켓 목록 (모든 포트가 하나의 이벤트 루프와 디스패치 테이블을 공유)
+        self.listeners: List[TCPListener] = []
+        if port is not None:
+            self.add_listener(host, port)
+        
+        # I/O 엔진 선택 (인자가 없으면 config의 TCP_IO_ENGINE 사용)
+        self.io_engine = io_engine or CONFIG.get('TCP_IO_ENGINE', self.IO_ENGINE_THREAD)
+        if self.io_engine not in (self.IO_ENGINE_THREAD, self.IO_ENGINE_SELECTOR):
+            logger.warning(f"알 수 없는 TCP I/O 엔진: {self.io_engine} - thread 엔진 사용")
+            self.io_engine = self.IO_ENGINE_THREAD
+        self.selector = None
+        self.select_timeout = CONFIG.get('TCP_SELECT_TIMEOUT', 0.5)
         self.clients = {}  # 클라이언트 소켓 저장 (클라이언트 ID: 정보)
         self.client_lock = threading.Lock()
         self.running = False
         self.auto_device_mapping = CONFIG.get('AUTO_DEVICE_MAPPING', {})
-        # 메시지 버퍼 (클라이언트 ID를 키로 사용)
-        self.message_buffers = {}
+        # 디바이스 라우팅 테이블 (디바이스 ID: [클라이언트 ID, ...]) - 등록/제거 시 갱신
+        self.device_routes: Dict[str, List[str]] = {}
+        self.route_cursor: Dict[str, int] = {}  # 디바이스별 라운드로빈 위치
+        self.route_lock = threading.Lock()
+        
+        # 송신 큐 설정 (연결별 큐 깊이, 오버플로 정책, 송신 타임아웃)
+        self.send_queue_size = CONFIG.get('TCP_SEND_QUEUE_SIZE', 64)
+        self.send_overflow_policy = CONFIG.get('TCP_SEND_OVERFLOW_POLICY', OutboundQueue.POLICY_REJECT)
+        self.send_overflow_policy_by_device = CONFIG.get('TCP_SEND_OVERFLOW_POLICY_BY_DEVICE', {})
+        self.send_timeout = CONFIG.get('TCP_SEND_TIMEOUT', 2.0)
+        
+        # 명령/응답 연관 추적 (응답 제한 시간, 재시도 횟수)
+        self.command_tracker = CommandTracker(
+            self._enqueue_message,
+            timeout=CONFIG.get('TCP_COMMAND_TIMEOUT', 1.0),
+            retries=CONFIG.get('TCP_COMMAND_RETRIES', 2)
+        )
+        
+        # 타이머 휠 (하트비트 기한) - 명령 응답 제한 시간과 같은 스레드에서 진행
+        self.timer_wheel = TimerWheel(tick=CONFIG.get('TCP_TIMER_TICK', 0.05))
+        
+        # 연결 생존 확인 (TCP keepalive + 애플리케이션 하트비트)
+        self.keepalive_idle = CONFIG.get('TCP_KEEPALIVE_IDLE', 5)
+        self.keepalive_interval = CONFIG.get('TCP_KEEPALIVE_INTERVAL', 1)
+        self.keepalive_count = CONFIG.get('TCP_KEEPALIVE_COUNT', 3)
+        self.user_timeout_ms = CONFIG.get('TCP_USER_TIMEOUT_MS', 3000)
+        self.heartbeat_interval = CONFIG.get('TCP_HEARTBEAT_INTERVAL', 1.0)
+        self.heartbeat_timeout = CONFIG.get('TCP_HEARTBEAT_TIMEOUT', 4.0)
+        self.heartbeat_devices = set(CONFIG.get('TCP_HEARTBEAT_DEVICES', []))
+        
+        # 디바이스 연결/해제 알림 콜백 (device_id, client_id, connected, reason)
+        self.connection_listeners: List[Callable[[str, str, bool, str], None]] = []
+        
+        # selector 엔진: 송신 대기 연결 목록과 루프 깨우기 소켓
+        self._write_pending = set()
+        self._write_pending_lock = threading.Lock()
+        self._wake_reader = None
+        self._wake_writer = None
+        
+        # 연결별 프레임 디코더 (클라이언트 ID를 키로 사용, 바이너리 협상 시 BinaryFrameDecoder로 교체)
+        self.message_buffers: Dict[str, Any] = {}
+        self.binary_framing_enabled = CONFIG.get('TCP_BINARY_FRAMING', True)
         
         # 디바이스별 메시지 타입 핸들러 (디바이스 ID: {메시지 타입: 핸들러 함수})
         self.device_handlers = {}
         
+        # 컴파일된 디스패치 테이블 ((원본 디바이스 ID, 메시지 타입): DispatchRoute)
+        self.dispatch_table: Dict[Tuple[str, str], DispatchRoute] = {}
+        # 핸들러 없는 메시지 수 ((원본 디바이스 ID, 메시지 타입): 횟수)
+        self.dispatch_misses: Dict[Tuple[str, str], int] = {}
+        
         # 헬스체크 주기 (초)
         self.health_check_interval = 60
         self.health_check_thread = None
         
-        logger.info("TCP 핸들러 초기화 완료")
+        logger.info(f"TCP 핸들러 초기화 완료 (I/O 엔진: {self.io_engine})")
 
         
     # ==== 서버 시작 ====
@@ -45,29 +157,86 @@ class TCPHandler:
             return True
         
         try:
-            # 소켓 생성
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(5)
-            self.running = True
+            # 리슨 소켓 생성
+            for listener in self.listeners:
+                listener.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                listener.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                listener.socket.bind((listener.host, listener.port))
+                listener.socket.listen(5)
+                logger.info(f"TCP 서버가 {listener.host}:{listener.port}에서 시작되었습니다. ({listener.name})")
             
-            logger.info(f"TCP 서버가 {self.host}:{self.port}에서 시작되었습니다.")
+            self.server_socket = self.listeners[0].socket if self.listeners else None
+            self.running = True
             
-            # 클라이언트 연결 수신 스레드 시작
-            threading.Thread(target=self._accept_connections, daemon=True).start()
+            if self.io_engine == self.IO_ENGINE_SELECTOR:
+                # 단일 이벤트 루프 스레드 시작 (모든 포트의 연결 수락 + 모든 클라이언트 송수신)
+                self.selector = selectors.DefaultSelector()
+                for listener in self.listeners:
+                    listener.socket.setblocking(False)
+                    self.selector.register(listener.socket, selectors.EVENT_READ, listener)
+                self._wake_reader, self._wake_writer = socket.socketpair()
+                self._wake_reader.setblocking(False)
+                self._wake_writer.setblocking(False)
+                self.selector.register(self._wake_reader, selectors.EVENT_READ, self._WAKE_EVENT)
+                threading.Thread(target=self._selector_loop, daemon=True).start()
+            else:
+                # 리슨 포트별 클라이언트 연결 수신 스레드 시작
+                for listener in self.listeners:
+                    threading.Thread(target=self._accept_connections, args=(listener,), daemon=True).start()
             
             # 헬스체크 스레드 시작
             self.health_check_thread = threading.Thread(target=self._health_check_loop, daemon=True)
             self.health_check_thread.start()
             
+            # 타이머 스레드 시작 (하트비트 기한, 명령 응답 제한 시간)
+            threading.Thread(target=self._timer_loop, daemon=True).start()
+            
             return True
         
         except Exception as e:
             logger.error(f"TCP 서버 시작 실패: {str(e)}")
             self.running = False
+            self._close_listeners()
             return False
     
+    # ==== 리슨 포트 추가 ====
+    def add_listener(self, host: str, port: int, device_id: Optional[str] = None):
+        """리슨 포트를 추가합니다 (start() 전에 호출).
+        
+        Args:
+            host: 바인드 주소
+            port: 포트 번호
+            device_id: 이 포트로 들어온 연결의 디바이스 ('S', 'H', 'G' 또는 별칭).
+                       지정하면 메시지 첫 바이트 대신 포트로 디바이스를 판별합니다.
+        """
+        raw_id = self.resolve_device_id(device_id) if device_id else None
+        if raw_id is not None and len(raw_id) != 1:
+            logger.warning(f"알 수 없는 포트 디바이스: {device_id} (포트 {port}) - 첫 메시지로 판별")
+            raw_id = None
+        
+        self.listeners.append(TCPListener(host, port, raw_id, device_id))
+    
+    @classmethod
+    def resolve_device_id(cls, device_id: str) -> str:
+        """매핑된 이름/별칭을 원본 디바이스 ID로 변환합니다 ('sort_controller' -> 'S')."""
+        return cls.REVERSE_DEVICE_ID_MAPPING.get(device_id, device_id)
+    
+    def _close_listeners(self):
+        for listener in self.listeners:
+            if listener.socket is None:
+                continue
+            try:
+                if self.selector:
+                    self.selector.unregister(listener.socket)
+            except Exception:
+                pass
+            try:
+                listener.socket.close()
+            except Exception as e:
+                logger.error(f"서버 소켓 종료 실패: {str(e)}")
+            listener.socket = None
+        self.server_socket = None
+    
     # ==== 서버 종료 ====
     def stop(self):
         self.running = False
@@ -76,54 +245,47 @@ class TCPHandler:
         with self.client_lock:
             for client_id, client_info in list(self.clients.items()):
                 try:
+                    if self.selector:
+                        try:
+                            self.selector.unregister(client_info['socket'])
+                        except (KeyError, ValueError):
+                            pass
                     client_info['socket'].close()
                 except Exception as e:
                     logger.error(f"클라이언트 {client_id} 연결 종료 실패: {str(e)}")
+                client_info['send_queue'].close()
             
             self.clients.clear()
             self.message_buffers.clear()
         
-        # 서버 소켓 종료
-        if self.server_socket:
-            try:
-                self.server_socket.close()
-            except Exception as e:
-                logger.error(f"서버 소켓 종료 실패: {str(e)}")
+        with self.route_lock:
+            self.device_routes.clear()
+            self.route_cursor.clear()
+        
+        # 리슨 소켓 종료
+        self._close_listeners()
+        
+        # 이벤트 루프가 대기 중이면 즉시 종료하도록 깨우기
+        self._wake_selector()
+        
+        # 응답을 기다리던 명령 정리
+        self.command_tracker.cancel_all()
         
         logger.info("TCP 서버가 종료되었습니다.")
     
     # ==== 클라이언트 연결 수락 ====
-    def _accept_connections(self):
-        logger.info("클라이언트 연결 대기 중...")
+    def _accept_connections(self, listener: TCPListener):
+        logger.info(f"클라이언트 연결 대기 중... (포트 {listener.port})")
         
         while self.running:
             try:
                 # 클라이언트 연결 수락
-                client_socket, address = self.server_socket.accept()
-                client_id = f"{address[0]}:{address[1]}"
+                client_socket, address = listener.socket.accept()
+                client_id = self._register_client(client_socket, address, listener)
                 
-                logger.info(f"새 클라이언트 연결: {client_id}")
-                
-                # 클라이언트 정보 저장
-                with self.client_lock:
-                    # 여기에 자동 매핑 코드 추가
-                    ip_address = address[0]
-                    device_id = None
-                    if ip_address in self.auto_device_mapping:
-                        device_id = self.auto_device_mapping[ip_address]
-                        logger.info(f"자동 디바이스 등록: {device_id} (클라이언트: {client_id})")
-                    
-                    self.clients[client_id] = {
-                        'socket': client_socket,
-                        'address': address,
-                        'device_id': device_id,  # None 대신 자동 매핑된 device_id 사용
-                        'last_activity': time.time()
-                    }
-                    # 메시지 버퍼 초기화
-                    self.message_buffers[client_id] = b""
-                
-                # 클라이언트 수신 스레드 시작
+                # 클라이언트 수신 스레드 및 송신 스레드 시작
                 threading.Thread(target=self._handle_client_data, args=(client_id,), daemon=True).start()
+                threading.Thread(target=self._writer_loop, args=(client_id,), daemon=True).start()
             
             except socket.timeout:
                 # 타임아웃은 정상 - 주기적으로 실행 상태 확인을 위함
@@ -133,6 +295,221 @@ class TCPHandler:
                     logger.error(f"클라이언트 연결 수락 실패: {str(e)}")
                     time.sleep(1)  # 연속 오류 방지
     
+    # ==== 클라이언트 등록 ====
+    def _register_client(self, client_socket: socket.socket, address,
+                         listener: Optional[TCPListener] = None) -> str:
+        """수락된 소켓을 클라이언트 목록에 등록하고 클라이언트 ID를 반환합니다."""
+        client_id = f"{address[0]}:{address[1]}"
+        port_device = listener.device_id if listener else None
+        
+        logger.info(f"새 클라이언트 연결: {client_id}")
+        self._configure_keepalive(client_socket)
+        
+        # 클라이언트 정보 저장
+        with self.client_lock:
+            ip_address = address[0]
+            device_id = None
+            if port_device:
+                # 디바이스 전용 포트로 들어온 연결
+                device_id = port_device
+                logger.info(f"포트 디바이스 등록: {device_id} (클라이언트: {client_id}, 포트 {listener.port})")
+            elif ip_address in self.auto_device_mapping:
+                device_id = self.auto_device_mapping[ip_address]
+                logger.info(f"자동 디바이스 등록: {device_id} (클라이언트: {client_id})")
+            
+            self.clients[client_id] = {
+                'socket': client_socket,
+                'address': address,
+                'device_id': device_id,  # None 대신 자동 매핑된 device_id 사용
+                'last_activity': time.time(),
+                'send_queue': OutboundQueue(self.send_queue_size, self._overflow_policy_for(device_id)),
+                'port_device': port_device,  # 설정 시 메시지 첫 바이트 대신 이 디바이스로 디스패치
+                'last_rx': time.monotonic(),  # 마지막 수신 시각 (하트비트 판정용)
+                'liveness_timer': None
+            }
+            # 연결별 프레임 디코더 생성
+            self.message_buffers[client_id] = LineFrameDecoder()
+        
+        if device_id:
+            self._device_attached(device_id, client_id)
+        
+        return client_id
+    
+    # ==== 이벤트 루프 (selector 엔진) ====
+    def _selector_loop(self):
+        """단일 스레드에서 연결 수락과 모든 클라이언트 수신을 처리합니다."""
+        logger.info("클라이언트 연결 대기 중... (selector 이벤트 루프)")
+        
+        while self.running:
+            try:
+                events = self.selector.select(timeout=self.select_timeout)
+            except Exception as e:
+                if self.running:
+                    logger.error(f"이벤트 루프 대기 중 오류: {str(e)}")
+                    time.sleep(0.1)
+                continue
+            
+            for key, mask in events:
+                if key.data.__class__ is TCPListener:
+                    self._accept_ready(key.data)
+                elif key.data is self._WAKE_EVENT:
+                    self._drain_wake_socket()
+                else:
+                    if mask & selectors.EVENT_WRITE:
+                        self._write_ready(key.fileobj, key.data)
+                    if mask & selectors.EVENT_READ:
+                        self._read_ready(key.fileobj, key.data)
+        
+        # 루프 종료 시 셀렉터 정리
+        try:
+            self.selector.close()
+        except Exception:
+            pass
+        for wake_socket in (self._wake_reader, self._wake_writer):
+            try:
+                if wake_socket:
+                    wake_socket.close()
+            except Exception:
+                pass
+        logger.info("selector 이벤트 루프 종료")
+    
+    def _accept_ready(self, listener: TCPListener):
+        """수락 대기 중인 연결을 처리합니다 (selector 엔진)."""
+        try:
+            client_socket, address = listener.socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            if self.running:
+                logger.error(f"클라이언트 연결 수락 실패: {str(e)}")
+            return
+        
+        # 송수신 모두 이벤트 루프에서 처리하므로 논블로킹 모드 사용
+        client_socket.setblocking(False)
+        client_id = self._register_client(client_socket, address, listener)
+        
+        try:
+            self.selector.register(client_socket, selectors.EVENT_READ, client_id)
+        except Exception as e:
+            logger.error(f"클라이언트 {client_id} 이벤트 루프 등록 실패: {str(e)}")
+            self._remove_client(client_id)
+    
+    def _read_ready(self, client_socket: socket.socket, client_id: str):
+        """읽기 가능한 클라이언트 소켓에서 데이터를 수신합니다 (selector 엔진)."""
+        try:
+            data = client_socket.recv(1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        except ConnectionResetError:
+            logger.info(f"클라이언트 {client_id} 연결 리셋")
+            self._remove_client(client_id)
+            return
+        except Exception as e:
+            logger.error(f"클라이언트 {client_id} 데이터 수신 중 오류: {str(e)}")
+            self._remove_client(client_id)
+            return
+        
+        if not data:
+            logger.debug(f"클라이언트 {client_id} 연결 종료")
+            self._remove_client(client_id)
+            return
+        
+        try:
+            # 데이터 처리
+            self._process_data(client_id, data)
+        except Exception as e:
+            logger.error(f"클라이언트 데이터 처리 오류: {str(e)}")
+        
+        # 활동 시간 업데이트
+        with self.client_lock:
+            if client_id in self.clients:
+                self.clients[client_id]['last_activity'] = time.time()
+    
+    def _write_ready(self, client_socket: socket.socket, client_id: str):
+        """쓰기 가능한 소켓으로 송신 큐를 비웁니다 (selector 엔진)."""
+        client_info = self.clients.get(client_id)
+        if client_info is None:
+            return
+        
+        try:
+            pending = client_info['send_queue'].write_to(client_socket)
+        except Exception as e:
+            logger.error(f"메시지 전송 오류 ({client_id}): {str(e)}")
+            self._remove_client(client_id, "send_error")
+            return
+        
+        if not pending:
+            # 보낼 데이터가 없으면 쓰기 이벤트 감시 해제
+            try:
+                self.selector.modify(client_socket, selectors.EVENT_READ, client_id)
+            except (KeyError, ValueError):
+                pass
+    
+    def _drain_wake_socket(self):
+        """깨우기 신호를 비우고 송신 대기 연결에 쓰기 이벤트 감시를 등록합니다."""
+        try:
+            while self._wake_reader.recv(1024):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        except Exception:
+            return
+        
+        with self._write_pending_lock:
+            client_ids = list(self._write_pending)
+            self._write_pending.clear()
+        
+        for client_id in client_ids:
+            client_info = self.clients.get(client_id)
+            if client_info is None:
+                continue
+            try:
+                self.selector.modify(client_info['socket'], selectors.EVENT_READ | selectors.EVENT_WRITE, client_id)
+            except (KeyError, ValueError):
+                pass
+    
+    def _wake_selector(self):
+        """다른 스레드에서 selector 이벤트 루프를 깨웁니다."""
+        if self._wake_writer is None:
+            return
+        try:
+            self._wake_writer.send(b'\0')
+        except (BlockingIOError, InterruptedError):
+            # 이미 깨우기 신호가 쌓여 있음
+            pass
+        except Exception:
+            pass
+    
+    # ==== 송신 스레드 (thread 엔진) ====
+    def _writer_loop(self, client_id: str):
+        """연결 하나의 송신 큐를 비우는 전용 스레드입니다.
+        
+        쓰기 가능할 때만 send()하므로 느린 디바이스는 자신의 큐만 막고,
+        send_timeout 동안 쓸 수 없으면 연결을 끊습니다.
+        """
+        client_info = self.clients.get(client_id)
+        if client_info is None:
+            return
+        
+        client_socket = client_info['socket']
+        send_queue = client_info['send_queue']
+        
+        while self.running and not send_queue.closed:
+            if not send_queue.wait(timeout=1.0):
+                continue
+            
+            try:
+                while send_queue.has_pending():
+                    _, writable, _ = select.select([], [client_socket], [], self.send_timeout)
+                    if not writable:
+                        raise socket.timeout(f"{self.send_timeout}초 동안 전송 불가")
+                    send_queue.write_to(client_socket)
+            except Exception as e:
+                if not send_queue.closed:
+                    logger.error(f"메시지 전송 오류 ({client_id}): {str(e)}")
+                    self._remove_client(client_id, "send_error")
+                break
+    
     # ==== 클라이언트 처리 ====
     def _handle_client_data(self, client_id):
         """클라이언트 데이터 처리 스레드"""
@@ -194,202 +571,337 @@ class TCPHandler:
     # ==== 데이터 처리 ====
     def _process_data(self, client_id: str, data: bytes):
         """수신한 데이터를 처리하고 완전한 메시지를 파싱합니다."""
-        # 버퍼에 데이터 추가
-        with self.client_lock:
-            if client_id not in self.message_buffers:
-                self.message_buffers[client_id] = b""
-            
-            self.message_buffers[client_id] += data
-            
-            # 완전한 메시지 처리
-            buffer = self.message_buffers[client_id]
-            messages = []
-            
-            while b'\n' in buffer:
-                # 개행 문자로 메시지 분리
-                message, buffer = buffer.split(b'\n', 1)
-                if message:  # 빈 메시지가 아닌 경우만 처리
-                    messages.append(message)
-            
-            # 버퍼 업데이트
-            self.message_buffers[client_id] = buffer
+        # 연결별 디코더는 해당 연결의 수신 루프에서만 사용하므로 전역 잠금 불필요
+        decoder = self.message_buffers.get(client_id)
+        if decoder is None:
+            decoder = self.message_buffers.setdefault(client_id, LineFrameDecoder())
+        
+        # 디바이스 전용 포트로 들어온 연결은 포트로 디바이스가 정해져 있음
+        client_info = self.clients.get(client_id)
+        port_device = None
+        if client_info is not None:
+            port_device = client_info['port_device']
+            client_info['last_rx'] = time.monotonic()
+        
+        # 바이너리 프레임으로 협상된 연결
+        if decoder.__class__ is BinaryFrameDecoder:
+            self._process_binary_frames(client_id, client_info, port_device, decoder.feed(data))
+            return
+        
+        # 완전한 메시지 처리 (디코딩된 문자열, 빈 메시지 제외)
+        messages = decoder.feed(data)
         
         # 메시지 처리
-        for message in messages:
+        for decoded_message in messages:
             try:
-                # 메시지 디코딩
-                decoded_message = message.decode('utf-8')
-                
                 # 첫 번째 문자는 디바이스 식별자(S, H, G), 두 번째 문자는 메시지 타입(E, C, R, X)
                 if len(decoded_message) < 2:
                     logger.warning(f"잘못된 메시지 형식(길이 부족): {decoded_message}")
                     continue
                 
-                device_type = decoded_message[0]  # 디바이스 타입(S, H, G)
+                device_type = port_device or decoded_message[0]  # 디바이스 타입(S, H, G)
                 message_type = decoded_message[1]  # 메시지 타입(E=이벤트, C=명령, R=응답, X=오류)
-                message_content = decoded_message[2:]  # 메시지 내용
                 
-                # 디바이스 ID 매핑
-                mapped_device_id = self.DEVICE_ID_MAPPING.get(device_type, device_type)
+                # 클라이언트-디바이스 매핑 업데이트 (미등록 연결의 첫 메시지에서만 잠금 사용)
+                if client_info is not None and client_info['device_id'] is None:
+                    self._assign_device(client_id, device_type)
                 
-                # 클라이언트-디바이스 매핑 업데이트
-                with self.client_lock:
-                    if client_id in self.clients:
-                        # 이미 ID가 설정되어 있지 않은 경우에만 업데이트
-                        if self.clients[client_id]['device_id'] is None:
-                            self.clients[client_id]['device_id'] = device_type
-                            logger.info(f"디바이스 등록: {device_type} (클라이언트: {client_id})")
+                # 바이너리 프레임 협상 요청 ('xCbn1')
+                if message_type == MSG_COMMAND and decoded_message[2:4] == CMD_BINARY_FRAMING:
+                    self._negotiate_binary_framing(client_id, device_type, decoded_message[4:])
+                    continue
                 
-                # 메시지 처리 - 중요: 프로토콜에 맞는 원래 타입 그대로 사용
-                self._process_message(mapped_device_id, message_type, device_type, message_content)
+                # 메시지 처리 - 디스패치 테이블 1회 조회 후 핸들러 호출
+                self._process_message(device_type, message_type, decoded_message, client_id=client_id)
             
             except Exception as e:
                 logger.error(f"메시지 처리 오류: {str(e)}")
     
-    # ==== 메시지 처리 ====
-    def _process_message(self, device_id: str, message_type: str, raw_device_id: str, content: str):
-        """메시지를 적절한 핸들러로 전달합니다."""
-        try:
-            handler_called = False
-            
-            # 원본 메시지 전체 재구성
-            original_message = f"{raw_device_id}{message_type}{content}"
-            
-            # 1. 매핑된 디바이스 ID와 메시지 타입으로 핸들러 찾기
-            if device_id in self.device_handlers and message_type in self.device_handlers[device_id]:
-                logger.debug(f"메시지 수신 ({raw_device_id}{message_type}): {content}")
-                
-                # 핸들러 호출 - 원본 메시지 전체 전달
-                self.device_handlers[device_id][message_type]({
-                    'device_type': raw_device_id,
-                    'message_type': message_type,
-                    'content': content,
-                    'raw': original_message  # 원본 메시지 전체 추가
-                })
-                handler_called = True
-            
-            # 2. 원래 디바이스 ID와 메시지 타입으로 핸들러 찾기
-            if not handler_called and raw_device_id in self.device_handlers and message_type in self.device_handlers[raw_device_id]:
-                logger.debug(f"메시지 수신 ({raw_device_id}{message_type}): {content} (원본 ID 사용)")
-                
-                # 핸들러 호출
-                self.device_handlers[raw_device_id][message_type]({
-                    'device_type': raw_device_id,
-                    'message_type': message_type,
-                    'content': content
-                })
-                handler_called = True
-            
-            # 호환성을 위해 이전 매핑 방식도 시도 (deprecated - 최종 버전에서는 제거 예정)
-            if not handler_called:
-                # 이전 매핑 변환
-                legacy_type = None
-                if message_type == 'E':
-                    legacy_type = 'evt'
-                elif message_type == 'R':
-                    legacy_type = 'res'
-                elif message_type == 'X':
-                    legacy_type = 'err'
+    def _process_binary_frames(self, client_id: str, client_info: Optional[Dict[str, Any]],
+                               port_device: Optional[str], frames: List[tuple]):
+        """바이너리 프레임을 텍스트 메시지와 같은 디스패치 경로로 전달합니다."""
+        for device, message_type, _, content, values in frames:
+            try:
+                device_type = port_device or device
                 
-                # 이전 매핑으로 다시 시도
-                if legacy_type and device_id in self.device_handlers and legacy_type in self.device_handlers[device_id]:
-                    logger.debug(f"메시지 수신 ({raw_device_id}{message_type}): {content} (레거시 매핑 사용)")
-                    
-                    # 핸들러 호출
-                    self.device_handlers[device_id][legacy_type]({
-                        'device_type': raw_device_id,
-                        'message_type': message_type,
-                        'content': content
-                    })
-                    handler_called = True
+                if client_info is not None and client_info['device_id'] is None:
+                    self._assign_device(client_id, device_type)
                 
-                # 원본 ID로도 시도
-                elif legacy_type and raw_device_id in self.device_handlers and legacy_type in self.device_handlers[raw_device_id]:
-                    logger.debug(f"메시지 수신 ({raw_device_id}{message_type}): {content} (원본 ID + 레거시 매핑)")
-                    
-                    # 핸들러 호출
-                    self.device_handlers[raw_device_id][legacy_type]({
-                        'device_type': raw_device_id,
-                        'message_type': message_type,
-                        'content': content
-                    })
-                    handler_called = True
+                self._process_message(device_type, message_type, device_type + message_type + content, values,
+                                      client_id=client_id)
             
-            # 핸들러를 찾지 못한 경우
-            if not handler_called:
-                logger.warning(f"핸들러 없음: 디바이스={device_id}, 타입={message_type}, 원본ID={raw_device_id}")
-                
-                # 디버깅 정보 추가
-                if logger.isEnabledFor(logging.DEBUG):
-                    handler_keys = []
-                    for d_id, handlers in self.device_handlers.items():
-                        for m_type in handlers.keys():
-                            handler_keys.append(f"{d_id}:{m_type}")
-                    
-                    if handler_keys:
-                        logger.debug(f"등록된 핸들러: {', '.join(handler_keys)}")
-                    else:
-                        logger.warning("등록된 핸들러 없음")
+            except Exception as e:
+                logger.error(f"메시지 처리 오류: {str(e)}")
+    
+    def _negotiate_binary_framing(self, client_id: str, device_type: str, version: str):
+        """연결의 수신 방향을 바이너리 프레임으로 전환합니다.
+        
+        디바이스는 'xRbn1' 응답을 받은 뒤부터 바이너리 프레임을 보내야 하므로,
+        전환 시점에 텍스트 디코더에 남은 데이터는 없습니다.
+        """
+        if not self.binary_framing_enabled or version != str(BINARY_FRAME_VERSION):
+            logger.info(f"바이너리 프레임 협상 거부: {device_type} ({client_id}, 버전 {version})")
+            self.send_message_async(device_type, f"{device_type}{MSG_ERROR}{CMD_BINARY_FRAMING}", client_id=client_id)
+            return
+        
+        self.message_buffers[client_id] = BinaryFrameDecoder()
+        self.send_message_async(
+            device_type, f"{device_type}{MSG_RESPONSE}{CMD_BINARY_FRAMING}{BINARY_FRAME_VERSION}", client_id=client_id)
+        logger.info(f"바이너리 프레임 사용: {device_type} ({client_id})")
+    
+    # ==== 메시지 처리 ====
+    def _process_message(self, device_type: str, message_type: str, raw_message: str,
+                         values: Optional[tuple] = None, client_id: Optional[str] = None):
+        """메시지를 디스패치 테이블에 등록된 핸들러로 전달합니다.
         
+        바이너리 프레임의 숫자 본문(온도 등)은 텍스트 변환 없이 values로 전달됩니다.
+        """
+        # 응답/에러는 대기 중인 명령과 먼저 짝지은 뒤 핸들러에도 그대로 전달
+        if message_type == 'R' or message_type == 'X':
+            if raw_message[2:] == CMD_HEARTBEAT:
+                # 하트비트 응답은 수신 시각 갱신만으로 충분 (명령 응답으로 취급하지 않음)
+                return
+            if client_id is not None:
+                self.command_tracker.on_reply(client_id, message_type, raw_message[2:])
+        
+        route = self.dispatch_table.get((device_type, message_type))
+        
+        if route is None:
+            self._handle_dispatch_miss(device_type, message_type)
+            return
+        
+        route.hits += 1
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"메시지 수신 ({device_type}{message_type}): {raw_message[2:]} (핸들러: {route.source})")
+        
+        try:
+            route.handler({
+                'device_type': device_type,
+                'message_type': message_type,
+                'content': raw_message[2:],
+                'raw': raw_message,  # 원본 메시지 전체
+                'values': values     # 바이너리 프레임의 숫자 본문 (텍스트 메시지는 None)
+            })
         except Exception as e:
             logger.error(f"메시지 처리 중 오류: {str(e)}")
-
+    
+    def _handle_dispatch_miss(self, device_type: str, message_type: str):
+        """핸들러가 없는 메시지를 집계합니다 (경고는 키별로 처음 한 번만 기록)."""
+        key = (device_type, message_type)
+        count = self.dispatch_misses.get(key, 0) + 1
+        self.dispatch_misses[key] = count
         
-    # ==== 메시지 전송 ====
-    def send_message(self, device_id: str, command: str) -> bool:
-        """지정된 디바이스에 커맨드 메시지를 전송합니다."""
-        # 디바이스 ID에 해당하는 클라이언트 찾기
-        client_id = self._find_client_by_device(device_id)
+        if count == 1:
+            logger.warning(f"핸들러 없음: 디바이스={device_type}, 타입={message_type}")
+            
+            # 디버깅 정보 추가
+            if logger.isEnabledFor(logging.DEBUG):
+                routes = [f"{d}{t}" for d, t in self.dispatch_table.keys()]
+                logger.debug(f"등록된 라우트: {', '.join(routes) if routes else '없음'}")
+    
+    # ==== 디스패치 테이블 컴파일 ====
+    def _compile_dispatch_table(self):
+        """등록된 핸들러에서 (원본 디바이스 ID, 메시지 타입) -> 핸들러 테이블을 생성합니다.
         
-        if not client_id:
-            logger.error(f"장치 {device_id} 연결 없음: 메시지 전송 실패")
+        별칭 우선순위는 이전 조회 순서를 그대로 따릅니다:
+        매핑된 ID > 원본 ID, 프로토콜 타입(E/R/X/C) > 레거시 타입(evt/res/err).
+        """
+        candidates = {}  # (디바이스, 타입): (우선순위, 핸들러, 등록 키)
+        
+        for registered_id, handlers in self.device_handlers.items():
+            raw_id = self.REVERSE_DEVICE_ID_MAPPING.get(registered_id, registered_id)
+            if len(raw_id) != 1:
+                # 프로토콜 디바이스 문자로 변환할 수 없는 ID
+                continue
+            id_priority = 0 if registered_id != raw_id else 1
             
-            # 디버그 정보 - 연결된 모든 클라이언트 목록 출력
-            with self.client_lock:
-                client_info = []
-                for cid, info in self.clients.items():
-                    device = info.get('device_id', 'None')
-                    addr = info.get('address', ('unknown', 0))
-                    client_info.append(f"{cid} (device: {device}, addr: {addr[0]}:{addr[1]})")
+            for registered_type, handler in handlers.items():
+                message_type = self.LEGACY_MESSAGE_TYPES.get(registered_type, registered_type)
+                type_priority = 0 if message_type == registered_type else 2
+                priority = type_priority + id_priority
                 
-                if client_info:
-                    logger.info(f"현재 연결된 클라이언트: {', '.join(client_info)}")
-                else:
-                    logger.warning("연결된 클라이언트가 없습니다.")
-            
-            # 매핑 정보도 출력
-            mapped_id = None
-            reverse_mapping = {v: k for k, v in self.DEVICE_ID_MAPPING.items()}
-            if device_id in reverse_mapping:
-                mapped_id = reverse_mapping[device_id]
-                logger.info(f"매핑된 원래 장치 ID: {mapped_id}")
-            
-            return False
+                key = (raw_id, message_type)
+                if key not in candidates or priority < candidates[key][0]:
+                    candidates[key] = (priority, handler, f"{registered_id}:{registered_type}")
         
-        try:
-            with self.client_lock:
-                if client_id not in self.clients:
-                    return False
-                
-                client_socket = self.clients[client_id]['socket']
-                
-                # 명령어에 개행 문자 추가 (없는 경우에만)
-                if not command.endswith('\n'):
-                    command = command + '\n'
-                
-                # 전송
-                client_socket.sendall(command.encode('utf-8'))
-                
-                # 활동 시간 업데이트
-                self.clients[client_id]['last_activity'] = time.time()
-                
-                logger.info(f"메시지 전송 성공 ({device_id}): {command.strip()}")
-                return True
+        table = {}
+        for key, (_, handler, source) in candidates.items():
+            route = DispatchRoute(handler, source)
+            # 재컴파일 시 기존 호출 횟수 유지
+            previous = self.dispatch_table.get(key)
+            if previous is not None:
+                route.hits = previous.hits
+            table[key] = route
         
-        except Exception as e:
-            logger.error(f"메시지 전송 오류 ({device_id}): {str(e)}")
-            self._remove_client(client_id)
-            return False
+        # 참조 교체 한 번으로 반영 (수신 스레드는 잠금 없이 조회)
+        self.dispatch_table = table
+    
+    # ==== 디스패치 통계 ====
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """라우트별 호출 횟수와 핸들러 없는 메시지 수를 반환합니다."""
+        return {
+            "routes": {
+                f"{device}{msg_type}": {"handler": route.source, "hits": route.hits}
+                for (device, msg_type), route in self.dispatch_table.items()
+            },
+            "misses": {
+                f"{device}{msg_type}": count
+                for (device, msg_type), count in self.dispatch_misses.items()
+            }
+        }
+
+    # ==== 메시지 전송 ====
+    def send_message(self, device_id: str, command: str, client_id: Optional[str] = None) -> bool:
+        """지정된 디바이스에 커맨드 메시지를 전송합니다.
+        
+        송신 큐에 넣고 바로 반환하며, 연결이 없거나 큐가 가득 차 거부된 경우에만 False입니다.
+        실제 전송 결과가 필요하면 send_message_async()를 사용하세요.
+        
+        Args:
+            device_id: 디바이스 ID ('S', 'H', 'G' 또는 매핑된 이름)
+            command: 전송할 명령
+            client_id: 특정 연결로 보낼 경우 클라이언트 ID (없으면 라운드로빈)
+        """
+        future = self.send_message_async(device_id, command, client_id=client_id)
+        return not (future.done() and not future.result())
+    
+    def send_message_async(self, device_id: str, command: str, client_id: Optional[str] = None,
+                           callback: Optional[Callable[[bool], None]] = None,
+                           coalesce_key: Optional[str] = None) -> Future:
+        """명령을 송신 큐에 넣고 전송 결과(True/False)를 담은 future를 반환합니다.
+        
+        Args:
+            device_id: 디바이스 ID ('S', 'H', 'G' 또는 매핑된 이름)
+            command: 전송할 명령
+            client_id: 특정 연결로 보낼 경우 클라이언트 ID (없으면 라운드로빈)
+            callback: 전송 완료 시 결과(bool)로 호출할 함수
+            coalesce_key: coalesce 정책에서 같은 명령으로 취급할 키 (없으면 명령 앞 4글자)
+        """
+        # 라우팅 테이블에서 클라이언트 선택
+        if client_id is None:
+            client_id = self._find_client_by_device(device_id)
+        
+        if client_id is not None and self._is_device_command(command):
+            # 응답이 다른 명령과 짝지어지지 않도록 보낸 순서에 기록
+            future = self.command_tracker.send(
+                self.REVERSE_DEVICE_ID_MAPPING.get(device_id, device_id), client_id, command, coalesce_key)
+        else:
+            future = self._enqueue_message(device_id, command, client_id, coalesce_key)
+        
+        if callback:
+            future.add_done_callback(lambda f: callback(f.result()))
+        
+        return future
+    
+    @staticmethod
+    def _is_device_command(command: str) -> bool:
+        """디바이스가 'R'/'X'로 응답하는 명령인지 (하트비트 제외)"""
+        return command[1:2] == MSG_COMMAND and command[2:4] != CMD_HEARTBEAT
+    
+    def _enqueue_message(self, device_id: str, command: str, client_id: Optional[str],
+                         coalesce_key: Optional[str] = None,
+                         on_replaced: Optional[Callable[[], None]] = None) -> Future:
+        """client_id 연결의 송신 큐에 메시지를 넣고 전송 결과 future를 반환합니다.
+        
+        on_replaced는 coalesce 정책으로 메시지가 같은 키의 새 메시지로 교체되면 호출됩니다.
+        """
+        client_info = self.clients.get(client_id) if client_id else None
+        
+        if client_info is None:
+            logger.error(f"장치 {device_id} 연결 없음: 메시지 전송 실패")
+            future = Future()
+            future.set_result(False)
+            return future
+        
+        # 명령어에 개행 문자 추가 (없는 경우에만)
+        if not command.endswith('\n'):
+            command = command + '\n'
+        
+        future = client_info['send_queue'].put(command.encode('utf-8'), coalesce_key or command[:4], on_replaced)
+        
+        if future.done() and not future.result():
+            logger.warning(f"송신 큐 거부 ({device_id}): {command.strip()}")
+        else:
+            self._schedule_write(client_id)
+            future.add_done_callback(
+                lambda f: self._on_send_complete(client_id, device_id, command, f.result()))
+        
+        return future
+    
+    def send_command(self, device_id: str, command: str, timeout: Optional[float] = None,
+                     retries: Optional[int] = None,
+                     callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                     client_id: Optional[str] = None,
+                     coalesce_key: Optional[str] = None) -> Future:
+        """명령을 보내고 디바이스 응답('R'/'X')을 담은 future를 반환합니다.
+        
+        응답이 timeout 안에 오지 않으면 retries 횟수만큼 같은 연결로 재전송합니다.
+        재전송하면 안 되는 명령(분류 등)은 retries=0으로 호출하세요.
+        client_id가 없으면 라우팅 테이블에서 연결을 고릅니다 (여러 연결이면 라운드로빈).
+        coalesce_key는 송신 큐 coalesce 정책에서 같은 명령으로 취급할 키입니다 (없으면 명령 앞 4글자).
+        
+        Returns:
+            Future: {"success", "reply", "error", "attempts", "rtt_ms"} 딕셔너리로 완료
+        """
+        device_id = self.REVERSE_DEVICE_ID_MAPPING.get(device_id, device_id)
+        if client_id is None:
+            client_id = self._find_client_by_device(device_id)
+        if client_id is None:
+            logger.error(f"장치 {device_id} 연결 없음: 명령 전송 실패")
+        future = self.command_tracker.submit(device_id, client_id, command, timeout=timeout, retries=retries,
+                                              coalesce_key=coalesce_key)
+        
+        if callback:
+            future.add_done_callback(lambda f: callback(f.result()))
+        
+        return future
+    
+    def _timer_loop(self):
+        """타이머 휠을 진행하고 응답 제한 시간이 지난 명령을 재전송/만료 처리합니다."""
+        while self.running:
+            try:
+                self.timer_wheel.advance()
+                self.command_tracker.expire()
+            except Exception as e:
+                logger.error(f"타이머 처리 중 오류: {str(e)}")
+            time.sleep(self.timer_wheel.tick)
+    
+    def get_command_stats(self) -> Dict[str, Any]:
+        """디바이스/명령별 왕복 지연 히스토그램을 반환합니다."""
+        return self.command_tracker.get_stats()
+    
+    def _schedule_write(self, client_id: str):
+        """selector 엔진에서 연결의 송신을 이벤트 루프에 요청합니다."""
+        if self.io_engine != self.IO_ENGINE_SELECTOR:
+            return
+        
+        with self._write_pending_lock:
+            self._write_pending.add(client_id)
+        self._wake_selector()
+    
+    def _on_send_complete(self, client_id: str, device_id: str, command: str, success: bool):
+        if success:
+            client_info = self.clients.get(client_id)
+            if client_info is not None:
+                client_info['last_activity'] = time.time()
+            logger.info(f"메시지 전송 성공 ({device_id}): {command.strip()}")
+        else:
+            logger.error(f"메시지 전송 실패 ({device_id}): {command.strip()}")
+    
+    def _overflow_policy_for(self, device_id: Optional[str]) -> str:
+        """디바이스별 송신 큐 오버플로 정책을 반환합니다."""
+        if device_id and device_id in self.send_overflow_policy_by_device:
+            return self.send_overflow_policy_by_device[device_id]
+        return self.send_overflow_policy
+    
+    # ==== 송신 통계 ====
+    def get_send_stats(self) -> Dict[str, Any]:
+        """연결별 송신 큐 깊이와 전송 지연 통계를 반환합니다."""
+        stats = {}
+        for client_id, client_info in list(self.clients.items()):
+            stats[client_id] = dict(client_info['send_queue'].get_stats(), device_id=client_info['device_id'])
+        return stats
     
     # ==== 디바이스 핸들러 등록 ====
     def register_device_handler(self, device_id: str, message_type: str, handler: Callable):
@@ -398,39 +910,184 @@ class TCPHandler:
             self.device_handlers[device_id] = {}
         
         self.device_handlers[device_id][message_type] = handler
+        self._compile_dispatch_table()
         logger.debug(f"디바이스 핸들러 등록: {device_id}, {message_type}")
     
     # ==== 클라이언트 제거 ====
-    def _remove_client(self, client_id: str):
+    def _remove_client(self, client_id: str, reason: str = "closed"):
         """클라이언트 연결을 종료하고 목록에서 제거합니다."""
+        device_id = None
+        
         with self.client_lock:
             if client_id not in self.clients:
                 return
             
             try:
                 device_id = self.clients[client_id].get('device_id')
-                self.clients[client_id]['socket'].close()
-                del self.clients[client_id]
+                client_socket = self.clients[client_id]['socket']
+                
+                # 하트비트 타이머 취소
+                if self.clients[client_id]['liveness_timer'] is not None:
+                    self.clients[client_id]['liveness_timer'].cancel()
+                
+                # selector 엔진: 소켓을 닫기 전에 이벤트 루프에서 해제
+                if self.selector:
+                    try:
+                        self.selector.unregister(client_socket)
+                    except (KeyError, ValueError):
+                        pass
+                
+                client_socket.close()
+                send_queue = self.clients.pop(client_id)['send_queue']
+
+                # 전송되지 못한 메시지는 실패 처리
+                send_queue.close()
+                
+                # 라우팅 테이블에서 제거
+                if device_id:
+                    self._remove_route(device_id, client_id)
                 
                 # 메시지 버퍼 제거
                 if client_id in self.message_buffers:
                     del self.message_buffers[client_id]
                 
                 if device_id:
-                    logger.info(f"디바이스 {device_id} 연결 종료됨")
+                    logger.info(f"디바이스 {device_id} 연결 종료됨 ({reason})")
             
             except Exception as e:
                 logger.error(f"클라이언트 종료 오류: {str(e)}")
+        
+        # 끊긴 연결로 보낸 명령의 응답 대기 정리
+        self.command_tracker.drop_connection(client_id)
+        
+        if device_id and self.running:
+            self._notify_connection(device_id, client_id, False, reason)
     
     # ==== 디바이스 ID로 클라이언트 찾기 ====
     def _find_client_by_device(self, device_id: str) -> Optional[str]:
-        """디바이스 ID에 해당하는 클라이언트 ID를 찾습니다."""
+        """디바이스 ID에 해당하는 클라이언트 ID를 찾습니다 (여러 연결이면 라운드로빈)."""
+        device_id = self.REVERSE_DEVICE_ID_MAPPING.get(device_id, device_id)
+        
+        with self.route_lock:
+            routes = self.device_routes.get(device_id)
+            if not routes:
+                return None
+            
+            if len(routes) == 1:
+                return routes[0]
+            
+            cursor = self.route_cursor.get(device_id, 0) % len(routes)
+            self.route_cursor[device_id] = cursor + 1
+            return routes[cursor]
+    
+    # ==== 디바이스 연결 목록 ====
+    def get_device_connections(self, device_id: str) -> List[str]:
+        """디바이스 ID에 연결된 모든 클라이언트 ID를 반환합니다 (명시적 라우팅용)."""
+        device_id = self.REVERSE_DEVICE_ID_MAPPING.get(device_id, device_id)
+        
+        with self.route_lock:
+            return list(self.device_routes.get(device_id, []))
+    
+    # ==== 라우팅 테이블 관리 ====
+    def _assign_device(self, client_id: str, device_id: str):
+        """연결에 디바이스 ID를 지정하고 라우팅 테이블에 추가합니다."""
         with self.client_lock:
-            for client_id, client_info in self.clients.items():
-                if client_info.get('device_id') == device_id:
-                    return client_id
+            client_info = self.clients.get(client_id)
+            # 이미 ID가 설정되어 있지 않은 경우에만 업데이트
+            if client_info is None or client_info['device_id'] is not None:
+                return
+            client_info['device_id'] = device_id
+            client_info['send_queue'].policy = self._overflow_policy_for(device_id)
+        
+        logger.info(f"디바이스 등록: {device_id} (클라이언트: {client_id})")
+        self._device_attached(device_id, client_id)
+    
+    def _add_route(self, device_id: str, client_id: str):
+        with self.route_lock:
+            routes = self.device_routes.setdefault(device_id, [])
+            if client_id not in routes:
+                routes.append(client_id)
+    
+    def _remove_route(self, device_id: str, client_id: str):
+        with self.route_lock:
+            routes = self.device_routes.get(device_id)
+            if not routes or client_id not in routes:
+                return
+            routes.remove(client_id)
+            if not routes:
+                del self.device_routes[device_id]
+                self.route_cursor.pop(device_id, None)
+    
+    # ==== 연결 생존 확인 ====
+    def _configure_keepalive(self, client_socket: socket.socket):
+        """TCP keepalive와 미확인 송신 제한 시간을 설정합니다 (지원하는 플랫폼에서만)."""
+        try:
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive_idle)
+            if hasattr(socket, 'TCP_KEEPINTVL'):
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keepalive_interval)
+            if hasattr(socket, 'TCP_KEEPCNT'):
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.keepalive_count)
+            if hasattr(socket, 'TCP_USER_TIMEOUT') and self.user_timeout_ms:
+                # 보낸 데이터가 이 시간 안에 ACK되지 않으면 커널이 연결을 끊음
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, self.user_timeout_ms)
+        except OSError as e:
+            logger.warning(f"TCP keepalive 설정 실패: {str(e)}")
+    
+    def _device_attached(self, device_id: str, client_id: str):
+        """디바이스가 확인된 연결을 라우팅 테이블에 넣고 하트비트를 시작합니다."""
+        self._add_route(device_id, client_id)
         
-        return None
+        if device_id in self.heartbeat_devices:
+            client_info = self.clients.get(client_id)
+            if client_info is not None:
+                client_info['liveness_timer'] = self.timer_wheel.schedule(
+                    self.heartbeat_interval, self._check_liveness, client_id)
+        
+        self._notify_connection(device_id, client_id, True, "connected")
+    
+    def _check_liveness(self, client_id: str):
+        """하트비트 기한 타이머: 조용한 연결에 ping을 보내고, 기한을 넘기면 끊습니다.
+        
+        수신할 때마다 타이머를 다시 걸지 않고 마지막 수신 시각만 기록해 두었다가,
+        타이머가 만료될 때 남은 시간만큼 다시 예약합니다.
+        """
+        client_info = self.clients.get(client_id)
+        if client_info is None or not self.running:
+            return
+        
+        silent = time.monotonic() - client_info['last_rx']
+        
+        if silent >= self.heartbeat_timeout:
+            logger.warning(f"하트비트 응답 없음: {client_info['device_id']} ({client_id}, {silent:.2f}초)")
+            self._remove_client(client_id, "heartbeat_timeout")
+            return
+        
+        if silent >= self.heartbeat_interval:
+            device_id = client_info['device_id']
+            client_info['send_queue'].put(f"{device_id}{MSG_COMMAND}{CMD_HEARTBEAT}\n".encode('utf-8'), CMD_HEARTBEAT)
+            self._schedule_write(client_id)
+            delay = min(self.heartbeat_interval, self.heartbeat_timeout - silent)
+        else:
+            delay = self.heartbeat_interval - silent
+        
+        client_info['liveness_timer'] = self.timer_wheel.schedule(delay, self._check_liveness, client_id)
+    
+    def add_connection_listener(self, callback: Callable[[str, str, bool, str], None]):
+        """디바이스 연결/해제 시 호출할 콜백을 등록합니다.
+        
+        Args:
+            callback: (device_id, client_id, connected, reason) 인자로 호출
+        """
+        self.connection_listeners.append(callback)
+    
+    def _notify_connection(self, device_id: str, client_id: str, connected: bool, reason: str):
+        for callback in self.connection_listeners:
+            try:
+                callback(device_id, client_id, connected, reason)
+            except Exception as e:
+                logger.error(f"연결 상태 알림 오류: {str(e)}")
     
     # ==== 헬스체크 루프 ====
     def _health_check_loop(self):
@@ -462,18 +1119,16 @@ class TCPHandler:
         # 비활성 클라이언트 제거
         for client_id in inactive_clients:
             logger.info(f"비활성 클라이언트 제거: {client_id}")
-            self._remove_client(client_id)
+            self._remove_client(client_id, "inactive")
     
     # ==== 연결된 디바이스 목록 반환 ====
     def get_connected_devices(self) -> List[str]:
         """현재 연결된 디바이스 ID 목록을 반환합니다."""
         connected_devices = []
         
-        with self.client_lock:
-            for client_info in self.clients.values():
-                device_id = client_info.get('device_id')
-                if device_id:
-                    connected_devices.append(device_id)
+        with self.route_lock:
+            for device_id, routes in self.device_routes.items():
+                connected_devices.extend([device_id] * len(routes))
         
         return connected_devices
 
@@ -481,7 +1136,8 @@ class TCPHandler:
     # ==== 디바이스 연결 상태 확인 ====
     def is_device_connected(self, device_id: str) -> bool:
         """특정 디바이스의 연결 상태를 확인합니다."""
-        return self._find_client_by_device(device_id) is not None
+        device_id = self.REVERSE_DEVICE_ID_MAPPING.get(device_id, device_id)
+        return bool(self.device_routes.get(device_id))
     
 
     def _disconnect_client(self, client_socket_or_id):
@@ -0,0 +1,88 @@
+# server/utils/timer_wheel.py
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# ==== 타이머 ====
+class Timer:
+    """타이머 휠에 등록된 타이머 하나 (cancel()로 취소)"""
+    __slots__ = ('callback', 'args', 'rounds', 'cancelled')
+
+    def __init__(self, callback: Callable, args: tuple, rounds: int):
+        self.callback = callback
+        self.args = args
+        self.rounds = rounds        # 휠을 몇 바퀴 더 돌아야 만료되는지
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+# ==== 해시드 타이머 휠 클래스 ====
+class TimerWheel:
+    """고정 틱 단위의 해시드 타이머 휠
+
+    타이머는 만료 틱에 해당하는 슬롯에 들어가며, advance()는 지난 틱의 슬롯만
+    확인하므로 전체 연결 수와 관계없이 만료 처리 비용이 일정합니다.
+    취소는 플래그만 세우고 해당 슬롯을 지날 때 버립니다.
+    """
+
+    def __init__(self, tick: float = 0.05, slots: int = 128):
+        self.tick = tick
+        self.slots: List[List[Timer]] = [[] for _ in range(slots)]
+        self.lock = threading.Lock()
+        self.current_tick = 0
+        self.next_tick_time = time.monotonic() + tick
+
+    # ==== 타이머 등록 ====
+    def schedule(self, delay: float, callback: Callable, *args) -> Timer:
+        """delay초 뒤(틱 단위 올림)에 callback(*args)을 호출하도록 등록합니다."""
+        ticks = max(1, int(-(-delay // self.tick)))
+        with self.lock:
+            timer = Timer(callback, args, (ticks - 1) // len(self.slots))
+            self.slots[(self.current_tick + ticks) % len(self.slots)].append(timer)
+        return timer
+
+    # ==== 시간 진행 ====
+    def advance(self, now: Optional[float] = None) -> int:
+        """현재 시각까지 지난 틱의 만료 타이머를 실행하고 실행 수를 반환합니다."""
+        now = time.monotonic() if now is None else now
+        due: List[Timer] = []
+
+        with self.lock:
+            while self.next_tick_time <= now:
+                self.current_tick += 1
+                self.next_tick_time += self.tick
+
+                index = self.current_tick % len(self.slots)
+                slot = self.slots[index]
+                if not slot:
+                    continue
+
+                remaining = []
+                for timer in slot:
+                    if timer.cancelled:
+                        continue
+                    if timer.rounds > 0:
+                        timer.rounds -= 1
+                        remaining.append(timer)
+                    else:
+                        due.append(timer)
+                self.slots[index] = remaining
+
+        # 콜백은 잠금 밖에서 실행 (콜백 안에서 다시 schedule() 가능)
+        for timer in due:
+            if timer.cancelled:
+                continue
+            try:
+                timer.callback(*timer.args)
+            except Exception as e:
+                logger.error(f"타이머 콜백 오류: {str(e)}")
+
+        return len(due)
+
+    def __len__(self):
+        return sum(1 for slot in self.slots for timer in slot if not timer.cancelled)
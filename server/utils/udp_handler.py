@@ -4,18 +4,192 @@ import logging
 import cv2
 import numpy as np
 import time
+import struct
+from collections import deque, OrderedDict
+from typing import Dict, Any, Optional, List
+
+from utils.command_tracker import LatencyHistogram
+from utils.qr_scanner import QRScanner, QRRegionTracker, DETECT_MODES, DETECT_MODE_FULL, STAGES
 
 logger = logging.getLogger(__name__)
 
+# 데이터그램 최대 크기 (수신 버퍼마다 이만큼 여유를 둠)
+PACKET_SIZE = 4096
+
+# ==== 카메라 프레임 데이터그램 형식 ====
+# 버전 1: [헤더 24바이트][JPEG 조각] - 리틀 엔디언
+#   magic "QRF" | version u8 | camera_id u16 | chunk_index u16 | total_chunks u16 | reserved u16
+#   | frame_id u32 | frame_size u32 | offset u32
+# 조각마다 프레임 ID와 위치가 있으므로 순서가 바뀌거나 중복돼도 조립할 수 있고,
+# 송신 주소/카메라/프레임 ID별로 따로 조립하므로 여러 카메라가 한 포트로 동시에 보낼 수 있습니다.
+# 헤더가 없는 데이터그램은 기존 펌웨어 형식(FRAME_START:<크기> / 원본 청크 / FRAME_END)으로 처리합니다.
+FRAME_MAGIC = b"QRF"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("<3sBHHHHIII")
+MAX_FRAME_SIZE = 4 * 1024 * 1024    # 이보다 큰 프레임 크기는 잘못된 헤더/시작 메시지로 봄
+RECENT_FRAMES = 64                  # 조립을 끝낸 프레임 ID 기억 개수 (늦게 온 중복 조각 무시용)
+
+
+def encode_frame_datagrams(camera_id: int, frame_id: int, jpg: bytes, chunk_size: int = 1024) -> List[bytes]:
+    """JPEG 프레임 하나를 버전 1 헤더가 붙은 데이터그램 목록으로 나눔 (송신 측/벤치마크용)"""
+    total_chunks = max(1, -(-len(jpg) // chunk_size))
+    return [
+        FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, camera_id, index, total_chunks, 0,
+                          frame_id & 0xFFFFFFFF, len(jpg), index * chunk_size)
+        + jpg[index * chunk_size:(index + 1) * chunk_size]
+        for index in range(total_chunks)
+    ]
+
+# 단계별 지연 히스토그램 이름 (수신 조립 -> 디코딩 대기 -> JPEG 디코딩 -> QR 인식)
+PIPELINE_STAGES = ("reassembly", "queue_wait", "decode", "detect", "total")
+
+
+# ==== 수신 완료 프레임 ====
+class ReceivedFrame:
+    """수신 스레드가 조립을 마친 JPEG 프레임 하나"""
+    __slots__ = ('camera', 'buffer', 'size', 'started_at', 'completed_at')
+    
+    def __init__(self, camera: str, buffer: bytearray, size: int, started_at: float, completed_at: float):
+        self.camera = camera            # 카메라 식별자 (버전 1은 camera_id, 기존 형식은 송신 IP)
+        self.buffer = buffer            # 풀에서 빌린 버퍼 (디코딩이 끝나면 반납, 그 전에는 수신 스레드가 다시 쓰지 않음)
+        self.size = size
+        self.started_at = started_at    # 첫 데이터그램 수신 시각 (perf_counter)
+        self.completed_at = completed_at
+
+
+# ==== 조립 중인 프레임 ====
+class PartialFrame:
+    """수신 스레드가 조립 중인 프레임 하나 (송신 주소 + 카메라 + 프레임 ID별)"""
+    __slots__ = ('camera', 'buffer', 'view', 'size', 'position', 'total_chunks', 'chunks',
+                 'chunks_received', 'started_at', 'updated_at')
+    
+    def __init__(self, camera: str, buffer: bytearray, size: int, total_chunks: int, now: float):
+        self.camera = camera
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.size = size
+        self.position = 0               # 받은 바이트 수 (기존 형식은 다음 청크를 쓸 위치)
+        self.total_chunks = total_chunks        # 기존 형식은 0
+        self.chunks = bytearray(total_chunks)   # 조각별 수신 여부 (중복 조각 무시)
+        self.chunks_received = 0
+        self.started_at = now
+        self.updated_at = now
+
+
+# ==== 최신 프레임 우선 큐 ====
+class LatestFrameQueue:
+    """크기가 제한된 프레임 큐 - 가득 차면 오래된 프레임을 버리고 새 프레임을 넣음
+    
+    디코딩이 수신을 따라가지 못할 때 밀린 프레임을 순서대로 처리하기보다
+    가장 최근 프레임을 처리하는 편이 컨베이어 위 물품 인식에 유리합니다.
+    버릴 때는 같은 카메라의 가장 오래된 프레임을 먼저 고르므로, 한 카메라가
+    다른 카메라의 프레임을 밀어내지 않습니다 (같은 카메라 프레임이 없을 때만 전체에서 가장 오래된 것).
+    """
+    
+    def __init__(self, max_size: int = 2):
+        self.frames = deque()
+        self.max_size = max(1, max_size)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.closed = False
+        self.dropped = 0
+    
+    def put(self, frame: ReceivedFrame) -> Optional[ReceivedFrame]:
+        """프레임 추가 (밀려난 프레임이 있으면 반환)"""
+        dropped = None
+        with self.lock:
+            if len(self.frames) >= self.max_size:
+                dropped = next((queued for queued in self.frames if queued.camera == frame.camera), self.frames[0])
+                self.frames.remove(dropped)
+                self.dropped += 1
+            self.frames.append(frame)
+            self.not_empty.notify()
+        return dropped
+    
+    def get(self, timeout: float = 0.5) -> Optional[ReceivedFrame]:
+        """가장 오래된 프레임을 꺼냄 (timeout 동안 없거나 닫히면 None)"""
+        with self.lock:
+            if not self.frames and not self.closed:
+                self.not_empty.wait(timeout)
+            if self.frames:
+                return self.frames.popleft()
+            return None
+    
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.frames.clear()
+            self.not_empty.notify_all()
+    
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+# ==== 프레임 버퍼 풀 ====
+class FrameBufferPool:
+    """프레임 조립용 bytearray를 미리 만들어 두고 재사용하는 풀
+    
+    프레임마다 버퍼를 새로 만들지 않도록 수신 중 1개 + 디코딩 대기 + 디코딩 중인
+    프레임 수만큼 미리 할당합니다. 풀이 비었거나 buffer_size보다 큰 프레임이면
+    새로 만들어 빌려주고, 반납할 때 크기가 다르거나 풀이 가득 찼으면 버립니다.
+    """
+    
+    def __init__(self, buffer_size: int, count: int):
+        self.buffer_size = buffer_size
+        self.count = count
+        self.free = [bytearray(buffer_size) for _ in range(count)]
+        self.lock = threading.Lock()
+        self.allocated = 0      # 풀 밖에서 새로 만든 버퍼 수
+    
+    def acquire(self, size: int) -> bytearray:
+        """size바이트 이상인 버퍼 대여"""
+        if size <= self.buffer_size:
+            with self.lock:
+                if self.free:
+                    return self.free.pop()
+                self.allocated += 1
+            return bytearray(self.buffer_size)
+        
+        with self.lock:
+            self.allocated += 1
+        return bytearray(size)
+    
+    def release(self, buffer: Optional[bytearray]):
+        if buffer is None or len(buffer) != self.buffer_size:
+            return
+        with self.lock:
+            if len(self.free) < self.count:
+                self.free.append(buffer)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {"size": self.buffer_size, "count": self.count, "free": len(self.free), "allocated": self.allocated}
+
+
 class UDPBarcodeHandler:
-    def __init__(self, host='0.0.0.0', port=9000, callback=None, debug_mode=False):
+    def __init__(self, host='0.0.0.0', port=9000, callback=None, debug_mode=False,
+                 decode_workers=2, queue_size=2, frame_buffer_size=128 * 1024,
+                 frame_timeout=0.5, max_partial_frames=8, detect_mode=DETECT_MODE_FULL,
+                 detect_mode_by_camera=None, full_res_fallback=False):
         """UDP 바코드 핸들러 초기화
         
+        수신 스레드는 UDP 청크를 프레임으로 조립해 큐에 넣기만 하고, JPEG 디코딩과
+        QR 인식은 디코딩 스레드(decode_workers개)가 처리합니다. OpenCV는 연산 중 GIL을
+        놓으므로 디코딩 중에도 수신 스레드가 다음 프레임 청크를 계속 받습니다.
+        
         Args:
             host (str): 바인딩할 호스트 주소
             port (int): 바인딩할 포트 번호
             callback (callable): 바코드 인식 시 호출할 콜백 함수
             debug_mode (bool): 디버그 모드 활성화 여부 (화면에 이미지 표시)
+            decode_workers (int): 디코딩 스레드 수
+            queue_size (int): 디코딩 대기 프레임 수 (넘치면 가장 오래된 프레임 폐기)
+            frame_buffer_size (int): 풀 버퍼 크기 - 이보다 큰 프레임만 버퍼를 새로 할당
+            frame_timeout (float): 이 시간(초) 동안 조각이 오지 않은 조립 중 프레임은 폐기
+            max_partial_frames (int): 동시에 조립하는 최대 프레임 수 (넘치면 가장 오래된 프레임 폐기)
+            detect_mode (str): QR 인식 모드 (full, fast, fast_multi - utils/qr_scanner.py 참고)
+            detect_mode_by_camera (dict): 카메라별 인식 모드 (키는 camera_id 문자열 또는 기존 형식 송신 IP)
+            full_res_fallback (bool): fast 계열에서 축소 프레임으로 놓친 프레임을 원본 해상도로 다시 인식
         """
         self.host = host
         self.port = port
@@ -24,36 +198,73 @@ class UDPBarcodeHandler:
         self.running = False
         self.udp_socket = None
         self.thread = None
+        self.decode_workers = max(1, decode_workers)
+        self.worker_threads = []
+        self.frame_queue = LatestFrameQueue(queue_size)
+        
+        self.detect_mode = detect_mode if detect_mode in DETECT_MODES else DETECT_MODE_FULL
+        self.detect_mode_by_camera = {
+            str(camera): mode for camera, mode in (detect_mode_by_camera or {}).items() if mode in DETECT_MODES
+        }
+        if detect_mode not in DETECT_MODES:
+            logger.warning(f"알 수 없는 QR 인식 모드: {detect_mode} - {DETECT_MODE_FULL} 사용")
+        self.frame_timeout = frame_timeout
+        self.max_partial_frames = max(1, max_partial_frames)
         
-        # 버퍼 및 상태 관리 변수
-        self.buffer = bytearray()
-        self.receiving = False
-        self.expected_size = 0
-        self.last_sent_data = ""  # 중복 전송 방지
-        self.last_sent_time = 0   # 마지막 데이터 전송 시간
+        # 프레임 버퍼 풀 (조립 중 + 디코딩 대기 + 디코딩 중)
+        self.buffer_pool = FrameBufferPool(frame_buffer_size + PACKET_SIZE,
+                                           self.max_partial_frames + self.frame_queue.max_size + self.decode_workers)
+        
+        # 조립 상태 (수신 스레드 전용)
+        # 키: 버전 1은 (송신 주소, camera_id, frame_id), 기존 형식은 (송신 주소, None)
+        self.partial_frames: "OrderedDict[tuple, PartialFrame]" = OrderedDict()
+        self.completed_keys: "OrderedDict[tuple, None]" = OrderedDict()
+        self.direct_key = None    # 다음 데이터그램을 바로 받을 기존 형식 프레임 (직전에 청크를 받은 프레임)
+        self.scratch_view = memoryview(bytearray(PACKET_SIZE))  # 바로 받을 프레임이 없을 때 받는 자리
+        self.last_eviction = 0.0
+        self.last_frame_time = 0
+        self.last_sent: Dict[tuple, float] = {}  # (카메라, 바코드)별 마지막 전송 시간 - 중복 전송 방지
+        self.send_lock = threading.Lock()     # 여러 디코딩 스레드의 중복 판단 보호
+        self.display_lock = threading.Lock()  # cv2.imshow는 한 번에 한 스레드만
         self.frame_count = 0      # 프레임 카운터
         self.last_fps_check = time.time()  # FPS 계산용 시간
         
-        # QR 코드 감지기 초기화
+        # QR 코드 인식기 초기화 (QRCodeDetector는 스레드 간 공유하지 않으므로 디코딩 스레드마다 하나,
+        # 카메라별 QR 위치 기억은 공유)
+        self.qr_tracker = QRRegionTracker()
         try:
-            self.qr_detector = cv2.QRCodeDetector()
-            logger.info("QR 코드 감지기 초기화 성공")
+            self.qr_scanners = [QRScanner(self.qr_tracker, full_res_fallback) for _ in range(self.decode_workers)]
+            logger.info(f"QR 코드 감지기 초기화 성공 (인식 모드 {self.detect_mode})")
         except Exception as e:
             logger.error(f"QR 코드 감지기 초기화 실패: {str(e)}")
-            self.qr_detector = None
+            self.qr_scanners = [None] * self.decode_workers
         
         # 성능 모니터링 변수
         self.fps = 0
         self.process_times = []  # 이미지 처리 시간 기록
         
-        logger.info(f"UDP 바코드 핸들러 초기화 완료 - {host}:{port}")
+        # 파이프라인 통계
+        self.stats_lock = threading.Lock()
+        self.frames_received = 0      # 조립을 마친 프레임
+        self.frames_incomplete = 0    # 청크 유실로 버린 프레임
+        self.frames_evicted = 0       # 그중 시간 초과/동시 조립 수 초과로 버린 프레임
+        self.duplicate_chunks = 0     # 중복 수신한 조각
+        self.camera_frames: Dict[str, int] = {}    # 카메라별 조립 완료 프레임 수
+        self.frames_decoded = 0       # JPEG 디코딩 성공
+        self.decode_failed = 0        # JPEG 디코딩 실패
+        self.frames_recognized = 0    # QR 코드가 인식된 프레임
+        self.barcodes_sent = 0        # 중복 제외 후 콜백으로 전달한 바코드
+        self.detect_stages = {stage: 0 for stage in STAGES}   # 인식 단계별 프레임 수 (ROI/전체/실패)
+        self.latency = {stage: LatencyHistogram() for stage in PIPELINE_STAGES}
+        
+        logger.info(f"UDP 바코드 핸들러 초기화 완료 - {host}:{port} (디코딩 스레드 {self.decode_workers}개)")
     
     def start(self):
         """UDP 바코드 핸들러 시작"""
         if self.running:
             logger.warning("UDP 바코드 핸들러가 이미 실행 중입니다.")
             return False
-            
+        
         try:
             # UDP 소켓 설정
             self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -66,8 +277,16 @@ class UDPBarcodeHandler:
             
             logger.info(f"UDP 바코드 핸들러 시작됨: {self.host}:{self.port}")
             
+            # 디코딩 스레드 시작
+            self.worker_threads = [
+                threading.Thread(target=self._decode_loop, args=(scanner,), name=f"udp-decode-{n}", daemon=True)
+                for n, scanner in enumerate(self.qr_scanners)
+            ]
+            for worker in self.worker_threads:
+                worker.start()
+            
             # 수신 스레드 시작
-            self.thread = threading.Thread(target=self._receive_loop, daemon=True)
+            self.thread = threading.Thread(target=self._receive_loop, name="udp-receive", daemon=True)
             self.thread.start()
             
             return True
@@ -79,6 +298,7 @@ class UDPBarcodeHandler:
         """UDP 바코드 핸들러 종료"""
         logger.info("UDP 바코드 핸들러 종료 중...")
         self.running = False
+        self.frame_queue.close()
         
         # 소켓 닫기
         if self.udp_socket:
@@ -89,147 +309,364 @@ class UDPBarcodeHandler:
                 logger.error(f"UDP 소켓 종료 중 오류: {str(e)}")
         
         # 스레드 종료 대기
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=2.0)
-            if self.thread.is_alive():
-                logger.warning("UDP 핸들러 스레드가 2초 내에 종료되지 않았습니다.")
-            
+        for thread in [self.thread] + self.worker_threads:
+            if thread and thread.is_alive():
+                thread.join(timeout=2.0)
+                if thread.is_alive():
+                    logger.warning(f"UDP 핸들러 스레드({thread.name})가 2초 내에 종료되지 않았습니다.")
+        
         logger.info("UDP 바코드 핸들러 종료됨")
     
+    def get_stats(self) -> Dict[str, Any]:
+        """수신/디코딩 파이프라인 통계 반환 (프레임 수와 단계별 지연)"""
+        with self.stats_lock:
+            return {
+                "fps": round(self.fps, 2),
+                "received": self.frames_received,
+                "incomplete": self.frames_incomplete,
+                "evicted": self.frames_evicted,
+                "duplicate_chunks": self.duplicate_chunks,
+                "partial": len(self.partial_frames),
+                "cameras": dict(self.camera_frames),
+                "dropped": self.frame_queue.dropped,
+                "queued": len(self.frame_queue),
+                "decoded": self.frames_decoded,
+                "decode_failed": self.decode_failed,
+                "recognized": self.frames_recognized,
+                "detect_stages": dict(self.detect_stages),
+                "sent": self.barcodes_sent,
+                "buffer_pool": self.buffer_pool.get_stats(),
+                "latency": {stage: histogram.to_dict() for stage, histogram in self.latency.items()}
+            }
+    
+    # ==== 수신 단계 ====
     def _receive_loop(self):
-        """UDP 데이터 수신 루프"""
-        # 패킷 크기 증가 - 더 큰 데이터 청크 처리
-        PACKET_SIZE = 4096  # 1024에서 4096으로 증가
-        
-        # 마지막 프레임 처리 시간 기록
-        last_frame_time = 0
-        
+        """UDP 데이터 수신 루프 (프레임 조립만 하고 디코딩은 디코딩 스레드에 넘김)"""
         logger.info("UDP 데이터 수신 루프 시작")
         while self.running:
             try:
-                data, addr = self.udp_socket.recvfrom(PACKET_SIZE)
-                
-                # 지나치게 자세한 로그 제거 (성능 향상)
-                if data.startswith(b'FRAME_START'):
-                    self.buffer = bytearray()  # 새 버퍼 생성 (메모리 재사용)
-                    parts = data.decode().strip().split(':')
-                    if len(parts) == 2:
-                        self.expected_size = int(parts[1])
-                        self.receiving = True
-                        # 큰 프레임을 미리 예약하여 메모리 할당 최적화
-                        self.buffer = bytearray(self.expected_size)
-                        self.buffer_position = 0
-                
-                elif data.startswith(b'FRAME_END'):
-                    if self.buffer_position == self.expected_size:
-                        # 성능 측정
-                        current_time = time.time()
-                        if last_frame_time > 0:
-                            frame_interval = current_time - last_frame_time
-                            instant_fps = 1 / frame_interval if frame_interval > 0 else 0
-                            # 평균 FPS 계산 (5프레임 이동 평균)
-                            self.frame_count += 1
-                            if len(self.process_times) >= 5:
-                                self.process_times.pop(0)
-                            self.process_times.append(instant_fps)
-                            self.fps = sum(self.process_times) / len(self.process_times)
-                            
-                            # 주기적 FPS 로깅 (5초마다)
-                            if current_time - self.last_fps_check > 5:
-                                logger.info(f"현재 프레임 처리 속도: {self.fps:.2f} FPS")
-                                self.last_fps_check = current_time
-                        
-                        last_frame_time = current_time
-                        # 이미지 처리 (QR 코드 인식)
-                        self._process_image()
-                    else:
-                        logger.warning(f"불완전한 프레임: {self.buffer_position}/{self.expected_size} 바이트")
-                    
-                    self.receiving = False
-                
-                elif self.receiving:
-                    # 더 효율적인 버퍼 관리
-                    data_len = len(data)
-                    if self.buffer_position + data_len <= self.expected_size:
-                        self.buffer[self.buffer_position:self.buffer_position + data_len] = data
-                        self.buffer_position += data_len
+                self._receive_datagram()
             
             except socket.timeout:
                 # 타임아웃 - 더 이상 로그 남기지 않음
+                self._evict_stale_frames(time.perf_counter())
                 continue
             except Exception as e:
+                if not self.running:
+                    break
                 logger.error(f"UDP 데이터 처리 오류: {str(e)}")
                 # 오류 발생 시 짧은 대기 후 계속
                 time.sleep(0.1)
         
+        for key in list(self.partial_frames):
+            self._discard_partial(key)
         logger.info("UDP 데이터 수신 루프 종료")
     
-    def _process_image(self):
-        """수신된 이미지 처리 및 QR 코드 인식"""
-        start_time = time.time()
+    def _receive_datagram(self):
+        """데이터그램 하나 수신 및 처리
         
-        try:
-            # 바이트 배열을 이미지로 변환
-            jpg = np.frombuffer(bytes(self.buffer[:self.buffer_position]), dtype=np.uint8)
-            img = cv2.imdecode(jpg, cv2.IMREAD_COLOR)
+        직전에 청크를 받은 기존 형식 프레임이 있으면 recvfrom_into로 그 풀 버퍼의 현재
+        위치에 바로 받습니다 (버퍼 끝에 PACKET_SIZE 여유가 있어 잘리지 않음). 받은 내용이
+        그 프레임의 청크가 아니면(제어 메시지, 버전 1 조각, 다른 송신자) 위치를 옮기지 않고
+        필요한 곳으로 복사하며, 그 자리는 다음 청크가 덮어씁니다. 버전 1 조각은 헤더를 읽어야
+        위치를 알 수 있으므로 임시 버퍼에 받은 뒤 풀 버퍼로 한 번 복사합니다 (새 할당 없음).
+        """
+        direct = self.partial_frames.get(self.direct_key) if self.direct_key else None
+        if direct is not None:
+            view = direct.view[direct.position:direct.position + PACKET_SIZE]
+        else:
+            view = self.scratch_view
+        nbytes, addr = self.udp_socket.recvfrom_into(view, PACKET_SIZE)
+        data = view[:nbytes]
+        now = time.perf_counter()
+        
+        # 지나치게 자세한 로그 제거 (성능 향상)
+        if nbytes >= FRAME_HEADER.size and data[:3] == FRAME_MAGIC and self._handle_chunk(addr, data, now):
+            pass
+        
+        elif nbytes >= 11 and data[:11] == b'FRAME_START':
+            parts = bytes(data).decode().strip().split(':')
+            if len(parts) == 2:
+                self._begin_legacy_frame(addr, int(parts[1]), now)
+        
+        elif nbytes >= 9 and data[:9] == b'FRAME_END':
+            self._end_legacy_frame(addr)
+        
+        else:
+            self._handle_legacy_chunk(addr, data, direct, now)
+        
+        if now - self.last_eviction >= self.frame_timeout / 2:
+            self._evict_stale_frames(now)
+    
+    def _handle_chunk(self, addr, data: memoryview, now: float) -> bool:
+        """버전 1 조각 처리 (헤더가 올바르지 않으면 False - 기존 형식 청크로 처리)"""
+        (_, version, camera_id, chunk_index, total_chunks, _,
+         frame_id, frame_size, offset) = FRAME_HEADER.unpack_from(data)
+        payload = data[FRAME_HEADER.size:]
+        if (version != FRAME_VERSION or chunk_index >= total_chunks or frame_size > MAX_FRAME_SIZE
+                or offset + len(payload) > frame_size):
+            return False
+        
+        key = (addr, camera_id, frame_id)
+        if key in self.completed_keys:
+            with self.stats_lock:
+                self.duplicate_chunks += 1
+            return True
+        
+        partial = self.partial_frames.get(key)
+        if partial is None:
+            partial = self._open_partial(key, str(camera_id), frame_size, total_chunks, now)
+        elif partial.size != frame_size or partial.total_chunks != total_chunks:
+            logger.warning(f"카메라 {camera_id} 프레임 {frame_id} 조각 헤더 불일치 - 무시")
+            return True
+        
+        if partial.chunks[chunk_index]:
+            with self.stats_lock:
+                self.duplicate_chunks += 1
+            return True
+        
+        partial.view[offset:offset + len(payload)] = payload
+        partial.chunks[chunk_index] = 1
+        partial.chunks_received += 1
+        partial.position += len(payload)
+        partial.updated_at = now
+        
+        if partial.chunks_received == total_chunks:
+            self.completed_keys[key] = None
+            if len(self.completed_keys) > RECENT_FRAMES:
+                self.completed_keys.popitem(last=False)
+            if partial.position == frame_size:
+                self._complete_partial(key)
+            else:
+                logger.warning(f"불완전한 프레임: 카메라 {camera_id} {partial.position}/{frame_size} 바이트")
+                self._discard_partial(key)
+        return True
+    
+    def _begin_legacy_frame(self, addr, expected_size: int, now: float):
+        """기존 형식 FRAME_START - 새 프레임 조립 시작 (같은 송신자가 받던 프레임은 버림)"""
+        key = (addr, None)
+        if key in self.partial_frames:
+            partial = self.partial_frames[key]
+            logger.warning(f"불완전한 프레임: {partial.position}/{partial.size} 바이트")
+            self._discard_partial(key)
+        if expected_size > MAX_FRAME_SIZE:
+            logger.warning(f"프레임 크기 초과: {expected_size} 바이트 - 무시")
+            return
+        self._open_partial(key, addr[0], expected_size, 0, now)
+        self.direct_key = key
+    
+    def _end_legacy_frame(self, addr):
+        """기존 형식 FRAME_END - 크기가 맞으면 완료, 아니면 버림"""
+        key = (addr, None)
+        partial = self.partial_frames.get(key)
+        if partial is None:
+            return
+        if partial.position == partial.size:
+            self._complete_partial(key)
+        else:
+            logger.warning(f"불완전한 프레임: {partial.position}/{partial.size} 바이트")
+            self._discard_partial(key)
+    
+    def _handle_legacy_chunk(self, addr, data: memoryview, direct: Optional[PartialFrame], now: float):
+        """기존 형식 원본 청크 - 송신자의 조립 중 프레임 현재 위치에 추가 (크기를 넘는 청크는 무시)"""
+        key = (addr, None)
+        partial = self.partial_frames.get(key)
+        if partial is None or partial.position + len(data) > partial.size:
+            return
+        
+        # 이미 그 프레임의 현재 위치에 받은 경우가 아니면 복사
+        if partial is not direct:
+            partial.view[partial.position:partial.position + len(data)] = data
+        partial.position += len(data)
+        partial.updated_at = now
+        self.direct_key = key
+    
+    def _open_partial(self, key, camera: str, size: int, total_chunks: int, now: float) -> PartialFrame:
+        """조립 중 프레임 추가 (동시 조립 수를 넘으면 가장 오래된 프레임 폐기)"""
+        while len(self.partial_frames) >= self.max_partial_frames:
+            oldest = next(iter(self.partial_frames))
+            with self.stats_lock:
+                self.frames_evicted += 1
+            self._discard_partial(oldest)
+        
+        partial = PartialFrame(camera, self.buffer_pool.acquire(size + PACKET_SIZE), size, total_chunks, now)
+        self.partial_frames[key] = partial
+        return partial
+    
+    def _discard_partial(self, key):
+        """조립 중 프레임을 버리고 버퍼 반납"""
+        partial = self.partial_frames.pop(key)
+        if self.direct_key == key:
+            self.direct_key = None
+        with self.stats_lock:
+            self.frames_incomplete += 1
+        partial.view.release()
+        self.buffer_pool.release(partial.buffer)
+    
+    def _evict_stale_frames(self, now: float):
+        """frame_timeout 동안 조각이 오지 않은 조립 중 프레임 폐기 (유실된 조각은 다시 오지 않음)"""
+        self.last_eviction = now
+        stale = [key for key, partial in self.partial_frames.items()
+                 if now - partial.updated_at > self.frame_timeout]
+        for key in stale:
+            partial = self.partial_frames[key]
+            logger.warning(f"불완전한 프레임 (시간 초과): 카메라 {partial.camera} {partial.position}/{partial.size} 바이트")
+            with self.stats_lock:
+                self.frames_evicted += 1
+            self._discard_partial(key)
+    
+    def _update_fps(self):
+        """프레임 수신 속도 (5프레임 이동 평균) 갱신"""
+        current_time = time.time()
+        if self.last_frame_time > 0:
+            frame_interval = current_time - self.last_frame_time
+            instant_fps = 1 / frame_interval if frame_interval > 0 else 0
+            # 평균 FPS 계산 (5프레임 이동 평균)
+            self.frame_count += 1
+            if len(self.process_times) >= 5:
+                self.process_times.pop(0)
+            self.process_times.append(instant_fps)
+            self.fps = sum(self.process_times) / len(self.process_times)
             
-            if img is None:
-                logger.warning("이미지 디코딩 실패")
-                return
+            # 주기적 FPS 로깅 (5초마다)
+            if current_time - self.last_fps_check > 5:
+                logger.info(f"현재 프레임 수신 속도: {self.fps:.2f} FPS")
+                self.last_fps_check = current_time
+        
+        self.last_frame_time = current_time
+    
+    def _complete_partial(self, key):
+        """조립을 마친 프레임을 디코딩 큐에 넣음 (큐가 차 있으면 가장 오래된 프레임을 폐기하고 버퍼 반납)"""
+        partial = self.partial_frames.pop(key)
+        if self.direct_key == key:
+            self.direct_key = None
+        partial.view.release()
+        self._update_fps()
+        
+        # 버퍼 소유권은 프레임으로 넘어감 (디코딩이 끝나면 디코딩 스레드가 반납)
+        completed_at = time.perf_counter()
+        frame = ReceivedFrame(partial.camera, partial.buffer, partial.size, partial.started_at, completed_at)
+        with self.stats_lock:
+            self.frames_received += 1
+            self.camera_frames[partial.camera] = self.camera_frames.get(partial.camera, 0) + 1
+            self.latency["reassembly"].record((completed_at - partial.started_at) * 1000)
+        
+        dropped = self.frame_queue.put(frame)
+        if dropped is not None:
+            self.buffer_pool.release(dropped.buffer)
+    
+    # ==== 디코딩 단계 ====
+    def _decode_loop(self, qr_scanner):
+        """디코딩 스레드 - 큐에서 프레임을 꺼내 JPEG 디코딩과 QR 인식"""
+        while self.running:
+            frame = self.frame_queue.get(timeout=0.5)
+            if frame is None:
+                continue
+            start_time = time.perf_counter()
+            try:
+                self._process_image(frame, qr_scanner)
+            except Exception as e:
+                logger.error(f"이미지 처리 중 오류: {str(e)}")
+            finally:
+                self.buffer_pool.release(frame.buffer)
             
-            # 디버그 모드 최적화: 낮은 해상도로 표시
-            if self.debug_mode:
-                # 이미지 크기 축소 (표시 성능 개선)
-                display_img = cv2.resize(img, (640, 480))
+            # 이미지 처리 시간 측정
+            process_time = time.perf_counter() - start_time
+            if process_time > 0.1:  # 100ms 이상 걸렸을 때만 로그
+                logger.debug(f"이미지 처리 시간: {process_time:.3f}초")
+    
+    def get_detect_mode(self, camera: str) -> str:
+        """카메라의 QR 인식 모드 (카메라별 설정이 없으면 기본 모드)"""
+        return self.detect_mode_by_camera.get(camera, self.detect_mode)
+    
+    def _process_image(self, frame: ReceivedFrame, qr_scanner):
+        """수신된 이미지 처리 및 QR 코드 인식"""
+        dequeued_at = time.perf_counter()
+        mode = self.get_detect_mode(frame.camera)
+        
+        # 바이트 배열을 이미지로 변환 (풀 버퍼를 복사 없이 읽음 - imdecode 결과는 별도 메모리)
+        jpg = np.frombuffer(frame.buffer, dtype=np.uint8, count=frame.size)
+        img = QRScanner.decode(jpg, mode)
+        decoded_at = time.perf_counter()
+        
+        with self.stats_lock:
+            self.latency["queue_wait"].record((dequeued_at - frame.completed_at) * 1000)
+            self.latency["decode"].record((decoded_at - dequeued_at) * 1000)
+            if img is None:
+                self.decode_failed += 1
+            else:
+                self.frames_decoded += 1
+        
+        if img is None:
+            logger.warning("이미지 디코딩 실패")
+            return
+        
+        # 디버그 모드 최적화: 낮은 해상도로 표시
+        if self.debug_mode:
+            # 이미지 크기 축소 (표시 성능 개선)
+            display_img = cv2.resize(img, (640, 480))
+            if display_img.ndim == 2:
+                display_img = cv2.cvtColor(display_img, cv2.COLOR_GRAY2BGR)
+            with self.display_lock:
                 cv2.imshow("QR UDP Stream", display_img)
                 cv2.waitKey(1)
-            
-            if self.qr_detector is None:
-                logger.error("QR 코드 감지기가 초기화되지 않았습니다.")
-                return
-            
-            # 매 3번째 프레임에서만 QR 코드 감지 (성능 최적화)
-            # 실시간성이 중요하다면 이 부분 제거
-            if self.frame_count % 3 != 0 and not self.debug_mode:
-                return
-                
-            # QR 코드 인식
-            qr_data, points, _ = self.qr_detector.detectAndDecode(img)
-            
-            current_time = time.time()
-            # 중복 데이터 처리 로직 개선: 같은 코드도 일정 시간 경과 시 다시 처리
-            if qr_data:
-                # 새로운 데이터이거나 마지막 전송 후 0.3초 이상 경과했을 때만 처리
-                if qr_data != self.last_sent_data or (current_time - self.last_sent_time > 0.3):
-                    logger.info(f"QR 코드 인식됨: {qr_data}")
-                    
-                    # 디버그 모드일 때 인식된 QR코드 시각화
-                    if self.debug_mode and points is not None and len(points) > 0:
-                        try:
-                            points = points.astype(int).reshape(-1, 2)
-                            cv2.polylines(display_img, [points], True, (0, 255, 0), 2)
-                            x, y = points[0]
-                            cv2.putText(display_img, qr_data, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                            cv2.imshow("QR UDP Stream", display_img)
-                            cv2.waitKey(1)
-                        except Exception as e:
-                            # 에러 로그 최소화
-                            pass
-                    
-                    # 콜백 함수 호출하여 바코드 데이터 전달
-                    if self.callback:
-                        try:
-                            self.callback(qr_data)
-                        except Exception as e:
-                            logger.error(f"바코드 콜백 처리 중 오류: {str(e)}")
-                    
-                    self.last_sent_data = qr_data
-                    self.last_sent_time = current_time
         
-        except Exception as e:
-            logger.error(f"이미지 처리 중 오류: {str(e)}")
+        if qr_scanner is None:
+            logger.error("QR 코드 감지기가 초기화되지 않았습니다.")
+            return
+        
+        # QR 코드 인식 (fast 계열은 직전 QR 영역 -> 축소 프레임 전체 -> 선택적으로 원본 해상도 순서)
+        codes, points, stage = qr_scanner.detect(img, frame.camera, mode, jpg)
+        detected_at = time.perf_counter()
+        
+        with self.stats_lock:
+            self.latency["detect"].record((detected_at - decoded_at) * 1000)
+            self.latency["total"].record((detected_at - frame.started_at) * 1000)
+            self.detect_stages[stage] += 1
+            if codes:
+                self.frames_recognized += 1
+        
+        # 중복 데이터 처리 로직 개선: 같은 코드도 일정 시간 경과 시 다시 처리
+        # 새로운 데이터이거나 마지막 전송 후 0.3초 이상 경과했을 때만 처리
+        current_time = time.time()
+        new_codes = []
+        with self.send_lock:
+            for qr_data in codes:
+                key = (frame.camera, qr_data)
+                if current_time - self.last_sent.get(key, 0) > 0.3:
+                    self.last_sent[key] = current_time
+                    new_codes.append(qr_data)
+            if len(self.last_sent) > 256:
+                self.last_sent = {key: sent_at for key, sent_at in self.last_sent.items()
+                                  if current_time - sent_at <= 0.3}
+        
+        if not new_codes:
+            return
+        
+        logger.info(f"QR 코드 인식됨 (카메라 {frame.camera}, {stage}): {', '.join(new_codes)}")
+        
+        # 디버그 모드일 때 인식된 QR코드 시각화
+        if self.debug_mode and points is not None and len(points) > 0:
+            try:
+                # 표시 이미지(640x480) 좌표로 변환
+                scale = np.array([640 / img.shape[1], 480 / img.shape[0]])
+                points = (points.reshape(-1, 2) * scale).astype(int)
+                cv2.polylines(display_img, [points], True, (0, 255, 0), 2)
+                x, y = points[0]
+                cv2.putText(display_img, codes[0], (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+                with self.display_lock:
+                    cv2.imshow("QR UDP Stream", display_img)
+                    cv2.waitKey(1)
+            except Exception as e:
+                # 에러 로그 최소화
+                pass
         
-        # 이미지 처리 시간 측정
-        process_time = time.time() - start_time
-        if process_time > 0.1:  # 100ms 이상 걸렸을 때만 로그
-            logger.debug(f"이미지 처리 시간: {process_time:.3f}초")
\ No newline at end of file
+        # 콜백 함수 호출하여 바코드 데이터 전달
+        with self.stats_lock:
+            self.barcodes_sent += len(new_codes)
+        if self.callback:
+            for qr_data in new_codes:
+                try:
+                    self.callback(qr_data)
+                except Exception as e:
+                    logger.error(f"바코드 콜백 처리 중 오류: {str(e)}")